@@ -5,20 +5,37 @@ import io
 import json
 import os
 import re
+import time
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict, deque
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from threading import Lock
 from typing import Any, Callable, Iterable
 
 from .errors import raise_api_error
-from .phase6.registry import build_registry_entry
+from .phase6.ohlcv_pyramid import (
+    OhlcvPyramid,
+    build_pyramid,
+    pyramid_from_table,
+    pyramid_path,
+    read_pyramid,
+    source_stamp,
+    write_pyramid,
+)
+from .phase6.registry import REGISTRY_CACHE_SETTLE_NS, build_registry_entry
 from .timeutils import format_ts, parse_ts
 
 _CACHE_MAX_ENTRIES = 32
+_DECISION_INDEX_VERSION = 1
+_DECISION_INDEX_DIRNAME = ".index"
+_DECISION_INDEX_FIELDS = ("symbol", "action", "severity", "reason_code")
 _ERRORS_LIMIT = 2000
 _MALFORMED_SAMPLE_LIMIT = 5
 _OHLCV_REQUIRED_COLUMNS = {"open", "high", "low", "close", "volume"}
+_OHLCV_VALUE_COLUMNS = ("open", "high", "low", "close", "volume")
+_PRICE_FIELDS = ("price", "entry_price", "exit_price", "price_raw", "fill_price", "avg_price")
+_TRADE_MARKER_COLUMNS = ("side", "direction", "action", "pnl", "trade_id", "id", *_PRICE_FIELDS)
 _TIMESTAMP_FIELDS = ("timestamp", "timestamp_utc", "ts_utc", "ts", "time", "date")
 _OHLCV_ARTIFACT_PATTERN = re.compile(r"^ohlcv_(?P<timeframe>[^.]+)\.(?:parquet|jsonl)$")
 
@@ -46,6 +63,8 @@ class _LRUCache:
 
 
 _DECISION_CACHE = _LRUCache(_CACHE_MAX_ENTRIES)
+_DECISION_INDEX_CACHE = _LRUCache(_CACHE_MAX_ENTRIES)
+_RUN_METADATA_CACHE = _LRUCache(16384)
 
 ARTIFACTS_ENV = "ARTIFACTS_ROOT"
 _TIMELINE_FILENAMES = (
@@ -151,7 +170,7 @@ def discover_runs() -> list[dict[str, Any]]:
         symbols = [entry["symbol"]] if isinstance(entry.get("symbol"), str) else None
         timeframe = entry.get("timeframe")
         if decision_path.exists():
-            strategy_hint, symbols_hint, timeframe_hint = extract_run_metadata(decision_path)
+            strategy_hint, symbols_hint, timeframe_hint = _cached_run_metadata(decision_path)
             if strategy is None:
                 strategy = strategy_hint
             if symbols is None:
@@ -209,6 +228,21 @@ def extract_run_metadata(decision_path: Path) -> tuple[str | None, list[str] | N
     return strategy, symbols, timeframe
 
 
+def _cached_run_metadata(
+    decision_path: Path,
+) -> tuple[str | None, list[str] | None, str | None]:
+    stat = decision_path.stat()
+    cache_key = (str(decision_path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _RUN_METADATA_CACHE.get(cache_key)
+    if cached is None:
+        strategy, symbols, timeframe = extract_run_metadata(decision_path)
+        cached = {"strategy": strategy, "symbols": symbols, "timeframe": timeframe}
+        if stat.st_mtime_ns < time.time_ns() - REGISTRY_CACHE_SETTLE_NS:
+            _RUN_METADATA_CACHE.set(cache_key, cached)
+    symbols = cached["symbols"]
+    return cached["strategy"], list(symbols) if symbols is not None else None, cached["timeframe"]
+
+
 def build_summary(decision_path: Path) -> dict[str, Any]:
     summary, _ = _get_cached_analysis(decision_path)
     return summary
@@ -237,33 +271,26 @@ def filter_decisions(
     page: int,
     page_size: int,
 ) -> dict[str, Any]:
-    symbol_filter = _normalize_filter(symbols)
-    action_filter = _normalize_filter(actions)
-    severity_filter = _normalize_filter(severities)
-    reason_filter = _normalize_filter(reason_codes)
-
-    records = DecisionRecords(decision_path)
-    results: list[dict[str, Any]] = []
-    total = 0
+    index = _get_decision_index(decision_path)
+    matched = _query_decision_index(
+        index,
+        {
+            "symbol": _normalize_filter(symbols),
+            "action": _normalize_filter(actions),
+            "severity": _normalize_filter(severities),
+            "reason_code": _normalize_filter(reason_codes),
+        },
+        start_ts,
+        end_ts,
+    )
+    total = len(matched)
     offset = (page - 1) * page_size
-
-    for record in records:
-        if not _matches_filters(
-            record,
-            symbol_filter,
-            action_filter,
-            severity_filter,
-            reason_filter,
-            start_ts,
-            end_ts,
-        ):
-            continue
-        total += 1
-        if total <= offset:
-            continue
-        if len(results) >= page_size:
-            continue
-        results.append(_normalize_record(record))
+    offsets = index["offsets"]
+    results: list[dict[str, Any]] = []
+    with decision_path.open("rb") as handle:
+        for record_id in matched[offset : offset + page_size]:
+            handle.seek(offsets[record_id])
+            results.append(_normalize_record(json.loads(handle.readline())))
 
     return {
         "total": total,
@@ -340,6 +367,132 @@ def _decision_cache_key(decision_path: Path) -> tuple[Any, ...]:
     return (run_id, stat.st_mtime_ns, stat.st_size)
 
 
+def _get_decision_index(decision_path: Path) -> dict[str, Any]:
+    """Return the seek index for ``decision_path``, building it once per file version.
+
+    The index is persisted under the run's ``.index/`` directory so it survives
+    restarts and stays out of the run's artifact listing.
+    """
+    stat = decision_path.stat()
+    cache_key = (str(decision_path), stat.st_mtime_ns, stat.st_size)
+    cached = _DECISION_INDEX_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    index_path = decision_path.parent / _DECISION_INDEX_DIRNAME / f"{decision_path.name}.json"
+    index: dict[str, Any] | None = None
+    try:
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        payload = None
+    if (
+        isinstance(payload, dict)
+        and payload.get("version") == _DECISION_INDEX_VERSION
+        and payload.get("source") == source
+    ):
+        index = payload
+    if index is None:
+        index = _build_decision_index(decision_path, stat.st_size)
+        index["source"] = source
+        try:
+            index_path.parent.mkdir(exist_ok=True)
+            tmp_path = index_path.with_name(f"{index_path.name}.tmp")
+            tmp_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass
+    _DECISION_INDEX_CACHE.set(cache_key, index)
+    return index
+
+
+def _build_decision_index(decision_path: Path, size: int) -> dict[str, Any]:
+    offsets: list[int] = []
+    timed: list[tuple[int, int]] = []
+    postings: dict[str, dict[str, list[int]]] = {field: {} for field in _DECISION_INDEX_FIELDS}
+    position = 0
+    with decision_path.open("rb") as handle:
+        for raw_line in handle:
+            line_offset = position
+            position += len(raw_line)
+            if line_offset >= size:
+                break
+            if not raw_line.strip():
+                continue
+            try:
+                payload = json.loads(raw_line)
+            except ValueError:
+                continue
+            if not isinstance(payload, dict):
+                continue
+
+            record_id = len(offsets)
+            offsets.append(line_offset)
+            keys = {
+                "symbol": _extract_symbols(payload) or [],
+                "action": _posting_keys(payload.get("action")),
+                "severity": _posting_keys(payload.get("severity") or payload.get("risk_state")),
+                "reason_code": _posting_keys(payload.get("reason_code") or payload.get("reason")),
+            }
+            for field, values in keys.items():
+                for value in dict.fromkeys(values):
+                    postings[field].setdefault(value, []).append(record_id)
+            try:
+                ts = parse_ts(_record_timestamp(payload))
+            except ValueError:
+                ts = None
+            if ts is not None:
+                timed.append((_epoch_micros(ts), record_id))
+
+    timed.sort()
+    return {
+        "version": _DECISION_INDEX_VERSION,
+        "offsets": offsets,
+        "ts_values": [value for value, _ in timed],
+        "ts_ids": [record_id for _, record_id in timed],
+        "postings": postings,
+    }
+
+
+def _query_decision_index(
+    index: dict[str, Any],
+    filters: dict[str, set[str] | None],
+    start_ts: datetime | None,
+    end_ts: datetime | None,
+) -> list[int] | range:
+    """Return matching record ids in file order (same semantics as ``_matches_filters``)."""
+    selected: set[int] | None = None
+    for field, allowed in filters.items():
+        if not allowed:
+            continue
+        postings = index["postings"][field]
+        ids: set[int] = set()
+        for value in allowed:
+            ids.update(postings.get(value, ()))
+        selected = ids if selected is None else selected & ids
+    if start_ts or end_ts:
+        values = index["ts_values"]
+        lo = bisect_left(values, _epoch_micros(start_ts)) if start_ts else 0
+        hi = bisect_right(values, _epoch_micros(end_ts)) if end_ts else len(values)
+        in_range = index["ts_ids"][lo:hi]
+        selected = set(in_range) if selected is None else selected.intersection(in_range)
+    if selected is None:
+        return range(len(index["offsets"]))
+    return sorted(selected)
+
+
+def _posting_keys(value: Any) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return [str(item) for item in value if item is not None]
+    return [str(value)]
+
+
+def _epoch_micros(value: datetime) -> int:
+    return (value - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1)
+
+
 def _scan_decision_records(decision_path: Path) -> tuple[dict[str, Any], dict[str, Any]]:
     min_ts: datetime | None = None
     max_ts: datetime | None = None
@@ -452,11 +605,10 @@ def load_trades(
     except ImportError as exc:  # pragma: no cover - env issue
         raise RuntimeError("pandas is required to read trades.parquet") from exc
 
-    df = pd.read_parquet(trade_path)
-    if df.empty:
+    df, timestamp_col = _read_parquet_window(trade_path, start_ts=start_ts, end_ts=end_ts)
+    if df is None:
         return {"total": 0, "page": page, "page_size": page_size, "results": []}
 
-    timestamp_col = _pick_timestamp_column(df.columns)
     if timestamp_col:
         ts = pd.to_datetime(df[timestamp_col], utc=True, errors="coerce")
         mask = ts.notna()
@@ -490,6 +642,53 @@ def load_trades(
     }
 
 
+def _read_parquet_window(
+    path: Path,
+    *,
+    start_ts: datetime | None,
+    end_ts: datetime | None,
+    columns: Iterable[str] | None = None,
+) -> tuple[Any, str | None]:
+    """Read ``path`` with the time window and column selection pushed down to pyarrow.
+
+    Returns ``(None, ts_col)`` for an empty file. Rows are pre-filtered only when
+    the timestamp column is an Arrow timestamp, so callers still apply their
+    pandas mask; row groups whose statistics fall outside the window are skipped.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    schema = parquet.schema_arrow
+    index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+    visible = [name for name in schema.names if name not in index_columns]
+    ts_col = _pick_timestamp_column(visible)
+    if parquet.metadata.num_rows == 0:
+        return None, ts_col
+
+    selected = None
+    if columns is not None:
+        wanted = set(columns) | ({ts_col} if ts_col else set())
+        selected = [name for name in visible if name in wanted]
+
+    filters = None
+    ts_type = schema.field(ts_col).type if ts_col else None
+    if ts_type is not None and pa.types.is_timestamp(ts_type):
+        filters = pc.field(ts_col).is_valid()
+        bound_type = pa.timestamp("us", tz=ts_type.tz)
+        for bound, compare in ((start_ts, pc.greater_equal), (end_ts, pc.less_equal)):
+            if bound is None:
+                continue
+            bound = bound.astimezone(timezone.utc)
+            if ts_type.tz is None:
+                bound = bound.replace(tzinfo=None)
+            filters &= compare(pc.field(ts_col), pa.scalar(bound, type=bound_type))
+
+    return pd.read_parquet(path, columns=selected, filters=filters), ts_col
+
+
 def load_trades_jsonl(
     trade_path: Path,
     start_ts: datetime | None,
@@ -535,11 +734,15 @@ def load_trade_markers(
     except ImportError as exc:  # pragma: no cover - env issue
         raise RuntimeError("pandas is required to read trades.parquet") from exc
 
-    df = pd.read_parquet(trade_path)
-    if df.empty:
+    df, timestamp_col = _read_parquet_window(
+        trade_path,
+        start_ts=start_ts,
+        end_ts=end_ts,
+        columns=_TRADE_MARKER_COLUMNS,
+    )
+    if df is None:
         return {"total": 0, "markers": []}
 
-    timestamp_col = _pick_timestamp_column(df.columns)
     if timestamp_col:
         ts = pd.to_datetime(df[timestamp_col], utc=True, errors="coerce")
         mask = ts.notna()
@@ -633,15 +836,19 @@ def load_ohlcv(
     limit: int | None,
 ) -> dict[str, Any]:
     try:
+        import numpy as np
         import pandas as pd
     except ImportError as exc:  # pragma: no cover - env issue
         raise RuntimeError("pandas is required to read OHLCV parquet") from exc
 
-    df = pd.read_parquet(ohlcv_path)
-    if df.empty:
-        return {"count": 0, "candles": []}
-
-    ts_col = _pick_timestamp_column(df.columns)
+    df, ts_col = _read_parquet_window(
+        ohlcv_path,
+        start_ts=start_ts,
+        end_ts=end_ts,
+        columns=_OHLCV_VALUE_COLUMNS,
+    )
+    if df is None:
+        return {"count": 0, "start_ts": None, "end_ts": None, "candles": []}
     if ts_col is None:
         raise RuntimeError("ohlcv parquet missing timestamp column")
 
@@ -660,23 +867,20 @@ def load_ohlcv(
     df[ts_col] = ts
 
     if df.empty:
-        return {"count": 0, "candles": []}
+        return {"count": 0, "start_ts": None, "end_ts": None, "candles": []}
 
     df = df.sort_values(ts_col)
     if limit is not None and limit > 0:
         df = df.iloc[:limit]
 
-    records: list[dict[str, Any]] = []
-    for _, row in df.iterrows():
-        record = {
-            "ts": _format_timestamp_value(row[ts_col]),
-            "open": float(row["open"]),
-            "high": float(row["high"]),
-            "low": float(row["low"]),
-            "close": float(row["close"]),
-            "volume": float(row["volume"]),
-        }
-        records.append(record)
+    stamps = np.datetime_as_string(
+        df[ts_col].dt.tz_localize(None).to_numpy().astype("datetime64[ms]"), unit="ms"
+    )
+    values = [df[name].astype(float).tolist() for name in _OHLCV_VALUE_COLUMNS]
+    records = [
+        {"ts": f"{stamp}Z", "open": o, "high": h, "low": low, "close": c, "volume": v}
+        for stamp, o, h, low, c, v in zip(stamps.tolist(), *values)
+    ]
 
     start_value = records[0]["ts"] if records else None
     end_value = records[-1]["ts"] if records else None
@@ -729,6 +933,58 @@ def load_ohlcv_jsonl(
     return {"count": len(records), "start_ts": start_value, "end_ts": end_value, "candles": records}
 
 
+def load_ohlcv_downsampled(
+    ohlcv_path: Path,
+    *,
+    start_ts: datetime | None,
+    end_ts: datetime | None,
+    max_points: int,
+    limit: int | None,
+) -> dict[str, Any]:
+    """Serve at most ``max_points`` candles covering the window from the OHLCV pyramid.
+
+    The finest pyramid level that fits is used, so the cost depends on
+    ``max_points`` rather than on the run length.
+    """
+    pyramid = read_pyramid(ohlcv_path) or _build_ohlcv_pyramid(ohlcv_path)
+    if pyramid is None:
+        raise RuntimeError("ohlcv changed while building its pyramid")
+    start_ms = -(-_epoch_micros(start_ts) // 1000) if start_ts is not None else None
+    end_ms = _epoch_micros(end_ts) // 1000 if end_ts is not None else None
+    level, lo, hi = pyramid.window(start_ms, end_ms, max_points)
+    if limit is not None and limit > 0:
+        hi = min(hi, lo + limit)
+    records = pyramid.candles(lo, hi)
+    start_value = records[0]["ts"] if records else None
+    end_value = records[-1]["ts"] if records else None
+    return {
+        "count": len(records),
+        "start_ts": start_value,
+        "end_ts": end_value,
+        "candles": records,
+        "bars_per_candle": pyramid.factor**level,
+    }
+
+
+def _build_ohlcv_pyramid(ohlcv_path: Path) -> OhlcvPyramid | None:
+    """Build (and persist, best-effort) the pyramid for a run that predates it."""
+    import numpy as np
+
+    source = source_stamp(ohlcv_path)
+    loader = load_ohlcv if ohlcv_path.suffix == ".parquet" else load_ohlcv_jsonl
+    candles = loader(ohlcv_path, start_ts=None, end_ts=None, limit=None)["candles"]
+    ts_ms = np.array([candle["ts"].rstrip("Z") for candle in candles], dtype="datetime64[ms]")
+    columns = {
+        name: np.array([candle[name] for candle in candles], dtype="float64")
+        for name in _OHLCV_VALUE_COLUMNS
+    }
+    table = build_pyramid(ts_ms.astype("int64"), columns, source)
+    if source_stamp(ohlcv_path) != source:
+        return None
+    write_pyramid(pyramid_path(ohlcv_path), table)
+    return pyramid_from_table(table, source)
+
+
 def load_metrics(metrics_path: Path) -> dict[str, Any]:
     try:
         payload = json.loads(metrics_path.read_text(encoding="utf-8"))
@@ -1068,7 +1324,7 @@ def _pick_timestamp_column(columns: Iterable[str]) -> str | None:
 
 
 def _pick_price_column(columns: Iterable[str]) -> str | None:
-    for name in ("price", "entry_price", "exit_price", "price_raw", "fill_price", "avg_price"):
+    for name in _PRICE_FIELDS:
         if name in columns:
             return name
     return None
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Iterable, Mapping
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from .phase6.dataset_cache import content_hash
+
+ARTIFACT_CACHE_CONTROL = "private, no-cache"
+VIEW_CACHE_MAX_BYTES = 64 * 1024 * 1024
+VIEW_CACHE_MAX_ENTRY_BYTES = 8 * 1024 * 1024
+
+
+class _ViewCache:
+    """Rendered response bodies keyed by ETag, evicted least-recently-used by total size."""
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes
+        self._lock = Lock()
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            body = self._data.get(key)
+            if body is not None:
+                self._data.move_to_end(key)
+            return body
+
+    def set(self, key: str, body: bytes) -> None:
+        if len(body) > self._max_entry_bytes:
+            return
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._data[key] = body
+            self._size += len(body)
+            while self._size > self._max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+
+_VIEW_CACHE = _ViewCache(VIEW_CACHE_MAX_BYTES, VIEW_CACHE_MAX_ENTRY_BYTES)
+
+
+def artifact_etag(path: Path) -> str:
+    """Strong ETag for a stored artifact: its SHA-256."""
+    return f'"{content_hash(path)}"'
+
+
+def view_etag(view: str, sources: Iterable[Path], params: Mapping[str, Any]) -> str:
+    """Strong ETag for a response computed from ``sources`` with ``params``.
+
+    The views are deterministic, so equal source digests and parameters mean
+    byte-identical bodies.
+    """
+    key = {
+        "view": view,
+        "sources": [[path.name, content_hash(path)] for path in sources],
+        "params": params,
+    }
+    text = json.dumps(key, sort_keys=True, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha256(text.encode("utf-8")).hexdigest()}"'
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": ARTIFACT_CACHE_CONTROL}
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison.
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
+
+
+def cached_response(
+    request: Request,
+    etag: str,
+    render: Callable[[], bytes],
+    *,
+    media_type: str,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Answer 304 for a matching ``If-None-Match``, else serve the (cached) rendered body."""
+    response_headers = {**(headers or {}), **cache_headers(etag)}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=response_headers)
+    body = _VIEW_CACHE.get(etag)
+    if body is None:
+        body = render()
+        _VIEW_CACHE.set(etag, body)
+    return Response(content=body, media_type=media_type, headers=response_headers)
+
+
+def json_view_response(request: Request, etag: str, build: Callable[[], Any]) -> Response:
+    """``cached_response`` for a JSON payload, rendered as FastAPI renders a returned dict."""
+    return cached_response(
+        request,
+        etag,
+        lambda: JSONResponse(content=jsonable_encoder(build())).body,
+        media_type="application/json",
+    )
+
+
+def clear_view_cache() -> None:
+    _VIEW_CACHE.clear()
@@ -7,16 +7,17 @@ import os
 import re
 import uuid
 import zipfile
+from contextlib import asynccontextmanager
 from email.parser import BytesParser
 from email.policy import default as email_default
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
 from fastapi import APIRouter, FastAPI, HTTPException, Query, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 
 from .artifacts import (
     build_summary,
@@ -29,6 +30,7 @@ from .artifacts import (
     get_artifacts_root,
     load_metrics,
     load_ohlcv,
+    load_ohlcv_downsampled,
     load_ohlcv_jsonl,
     load_timeline,
     load_trade_markers,
@@ -46,8 +48,18 @@ from .artifacts import (
 )
 from .chat import router as chat_router
 from .errors import build_error_envelope, build_error_payload, raise_api_error
+from .http_cache import (
+    artifact_etag,
+    cache_headers,
+    cached_response,
+    is_not_modified,
+    json_view_response,
+    not_modified_response,
+    view_etag,
+)
 from .plugins import get_validation_summary, list_active_plugins, list_failed_plugins
 from .phase6.canonical import write_canonical_json
+from .phase6.dataset_cache import content_hash
 from .phase6.http import error_response
 from .phase6.paths import (
     RUNS_ROOT_ENV,
@@ -60,7 +72,12 @@ from .phase6.paths import (
     user_runs_root,
     user_uploads_root,
 )
-from .phase6.experiment_builder import ExperimentBuilderError, create_experiment
+from .phase6.experiment_builder import (
+    ExperimentBuilderError,
+    create_experiment,
+    experiment_progress_path,
+    shutdown_experiment_executor,
+)
 from .phase6.registry import (
     build_registry_entry,
     has_legacy_runs,
@@ -76,7 +93,9 @@ from .phase6.run_builder import (
     inspect_csv_path,
     list_builtin_strategies,
     normalize_strategy_request,
+    submit_run,
 )
+from .phase6.run_queue import JOB_COMPLETED, JOB_FAILED, get_run_queue
 from .security.user_context import UserContext, UserContextError, resolve_user_context
 from .timeutils import coerce_ts_param
 
@@ -379,17 +398,10 @@ def _artifact_digests(run_dir: Path) -> list[dict[str, object]]:
     for child in sorted(run_dir.iterdir(), key=lambda item: item.name):
         if not child.is_file():
             continue
-        digest = hashlib.sha256()
-        with child.open("rb") as handle:
-            while True:
-                chunk = handle.read(1024 * 1024)
-                if not chunk:
-                    break
-                digest.update(chunk)
         files.append(
             {
                 "name": child.name,
-                "sha256": digest.hexdigest(),
+                "sha256": content_hash(child),
                 "size_bytes": child.stat().st_size,
             }
         )
@@ -1733,6 +1745,28 @@ def _normalize_product_run_payload(
     return normalized, dataset_id
 
 
+def _queued_run_status(job: dict[str, object]) -> dict[str, object]:
+    stage = str(job.get("stage") or job.get("state"))
+    payload: dict[str, object] = {
+        "state": job.get("state"),
+        "percent": job.get("percent"),
+        "last_event": {
+            "stage": stage,
+            "timestamp": job.get("updated_at"),
+            "detail": f"status={stage}",
+        },
+    }
+    error = job.get("error")
+    if job.get("state") == JOB_FAILED and isinstance(error, dict):
+        details = error.get("details") if isinstance(error.get("details"), dict) else {}
+        payload["error_envelope"] = build_error_envelope(
+            str(error.get("code") or "INTERNAL"),
+            str(error.get("message") or "Internal error"),
+            {"run_id": job.get("run_id"), **details},
+        )
+    return payload
+
+
 def _status_percent(state: str) -> int:
     normalized = (state or "").strip().upper()
     if normalized in {"COMPLETED", "OK", "FAILED", "CORRUPTED"}:
@@ -2016,6 +2050,8 @@ async def create_run_endpoint(request: Request) -> JSONResponse:
     is_product_payload = isinstance(payload, dict) and any(
         key in payload for key in ("dataset_id", "strategy_id", "risk_level")
     )
+    run_async = "respond-async" in request.headers.get("prefer", "").lower()
+    start_run = submit_run if run_async else create_run
 
     try:
         if is_product_payload:
@@ -2028,10 +2064,12 @@ async def create_run_endpoint(request: Request) -> JSONResponse:
                 base_runs_root=base_runs_root,
                 user_id=user_ctx.user_id,
             )
-            status_code, response = create_run(normalized_payload, user_id=user_ctx.user_id)
+            status_code, response = start_run(normalized_payload, user_id=user_ctx.user_id)
             run_id = str(response.get("run_id") or "").strip()
             if not run_id:
                 return error_response(500, "INTERNAL", "Internal error")
+            if status_code == 202:
+                return JSONResponse(status_code=status_code, content=response)
 
             runs_root = user_runs_root(base_runs_root, user_ctx.user_id)
             run_dir = (runs_root / run_id).resolve()
@@ -2054,7 +2092,7 @@ async def create_run_endpoint(request: Request) -> JSONResponse:
                 },
             )
 
-        status_code, response = create_run(payload, user_id=user_ctx.user_id)
+        status_code, response = start_run(payload, user_id=user_ctx.user_id)
         return JSONResponse(status_code=status_code, content=response)
     except RunBuilderError as exc:
         return error_response(exc.status_code, exc.code, exc.message, exc.details)
@@ -2144,6 +2182,49 @@ def experiment_comparison(experiment_id: str, request: Request) -> JSONResponse:
     return JSONResponse(status_code=200, content=payload)
 
 
+@router.get("/experiments/{experiment_id}/progress")
+def experiment_progress(experiment_id: str, request: Request) -> JSONResponse:
+    if _is_invalid_component(experiment_id):
+        return _invalid_experiment_id_response(experiment_id)
+    scope = _resolve_user_scope(request)
+    if isinstance(scope, JSONResponse):
+        return scope
+    user_ctx, base_runs_root, _, _, _ = scope
+    experiments_root = user_experiments_root(base_runs_root, user_ctx.user_id)
+    experiment_dir = (experiments_root / experiment_id).resolve()
+    if not is_within_root(experiment_dir, experiments_root):
+        return _invalid_experiment_id_response(experiment_id)
+
+    manifest = _load_experiment_artifact(experiment_dir, "experiment_manifest.json")
+    if manifest is not None:
+        status = _normalize_experiment_status(manifest)
+    else:
+        # Still running: create_experiment publishes finished candidates here.
+        progress_path = experiment_progress_path(experiments_root, experiment_id)
+        manifest = _load_experiment_artifact(progress_path.parent, progress_path.name)
+        if manifest is None:
+            return error_response(
+                404,
+                "EXPERIMENT_NOT_FOUND",
+                "Experiment not found",
+                {"experiment_id": experiment_id},
+            )
+        status = "RUNNING"
+    succeeded, failed, total_candidates = _extract_experiment_counts(manifest)
+    return JSONResponse(
+        status_code=200,
+        content={
+            "experiment_id": experiment_id,
+            "status": status,
+            "counts": {
+                "total_candidates": total_candidates,
+                "succeeded": succeeded,
+                "failed": failed,
+            },
+        },
+    )
+
+
 @router.get("/runs/{run_id}/status")
 def run_status(run_id: str, request: Request) -> object:
     scope = _resolve_user_scope(request)
@@ -2153,11 +2234,18 @@ def run_status(run_id: str, request: Request) -> object:
     if _is_invalid_component(run_id):
         return _invalid_run_id_response(run_id)
 
+    # The registry is authoritative; a queue job only describes runs not registered yet
+    # (a failed async attempt must not mask a later successful create).
+    job = get_run_queue().get(user_ctx.user_id, run_id)
+    pending_job = job if job is not None and job["state"] != JOB_COMPLETED else None
+
     registry_result = _load_registry_with_lock(owner_root)
     if isinstance(registry_result, JSONResponse):
-        return registry_result
+        return _queued_run_status(pending_job) if pending_job is not None else registry_result
     entry = _find_registry_entry(registry_result, run_id)
     if entry is None:
+        if pending_job is not None:
+            return _queued_run_status(pending_job)
         return error_response(404, "RUN_NOT_FOUND", "Run not found", {"run_id": run_id})
 
     owner_user_id = str(entry.get("owner_user_id") or "").strip()
@@ -2275,9 +2363,8 @@ def run_artifact(run_id: str, name: str, request: Request):
             {"run_id": run_id, "name": name},
         )
 
-    media_type = _artifact_media_type(name)
     try:
-        content = artifact_path.read_bytes()
+        etag = artifact_etag(artifact_path)
     except OSError:
         return error_response(
             404,
@@ -2285,7 +2372,12 @@ def run_artifact(run_id: str, name: str, request: Request):
             "Artifact not found",
             {"run_id": run_id, "name": name},
         )
-    return StreamingResponse(iter([content]), media_type=media_type)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    # FileResponse streams from disk and answers Range/If-Range against the ETag.
+    return FileResponse(
+        artifact_path, media_type=_artifact_media_type(name), headers=cache_headers(etag)
+    )
 
 
 @router.get("/runs/{run_id}/diagnostics")
@@ -2496,7 +2588,7 @@ def trade_markers(
     return payload
 
 
-@router.get("/runs/{run_id}/ohlcv")
+@router.get("/runs/{run_id}/ohlcv", response_model=None)
 def ohlcv(
     run_id: str,
     request: Request,
@@ -2505,7 +2597,8 @@ def ohlcv(
     start_ts: str | None = None,
     end_ts: str | None = None,
     limit: int | None = Query(default=None, ge=1, le=10000),
-) -> dict[str, object]:
+    max_points: int | None = Query(default=None, ge=1, le=10000),
+) -> Response:
     resolved = _resolve_run_dir_for_read(request, run_id)
     if isinstance(resolved, JSONResponse):
         return resolved
@@ -2527,26 +2620,49 @@ def ohlcv(
         source_path = ohlcv_jsonl_path
 
     start_dt, end_dt = _parse_time_range(start_ts, end_ts)
-    try:
-        payload = ohlcv_loader(source_path, start_ts=start_dt, end_ts=end_dt, limit=limit)
-    except RuntimeError as exc:
-        raise_api_error(
-            422,
-            "ohlcv_invalid",
-            str(exc),
-            {"run_id": run_id, "timeframe": timeframe},
-        )
-    payload["run_id"] = run_id
-    payload["symbol"] = symbol
-    payload["timeframe"] = timeframe
-    payload["source"] = source_path.name
-    if mode == "demo":
-        payload["mode"] = "demo"
-    return payload
+
+    def build() -> dict[str, object]:
+        try:
+            if max_points is not None:
+                payload = load_ohlcv_downsampled(
+                    source_path,
+                    start_ts=start_dt,
+                    end_ts=end_dt,
+                    max_points=max_points,
+                    limit=limit,
+                )
+            else:
+                payload = ohlcv_loader(source_path, start_ts=start_dt, end_ts=end_dt, limit=limit)
+        except RuntimeError as exc:
+            raise_api_error(
+                422,
+                "ohlcv_invalid",
+                str(exc),
+                {"run_id": run_id, "timeframe": timeframe},
+            )
+        payload["run_id"] = run_id
+        payload["symbol"] = symbol
+        payload["timeframe"] = timeframe
+        payload["source"] = source_path.name
+        if mode == "demo":
+            payload["mode"] = "demo"
+        return payload
+
+    params = {
+        "run_id": run_id,
+        "mode": mode,
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "start_ts": start_dt,
+        "end_ts": end_dt,
+        "limit": limit,
+        "max_points": max_points,
+    }
+    return json_view_response(request, view_etag("ohlcv", [source_path], params), build)
 
 
-@router.get("/runs/{run_id}/metrics")
-def metrics(run_id: str, request: Request) -> dict[str, object]:
+@router.get("/runs/{run_id}/metrics", response_model=None)
+def metrics(run_id: str, request: Request) -> Response:
     resolved = _resolve_run_dir_for_read(request, run_id)
     if isinstance(resolved, JSONResponse):
         return resolved
@@ -2554,14 +2670,19 @@ def metrics(run_id: str, request: Request) -> dict[str, object]:
     metrics_path = run_path / "metrics.json"
     if not metrics_path.exists():
         raise_api_error(404, "metrics_missing", "metrics.json missing", {"run_id": run_id})
-    try:
-        payload = load_metrics(metrics_path)
-    except RuntimeError as exc:
-        raise_api_error(422, "metrics_invalid", str(exc), {"run_id": run_id})
-    payload.setdefault("run_id", run_id)
-    if mode == "demo":
-        payload["mode"] = "demo"
-    return payload
+
+    def build() -> dict[str, object]:
+        try:
+            payload = load_metrics(metrics_path)
+        except RuntimeError as exc:
+            raise_api_error(422, "metrics_invalid", str(exc), {"run_id": run_id})
+        payload.setdefault("run_id", run_id)
+        if mode == "demo":
+            payload["mode"] = "demo"
+        return payload
+
+    etag = view_etag("metrics", [metrics_path], {"run_id": run_id, "mode": mode})
+    return json_view_response(request, etag, build)
 
 
 @router.get("/runs/{run_id}/timeline")
@@ -2652,7 +2773,7 @@ def export_decisions(
     reason_code: list[str] | None = Query(default=None),
     start_ts: str | None = None,
     end_ts: str | None = None,
-) -> StreamingResponse:
+) -> Response:
     resolved = _resolve_run_dir_for_read(request, run_id)
     if isinstance(resolved, JSONResponse):
         return resolved
@@ -2665,6 +2786,27 @@ def export_decisions(
             "decision_records.jsonl missing",
             {"run_id": run_id},
         )
+
+    symbol = _normalize_filter_values(symbol, "symbol")
+    action = _normalize_filter_values(action, "action")
+    severity = _normalize_filter_values(severity, "severity")
+    reason_code = _normalize_filter_values(reason_code, "reason_code")
+
+    start_dt, end_dt = _parse_time_range(start_ts, end_ts)
+    params = {
+        "run_id": run_id,
+        "format": format,
+        "symbol": symbol,
+        "action": action,
+        "severity": severity,
+        "reason_code": reason_code,
+        "start_ts": start_dt,
+        "end_ts": end_dt,
+    }
+    etag = view_etag("decisions_export", [decision_path], params)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
     validation = validate_decision_records(decision_path)
     if validation:
         raise_api_error(
@@ -2673,13 +2815,6 @@ def export_decisions(
             "decision_records.jsonl contains invalid JSON lines",
             validation,
         )
-
-    symbol = _normalize_filter_values(symbol, "symbol")
-    action = _normalize_filter_values(action, "action")
-    severity = _normalize_filter_values(severity, "severity")
-    reason_code = _normalize_filter_values(reason_code, "reason_code")
-
-    start_dt, end_dt = _parse_time_range(start_ts, end_ts)
     try:
         stream, media_type = stream_decisions_export(
             decision_path,
@@ -2693,11 +2828,11 @@ def export_decisions(
         )
     except ValueError as exc:
         raise_api_error(400, "invalid_export_format", str(exc), {"run_id": run_id})
-    return _export_response(stream, media_type, f"{run_id}-decisions.{format}")
+    return _export_response(stream, media_type, f"{run_id}-decisions.{format}", etag)
 
 
 @router.get("/runs/{run_id}/errors/export")
-def export_errors(run_id: str, request: Request, format: str = "json") -> StreamingResponse:
+def export_errors(run_id: str, request: Request, format: str = "json") -> Response:
     resolved = _resolve_run_dir_for_read(request, run_id)
     if isinstance(resolved, JSONResponse):
         return resolved
@@ -2710,6 +2845,9 @@ def export_errors(run_id: str, request: Request, format: str = "json") -> Stream
             "decision_records.jsonl missing",
             {"run_id": run_id},
         )
+    etag = view_etag("errors_export", [decision_path], {"run_id": run_id, "format": format})
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
     validation = validate_decision_records(decision_path)
     if validation:
         raise_api_error(
@@ -2723,7 +2861,7 @@ def export_errors(run_id: str, request: Request, format: str = "json") -> Stream
         stream, media_type = stream_errors_export(decision_path, fmt=format)
     except ValueError as exc:
         raise_api_error(400, "invalid_export_format", str(exc), {"run_id": run_id})
-    return _export_response(stream, media_type, f"{run_id}-errors.{format}")
+    return _export_response(stream, media_type, f"{run_id}-errors.{format}", etag)
 
 
 @router.get("/runs/{run_id}/trades/export")
@@ -2733,7 +2871,7 @@ def export_trades(
     format: str = "json",
     start_ts: str | None = None,
     end_ts: str | None = None,
-) -> StreamingResponse:
+) -> Response:
     resolved = _resolve_run_dir_for_read(request, run_id)
     if isinstance(resolved, JSONResponse):
         return resolved
@@ -2748,30 +2886,48 @@ def export_trades(
         raise_api_error(404, "trades_missing", "trades artifact missing", {"run_id": run_id})
 
     start_dt, end_dt = _parse_time_range(start_ts, end_ts)
+    params = {"run_id": run_id, "format": format, "start_ts": start_dt, "end_ts": end_dt}
+    etag = view_etag("trades_export", [trade_path], params)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
     try:
         stream, media_type = stream_trades_export(
             trade_path, start_ts=start_dt, end_ts=end_dt, fmt=format
         )
     except ValueError as exc:
         raise_api_error(400, "invalid_export_format", str(exc), {"run_id": run_id})
-    return _export_response(stream, media_type, f"{run_id}-trades.{format}")
+    return _export_response(stream, media_type, f"{run_id}-trades.{format}", etag)
 
 
 @router.get("/runs/{run_id}/report/export", response_model=None)
-def export_report_bundle(run_id: str, request: Request) -> StreamingResponse:
+def export_report_bundle(run_id: str, request: Request) -> Response:
     resolved = _resolve_run_dir_for_read(request, run_id)
     if isinstance(resolved, JSONResponse):
         return resolved
     run_path, _, _ = resolved
-    bundle = _build_export_bundle(run_path, run_id)
-    headers = {
-        "Content-Disposition": f'attachment; filename="{run_id}-report.zip"',
-        "Cache-Control": "no-store",
-    }
-    return StreamingResponse(iter([bundle]), media_type="application/zip", headers=headers)
+    sources = sorted((path for path in run_path.iterdir() if path.is_file()), key=lambda p: p.name)
+    etag = view_etag("report_bundle", sources, {"run_id": run_id, "stage_token": STAGE_TOKEN})
+    return cached_response(
+        request,
+        etag,
+        lambda: _build_export_bundle(run_path, run_id),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{run_id}-report.zip"'},
+    )
+
 
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    shutdown_experiment_executor()
 
-app = FastAPI(title="Buff Artifacts API", docs_url="/api/docs", openapi_url="/api/openapi.json")
+
+app = FastAPI(
+    title="Buff Artifacts API",
+    docs_url="/api/docs",
+    openapi_url="/api/openapi.json",
+    lifespan=_lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -2847,10 +3003,12 @@ def _normalize_filter_values(values: list[str] | None, name: str) -> list[str] |
     return normalized or None
 
 
-def _export_response(stream: Iterable[bytes], media_type: str, filename: str) -> StreamingResponse:
+def _export_response(
+    stream: Iterable[bytes], media_type: str, filename: str, etag: str
+) -> StreamingResponse:
     headers = {
         "Content-Disposition": f'attachment; filename="{filename}"',
-        "Cache-Control": "no-store",
+        **cache_headers(etag),
     }
     return StreamingResponse(stream, media_type=media_type, headers=headers)
 
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+from .canonical import to_canonical_bytes
+from .registry import REGISTRY_CACHE_SETTLE_NS
+
+DATASET_CACHE_DIRNAME = ".dataset_cache"
+DATASET_CACHE_SCHEMA_VERSION = "phase6.dataset_cache.v1"
+DATASET_CACHE_MAX_BYTES_ENV = "BUFF_DATASET_CACHE_MAX_BYTES"
+DEFAULT_DATASET_CACHE_MAX_BYTES = 2 * 1024**3
+CONTENT_HASH_CACHE_MAX_ENTRIES = 1024
+_HASH_CHUNK_BYTES = 1 << 20
+
+_CONTENT_HASH_CACHE: OrderedDict[str, tuple[tuple[int, int, int], str]] = OrderedDict()
+_CONTENT_HASH_CACHE_LOCK = Lock()
+
+
+def content_hash(path: Path) -> str:
+    """Return the sha256 of ``path``, reusing the last digest while its stat is unchanged.
+
+    Files modified within ``REGISTRY_CACHE_SETTLE_NS`` are hashed but not
+    memoized, so a rewrite in the same filesystem tick is never missed.
+    """
+    stat = path.stat()
+    stat_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    key = str(path)
+    with _CONTENT_HASH_CACHE_LOCK:
+        cached = _CONTENT_HASH_CACHE.get(key)
+        if cached is not None and cached[0] == stat_key:
+            _CONTENT_HASH_CACHE.move_to_end(key)
+            return cached[1]
+
+    digest = sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+    if stat_key[0] <= time.time_ns() - REGISTRY_CACHE_SETTLE_NS:
+        with _CONTENT_HASH_CACHE_LOCK:
+            _CONTENT_HASH_CACHE[key] = (stat_key, value)
+            _CONTENT_HASH_CACHE.move_to_end(key)
+            while len(_CONTENT_HASH_CACHE) > CONTENT_HASH_CACHE_MAX_ENTRIES:
+                _CONTENT_HASH_CACHE.popitem(last=False)
+    return value
+
+
+def dataset_cache_path(
+    runs_root: Path, source_path: Path, data_source: dict[str, Any], timeframe: str
+) -> Path:
+    """Locate the cached frame for ``data_source``'s time window at ``timeframe``.
+
+    Entries live under the source's content hash, so editing the file moves
+    every lookup to a fresh directory.
+    """
+    window = {
+        "schema_version": DATASET_CACHE_SCHEMA_VERSION,
+        "start_ts": data_source.get("start_ts"),
+        "end_ts": data_source.get("end_ts"),
+    }
+    window_id = sha256(to_canonical_bytes(window)).hexdigest()[:16]
+    return (
+        runs_root
+        / DATASET_CACHE_DIRNAME
+        / content_hash(source_path)
+        / f"ohlcv_{timeframe}_{window_id}.arrow"
+    )
+
+
+def dataset_cache_max_bytes() -> int:
+    raw = (os.getenv(DATASET_CACHE_MAX_BYTES_ENV) or "").strip()
+    try:
+        max_bytes = int(raw) if raw else DEFAULT_DATASET_CACHE_MAX_BYTES
+    except ValueError:
+        max_bytes = DEFAULT_DATASET_CACHE_MAX_BYTES
+    return max(max_bytes, 0)
+
+
+def read_cached_frame(path: Path) -> pd.DataFrame | None:
+    """Load a cached frame, marking it recently used for ``prune_dataset_cache``."""
+    if not path.is_file():
+        return None
+    try:
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowException):
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return table.to_pandas()
+
+
+def prune_dataset_cache(
+    cache_root: Path, *, max_bytes: int | None = None, keep: Path | None = None
+) -> list[Path]:
+    """Evict least-recently-used entries until the cache fits in ``max_bytes``.
+
+    Recency is the entry's mtime, which ``read_cached_frame`` refreshes on
+    every hit (atime is unreliable under ``noatime``/``relatime`` mounts).
+    ``keep`` is never evicted. Returns the removed entries.
+    """
+    if max_bytes is None:
+        max_bytes = dataset_cache_max_bytes()
+    entries: list[tuple[int, int, Path]] = []
+    for entry in cache_root.glob("*/*.arrow"):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, entry))
+    total = sum(size for _, size, _ in entries)
+    removed: list[Path] = []
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        if entry == keep:
+            continue
+        try:
+            entry.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            continue
+        total -= size
+        removed.append(entry)
+        try:
+            entry.parent.rmdir()
+        except OSError:
+            pass
+    return removed
+
+
+def write_cached_frame(path: Path, df: pd.DataFrame) -> None:
+    """Store ``df`` as an Arrow IPC file; failures only cost the next reader a re-parse.
+
+    Each write prunes the cache (``path``'s grandparent) back under
+    ``BUFF_DATASET_CACHE_MAX_BYTES``, keeping the entry just written.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}-{uuid.uuid4().hex}")
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=None)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, path)
+    except (OSError, pa.ArrowException):
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return
+    prune_dataset_cache(path.parent.parent, keep=path)
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import timezone
-from typing import Any
+from typing import Any, Callable, Iterator, Sequence, overload
 
+import numpy as np
 import pandas as pd
 
 
@@ -21,9 +22,9 @@ class EngineConfig:
 
 @dataclass(frozen=True)
 class EngineResult:
-    decisions: list[dict[str, Any]]
+    decisions: Sequence[dict[str, Any]]
     trades: list[dict[str, Any]]
-    equity_curve: list[dict[str, Any]]
+    equity_curve: Sequence[dict[str, Any]]
     metrics: dict[str, Any]
 
 
@@ -60,17 +61,23 @@ def _apply_slippage(price: float, side: str, slippage_bps: float) -> float:
     return float(price) * (1.0 - slippage_bps / 10_000.0)
 
 
-def _signal_actions_hold(count: int) -> list[str]:
-    actions = ["HOLD"] * count
+HOLD = 0
+ENTER_LONG = 1
+EXIT_LONG = 2
+_ACTION_NAMES = ("HOLD", "ENTER_LONG", "EXIT_LONG")
+
+
+def _signal_actions_hold(count: int) -> np.ndarray:
+    actions = np.full(count, HOLD, dtype=np.int8)
     if count > 0:
-        actions[0] = "ENTER_LONG"
-        actions[-1] = "EXIT_LONG"
+        actions[0] = ENTER_LONG
+        actions[-1] = EXIT_LONG
     return actions
 
 
-def _signal_actions_ma_cross(df: pd.DataFrame, params: dict[str, Any]) -> list[str]:
+def _signal_actions_ma_cross(df: pd.DataFrame, params: dict[str, Any]) -> np.ndarray:
     count = len(df)
-    actions = ["HOLD"] * count
+    actions = np.full(count, HOLD, dtype=np.int8)
     if count < 2:
         return actions
 
@@ -80,24 +87,110 @@ def _signal_actions_ma_cross(df: pd.DataFrame, params: dict[str, Any]) -> list[s
         raise ValueError("strategy_params_invalid")
 
     close = df["close"].astype("float64")
-    fast_ma = close.rolling(window=fast, min_periods=fast).mean()
-    slow_ma = close.rolling(window=slow, min_periods=slow).mean()
-
-    for idx in range(1, count - 1):
-        prev_fast = fast_ma.iloc[idx - 1]
-        prev_slow = slow_ma.iloc[idx - 1]
-        curr_fast = fast_ma.iloc[idx]
-        curr_slow = slow_ma.iloc[idx]
-        if pd.isna(prev_fast) or pd.isna(prev_slow) or pd.isna(curr_fast) or pd.isna(curr_slow):
-            continue
-        if prev_fast <= prev_slow and curr_fast > curr_slow:
-            actions[idx] = "ENTER_LONG"
-        elif prev_fast >= prev_slow and curr_fast < curr_slow:
-            actions[idx] = "EXIT_LONG"
+    fast_ma = close.rolling(window=fast, min_periods=fast).mean().to_numpy()
+    slow_ma = close.rolling(window=slow, min_periods=slow).mean().to_numpy()
+
+    # Crosses at bars 1..count-2; comparisons against warm-up NaNs are False.
+    prev_fast, prev_slow = fast_ma[:-2], slow_ma[:-2]
+    curr_fast, curr_slow = fast_ma[1:-1], slow_ma[1:-1]
+    crossed_up = (prev_fast <= prev_slow) & (curr_fast > curr_slow)
+    crossed_down = (prev_fast >= prev_slow) & (curr_fast < curr_slow)
+    actions[1:-1][crossed_up] = ENTER_LONG
+    actions[1:-1][crossed_down] = EXIT_LONG
     return actions
 
 
-def run_engine(df: pd.DataFrame, config: EngineConfig) -> EngineResult:
+def _format_ts_array(values: pd.Series) -> list[str]:
+    """``_format_ts`` for a whole column."""
+    dtype = values.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        naive = values.dt.tz_convert("UTC").dt.tz_localize(None)
+    elif pd.api.types.is_datetime64_dtype(dtype):
+        naive = values
+    else:
+        return [_format_ts(value) for value in values]
+    text = np.datetime_as_string(naive.to_numpy().astype("datetime64[ms]"), unit="ms")
+    return [f"{item}Z" for item in text.tolist()]
+
+
+class _LazyRecords(Sequence[dict[str, Any]]):
+    """Per-bar records built by ``build(index)`` when read, one dict at a time."""
+
+    def __init__(self, size: int, build: Callable[[int], dict[str, Any]]) -> None:
+        self._size = size
+        self._build = build
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return self._build(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(self._size):
+            yield self._build(index)
+
+
+def _decision_records(
+    ts_utc: list[str],
+    actions: np.ndarray,
+    prices: np.ndarray,
+    config: EngineConfig,
+    run_id: str | None,
+) -> _LazyRecords:
+    action_codes = actions.tolist()
+    price_values = prices.tolist()
+    common = {
+        "symbol": config.symbol,
+        "timeframe": config.timeframe,
+        "strategy_id": config.strategy_id,
+        "risk_level": int(config.risk_level),
+    }
+
+    def build(index: int) -> dict[str, Any]:
+        return {
+            "schema_version": "dr.v1",
+            "run_id": run_id,
+            "seq": index,
+            "ts_utc": ts_utc[index],
+            "action": _ACTION_NAMES[action_codes[index]],
+            "price": price_values[index],
+            **common,
+        }
+
+    return _LazyRecords(len(ts_utc), build)
+
+
+def _equity_records(ts_utc: list[str], equity: np.ndarray) -> _LazyRecords:
+    values = equity.tolist()
+    return _LazyRecords(len(ts_utc), lambda index: {"t": ts_utc[index], "equity": values[index]})
+
+
+def run_engine(
+    df: pd.DataFrame,
+    config: EngineConfig,
+    *,
+    run_id: str | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> EngineResult:
+    """Simulate ``config`` over ``df``; ``progress(done, total)`` is called as stages finish.
+
+    Signals are computed over whole columns and the position only changes at
+    fills, so the per-bar cash/position state is filled in segment by segment.
+    Decision and equity records are materialized when iterated.
+    """
     if df.empty:
         raise ValueError("engine_empty_data")
 
@@ -110,10 +203,14 @@ def run_engine(df: pd.DataFrame, config: EngineConfig) -> EngineResult:
     else:
         raise ValueError("strategy_unsupported")
 
-    decisions: list[dict[str, Any]] = []
-    trades: list[dict[str, Any]] = []
-    equity_curve: list[dict[str, Any]] = []
+    total_bars = len(df)
+    open_prices = df["open"].to_numpy(dtype="float64")
+    close_prices = df["close"].to_numpy(dtype="float64")
+    ts_utc = _format_ts_array(df["ts"])
+    if progress is not None:
+        progress(total_bars // 4, total_bars)
 
+    trades: list[dict[str, Any]] = []
     cash = float(config.initial_equity)
     position_qty = 0.0
     entry_price = 0.0
@@ -121,11 +218,10 @@ def run_engine(df: pd.DataFrame, config: EngineConfig) -> EngineResult:
     entry_commission = 0.0
     risk_fraction = _risk_fraction(config.risk_level)
 
-    open_prices = df["open"].astype("float64").tolist()
-    close_prices = df["close"].astype("float64").tolist()
-    timestamps = df["ts"].tolist()
+    # (first bar, cash, position) for each stretch of bars between fills.
+    segments: list[tuple[int, float, float]] = [(0, cash, position_qty)]
 
-    def _enter(price: float, ts_value: pd.Timestamp) -> None:
+    def _enter(idx: int, price: float) -> None:
         nonlocal cash, position_qty, entry_price, entry_time, entry_commission
         effective = _apply_slippage(price, "BUY", config.slippage_bps)
         if effective <= 0:
@@ -137,10 +233,10 @@ def run_engine(df: pd.DataFrame, config: EngineConfig) -> EngineResult:
         cash -= (qty * effective) + commission
         position_qty = float(qty)
         entry_price = float(effective)
-        entry_time = _format_ts(ts_value)
+        entry_time = ts_utc[idx]
         entry_commission = float(commission)
 
-    def _exit(price: float, ts_value: pd.Timestamp) -> None:
+    def _exit(idx: int, price: float) -> None:
         nonlocal cash, position_qty, entry_price, entry_time, entry_commission
         if position_qty <= 0:
             return
@@ -153,7 +249,7 @@ def run_engine(df: pd.DataFrame, config: EngineConfig) -> EngineResult:
             {
                 "entry_time": entry_time,
                 "entry_price": float(entry_price),
-                "exit_time": _format_ts(ts_value),
+                "exit_time": ts_utc[idx],
                 "exit_price": float(effective),
                 "qty": float(position_qty),
                 "pnl": float(pnl),
@@ -166,74 +262,63 @@ def run_engine(df: pd.DataFrame, config: EngineConfig) -> EngineResult:
         entry_time = None
         entry_commission = 0.0
 
-    for idx, ts_value in enumerate(timestamps):
-        if hold_like:
-            if idx == 0 and position_qty == 0:
-                _enter(open_prices[idx], ts_value)
-        else:
-            if idx > 0:
-                prev_action = signal_actions[idx - 1]
-                if prev_action == "ENTER_LONG" and position_qty == 0:
-                    _enter(open_prices[idx], ts_value)
-                elif prev_action == "EXIT_LONG" and position_qty > 0:
-                    _exit(open_prices[idx], ts_value)
-
-        action = signal_actions[idx]
-        if config.strategy_id == "ma_cross":
-            if action == "ENTER_LONG" and position_qty > 0:
-                action = "HOLD"
-            elif action == "EXIT_LONG" and position_qty == 0:
-                action = "HOLD"
-
-        equity = cash + (position_qty * close_prices[idx])
-        equity_curve.append({"t": _format_ts(ts_value), "equity": float(equity)})
-
-        if hold_like:
-            if idx == 0:
-                action = "ENTER_LONG"
-            elif idx == len(timestamps) - 1:
-                action = "EXIT_LONG"
-            else:
-                action = "HOLD"
-
-        decisions.append(
-            {
-                "schema_version": "dr.v1",
-                "run_id": None,
-                "seq": idx,
-                "ts_utc": _format_ts(ts_value),
-                "action": action,
-                "price": float(close_prices[idx]),
-                "symbol": config.symbol,
-                "timeframe": config.timeframe,
-                "strategy_id": config.strategy_id,
-                "risk_level": int(config.risk_level),
-            }
-        )
+    if hold_like:
+        fill_bars = [0]
+    else:
+        # A signal on bar i fills at the open of bar i + 1.
+        fill_bars = (np.flatnonzero(signal_actions[:-1] != HOLD) + 1).tolist()
+    for idx in fill_bars:
+        was_long = position_qty > 0
+        if hold_like or (signal_actions[idx - 1] == ENTER_LONG and not was_long):
+            _enter(idx, float(open_prices[idx]))
+        elif signal_actions[idx - 1] == EXIT_LONG and was_long:
+            _exit(idx, float(open_prices[idx]))
+        if (position_qty > 0) != was_long:
+            segments.append((idx, cash, position_qty))
+    if progress is not None:
+        progress(total_bars // 2, total_bars)
+
+    starts = np.array([segment[0] for segment in segments] + [total_bars])
+    lengths = np.diff(starts)
+    cash_by_bar = np.repeat(np.array([segment[1] for segment in segments]), lengths)
+    qty_by_bar = np.repeat(np.array([segment[2] for segment in segments]), lengths)
+    equity = cash_by_bar + (qty_by_bar * close_prices)
+
+    if hold_like:
+        actions = np.full(total_bars, HOLD, dtype=np.int8)
+        actions[-1] = EXIT_LONG
+        actions[0] = ENTER_LONG
+    else:
+        # Drop signals that would re-enter while long or exit while flat.
+        is_long = qty_by_bar > 0
+        actions = signal_actions.copy()
+        actions[(actions == ENTER_LONG) & is_long] = HOLD
+        actions[(actions == EXIT_LONG) & ~is_long] = HOLD
 
     if position_qty > 0:
-        last_idx = len(timestamps) - 1
-        _exit(close_prices[last_idx], timestamps[last_idx])
-        equity_curve[-1]["equity"] = float(cash)
-        if decisions:
-            decisions[-1]["action"] = "EXIT_LONG"
+        last_idx = total_bars - 1
+        _exit(last_idx, float(close_prices[last_idx]))
+        equity[-1] = cash
+        actions[-1] = EXIT_LONG
 
-    metrics = _compute_metrics(equity_curve, trades, config.initial_equity)
+    metrics = _compute_metrics(equity, trades, config.initial_equity)
+    if progress is not None:
+        progress(total_bars, total_bars)
 
     return EngineResult(
-        decisions=decisions,
+        decisions=_decision_records(ts_utc, actions, close_prices, config, run_id),
         trades=trades,
-        equity_curve=equity_curve,
+        equity_curve=_equity_records(ts_utc, equity),
         metrics=metrics,
     )
 
 
 def _compute_metrics(
-    equity_curve: list[dict[str, Any]],
+    equity: np.ndarray,
     trades: list[dict[str, Any]],
     initial_equity: float,
 ) -> dict[str, Any]:
-    if not equity_curve:
+    if equity.size == 0:
         return {
             "total_return": 0.0,
             "max_drawdown": 0.0,
@@ -243,19 +328,15 @@ def _compute_metrics(
             "final_equity": float(initial_equity),
         }
 
-    equities = [float(point["equity"]) for point in equity_curve]
     start = float(initial_equity)
-    end = float(equities[-1])
+    end = float(equity[-1])
     total_return = 0.0 if start == 0 else (end - start) / start
 
-    peak = equities[0]
-    max_drawdown = 0.0
-    for value in equities:
-        if value > peak:
-            peak = value
-        drawdown = 0.0 if peak == 0 else (peak - value) / peak
-        if drawdown > max_drawdown:
-            max_drawdown = drawdown
+    # fmax skips NaN like the ``value > peak`` comparison it replaces.
+    peak = np.fmax.accumulate(equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = np.where(peak == 0, 0.0, (peak - equity) / peak)
+    max_drawdown = float(np.fmax.reduce(drawdown, initial=0.0))
 
     pnls = [float(trade.get("pnl", 0.0)) for trade in trades]
     wins = [pnl for pnl in pnls if pnl > 0]
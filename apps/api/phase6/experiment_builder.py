@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import copy
 import json
+import multiprocessing
 import os
 import shutil
+import threading
 import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from .canonical import to_canonical_bytes
 from .experiment_contract import (
@@ -24,7 +27,17 @@ from .paths import (
     validate_user_id,
 )
 from .registry import compute_inputs_hash
-from .run_builder import RunBuilderError, create_run
+from .run_builder import (
+    CachedRunData,
+    PreparedRun,
+    RunBuilderError,
+    RunData,
+    cached_run_data,
+    create_run,
+    execute_run,
+    load_run_data,
+    prepare_run,
+)
 from .runs_root_probe import check_runs_root_writable
 
 _EXECUTION_MODE = "SIM_ONLY"
@@ -33,6 +46,11 @@ _EXPERIMENT_STATUS = {"COMPLETED", "PARTIAL", "FAILED"}
 _EXPERIMENT_LOCK_TIMEOUT_SECONDS = 0.2
 _EXPERIMENT_LOCK_TTL_SECONDS = 30.0
 _EXPERIMENT_LOCK_POLL_SECONDS = 0.02
+EXPERIMENT_WORKERS_ENV = "BUFF_EXPERIMENT_WORKERS"
+DEFAULT_EXPERIMENT_WORKERS = 2
+
+_EXECUTOR: ProcessPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
 
 
 @dataclass
@@ -79,13 +97,16 @@ class ExperimentLock:
                 return False
             time.sleep(max(self.poll_seconds, 0.001))
 
-    def _try_acquire(self) -> bool:
+    def _payload_bytes(self) -> bytes:
         payload = {
             "pid": os.getpid(),
             "acquired_at_unix": time.time(),
             "ttl_seconds": self.ttl_seconds,
         }
-        data = json.dumps(payload, sort_keys=True).encode("utf-8") + b"\n"
+        return json.dumps(payload, sort_keys=True).encode("utf-8") + b"\n"
+
+    def _try_acquire(self) -> bool:
+        data = self._payload_bytes()
         try:
             fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
         except FileExistsError:
@@ -110,6 +131,20 @@ class ExperimentLock:
             raise
         return True
 
+    def refresh(self) -> None:
+        """Re-stamp a held lock so long experiments are not taken for stale ones."""
+        if not self._acquired:
+            return
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp-{uuid.uuid4().hex}")
+        try:
+            tmp_path.write_bytes(self._payload_bytes())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
     def release(self) -> None:
         if not self._acquired:
             return
@@ -205,109 +240,67 @@ def create_experiment(
                     {"experiment_id": experiment_id},
                 )
 
-            candidate_results: list[dict[str, Any]] = []
-            comparison_rows: list[dict[str, Any]] = []
-            for index, candidate in enumerate(normalized["candidates"]):
-                candidate_id = str(candidate.get("candidate_id") or f"cand_{index + 1:03d}")
-                run_config = candidate.get("run_config")
-                if not isinstance(run_config, dict):
-                    raise ExperimentBuilderError(
-                        "EXPERIMENT_CONFIG_INVALID",
-                        "candidate.run_config must be an object",
-                        400,
-                        {"candidate_index": index, "candidate_id": candidate_id},
-                    )
+            total_candidates = len(normalized["candidates"])
+            progress_path = experiment_progress_path(experiments_root, experiment_id)
+
+            def record_progress(finished: list[dict[str, Any]]) -> None:
+                lock.refresh()
+                _write_progress_manifest(
+                    progress_path,
+                    owner_user_id=owner_user_id,
+                    experiment_id=experiment_id,
+                    experiment_digest=experiment_digest,
+                    normalized=normalized,
+                    candidate_results=finished,
+                    total_candidates=total_candidates,
+                )
 
-                result: dict[str, Any] = {
-                    "candidate_index": index,
-                    "candidate_id": candidate_id,
-                    "status": "FAILED",
-                    "run_id": None,
-                }
-                label = candidate.get("label")
-                if isinstance(label, str) and label.strip():
-                    result["label"] = label.strip()
+            try:
+                candidate_results, comparison_rows = _run_candidates(
+                    normalized["candidates"],
+                    owner_user_id=owner_user_id,
+                    runs_root=runs_root,
+                    on_progress=record_progress,
+                )
 
-                try:
-                    status_code, run_response = create_run(
-                        copy.deepcopy(run_config), user_id=owner_user_id
-                    )
-                    run_id = str(run_response.get("run_id") or "").strip()
-                    if not run_id:
-                        raise ExperimentBuilderError(
-                            "RUN_WRITE_FAILED",
-                            "Run creation returned empty run_id",
-                            500,
-                            {"candidate_index": index, "candidate_id": candidate_id},
-                        )
-                    run_status = _normalize_status(run_response.get("status"))
-                    metrics_payload = _load_run_metrics(runs_root, run_id)
-                    comparison_rows.append(
-                        _build_comparison_row(
-                            candidate_id=candidate_id,
-                            candidate_index=index,
-                            run_id=run_id,
-                            run_status=run_status,
-                            metrics_payload=metrics_payload,
-                        )
-                    )
-                    result.update(
-                        {
-                            "status": "COMPLETED",
-                            "run_id": run_id,
-                            "run_status": run_status,
-                            "run_status_code": status_code,
-                            "inputs_hash": run_response.get("inputs_hash"),
-                        }
-                    )
-                except (RunBuilderError, ExperimentBuilderError) as exc:
-                    result["status"] = "FAILED"
-                    result["error"] = exc.to_payload()
-                except Exception:
-                    result["status"] = "FAILED"
-                    result["error"] = {
-                        "code": "INTERNAL",
-                        "message": "Internal error",
-                        "details": {"candidate_index": index, "candidate_id": candidate_id},
-                    }
-                candidate_results.append(result)
-
-            succeeded = len(
-                [item for item in candidate_results if item.get("status") == "COMPLETED"]
-            )
-            failed = len(candidate_results) - succeeded
-            if failed == 0:
-                overall_status = "COMPLETED"
-            elif succeeded == 0:
-                overall_status = "FAILED"
-            else:
-                overall_status = "PARTIAL"
-
-            experiment_manifest = _build_manifest(
-                owner_user_id=owner_user_id,
-                experiment_id=experiment_id,
-                experiment_digest=experiment_digest,
-                normalized=normalized,
-                candidate_results=candidate_results,
-                overall_status=overall_status,
-                succeeded=succeeded,
-                failed=failed,
-            )
-            comparison_summary = _build_comparison_summary(
-                experiment_id=experiment_id,
-                experiment_digest=experiment_digest,
-                overall_status=overall_status,
-                total_candidates=len(candidate_results),
-                succeeded=succeeded,
-                failed=failed,
-                rows=comparison_rows,
-            )
-            _write_experiment_artifacts(
-                experiments_root=experiments_root,
-                experiment_dir=experiment_dir,
-                experiment_manifest=experiment_manifest,
-                comparison_summary=comparison_summary,
-            )
+                succeeded = len(
+                    [item for item in candidate_results if item.get("status") == "COMPLETED"]
+                )
+                failed = len(candidate_results) - succeeded
+                if failed == 0:
+                    overall_status = "COMPLETED"
+                elif succeeded == 0:
+                    overall_status = "FAILED"
+                else:
+                    overall_status = "PARTIAL"
+
+                experiment_manifest = _build_manifest(
+                    owner_user_id=owner_user_id,
+                    experiment_id=experiment_id,
+                    experiment_digest=experiment_digest,
+                    normalized=normalized,
+                    candidate_results=candidate_results,
+                    overall_status=overall_status,
+                    succeeded=succeeded,
+                    failed=failed,
+                )
+                comparison_summary = _build_comparison_summary(
+                    experiment_id=experiment_id,
+                    experiment_digest=experiment_digest,
+                    overall_status=overall_status,
+                    total_candidates=len(candidate_results),
+                    succeeded=succeeded,
+                    failed=failed,
+                    rows=comparison_rows,
+                )
+                _write_experiment_artifacts(
+                    experiments_root=experiments_root,
+                    experiment_dir=experiment_dir,
+                    experiment_manifest=experiment_manifest,
+                    comparison_summary=comparison_summary,
+                )
+            finally:
+                _remove_progress_manifest(progress_path)
 
             return 201, _success_response(
                 experiment_id=experiment_id,
@@ -326,6 +319,257 @@ def create_experiment(
         ) from exc
 
 
+def _run_candidates(
+    candidates: list[dict[str, Any]],
+    *,
+    owner_user_id: str,
+    runs_root: Path,
+    on_progress: Callable[[list[dict[str, Any]]], None],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Run every candidate; results and comparison rows come back in candidate order.
+
+    Each distinct dataset is loaded once and new runs execute on the shared
+    candidate executor. ``on_progress`` receives the finished results after every candidate.
+    """
+    results: dict[int, dict[str, Any]] = {}
+    rows: dict[int, dict[str, Any]] = {}
+
+    def finish(result: dict[str, Any], outcome: dict[str, Any]) -> None:
+        row = _complete_candidate(result, outcome, runs_root)
+        index = result["candidate_index"]
+        results[index] = result
+        if row is not None:
+            rows[index] = row
+        on_progress([results[key] for key in sorted(results)])
+
+    pending: list[tuple[dict[str, Any], PreparedRun]] = []
+    deferred: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    claimed_run_ids: set[str] = set()
+    for index, candidate in enumerate(candidates):
+        candidate_id = str(candidate.get("candidate_id") or f"cand_{index + 1:03d}")
+        run_config = candidate.get("run_config")
+        if not isinstance(run_config, dict):
+            raise ExperimentBuilderError(
+                "EXPERIMENT_CONFIG_INVALID",
+                "candidate.run_config must be an object",
+                400,
+                {"candidate_index": index, "candidate_id": candidate_id},
+            )
+
+        result: dict[str, Any] = {
+            "candidate_index": index,
+            "candidate_id": candidate_id,
+            "status": "FAILED",
+            "run_id": None,
+        }
+        label = candidate.get("label")
+        if isinstance(label, str) and label.strip():
+            result["label"] = label.strip()
+
+        outcome = _capture_outcome(prepare_run, copy.deepcopy(run_config), user_id=owner_user_id)
+        prepared = outcome.get("prepared")
+        if prepared is None:
+            finish(result, outcome)
+        elif prepared.run_id in claimed_run_ids:
+            # Resolves to a run an earlier candidate creates; answer it once that exists.
+            deferred.append((result, run_config))
+        else:
+            claimed_run_ids.add(prepared.run_id)
+            pending.append((result, prepared))
+
+    datasets, dataset_keys, dataset_errors = _load_candidate_datasets(
+        [prepared for _, prepared in pending]
+    )
+    runnable: list[tuple[dict[str, Any], PreparedRun, str]] = []
+    for (result, prepared), key in zip(pending, dataset_keys):
+        if key in dataset_errors:
+            finish(result, {"error": dataset_errors[key]})
+        else:
+            runnable.append((result, prepared, key))
+    _execute_candidates(runnable, datasets, on_outcome=finish)
+
+    for result, run_config in deferred:
+        finish(
+            result,
+            _capture_outcome(create_run, copy.deepcopy(run_config), user_id=owner_user_id),
+        )
+
+    return [results[key] for key in sorted(results)], [rows[key] for key in sorted(rows)]
+
+
+def _capture_outcome(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> dict[str, Any]:
+    try:
+        value = fn(*args, **kwargs)
+    except (RunBuilderError, ExperimentBuilderError) as exc:
+        return {"error": exc.to_payload()}
+    except Exception:
+        return {"error": None}
+    if isinstance(value, PreparedRun):
+        return {"prepared": value}
+    status_code, response = value
+    return {"status_code": status_code, "response": response}
+
+
+def _complete_candidate(
+    result: dict[str, Any], outcome: dict[str, Any], runs_root: Path
+) -> dict[str, Any] | None:
+    index = result["candidate_index"]
+    candidate_id = result["candidate_id"]
+    try:
+        if "error" in outcome:
+            if outcome["error"] is None:
+                raise RuntimeError("candidate run failed")
+            result["error"] = outcome["error"]
+            return None
+        run_response = outcome["response"]
+        run_id = str(run_response.get("run_id") or "").strip()
+        if not run_id:
+            raise ExperimentBuilderError(
+                "RUN_WRITE_FAILED",
+                "Run creation returned empty run_id",
+                500,
+                {"candidate_index": index, "candidate_id": candidate_id},
+            )
+        run_status = _normalize_status(run_response.get("status"))
+        metrics_payload = _load_run_metrics(runs_root, run_id)
+    except ExperimentBuilderError as exc:
+        result["error"] = exc.to_payload()
+        return None
+    except Exception:
+        result["error"] = {
+            "code": "INTERNAL",
+            "message": "Internal error",
+            "details": {"candidate_index": index, "candidate_id": candidate_id},
+        }
+        return None
+
+    result.update(
+        {
+            "status": "COMPLETED",
+            "run_id": run_id,
+            "run_status": run_status,
+            "run_status_code": outcome["status_code"],
+            "inputs_hash": run_response.get("inputs_hash"),
+        }
+    )
+    return _build_comparison_row(
+        candidate_id=candidate_id,
+        candidate_index=index,
+        run_id=run_id,
+        run_status=run_status,
+        metrics_payload=metrics_payload,
+    )
+
+
+def _load_candidate_datasets(
+    prepared_runs: list[PreparedRun],
+) -> tuple[dict[str, RunData], list[str], dict[str, dict[str, Any] | None]]:
+    """Load each distinct data source once, keyed by its canonical form."""
+    datasets: dict[str, RunData] = {}
+    errors: dict[str, dict[str, Any] | None] = {}
+    keys: list[str] = []
+    for prepared in prepared_runs:
+        data_source = prepared.normalized["data_source"]
+        key = to_canonical_bytes(data_source).decode("utf-8")
+        keys.append(key)
+        if key in datasets or key in errors:
+            continue
+        try:
+            datasets[key] = load_run_data(data_source)
+        except RunBuilderError as exc:
+            errors[key] = exc.to_payload()
+        except Exception:
+            errors[key] = None
+    return datasets, keys, errors
+
+
+def _experiment_workers() -> int:
+    raw = (os.getenv(EXPERIMENT_WORKERS_ENV) or "").strip()
+    try:
+        workers = int(raw) if raw else DEFAULT_EXPERIMENT_WORKERS
+    except ValueError:
+        workers = DEFAULT_EXPERIMENT_WORKERS
+    return max(workers, 1)
+
+
+def _experiment_mp_context() -> multiprocessing.context.BaseContext:
+    # Never fork: the API process is threaded (request threadpool, run queue workers).
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def get_experiment_executor() -> ProcessPoolExecutor:
+    """Return the process-wide candidate pool, sized from ``BUFF_EXPERIMENT_WORKERS``.
+
+    All experiments share it, so concurrent requests cannot multiply the
+    number of candidate runs in flight. It is created on first use.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ProcessPoolExecutor(
+                max_workers=_experiment_workers(), mp_context=_experiment_mp_context()
+            )
+        return _EXECUTOR
+
+
+def shutdown_experiment_executor(*, wait: bool = True) -> None:
+    """Stop the candidate pool; the next experiment starts a fresh one."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _execute_in_worker(prepared: PreparedRun, data: RunData | CachedRunData) -> dict[str, Any]:
+    return _capture_outcome(_execute_with_data, prepared, data)
+
+
+def _execute_with_data(
+    prepared: PreparedRun, data: RunData | CachedRunData
+) -> tuple[int, dict[str, Any]]:
+    if isinstance(data, CachedRunData):
+        data = data.load()
+    return execute_run(prepared, data=data)
+
+
+def _execute_candidates(
+    runnable: list[tuple[dict[str, Any], PreparedRun, str]],
+    datasets: dict[str, RunData],
+    *,
+    on_outcome: Callable[[dict[str, Any], dict[str, Any]], None],
+) -> None:
+    """Execute candidate runs on the shared process pool, reporting as each finishes.
+
+    Workers map each dataset from the dataset cache ``load_run_data`` filled;
+    frames are only pickled over when that cache is unavailable.
+    """
+    if len(runnable) <= 1 or _experiment_workers() <= 1:
+        for result, prepared, key in runnable:
+            on_outcome(result, _capture_outcome(execute_run, prepared, data=datasets[key]))
+        return
+
+    shipped: dict[str, RunData | CachedRunData] = {}
+    for _, prepared, key in runnable:
+        if key not in shipped:
+            data_source = prepared.normalized["data_source"]
+            shipped[key] = cached_run_data(data_source, datasets[key]) or datasets[key]
+
+    executor = get_experiment_executor()
+    futures = {
+        executor.submit(_execute_in_worker, prepared, shipped[key]): result
+        for result, prepared, key in runnable
+    }
+    for future in as_completed(futures):
+        try:
+            outcome = future.result()
+        except Exception:
+            outcome = {"error": None}
+        on_outcome(futures[future], outcome)
+
+
 def _resolve_runs_root() -> Path:
     runs_root = get_runs_root()
     if runs_root is None:
@@ -623,6 +867,49 @@ def write_json_atomic(path: Path, payload: object) -> None:
         raise ExperimentBuilderError("RUN_WRITE_FAILED", str(exc), 500) from exc
 
 
+def _experiment_temp_dir(experiments_root: Path, experiment_dir: Path) -> Path:
+    return experiments_root / f".tmp_{experiment_dir.name}"
+
+
+def experiment_progress_path(experiments_root: Path, experiment_id: str) -> Path:
+    """Where a running experiment publishes its progress manifest until it is written."""
+    return experiments_root / ".progress" / f"{experiment_id}.json"
+
+
+def _write_progress_manifest(
+    progress_path: Path,
+    *,
+    owner_user_id: str,
+    experiment_id: str,
+    experiment_digest: str,
+    normalized: dict[str, Any],
+    candidate_results: list[dict[str, Any]],
+    total_candidates: int,
+) -> None:
+    """Publish finished candidates at ``progress_path`` while the experiment runs."""
+    succeeded = len([item for item in candidate_results if item.get("status") == "COMPLETED"])
+    manifest = _build_manifest(
+        owner_user_id=owner_user_id,
+        experiment_id=experiment_id,
+        experiment_digest=experiment_digest,
+        normalized=normalized,
+        candidate_results=candidate_results,
+        overall_status="RUNNING",
+        succeeded=succeeded,
+        failed=len(candidate_results) - succeeded,
+    )
+    manifest["status_history"] = ["CREATED", "RUNNING"]
+    manifest["summary"]["total_candidates"] = total_candidates
+    write_json_atomic(progress_path, manifest)
+
+
+def _remove_progress_manifest(progress_path: Path) -> None:
+    try:
+        progress_path.unlink()
+    except OSError:
+        pass
+
+
 def _write_experiment_artifacts(
     *,
     experiments_root: Path,
@@ -630,7 +917,7 @@ def _write_experiment_artifacts(
     experiment_manifest: dict[str, Any],
     comparison_summary: dict[str, Any],
 ) -> None:
-    temp_dir = experiments_root / f".tmp_{experiment_dir.name}"
+    temp_dir = _experiment_temp_dir(experiments_root, experiment_dir)
     _cleanup_temp_dir(temp_dir)
     temp_dir.mkdir(parents=True, exist_ok=True)
     try:
@@ -83,3 +83,32 @@ def normalize_numbers(value: Any) -> Any:
         return normalized
 
     raise TypeError(f"Unsupported type for numeric normalization: {type(value).__name__}")
+
+
+# Below _FAST_QUANT_LIMIT a float equal to its 8-decimal rounding has at most 8
+# decimals in its shortest repr, so quantizing it is the identity. Below
+# _NEAR_QUANT_LIMIT the repr is within 1.2e-10 of the float, so a float within
+# _NEAR_QUANT_TOLERANCE of the 8-decimal grid quantizes to that grid point.
+_FAST_QUANT_LIMIT = float(2**53) / 1e8
+_NEAR_QUANT_LIMIT = float(2**20)
+_NEAR_QUANT_TOLERANCE = 1e-9
+
+
+def normalize_float_array(values: Any) -> Any:
+    """Apply the float policy to an array, returning the floats JSON readers would see.
+
+    Only values near a rounding boundary go through Decimal.
+    """
+    if np is None:  # pragma: no cover - optional
+        raise RuntimeError("numpy is required for array normalization")
+    out = np.array(values, dtype="float64", copy=True)
+    out[out == 0] = 0.0
+    with np.errstate(invalid="ignore"):
+        rounded = np.round(out, 8)
+        magnitude = np.abs(out)
+        settled = (rounded == out) & (magnitude < _FAST_QUANT_LIMIT)
+        near = (np.abs(out - rounded) <= _NEAR_QUANT_TOLERANCE) & (magnitude < _NEAR_QUANT_LIMIT)
+    out[near] = rounded[near]
+    for idx in np.flatnonzero(~(settled | near)):
+        out[idx] = float(_normalize_float(float(out[idx])))
+    return out
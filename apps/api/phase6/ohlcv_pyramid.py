@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Mapping
+
+import numpy as np
+import pyarrow as pa
+
+from .numeric import normalize_float_array
+
+PYRAMID_DIRNAME = ".index"
+PYRAMID_SCHEMA_VERSION = "phase6.ohlcv_pyramid.v1"
+PYRAMID_FACTOR = 4
+PYRAMID_CACHE_MAX_ENTRIES = 32
+_METADATA_KEY = b"buff.ohlcv_pyramid"
+_VALUE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+_PYRAMID_CACHE: OrderedDict[tuple[str, int, int], OhlcvPyramid] = OrderedDict()
+_PYRAMID_CACHE_LOCK = Lock()
+
+
+class OhlcvPyramid:
+    """OHLCV levels where each candle of level ``k`` aggregates ``PYRAMID_FACTOR**k`` bars.
+
+    Level 0 is the base series. All levels share one table, level after level,
+    so a window lookup is a binary search per level over memory-mapped columns.
+    """
+
+    def __init__(
+        self,
+        table: pa.Table,
+        levels: list[tuple[int, int]],
+        factor: int,
+        source: dict[str, int],
+    ) -> None:
+        self._table = table
+        self.levels = levels
+        self.factor = factor
+        self.source = source
+        self._ts = _column(table, "ts")
+        self._values = {name: _column(table, name) for name in _VALUE_COLUMNS}
+
+    def window(
+        self, start_ms: int | None, end_ms: int | None, max_points: int
+    ) -> tuple[int, int, int]:
+        """Return ``(level, lo, hi)``: the finest level with at most ``max_points`` candles
+        whose first bar falls in ``[start_ms, end_ms]``, as table row bounds."""
+        # The top level is a single candle, so the loop always returns.
+        for level, (offset, rows) in enumerate(self.levels):
+            ts = self._ts[offset : offset + rows]
+            lo = 0 if start_ms is None else int(np.searchsorted(ts, start_ms, side="left"))
+            hi = rows if end_ms is None else int(np.searchsorted(ts, end_ms, side="right"))
+            if hi - lo <= max_points or level == len(self.levels) - 1:
+                return level, offset + lo, offset + max(lo, hi)
+        return 0, 0, 0
+
+    def candles(self, lo: int, hi: int) -> list[dict[str, Any]]:
+        stamps = np.datetime_as_string(self._ts[lo:hi].astype("datetime64[ms]"), unit="ms")
+        values = [self._values[name][lo:hi].tolist() for name in _VALUE_COLUMNS]
+        return [
+            {"ts": f"{stamp}Z", "open": o, "high": h, "low": low, "close": c, "volume": v}
+            for stamp, o, h, low, c, v in zip(stamps.tolist(), *values)
+        ]
+
+
+def _column(table: pa.Table, name: str) -> np.ndarray:
+    column = table.column(name)
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy(zero_copy_only=False)
+    return column.to_numpy()
+
+
+def pyramid_path(ohlcv_path: Path) -> Path:
+    """Where the pyramid for a base OHLCV artifact lives (outside the artifact listing)."""
+    stem = ohlcv_path.name.rsplit(".", 1)[0]
+    return ohlcv_path.parent / PYRAMID_DIRNAME / f"{stem}.pyramid.arrow"
+
+
+def build_pyramid(
+    ts_ms: np.ndarray, columns: Mapping[str, np.ndarray], source: Mapping[str, int]
+) -> pa.Table:
+    """Aggregate the base series level by level until a single candle remains.
+
+    Candles group ``PYRAMID_FACTOR`` consecutive candles of the level below
+    (first open, max high, min low, last close, summed volume) and carry the
+    first bar's timestamp. Values follow the artifact numeric policy.
+    """
+    level_ts = np.asarray(ts_ms, dtype="int64")
+    level = {name: normalize_float_array(columns[name]) for name in _VALUE_COLUMNS}
+    parts_ts = [level_ts]
+    parts = {name: [level[name]] for name in _VALUE_COLUMNS}
+    levels = [(0, len(level_ts))]
+    while len(level_ts) > 1:
+        starts = np.arange(0, len(level_ts), PYRAMID_FACTOR)
+        ends = np.minimum(starts + PYRAMID_FACTOR, len(level_ts)) - 1
+        level = {
+            "open": level["open"][starts],
+            "high": np.maximum.reduceat(level["high"], starts),
+            "low": np.minimum.reduceat(level["low"], starts),
+            "close": level["close"][ends],
+            "volume": normalize_float_array(np.add.reduceat(level["volume"], starts)),
+        }
+        level_ts = level_ts[starts]
+        levels.append((levels[-1][0] + levels[-1][1], len(level_ts)))
+        parts_ts.append(level_ts)
+        for name in _VALUE_COLUMNS:
+            parts[name].append(level[name])
+
+    metadata = {
+        "schema_version": PYRAMID_SCHEMA_VERSION,
+        "factor": PYRAMID_FACTOR,
+        "levels": levels,
+        "source": dict(source),
+    }
+    arrays = {"ts": pa.array(np.concatenate(parts_ts), type=pa.int64())}
+    for name in _VALUE_COLUMNS:
+        arrays[name] = pa.array(np.concatenate(parts[name]), type=pa.float64())
+    table = pa.table(arrays)
+    return table.replace_schema_metadata({_METADATA_KEY: json.dumps(metadata, sort_keys=True)})
+
+
+def source_stamp(path: Path) -> dict[str, int]:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def write_pyramid(path: Path, table: pa.Table) -> None:
+    """Store ``table`` as an Arrow IPC file; failures only cost a rebuild on the next read."""
+    tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}-{uuid.uuid4().hex}")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+        os.replace(tmp_path, path)
+    except (OSError, pa.ArrowException):
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def pyramid_from_table(table: pa.Table, source: Mapping[str, int]) -> OhlcvPyramid | None:
+    """Wrap ``table`` if it is a current pyramid of the base file stamped ``source``."""
+    raw = (table.schema.metadata or {}).get(_METADATA_KEY)
+    try:
+        metadata = json.loads(raw) if raw else None
+    except ValueError:
+        metadata = None
+    if (
+        not isinstance(metadata, dict)
+        or metadata.get("schema_version") != PYRAMID_SCHEMA_VERSION
+        or metadata.get("source") != dict(source)
+    ):
+        return None
+    levels = [(int(offset), int(rows)) for offset, rows in metadata["levels"]]
+    return OhlcvPyramid(table, levels, int(metadata["factor"]), dict(source))
+
+
+def read_pyramid(ohlcv_path: Path) -> OhlcvPyramid | None:
+    """Memory-map the stored pyramid of ``ohlcv_path``; ``None`` if missing or stale."""
+    path = pyramid_path(ohlcv_path)
+    try:
+        stat = path.stat()
+        source = source_stamp(ohlcv_path)
+    except OSError:
+        return None
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _PYRAMID_CACHE_LOCK:
+        cached = _PYRAMID_CACHE.get(key)
+        if cached is not None:
+            _PYRAMID_CACHE.move_to_end(key)
+    if cached is None:
+        try:
+            table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        except (OSError, pa.ArrowException):
+            return None
+        cached = pyramid_from_table(table, source)
+        if cached is None:
+            return None
+        with _PYRAMID_CACHE_LOCK:
+            _PYRAMID_CACHE[key] = cached
+            while len(_PYRAMID_CACHE) > PYRAMID_CACHE_MAX_ENTRIES:
+                _PYRAMID_CACHE.popitem(last=False)
+    elif cached.source != source:
+        return None
+    return cached
@@ -3,10 +3,12 @@ from __future__ import annotations
 import json
 import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
 from pathlib import Path
+from threading import Lock
 from typing import Any
 
 from .canonical import write_canonical_json
@@ -44,6 +46,11 @@ JSON_VALIDATION_ARTIFACTS = (
     "metrics.json",
 )
 
+REGISTRY_CACHE_MAX_ENTRIES = 16384
+REGISTRY_CACHE_SETTLE_NS = 2_000_000_000
+_ARTIFACT_EVAL_CACHE: OrderedDict[str, tuple[tuple[Any, ...], str]] = OrderedDict()
+_ARTIFACT_EVAL_CACHE_LOCK = Lock()
+
 
 @dataclass
 class RegistryLock:
@@ -260,6 +267,63 @@ def _evaluate_artifacts(run_dir: Path) -> dict[str, Any]:
     }
 
 
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _run_dir_fingerprint(run_dir: Path) -> tuple[Any, ...] | None:
+    """Stat everything ``_evaluate_artifacts`` depends on.
+
+    Adding, removing or renaming a file bumps the directory's mtime; the parsed
+    JSON artifacts are stat'ed individually since in-place edits do not.
+    Returns ``None`` while anything changed within the last
+    ``REGISTRY_CACHE_SETTLE_NS``: coarse filesystem timestamps could otherwise
+    hide a second change made in the same tick.
+    """
+    fingerprint = (
+        _stat_key(run_dir),
+        *(_stat_key(run_dir / name) for name in JSON_VALIDATION_ARTIFACTS + TIMELINE_ARTIFACTS),
+    )
+    if fingerprint[0] is None:
+        return None
+    settled_before = time.time_ns() - REGISTRY_CACHE_SETTLE_NS
+    if any(key is not None and key[0] > settled_before for key in fingerprint):
+        return None
+    return fingerprint
+
+
+def _evaluate_artifacts_cached(run_dir: Path) -> dict[str, Any]:
+    key = str(run_dir)
+    fingerprint = _run_dir_fingerprint(run_dir)
+    if fingerprint is None:
+        return _evaluate_artifacts(run_dir)
+    with _ARTIFACT_EVAL_CACHE_LOCK:
+        cached = _ARTIFACT_EVAL_CACHE.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            _ARTIFACT_EVAL_CACHE.move_to_end(key)
+            return json.loads(cached[1])
+    artifact_eval = _evaluate_artifacts(run_dir)
+    with _ARTIFACT_EVAL_CACHE_LOCK:
+        _ARTIFACT_EVAL_CACHE[key] = (fingerprint, json.dumps(artifact_eval))
+        _ARTIFACT_EVAL_CACHE.move_to_end(key)
+        while len(_ARTIFACT_EVAL_CACHE) > REGISTRY_CACHE_MAX_ENTRIES:
+            _ARTIFACT_EVAL_CACHE.popitem(last=False)
+    return artifact_eval
+
+
+def invalidate_registry_cache(run_dir: Path | None = None) -> None:
+    """Drop cached artifact evaluations for ``run_dir`` (or all run dirs)."""
+    with _ARTIFACT_EVAL_CACHE_LOCK:
+        if run_dir is None:
+            _ARTIFACT_EVAL_CACHE.clear()
+        else:
+            _ARTIFACT_EVAL_CACHE.pop(str(run_dir), None)
+
+
 def _derive_status_and_health(
     missing_artifacts: list[str],
     invalid_artifacts: list[str],
@@ -301,7 +365,7 @@ def build_registry_entry(
     migrated_from_legacy: bool | None = None,
 ) -> dict[str, Any]:
     run_id = str(manifest.get("run_id") or run_dir.name)
-    artifact_eval = _evaluate_artifacts(run_dir)
+    artifact_eval = _evaluate_artifacts_cached(run_dir)
     status, health = _derive_status_and_health(
         artifact_eval["missing_artifacts"],
         artifact_eval["invalid_artifacts"],
@@ -451,6 +515,7 @@ def upsert_registry_entry(
     registry = _load_registry_payload(user_root_path)
     runs = registry.get("runs", [])
     owner_user_id = _user_id_from_user_root(user_root_path)
+    invalidate_registry_cache(run_dir)
     entry = build_registry_entry(
         run_dir,
         manifest,
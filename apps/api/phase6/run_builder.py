@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
 import os
 import re
@@ -12,12 +13,16 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from buff.data.resample import resample_ohlcv
 
 from .canonical import to_canonical_bytes, write_canonical_json, write_canonical_jsonl
+from .dataset_cache import dataset_cache_path, read_cached_frame, write_cached_frame
 from .engine import EngineConfig, run_engine
-from .numeric import NonFiniteNumberError
+from .numeric import NonFiniteNumberError, normalize_float_array
+from .ohlcv_pyramid import build_pyramid, pyramid_path, source_stamp, write_pyramid
 from .paths import (
     RUNS_ROOT_ENV,
     get_runs_root,
@@ -29,6 +34,7 @@ from .paths import (
 )
 from .runs_root_probe import check_runs_root_writable
 from .registry import compute_inputs_hash, lock_registry, upsert_registry_entry
+from .run_queue import ProgressFn, RunQueue, get_run_queue
 
 ENGINE_VERSION = "phase6-1.0.0"
 BUILDER_VERSION = "phase6-1.0.0"
@@ -38,6 +44,10 @@ _CAPABILITIES = ["SIMULATION", "DATA_READONLY"]
 
 RUN_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{2,63}$")
 
+ARTIFACT_PROFILE_JSON = "json"
+ARTIFACT_PROFILE_COLUMNAR = "columnar"
+ARTIFACT_PROFILES = (ARTIFACT_PROFILE_JSON, ARTIFACT_PROFILE_COLUMNAR)
+
 _BUILTIN_STRATEGIES: tuple[dict[str, Any], ...] = (
     {
         "id": "hold",
@@ -164,9 +174,101 @@ def normalize_strategy_request(strategy: dict[str, Any]) -> tuple[str, dict[str,
     return strategy_id, {}
 
 
+@dataclass(frozen=True)
+class PreparedRun:
+    """A validated run request whose run dir does not exist yet; see ``prepare_run``."""
+
+    run_id: str
+    owner_user_id: str
+    owner_root: Path
+    runs_root: Path
+    run_dir: Path
+    normalized: dict[str, Any]
+    meta: dict[str, Any]
+    inputs_hash: str
+
+
+@dataclass(frozen=True)
+class RunData:
+    """Loaded inputs for ``execute_run``: the 1m frame, its metadata and the run timeframe."""
+
+    df_1m: pd.DataFrame
+    data_meta: dict[str, Any]
+    df_tf: pd.DataFrame
+
+
+@dataclass(frozen=True)
+class CachedRunData:
+    """A ``RunData`` referenced by its dataset-cache files, for runs in worker processes.
+
+    ``df_tf_path`` is None for 1m runs, whose run frame is a copy of the 1m frame.
+    An entry evicted before the worker reads it is rebuilt from ``data_source``.
+    """
+
+    df_1m_path: Path
+    data_meta: dict[str, Any]
+    df_tf_path: Path | None
+    data_source: dict[str, Any]
+
+    def load(self) -> RunData:
+        df_1m = read_cached_frame(self.df_1m_path)
+        if df_1m is None:
+            return load_run_data(self.data_source)
+        if self.df_tf_path is None:
+            return RunData(df_1m, self.data_meta, df_1m.copy())
+        df_tf = read_cached_frame(self.df_tf_path)
+        if df_tf is None:
+            return load_run_data(self.data_source)
+        return RunData(df_1m, self.data_meta, df_tf)
+
+
 def create_run(
     payload: dict[str, Any], *, user_id: str | None = None
 ) -> tuple[int, dict[str, Any]]:
+    prepared = prepare_run(payload, user_id=user_id)
+    if not isinstance(prepared, PreparedRun):
+        return prepared
+    return execute_run(prepared)
+
+
+def submit_run(
+    payload: dict[str, Any],
+    *,
+    user_id: str | None = None,
+    queue: RunQueue | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Validate ``payload`` and queue the run; returns 202 while it executes.
+
+    Requests resolving to an existing run are answered like ``create_run``.
+    """
+    prepared = prepare_run(payload, user_id=user_id)
+    if not isinstance(prepared, PreparedRun):
+        return prepared
+    queue = queue or get_run_queue()
+    job = queue.submit(
+        prepared.owner_user_id,
+        prepared.run_id,
+        prepared.inputs_hash,
+        lambda report: execute_run(prepared, progress=report),
+    )
+    if job["inputs_hash"] != prepared.inputs_hash:
+        raise RunBuilderError(
+            "RUN_EXISTS", "run_id already exists", 409, {"run_id": prepared.run_id}
+        )
+    response = _success_response(prepared.run_id, job["state"], prepared.inputs_hash)
+    response["message"] = "run queued"
+    response["links"]["status"] = f"/api/v1/runs/{prepared.run_id}/status"
+    return 202, response
+
+
+def prepare_run(
+    payload: dict[str, Any], *, user_id: str | None
+) -> PreparedRun | tuple[int, dict[str, Any]]:
+    """Validate ``payload`` and resolve its run dir.
+
+    Returns the ``create_run`` response when the run already exists with the
+    same inputs, otherwise a ``PreparedRun`` for ``execute_run``.
+    """
     if not isinstance(payload, dict):
         raise RunBuilderError("RUN_CONFIG_INVALID", "Request body must be an object", 400)
 
@@ -226,8 +328,36 @@ def create_run(
             )
         raise RunBuilderError("RUN_EXISTS", "run_id already exists", 409, {"run_id": run_id})
 
-    df_1m, data_meta = _load_and_validate_csv(normalized["data_source"])
-    df_tf = _align_timeframe(df_1m, normalized["data_source"]["timeframe"])
+    return PreparedRun(
+        run_id=run_id,
+        owner_user_id=owner_user_id,
+        owner_root=owner_root,
+        runs_root=runs_root,
+        run_dir=run_dir,
+        normalized=normalized,
+        meta=meta,
+        inputs_hash=inputs_hash,
+    )
+
+
+def execute_run(
+    prepared: PreparedRun,
+    *,
+    progress: ProgressFn | None = None,
+    data: RunData | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Simulate ``prepared`` and publish its run dir.
+
+    ``data`` lets callers that share a dataset across runs pass it pre-loaded.
+    """
+    report = progress or (lambda stage, percent: None)
+    run_id = prepared.run_id
+    normalized = prepared.normalized
+
+    report("LOADING_DATA", 5)
+    if data is None:
+        data = load_run_data(normalized["data_source"])
+    df_1m, data_meta, df_tf = data.df_1m, data.data_meta, data.df_tf
 
     created_at = _format_ts(df_1m["ts"].iloc[0].to_pydatetime())
 
@@ -242,14 +372,17 @@ def create_run(
         initial_equity=INITIAL_EQUITY,
     )
 
+    report("SIMULATING", 15)
     try:
-        engine_result = run_engine(df_tf, engine_config)
+        engine_result = run_engine(
+            df_tf,
+            engine_config,
+            run_id=run_id,
+            progress=lambda done, total: report("SIMULATING", 15 + (70 * done) // total),
+        )
     except ValueError as exc:
         raise RunBuilderError("RUN_CONFIG_INVALID", str(exc), 400)
 
-    for decision in engine_result.decisions:
-        decision["run_id"] = run_id
-
     status_history = ["CREATED", "VALIDATED", "RUNNING", "COMPLETED"]
 
     config_payload = _build_config_payload(run_id, normalized)
@@ -257,17 +390,18 @@ def create_run(
 
     manifest = _build_manifest(
         run_id=run_id,
-        owner_user_id=owner_user_id,
+        owner_user_id=prepared.owner_user_id,
         created_at=created_at,
         inputs=normalized,
-        inputs_hash=inputs_hash,
+        inputs_hash=prepared.inputs_hash,
         status="COMPLETED",
         status_history=status_history,
         data_meta=data_meta,
-        meta=meta,
+        meta=prepared.meta,
     )
 
-    temp_dir = runs_root / f".tmp_{run_id}_{uuid.uuid4().hex[:8]}"
+    report("WRITING_ARTIFACTS", 85)
+    temp_dir = prepared.runs_root / f".tmp_{run_id}_{uuid.uuid4().hex[:8]}"
     try:
         _write_artifacts(
             temp_dir,
@@ -278,8 +412,8 @@ def create_run(
             df_1m,
             df_tf,
         )
-        _atomic_rename(temp_dir, run_dir)
-        _register_run(owner_root, run_dir, manifest)
+        _atomic_rename(temp_dir, prepared.run_dir)
+        _register_run(prepared.owner_root, prepared.run_dir, manifest)
     except NonFiniteNumberError as exc:
         _cleanup_temp_dir(temp_dir)
         raise RunBuilderError("DATA_INVALID", "Non-finite numeric value", 400) from exc
@@ -290,7 +424,7 @@ def create_run(
         _cleanup_temp_dir(temp_dir)
         raise RunBuilderError("RUN_WRITE_FAILED", str(exc), 500) from exc
 
-    return 201, _success_response(run_id, "COMPLETED", inputs_hash)
+    return 201, _success_response(run_id, "COMPLETED", prepared.inputs_hash)
 
 
 def _resolve_runs_root() -> Path:
@@ -438,6 +572,15 @@ def _normalize_request(payload: dict[str, Any]) -> tuple[dict[str, Any], dict[st
     except (TypeError, ValueError):
         seed_val = 0
 
+    artifact_profile = payload.get("artifact_profile", ARTIFACT_PROFILE_JSON)
+    if artifact_profile not in ARTIFACT_PROFILES:
+        raise RunBuilderError(
+            "RUN_CONFIG_INVALID",
+            "artifact_profile must be json or columnar",
+            400,
+            details={"field": "artifact_profile"},
+        )
+
     normalized = {
         "schema_version": schema_version,
         "data_source": {
@@ -455,6 +598,8 @@ def _normalize_request(payload: dict[str, Any]) -> tuple[dict[str, Any], dict[st
         "seed": seed_val,
     }
 
+    if artifact_profile != ARTIFACT_PROFILE_JSON:
+        normalized["artifact_profile"] = artifact_profile
     if start_ts is not None:
         normalized["data_source"]["start_ts"] = _format_ts(_parse_ts(start_ts))
     if end_ts is not None:
@@ -586,6 +731,34 @@ def _load_and_validate_csv(data_source: dict[str, Any]) -> tuple[pd.DataFrame, d
             400,
             {"path": path},
         )
+
+    cache_path = _dataset_cache_path(source_path, data_source, "1m")
+    df_out = read_cached_frame(cache_path) if cache_path is not None else None
+    if df_out is None:
+        df_out = _parse_and_validate_csv(source_path, data_source)
+        if cache_path is not None:
+            write_cached_frame(cache_path, df_out)
+
+    return df_out, {
+        "source_path": normalized_path,
+        "start_ts": _format_ts(df_out["ts"].iloc[0].to_pydatetime()),
+        "end_ts": _format_ts(df_out["ts"].iloc[-1].to_pydatetime()),
+    }
+
+
+def _dataset_cache_path(
+    source_path: Path, data_source: dict[str, Any], timeframe: str
+) -> Path | None:
+    runs_root = get_runs_root()
+    if runs_root is None or not runs_root.is_dir():
+        return None
+    try:
+        return dataset_cache_path(runs_root, source_path, data_source, timeframe)
+    except OSError:
+        return None
+
+
+def _parse_and_validate_csv(source_path: Path, data_source: dict[str, Any]) -> pd.DataFrame:
     try:
         df = pd.read_csv(source_path)
     except Exception as exc:
@@ -668,11 +841,38 @@ def _load_and_validate_csv(data_source: dict[str, Any]) -> tuple[pd.DataFrame, d
     if not diffs.eq(pd.Timedelta(minutes=1)).all():
         raise RunBuilderError("DATA_INVALID", "input data must be 1m with no gaps", 400)
 
-    return df_out, {
-        "source_path": normalized_path,
-        "start_ts": _format_ts(df_out["ts"].iloc[0].to_pydatetime()),
-        "end_ts": _format_ts(df_out["ts"].iloc[-1].to_pydatetime()),
-    }
+    return df_out
+
+
+def load_run_data(data_source: dict[str, Any]) -> RunData:
+    """Load the validated 1m frame and its run timeframe, via the dataset cache."""
+    df_1m, data_meta = _load_and_validate_csv(data_source)
+    timeframe = data_source["timeframe"]
+    cache_path = None
+    if timeframe != "1m":
+        _, source_path = _resolve_source_path(str(data_source["path"]))
+        cache_path = _dataset_cache_path(source_path, data_source, timeframe)
+    df_tf = read_cached_frame(cache_path) if cache_path is not None else None
+    if df_tf is None:
+        df_tf = _align_timeframe(df_1m, timeframe)
+        if cache_path is not None:
+            write_cached_frame(cache_path, df_tf)
+    return RunData(df_1m, data_meta, df_tf)
+
+
+def cached_run_data(data_source: dict[str, Any], data: RunData) -> CachedRunData | None:
+    """Reference ``data`` through the cache entries ``load_run_data`` wrote, if they exist."""
+    _, source_path = _resolve_source_path(str(data_source["path"]))
+    path_1m = _dataset_cache_path(source_path, data_source, "1m")
+    if path_1m is None or not path_1m.is_file():
+        return None
+    timeframe = data_source["timeframe"]
+    if timeframe == "1m":
+        return CachedRunData(path_1m, data.data_meta, None, data_source)
+    path_tf = _dataset_cache_path(source_path, data_source, timeframe)
+    if path_tf is None or not path_tf.is_file():
+        return None
+    return CachedRunData(path_1m, data.data_meta, path_tf, data_source)
 
 
 def _align_timeframe(df_1m: pd.DataFrame, timeframe: str) -> pd.DataFrame:
@@ -743,6 +943,8 @@ def _build_manifest(
 ) -> dict[str, Any]:
     data_source = inputs["data_source"]
     strategy = inputs["strategy"]
+    profile = inputs.get("artifact_profile", ARTIFACT_PROFILE_JSON)
+    ohlcv_suffix = "parquet" if profile == ARTIFACT_PROFILE_COLUMNAR else "jsonl"
     manifest = {
         "schema_version": inputs.get("schema_version"),
         "run_id": run_id,
@@ -779,11 +981,13 @@ def _build_manifest(
                 "config.json",
                 "equity_curve.json",
                 "trades.jsonl",
-                "ohlcv_1m.jsonl",
-                f"ohlcv_{data_source.get('timeframe')}.jsonl",
+                f"ohlcv_1m.{ohlcv_suffix}",
+                f"ohlcv_{data_source.get('timeframe')}.{ohlcv_suffix}",
             ],
         },
     }
+    if profile != ARTIFACT_PROFILE_JSON:
+        manifest["artifacts"]["profile"] = profile
     meta_payload: dict[str, Any] = {}
     if meta:
         meta_payload.update(meta)
@@ -803,10 +1007,25 @@ def _write_artifacts(
 ) -> None:
     run_dir.mkdir(parents=True, exist_ok=True)
 
+    timeframe = manifest["data"]["timeframe"]
+    ohlcv_frames = {"ohlcv_1m": df_1m, f"ohlcv_{timeframe}": df_tf}
+    if manifest["artifacts"].get("profile") == ARTIFACT_PROFILE_COLUMNAR:
+        digests: dict[str, str] = {}
+        for stem, df in ohlcv_frames.items():
+            digests[f"{stem}.parquet"] = _write_ohlcv_parquet(run_dir / f"{stem}.parquet", df)
+        manifest["artifacts"]["digests"] = digests
+        ohlcv_suffix = "parquet"
+    else:
+        for stem, df in ohlcv_frames.items():
+            write_canonical_jsonl(run_dir / f"{stem}.jsonl", _ohlcv_records(df))
+        ohlcv_suffix = "jsonl"
+    for stem, df in ohlcv_frames.items():
+        _write_ohlcv_pyramid(run_dir / f"{stem}.{ohlcv_suffix}", df)
+
     write_canonical_json(run_dir / "manifest.json", manifest)
     write_canonical_json(run_dir / "config.json", config_payload)
     write_canonical_json(run_dir / "metrics.json", metrics_payload)
-    write_canonical_json(run_dir / "equity_curve.json", engine_result.equity_curve)
+    write_canonical_json(run_dir / "equity_curve.json", list(engine_result.equity_curve))
     write_canonical_json(
         run_dir / "timeline.json",
         _build_timeline(
@@ -816,15 +1035,35 @@ def _write_artifacts(
     write_canonical_jsonl(run_dir / "decision_records.jsonl", engine_result.decisions)
     write_canonical_jsonl(run_dir / "trades.jsonl", engine_result.trades)
 
-    write_canonical_jsonl(run_dir / "ohlcv_1m.jsonl", _ohlcv_records(df_1m))
-    if df_tf is not df_1m:
-        write_canonical_jsonl(
-            run_dir / f"ohlcv_{manifest['data']['timeframe']}.jsonl", _ohlcv_records(df_tf)
-        )
-    else:
-        write_canonical_jsonl(
-            run_dir / f"ohlcv_{manifest['data']['timeframe']}.jsonl", _ohlcv_records(df_1m)
-        )
+
+def _write_ohlcv_parquet(path: Path, df: pd.DataFrame) -> str:
+    """Write bars under the JSON numeric policy and return the file's sha256.
+
+    Readers get the same timestamps and values as from the JSONL profile.
+    """
+    frame = pd.DataFrame(
+        {
+            "ts": df["ts"].astype("datetime64[ms, UTC]"),
+            **{
+                name: normalize_float_array(df[name].to_numpy())
+                for name in ("open", "high", "low", "close", "volume")
+            },
+        }
+    )
+    pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), path)
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_ohlcv_pyramid(ohlcv_path: Path, df: pd.DataFrame) -> None:
+    """Precompute the chart pyramid of ``ohlcv_path`` under the run's ``.index/``."""
+    ts = df["ts"].astype("datetime64[ms, UTC]").dt.tz_localize(None)
+    columns = {name: df[name].to_numpy() for name in ("open", "high", "low", "close", "volume")}
+    table = build_pyramid(ts.to_numpy().astype("int64"), columns, source_stamp(ohlcv_path))
+    write_pyramid(pyramid_path(ohlcv_path), table)
 
 
 def _ohlcv_records(df: pd.DataFrame) -> list[dict[str, Any]]:
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+RUN_QUEUE_WORKERS_ENV = "BUFF_RUN_QUEUE_WORKERS"
+DEFAULT_RUN_QUEUE_WORKERS = 2
+FINISHED_JOBS_LIMIT = 1024
+
+JOB_QUEUED = "QUEUED"
+JOB_RUNNING = "RUNNING"
+JOB_COMPLETED = "COMPLETED"
+JOB_FAILED = "FAILED"
+_ACTIVE_STATES = {JOB_QUEUED, JOB_RUNNING}
+
+ProgressFn = Callable[[str, int], None]
+
+logger = logging.getLogger(__name__)
+
+
+def _utc_now_iso() -> str:
+    text = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+    if text.endswith("+00:00"):
+        return text[:-6] + "Z"
+    return text
+
+
+@dataclass
+class RunJob:
+    user_id: str
+    run_id: str
+    inputs_hash: str
+    work: Callable[[ProgressFn], Any] = field(repr=False)
+    state: str = JOB_QUEUED
+    stage: str = JOB_QUEUED
+    percent: int = 0
+    error: dict[str, Any] | None = None
+    submitted_at: str = field(default_factory=_utc_now_iso)
+    updated_at: str = field(default_factory=_utc_now_iso)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "user_id": self.user_id,
+            "inputs_hash": self.inputs_hash,
+            "state": self.state,
+            "stage": self.stage,
+            "percent": self.percent,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class RunQueue:
+    """In-process run executor with a concurrency limit and per-user round-robin.
+
+    Each user has a FIFO of pending jobs; workers take the head job of the user
+    who has waited longest, so one user's backlog cannot starve another user.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_RUN_QUEUE_WORKERS) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+        self.max_workers = max_workers
+        self._cond = threading.Condition()
+        self._pending: OrderedDict[str, deque[RunJob]] = OrderedDict()
+        self._jobs: dict[tuple[str, str], RunJob] = {}
+        self._finished: deque[tuple[str, str]] = deque()
+        self._running = 0
+        self._workers: list[threading.Thread] = []
+
+    def submit(
+        self,
+        user_id: str,
+        run_id: str,
+        inputs_hash: str,
+        work: Callable[[ProgressFn], Any],
+    ) -> dict[str, Any]:
+        """Queue ``work`` unless a job for the same run is already active.
+
+        Returns a snapshot of the queued job or of the active job it collided with.
+        """
+        with self._cond:
+            existing = self._jobs.get((user_id, run_id))
+            if existing is not None and existing.state in _ACTIVE_STATES:
+                return existing.snapshot()
+            job = RunJob(user_id=user_id, run_id=run_id, inputs_hash=inputs_hash, work=work)
+            self._jobs[(user_id, run_id)] = job
+            self._pending.setdefault(user_id, deque()).append(job)
+            self._ensure_workers()
+            self._cond.notify()
+            return job.snapshot()
+
+    def get(self, user_id: str, run_id: str) -> dict[str, Any] | None:
+        with self._cond:
+            job = self._jobs.get((user_id, run_id))
+            return job.snapshot() if job is not None else None
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until no job is pending or running."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and self._running == 0, timeout=timeout
+            )
+
+    def _ensure_workers(self) -> None:
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"run-queue-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _next_job(self) -> RunJob:
+        with self._cond:
+            self._cond.wait_for(lambda: bool(self._pending))
+            user_id, jobs = next(iter(self._pending.items()))
+            job = jobs.popleft()
+            del self._pending[user_id]
+            if jobs:
+                self._pending[user_id] = jobs
+            self._running += 1
+            self._update(job, JOB_RUNNING, JOB_RUNNING, 0)
+            return job
+
+    def _update(self, job: RunJob, state: str, stage: str, percent: int) -> None:
+        job.state = state
+        job.stage = stage
+        job.percent = max(job.percent, min(int(percent), 100))
+        job.updated_at = _utc_now_iso()
+
+    def _worker_loop(self) -> None:
+        while True:
+            job = self._next_job()
+
+            def report(stage: str, percent: int, job: RunJob = job) -> None:
+                with self._cond:
+                    self._update(job, JOB_RUNNING, stage, percent)
+
+            try:
+                job.work(report)
+            except Exception as exc:
+                to_payload = getattr(exc, "to_payload", None)
+                if callable(to_payload):
+                    error = to_payload()
+                else:
+                    # The INTERNAL envelope points users at the API logs.
+                    logger.exception("run job failed: user=%s run_id=%s", job.user_id, job.run_id)
+                    error = {"code": "INTERNAL", "message": "Internal error", "details": {}}
+                with self._cond:
+                    job.error = error
+                    self._update(job, JOB_FAILED, JOB_FAILED, 100)
+            else:
+                with self._cond:
+                    self._update(job, JOB_COMPLETED, JOB_COMPLETED, 100)
+            with self._cond:
+                self._running -= 1
+                self._retire(job)
+                self._cond.notify_all()
+
+    def _retire(self, job: RunJob) -> None:
+        self._finished.append((job.user_id, job.run_id))
+        while len(self._finished) > FINISHED_JOBS_LIMIT:
+            key = self._finished.popleft()
+            stale = self._jobs.get(key)
+            if stale is not None and stale.state not in _ACTIVE_STATES:
+                del self._jobs[key]
+
+
+_RUN_QUEUE: RunQueue | None = None
+_RUN_QUEUE_LOCK = threading.Lock()
+
+
+def get_run_queue() -> RunQueue:
+    """Return the process-wide queue, sized from ``BUFF_RUN_QUEUE_WORKERS``."""
+    global _RUN_QUEUE
+    with _RUN_QUEUE_LOCK:
+        if _RUN_QUEUE is None:
+            raw = (os.getenv(RUN_QUEUE_WORKERS_ENV) or "").strip()
+            try:
+                workers = int(raw) if raw else DEFAULT_RUN_QUEUE_WORKERS
+            except ValueError:
+                workers = DEFAULT_RUN_QUEUE_WORKERS
+            _RUN_QUEUE = RunQueue(max(workers, 1))
+        return _RUN_QUEUE
@@ -391,7 +391,7 @@ export default function useWorkspace(runId, options = {}) {
         timeframe: timeframe || undefined,
         start_ts: range.start_ts || undefined,
         end_ts: range.end_ts || undefined,
-        limit: 2000,
+        max_points: 2000,
       };
       const result = await requestWithTransientRetry({
         request: () =>
@@ -207,7 +207,7 @@ export default function CompareRunsPage() {
       }
 
       const runMetaA = runIndex.find((run) => run.id === runAId);
-      const ohlcvParams = { limit: 2000 };
+      const ohlcvParams = { max_points: 2000 };
       if (runMetaA?.timeframe) {
         ohlcvParams.timeframe = runMetaA.timeframe;
       }
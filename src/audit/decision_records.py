@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from hashlib import sha256
 from pathlib import Path
+from typing import Iterable, Iterator, Mapping
 
 
 def canonical_json(obj: object) -> str:
@@ -21,10 +24,33 @@ def parse_json_line(line: str) -> dict:
     return json.loads(line)
 
 
+MARKET_STATE_HASH_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=MARKET_STATE_HASH_CACHE_SIZE)
+def _market_state_hash_cached(items: tuple[tuple[str, str], ...]) -> str:
+    return sha256_hex(canonical_json(dict(items)))
+
+
 def compute_market_state_hash(market_state: dict) -> str:
+    """sha256 of the canonical JSON; flat all-string states are memoized."""
+    if isinstance(market_state, dict) and all(
+        type(key) is str and type(value) is str for key, value in market_state.items()
+    ):
+        return _market_state_hash_cached(tuple(sorted(market_state.items())))
     return sha256_hex(canonical_json(market_state))
 
 
+def market_state_hash_cache_info() -> dict[str, int | None]:
+    info = _market_state_hash_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "maxsize": info.maxsize,
+        "currsize": info.currsize,
+    }
+
+
 def _is_utc_iso8601(ts: object) -> bool:
     if not isinstance(ts, str):
         return False
@@ -80,42 +106,180 @@ def make_records_path(run_id: str, *, shard_index: int) -> str:
     return str(path / f"decision_records_{shard_index:04d}.jsonl")
 
 
+_TAIL_BLOCK_BYTES = 64 * 1024
+
+SHARD_MANIFEST_NAME = "decision_records.shards.json"
+SHARD_MANIFEST_SCHEMA_VERSION = "dr.shards.v1"
+
+
+def _iter_lines_reversed(path: Path) -> Iterator[bytes]:
+    """Yield the lines of ``path`` last to first, reading fixed-size blocks back from the end."""
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            step = min(_TAIL_BLOCK_BYTES, position)
+            position -= step
+            handle.seek(position)
+            lines = (handle.read(step) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            yield from reversed(lines)
+        yield remainder
+
+
+def _line_seq(line: bytes | str) -> int | None:
+    if not line.strip():
+        return None
+    try:
+        record = parse_json_line(line.decode("utf-8") if isinstance(line, bytes) else line)
+        seq = record.get("seq")
+    except Exception:
+        return None
+    return seq if isinstance(seq, int) else None
+
+
+def _last_seq(path: Path) -> int | None:
+    # Torn or corrupt trailing lines are skipped until a parseable record is found.
+    for line in _iter_lines_reversed(path):
+        seq = _line_seq(line)
+        if seq is not None:
+            return seq
+    return None
+
+
+def _first_seq(path: Path) -> int | None:
+    with path.open("rb") as handle:
+        for line in handle:
+            seq = _line_seq(line)
+            if seq is not None:
+                return seq
+    return None
+
+
 def infer_next_seq_from_jsonl(path: str) -> int:
     jsonl_path = Path(path)
     if not jsonl_path.exists():
         return 0
-    last_seq: int | None = None
-    for line in jsonl_path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        try:
-            record = parse_json_line(line)
-            seq = record.get("seq")
-            if isinstance(seq, int):
-                last_seq = seq
-        except Exception:
-            continue
+    last_seq = _last_seq(jsonl_path)
     if last_seq is None:
         return 0
     return last_seq + 1
 
 
-def infer_next_shard_and_seq(run_dir: str) -> tuple[int, int]:
-    run_path = Path(run_dir)
-    if not run_path.exists():
-        return 0, 0
+@dataclass(frozen=True)
+class ShardInfo:
+    shard_index: int
+    first_seq: int | None
+    last_seq: int | None
+    size: int
+    mtime_ns: int
+
+
+def _shard_path(run_path: Path, shard_index: int) -> Path:
+    return run_path / f"decision_records_{shard_index:04d}.jsonl"
+
+
+def _shard_indices(run_path: Path) -> list[int]:
     shard_indices: list[int] = []
     for path in run_path.glob("decision_records_*.jsonl"):
         try:
             shard_indices.append(int(path.stem.split("_")[-1]))
         except ValueError:
             continue
+    return sorted(shard_indices)
+
+
+def load_shard_manifest(run_dir: str) -> dict[int, ShardInfo]:
+    """Return the cached shard summaries of ``run_dir``; entries may be stale."""
+    try:
+        payload = json.loads((Path(run_dir) / SHARD_MANIFEST_NAME).read_text(encoding="utf-8"))
+        if payload.get("schema_version") != SHARD_MANIFEST_SCHEMA_VERSION:
+            return {}
+        shards = [ShardInfo(**entry) for entry in payload["shards"]]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+    return {info.shard_index: info for info in shards}
+
+
+def _write_shard_manifest(run_path: Path, shards: Iterable[ShardInfo]) -> None:
+    payload = {
+        "schema_version": SHARD_MANIFEST_SCHEMA_VERSION,
+        "shards": [asdict(info) for info in sorted(shards, key=lambda info: info.shard_index)],
+    }
+    path = run_path / SHARD_MANIFEST_NAME
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.write(canonical_json(payload))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        # The manifest is only a cache; the next lookup re-reads the shard.
+        pass
+
+
+def _shard_info(
+    run_path: Path, shard_index: int, manifest: Mapping[int, ShardInfo]
+) -> ShardInfo | None:
+    """Return the manifest entry while the shard's size and mtime still match, else re-read it."""
+    path = _shard_path(run_path, shard_index)
+    try:
+        stat = path.stat()
+        cached = manifest.get(shard_index)
+        if cached is not None and (cached.size, cached.mtime_ns) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return cached
+        return ShardInfo(
+            shard_index=shard_index,
+            first_seq=_first_seq(path),
+            last_seq=_last_seq(path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        )
+    except OSError:
+        return None
+
+
+def refresh_shard_manifest(
+    run_dir: str, *, shard_indices: Iterable[int] | None = None
+) -> list[ShardInfo]:
+    """Summarize the shards of ``run_dir`` (all of them unless ``shard_indices``).
+
+    Only shards whose size or mtime changed since the manifest was written are
+    read, and then just their first and last complete records. The manifest is
+    rewritten when an entry changed.
+    """
+    run_path = Path(run_dir)
+    existing = _shard_indices(run_path)
+    manifest = load_shard_manifest(run_dir)
+    wanted = existing if shard_indices is None else sorted(set(shard_indices) & set(existing))
+    infos = [
+        info
+        for info in (_shard_info(run_path, index, manifest) for index in wanted)
+        if info is not None
+    ]
+    updated = {index: info for index, info in manifest.items() if index in existing}
+    updated.update((info.shard_index, info) for info in infos)
+    if updated != manifest:
+        _write_shard_manifest(run_path, updated.values())
+    return infos
+
+
+def infer_next_shard_and_seq(run_dir: str) -> tuple[int, int]:
+    run_path = Path(run_dir)
+    if not run_path.exists():
+        return 0, 0
+    shard_indices = _shard_indices(run_path)
     if not shard_indices:
         return 0, 0
-    shard_index = max(shard_indices)
-    records_path = run_path / f"decision_records_{shard_index:04d}.jsonl"
-    next_seq = infer_next_seq_from_jsonl(str(records_path))
-    return shard_index, next_seq
+    shard_index = shard_indices[-1]
+    infos = refresh_shard_manifest(run_dir, shard_indices=[shard_index])
+    if not infos or infos[0].last_seq is None:
+        return shard_index, 0
+    return shard_index, infos[0].last_seq + 1
 
 
 def _utc_timestamp() -> str:
@@ -125,12 +289,150 @@ def _utc_timestamp() -> str:
     return ts
 
 
+DURABILITY_PER_RECORD = "per_record"
+DURABILITY_GROUP = "group"
+DURABILITY_ON_CLOSE = "on_close"
+DURABILITY_MODES = (DURABILITY_PER_RECORD, DURABILITY_GROUP, DURABILITY_ON_CLOSE)
+
+SYNC_MARKER_SCHEMA_VERSION = "dr.sync_marker.v1"
+SYNC_MARKER_SUFFIX = ".sync.json"
+
+
+@dataclass(frozen=True)
+class DurabilityPolicy:
+    """When ``DecisionRecordWriter`` forces appended records to disk.
+
+    ``per_record`` fsyncs every append. ``group`` fsyncs once ``max_records``
+    records are pending or the oldest pending record is ``max_delay_ms`` old.
+    The deadline is checked by ``append()`` and ``maybe_sync()``, so a writer
+    that may sit idle must call ``maybe_sync()`` periodically. ``on_close``
+    fsyncs only on ``sync()``/``close()``. A crash loses at most the records
+    pending since the last sync.
+
+    ``group`` and ``on_close`` commits cost three fsyncs: the data file, the
+    sync marker and the marker's directory. ``per_record`` costs one.
+    """
+
+    mode: str = DURABILITY_PER_RECORD
+    max_records: int = 1
+    max_delay_ms: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.mode not in DURABILITY_MODES:
+            raise ValueError(f"mode must be one of {list(DURABILITY_MODES)}")
+        if self.max_records <= 0:
+            raise ValueError("max_records must be > 0")
+        if self.max_delay_ms is not None and self.max_delay_ms < 0:
+            raise ValueError("max_delay_ms must be >= 0")
+
+
+@dataclass
+class SyncMetrics:
+    """Sync latency and batch size counters; one instance may be shared by many writers.
+
+    ``fsyncs`` counts every fsync a commit issued, sync marker included.
+    """
+
+    syncs: int = 0
+    fsyncs: int = 0
+    records: int = 0
+    sync_seconds_total: float = 0.0
+    sync_seconds_max: float = 0.0
+    batch_size_max: int = 0
+
+    def observe(self, batch_size: int, seconds: float, fsyncs: int = 1) -> None:
+        self.syncs += 1
+        self.fsyncs += fsyncs
+        self.records += batch_size
+        self.sync_seconds_total += seconds
+        self.sync_seconds_max = max(self.sync_seconds_max, seconds)
+        self.batch_size_max = max(self.batch_size_max, batch_size)
+
+    def snapshot(self) -> dict[str, int | float]:
+        return {
+            "syncs": self.syncs,
+            "fsyncs": self.fsyncs,
+            "records": self.records,
+            "sync_seconds_total": self.sync_seconds_total,
+            "sync_seconds_max": self.sync_seconds_max,
+            "sync_seconds_mean": self.sync_seconds_total / self.syncs if self.syncs else 0.0,
+            "batch_size_max": self.batch_size_max,
+            "batch_size_mean": self.records / self.syncs if self.syncs else 0.0,
+        }
+
+
+def sync_marker_path(out_path: str) -> Path:
+    path = Path(out_path)
+    return path.with_name(path.name + SYNC_MARKER_SUFFIX)
+
+
+def read_sync_marker(out_path: str) -> dict | None:
+    """Return the last sync marker written for ``out_path``, if any.
+
+    ``offset`` is the file size known to be on disk; bytes after it belong to
+    at most one pending window of ``policy`` and may be torn or missing after
+    a crash. ``replay_verify`` reports records in that window as ``unsynced``.
+    """
+    try:
+        marker = json.loads(sync_marker_path(out_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(marker, dict) or marker.get("schema_version") != SYNC_MARKER_SCHEMA_VERSION:
+        return None
+    return marker
+
+
+def _fsync_dir(path: Path) -> int:
+    """fsync ``path`` so a rename inside it is durable; return 0 where unsupported."""
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return 0
+    try:
+        os.fsync(fd)
+    except OSError:
+        return 0
+    finally:
+        os.close(fd)
+    return 1
+
+
 class DecisionRecordWriter:
-    def __init__(self, *, out_path: str, run_id: str, start_seq: int = 0) -> None:
+    """Appends dr.v1 records as canonical JSON lines, synced per ``durability``.
+
+    Batched policies keep ``<out_path>.sync.json`` as a durable watermark: it
+    is rewritten after every fsync of the data (and on open, once whatever an
+    earlier writer left unsynced has been fsynced) with the durable offset and
+    last durable seq. Records past ``offset`` are the unsynced window a crash
+    can lose; replay reports them.
+    """
+
+    def __init__(
+        self,
+        *,
+        out_path: str,
+        run_id: str,
+        start_seq: int = 0,
+        durability: DurabilityPolicy | None = None,
+        metrics: SyncMetrics | None = None,
+    ) -> None:
         self._file = open(out_path, "a", encoding="utf-8")
         self._ensure_newline(out_path)
+        self._out_path = out_path
         self._run_id = run_id
         self._seq = start_seq
+        self._durability = durability or DurabilityPolicy()
+        self.metrics = metrics or SyncMetrics()
+        self._pending = 0
+        self._pending_since = 0.0
+        self._file.flush()
+        marker = read_sync_marker(out_path)
+        if marker is not None and marker.get("offset") != self._file.tell():
+            os.fsync(self._file.fileno())
+        if self._durability.mode == DURABILITY_PER_RECORD:
+            sync_marker_path(out_path).unlink(missing_ok=True)
+        else:
+            self._write_sync_marker()
 
     def append(
         self,
@@ -154,14 +456,69 @@ class DecisionRecordWriter:
         )
         validate_decision_record_v1(asdict(record))
         self._file.write(record.to_json_line())
-        self._file.flush()
-        os.fsync(self._file.fileno())
         self._seq += 1
+        self._pending += 1
+        if self._pending == 1:
+            self._pending_since = time.monotonic()
+        if self._sync_due():
+            self.sync()
         return record
 
+    def _sync_due(self) -> bool:
+        policy = self._durability
+        if policy.mode == DURABILITY_PER_RECORD:
+            return True
+        if policy.mode == DURABILITY_ON_CLOSE:
+            return False
+        if self._pending >= policy.max_records:
+            return True
+        return (
+            policy.max_delay_ms is not None
+            and (time.monotonic() - self._pending_since) * 1000.0 >= policy.max_delay_ms
+        )
+
+    def maybe_sync(self) -> None:
+        """Sync if the policy's deadline has passed, even though nothing was appended."""
+        if self._pending and self._sync_due():
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush and fsync every pending record."""
+        if not self._pending:
+            return
+        started = time.perf_counter()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        fsyncs = 1
+        if self._durability.mode != DURABILITY_PER_RECORD:
+            fsyncs += self._write_sync_marker()
+        self.metrics.observe(self._pending, time.perf_counter() - started, fsyncs)
+        self._pending = 0
+
     def close(self) -> None:
+        if self._file.closed:
+            return
+        self.sync()
         self._file.close()
 
+    def _write_sync_marker(self) -> int:
+        """Durably replace the sync marker; return the number of fsyncs issued."""
+        policy = self._durability
+        payload = {
+            "schema_version": SYNC_MARKER_SCHEMA_VERSION,
+            "offset": self._file.tell(),
+            "last_seq": self._seq - 1 if self._seq > 0 else None,
+            "policy": asdict(policy),
+        }
+        path = sync_marker_path(self._out_path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.write(canonical_json(payload))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+        return 1 + _fsync_dir(path.parent)
+
     def _ensure_newline(self, path: str) -> None:
         file_path = Path(path)
         if not file_path.exists():
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from hashlib import sha256
 from pathlib import Path
-from typing import Any, Callable, Iterable, Mapping
+from typing import Any, Callable, Iterable, Mapping, Sequence
 
 from audit.canonical_json import canonical_json, canonical_json_bytes
 from audit.decision_record import (
@@ -14,7 +19,7 @@ from audit.decision_record import (
     RunContext,
     Selection,
 )
-from audit.decision_records import compute_market_state_hash, parse_json_line
+from audit.decision_records import compute_market_state_hash, parse_json_line, read_sync_marker
 from audit.snapshot import Snapshot
 from risk.contracts import RiskInputs as RiskInputsContract
 from risk.contracts import RiskConfig, RiskState as RiskStateMachine
@@ -25,6 +30,11 @@ from selector.records import selection_to_record
 from selector.selector import select_strategy
 
 _LAST_LOAD_ERRORS = 0
+_MAX_MISMATCH_DETAILS = 20
+REPLAYED_SELECTION_CACHE_SIZE = 4096
+
+REPLAY_CHECKPOINT_SCHEMA_VERSION = "replay.checkpoint.v1"
+REPLAY_CHECKPOINT_SUFFIX = ".replay_checkpoint.json"
 
 
 @dataclass(frozen=True)
@@ -34,6 +44,13 @@ class ReplayResult:
     mismatched: int
     hash_mismatch: int
     errors: int
+    # 1 when the file ends in a line without its newline, i.e. an append torn by a crash.
+    torn_tail: int = 0
+    # Records past the writer's sync marker offset: appended but not yet known to be on disk.
+    unsynced: int = 0
+
+
+_RESULT_FIELDS = tuple(field.name for field in fields(ReplayResult))
 
 
 @dataclass(frozen=True)
@@ -50,6 +67,15 @@ class ReplayReport:
     replay_record: DecisionRecord
 
 
+@dataclass(frozen=True)
+class ReplayBatchReport:
+    """``ReplayRunner.replay_many`` outcome: counts plus ``(index, report)`` per mismatch."""
+
+    total: int
+    matched: int
+    mismatches: list[tuple[int, ReplayReport]]
+
+
 @dataclass(frozen=True)
 class ReplayConfig:
     feature_builder: Callable[[list[dict[str, Any]]], dict[str, Any]] | None = None
@@ -71,6 +97,28 @@ class ReplayConfigMismatchError(RuntimeError):
         self.path = path
 
 
+_REQUIRED_RECORD_FIELDS = frozenset(
+    {
+        "run_id",
+        "seq",
+        "timeframe",
+        "risk_state",
+        "market_state",
+        "market_state_hash",
+        "selection",
+    }
+)
+
+
+def _parse_decision_record(line: str) -> dict:
+    record = parse_json_line(line)
+    if record.get("schema_version") != "dr.v1":
+        raise ValueError("schema_version")
+    if not _REQUIRED_RECORD_FIELDS.issubset(record.keys()):
+        raise ValueError("missing_required_fields")
+    return record
+
+
 def load_decision_records(path: str) -> list[dict]:
     records: list[dict] = []
     errors = 0
@@ -78,21 +126,7 @@ def load_decision_records(path: str) -> list[dict]:
         if not line.strip():
             continue
         try:
-            record = parse_json_line(line)
-            if record.get("schema_version") != "dr.v1":
-                raise ValueError("schema_version")
-            required = {
-                "run_id",
-                "seq",
-                "timeframe",
-                "risk_state",
-                "market_state",
-                "market_state_hash",
-                "selection",
-            }
-            if not required.issubset(record.keys()):
-                raise ValueError("missing_required_fields")
-            records.append(record)
+            records.append(_parse_decision_record(line))
         except Exception:
             errors += 1
     global _LAST_LOAD_ERRORS
@@ -158,62 +192,258 @@ def _risk_replay_hash_matches(record: Mapping[str, Any]) -> bool:
     )
 
 
-def replay_verify(*, records_path: str, strict: bool = False) -> ReplayResult:
-    _ = strict
-    records = load_decision_records(records_path)
-    errors = last_load_errors()
+@lru_cache(maxsize=REPLAYED_SELECTION_CACHE_SIZE)
+def _replayed_selection_cached(items: tuple[tuple[str, str], ...], risk_state: RiskState) -> dict:
+    return normalize_selection(selection_to_record(select_strategy(dict(items), risk_state)))
 
-    total = len(records)
-    matched = 0
-    mismatched = 0
-    hash_mismatch = 0
-    details: list[dict] = []
 
-    for record in records:
-        expected_hash = record.get("market_state_hash")
-        computed_hash = compute_market_state_hash(record.get("market_state", {}))
-        if computed_hash != expected_hash:
-            hash_mismatch += 1
-            continue
-        if not _risk_replay_hash_matches(record):
-            hash_mismatch += 1
-            continue
+def _replayed_selection(market_state: Any, risk_state: RiskState) -> dict:
+    """Normalized selection replayed for ``market_state``; flat all-string states are memoized.
 
-        risk_state_raw = record.get("risk_state", "")
-        if isinstance(risk_state_raw, str):
-            try:
-                risk_state = RiskState(risk_state_raw)
-            except ValueError:
-                risk_state = RiskState.RED
-        else:
+    Cached results are shared, so callers must not mutate them.
+    """
+    if isinstance(market_state, dict) and all(
+        type(key) is str and type(value) is str for key, value in market_state.items()
+    ):
+        return _replayed_selection_cached(tuple(sorted(market_state.items())), risk_state)
+    return normalize_selection(selection_to_record(select_strategy(market_state, risk_state)))
+
+
+def _verify_record(record: Mapping[str, Any]) -> tuple[str, dict | None]:
+    """Classify one loaded record as ``matched``, ``mismatched`` or ``hash_mismatch``.
+
+    A mismatch also returns its detail entry.
+    """
+    expected_hash = record.get("market_state_hash")
+    computed_hash = compute_market_state_hash(record.get("market_state", {}))
+    if computed_hash != expected_hash:
+        return "hash_mismatch", None
+    if not _risk_replay_hash_matches(record):
+        return "hash_mismatch", None
+
+    risk_state_raw = record.get("risk_state", "")
+    if isinstance(risk_state_raw, str):
+        try:
+            risk_state = RiskState(risk_state_raw)
+        except ValueError:
             risk_state = RiskState.RED
+    else:
+        risk_state = RiskState.RED
 
-        out = select_strategy(record.get("market_state", {}), risk_state)
-        expected = normalize_selection(record.get("selection", {}))
-        got = normalize_selection(selection_to_record(out))
-        if expected == got:
-            matched += 1
-        else:
-            mismatched += 1
-            if len(details) < 20:
-                details.append(
-                    {
-                        "seq": record.get("seq"),
-                        "expected": expected,
-                        "got": got,
-                    }
-                )
+    expected = normalize_selection(record.get("selection", {}))
+    got = _replayed_selection(record.get("market_state", {}), risk_state)
+    if expected == got:
+        return "matched", None
+    return "mismatched", {"seq": record.get("seq"), "expected": expected, "got": got}
 
+
+def _verify_line(raw: bytes, counts: dict[str, int], details: list[dict]) -> int | None:
+    """Verify one raw records line into ``counts``; return its ``seq`` if it has one."""
+    if not raw.strip():
+        return None
+    try:
+        record = _parse_decision_record(raw.decode("utf-8"))
+    except Exception:
+        counts["errors"] += 1
+        return None
+    counts["total"] += 1
+    outcome, detail = _verify_record(record)
+    counts[outcome] += 1
+    if detail is not None and len(details) < _MAX_MISMATCH_DETAILS:
+        details.append(detail)
+    seq = record.get("seq")
+    return seq if isinstance(seq, int) else None
+
+
+def _unsynced_records(records_path: str) -> int:
+    """Count the lines after the durable offset in ``records_path``'s sync marker."""
+    marker = read_sync_marker(records_path)
+    if marker is None or not isinstance(marker.get("offset"), int):
+        return 0
+    with Path(records_path).open("rb") as fh:
+        fh.seek(marker["offset"])
+        return sum(1 for _ in fh)
+
+
+def _verify_shard(records_path: str) -> tuple[ReplayResult, list[dict]]:
+    """Stream ``records_path`` line by line; return its counts and first mismatch details."""
+    counts = dict.fromkeys(_RESULT_FIELDS, 0)
+    details: list[dict] = []
+    last_line = b""
+    with Path(records_path).open("rb") as fh:
+        for last_line in fh:
+            _verify_line(last_line, counts, details)
+    counts["torn_tail"] = int(bool(last_line) and not last_line.endswith(b"\n"))
+    counts["unsynced"] = _unsynced_records(records_path)
+    return ReplayResult(**counts), details
+
+
+def _print_mismatches(details: list[dict]) -> None:
     if details:
         print(json.dumps({"mismatches": details}, indent=2))
 
-    return ReplayResult(
-        total=total,
-        matched=matched,
-        mismatched=mismatched,
-        hash_mismatch=hash_mismatch,
-        errors=errors,
-    )
+
+def replay_verify(*, records_path: str, strict: bool = False) -> ReplayResult:
+    _ = strict
+    result, details = _verify_shard(records_path)
+    _print_mismatches(details)
+    return result
+
+
+def replay_verify_shards(records_paths: Sequence[str], *, workers: int = 1) -> ReplayResult:
+    """``replay_verify`` over several files, across a process pool when ``workers > 1``.
+
+    Totals and mismatch details are merged in ``records_paths`` order, so the
+    result does not depend on how shards were scheduled.
+    """
+    paths = [str(path) for path in records_paths]
+    if workers <= 1 or len(paths) <= 1:
+        outcomes = [_verify_shard(path) for path in paths]
+    else:
+        context = None
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths)), mp_context=context) as pool:
+            outcomes = list(pool.map(_verify_shard, paths))
+
+    totals = dict.fromkeys(_RESULT_FIELDS, 0)
+    details: list[dict] = []
+    for result, shard_details in outcomes:
+        for key, value in asdict(result).items():
+            totals[key] += value
+        details.extend(shard_details[: _MAX_MISMATCH_DETAILS - len(details)])
+    _print_mismatches(details)
+    return ReplayResult(**totals)
+
+
+@dataclass(frozen=True)
+class ReplayCheckpoint:
+    """How far ``replay_verify_incremental`` got through one records file.
+
+    ``offset`` is the end of the last verified complete line and ``result``
+    holds the cumulative counts up to ``offset``. Only the last verified line
+    is fingerprinted (``last_line_sha256``); see ``load_replay_checkpoint``.
+    """
+
+    offset: int
+    last_seq: int | None
+    last_line_offset: int
+    last_line_sha256: str
+    result: ReplayResult
+
+
+def replay_checkpoint_path(records_path: str) -> Path:
+    path = Path(records_path)
+    return path.with_name(path.name + REPLAY_CHECKPOINT_SUFFIX)
+
+
+def load_replay_checkpoint(records_path: str) -> ReplayCheckpoint | None:
+    """Return the stored checkpoint if it still describes ``records_path``.
+
+    The file must be at least ``offset`` bytes long and its last verified line
+    must hash as recorded; anything else (including a missing or unreadable
+    checkpoint) returns ``None``. Earlier lines are not re-read, so a rewrite
+    before the last verified line that keeps the file size at or above
+    ``offset`` is not detected; ``replay_verify_incremental(full=True)``
+    re-verifies the whole file.
+    """
+    try:
+        payload = json.loads(replay_checkpoint_path(records_path).read_text(encoding="utf-8"))
+        if payload.get("schema_version") != REPLAY_CHECKPOINT_SCHEMA_VERSION:
+            return None
+        checkpoint = ReplayCheckpoint(
+            offset=int(payload["offset"]),
+            last_seq=payload["last_seq"],
+            last_line_offset=int(payload["last_line_offset"]),
+            last_line_sha256=str(payload["last_line_sha256"]),
+            result=ReplayResult(**{key: int(value) for key, value in payload["result"].items()}),
+        )
+        if not 0 <= checkpoint.last_line_offset <= checkpoint.offset or not (
+            checkpoint.last_seq is None or isinstance(checkpoint.last_seq, int)
+        ):
+            return None
+        with Path(records_path).open("rb") as fh:
+            if os.fstat(fh.fileno()).st_size < checkpoint.offset:
+                return None
+            fh.seek(checkpoint.last_line_offset)
+            last_line = fh.read(checkpoint.offset - checkpoint.last_line_offset)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if sha256(last_line).hexdigest() != checkpoint.last_line_sha256:
+        return None
+    return checkpoint
+
+
+def _write_replay_checkpoint(records_path: str, checkpoint: ReplayCheckpoint) -> None:
+    payload = {
+        "schema_version": REPLAY_CHECKPOINT_SCHEMA_VERSION,
+        **asdict(checkpoint),
+    }
+    path = replay_checkpoint_path(records_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(canonical_json_bytes(payload))
+    os.replace(tmp_path, path)
+
+
+def replay_verify_incremental(*, records_path: str, full: bool = False) -> ReplayResult:
+    """``replay_verify`` that only verifies lines appended since the last call.
+
+    Progress is persisted to ``<records>.replay_checkpoint.json``. A checkpoint
+    that no longer matches the file (truncated, or its last verified line
+    rewritten) or ``full=True`` re-verifies from the start; callers that must
+    catch rewrites of earlier lines run a periodic ``full=True`` pass.
+
+    A trailing line without its newline is still being written or was torn by
+    a crash: it is verified, counted and flagged as ``torn_tail`` but not
+    checkpointed. ``unsynced`` is recomputed from the sync marker on every call
+    and is not checkpointed either.
+    """
+    checkpoint = None if full else load_replay_checkpoint(records_path)
+    restart = checkpoint is None
+    if checkpoint is None:
+        checkpoint = ReplayCheckpoint(
+            offset=0,
+            last_seq=None,
+            last_line_offset=0,
+            last_line_sha256=sha256(b"").hexdigest(),
+            result=ReplayResult(total=0, matched=0, mismatched=0, hash_mismatch=0, errors=0),
+        )
+    verified = asdict(checkpoint.result)
+    partial: dict[str, int] | None = None
+    offset = checkpoint.offset
+    last_seq = checkpoint.last_seq
+    last_line_offset = checkpoint.last_line_offset
+    last_line_sha256 = checkpoint.last_line_sha256
+    details: list[dict] = []
+
+    with Path(records_path).open("rb") as fh:
+        fh.seek(offset)
+        for raw in fh:
+            if not raw.endswith(b"\n"):
+                partial = dict(verified, torn_tail=1)
+                _verify_line(raw, partial, details)
+                break
+            seq = _verify_line(raw, verified, details)
+            if seq is not None:
+                last_seq = seq
+            last_line_offset, last_line_sha256 = offset, sha256(raw).hexdigest()
+            offset += len(raw)
+
+    _print_mismatches(details)
+
+    if restart or offset != checkpoint.offset:
+        _write_replay_checkpoint(
+            records_path,
+            ReplayCheckpoint(
+                offset=offset,
+                last_seq=last_seq,
+                last_line_offset=last_line_offset,
+                last_line_sha256=last_line_sha256,
+                result=ReplayResult(**verified),
+            ),
+        )
+    counts = partial if partial is not None else verified
+    return ReplayResult(**dict(counts, unsynced=_unsynced_records(records_path)))
 
 
 def _normalize_selection(selection: dict[str, Any], risk_state: str) -> Selection:
@@ -270,6 +500,7 @@ def _evaluate_risk_state(
     record: DecisionRecord,
     snapshot: Snapshot | None,
     config: ReplayConfig,
+    risk_configs: dict[tuple, RiskConfig] | None = None,
 ) -> str:
     if snapshot is None or snapshot.risk_inputs is None:
         if record.inputs.risk_mode == "fact":
@@ -279,7 +510,7 @@ def _evaluate_risk_state(
         return record.inputs.risk_state
     validated: RiskInputsContract = validate_risk_inputs(snapshot.risk_inputs)
     risk_config = _resolve_risk_config(record, snapshot)
-    cfg = _build_risk_config(risk_config)
+    cfg = _cached_risk_config(risk_config, risk_configs)
     decision = evaluate_risk(validated, cfg)
     return decision.state.value
 
@@ -337,6 +568,35 @@ def replay_equivalence(
     return diffs
 
 
+def _same_json(left: Any, right: Any) -> bool:
+    """Equal values of identical types all the way down.
+
+    Stricter than both ``==`` (``1 == 1.0``) and canonical JSON (floats are
+    rounded), so it implies equal canonical bytes and an empty structured diff.
+    """
+    if left is right:
+        return True
+    if type(left) is not type(right):
+        return False
+    if isinstance(left, dict):
+        if left.keys() != right.keys():
+            return False
+        for key, value in left.items():
+            if not _same_json(value, right[key]):
+                return False
+        return True
+    if isinstance(left, (list, tuple)):
+        return len(left) == len(right) and all(map(_same_json, left, right))
+    return left == right
+
+
+def _same_fields(left: Any, right: Any) -> bool:
+    for name in left.__dataclass_fields__:
+        if not _same_json(getattr(left, name), getattr(right, name)):
+            return False
+    return True
+
+
 class ReplayRunner:
     def __init__(self, config: ReplayConfig | None = None) -> None:
         self._config = config or ReplayConfig()
@@ -349,14 +609,104 @@ class ReplayRunner:
         strict_core: bool = False,
         strict_full: bool = False,
     ) -> ReplayReport:
+        inputs, selection, outcome = self._replay_inputs(record, snapshot)
+        return self._report(
+            record, inputs, selection, outcome, strict_core=strict_core, strict_full=strict_full
+        )
+
+    def replay_many(
+        self,
+        records: Sequence[DecisionRecord],
+        snapshots: Sequence[Snapshot | None] | None = None,
+        *,
+        strict_core: bool = False,
+        strict_full: bool = False,
+    ) -> ReplayBatchReport:
+        """Replay ``records`` (each with the snapshot at the same index) as ``replay`` would.
+
+        Records sharing a snapshot and ``inputs_hash`` (so the same risk config)
+        are replayed once per group. A record whose inputs, selection and
+        outcome are identical to its group's replay reproduces byte for byte,
+        so it is counted without building and hashing a replay record; only
+        the others go through ``replay`` and its structured diff. Replay errors
+        raise as in ``replay``.
+
+        The saving comes from grouping: when every record has its own snapshot,
+        risk evaluation still runs once per record and the batch is only a few
+        times faster than a loop over ``replay``.
+        """
+        if snapshots is None:
+            snapshots = [None] * len(records)
+        elif len(snapshots) != len(records):
+            raise ValueError("snapshots must align with records")
+
+        groups: dict[tuple[int, str], tuple[Inputs, Selection, Outcome]] = {}
+        risk_configs: dict[tuple, RiskConfig] = {}
+        matched = 0
+        mismatches: list[tuple[int, ReplayReport]] = []
+        for index, (record, snapshot) in enumerate(zip(records, snapshots)):
+            inputs_hash = record.hashes.inputs_hash if record.hashes is not None else None
+            key = (id(snapshot), inputs_hash) if inputs_hash is not None else None
+            replayed = groups.get(key) if key is not None else None
+            if replayed is None:
+                replayed = self._replay_inputs(record, snapshot, risk_configs)
+                if key is not None:
+                    groups[key] = replayed
+            # Replay only reads the record's inputs, so identical inputs replay identically.
+            inputs, selection, outcome = replayed
+            if (
+                _same_fields(record.inputs, inputs)
+                and _same_fields(record.selection, selection)
+                and _same_fields(record.outcome, outcome)
+            ):
+                matched += 1
+                continue
+            report = self.replay(record, snapshot, strict_core=strict_core, strict_full=strict_full)
+            if report.matched:
+                matched += 1
+            else:
+                mismatches.append((index, report))
+        return ReplayBatchReport(total=len(records), matched=matched, mismatches=mismatches)
+
+    def _replay_inputs(
+        self,
+        record: DecisionRecord,
+        snapshot: Snapshot | None,
+        risk_configs: dict[tuple, RiskConfig] | None = None,
+    ) -> tuple[Inputs, Selection, Outcome]:
         config = self._config
         market_features = _build_market_features(record, snapshot, config)
-        risk_state = _evaluate_risk_state(record, snapshot, config)
+        risk_state = _evaluate_risk_state(record, snapshot, config, risk_configs)
 
         selector_state = select_strategy(market_features, _coerce_risk_state(risk_state))
         selection = _normalize_selection(selection_to_record(selector_state), risk_state)
         outcome = _outcome_from_selection(selection)
 
+        selector_inputs = (
+            snapshot.selector_inputs
+            if snapshot is not None and snapshot.selector_inputs is not None
+            else record.inputs.selector_inputs
+        )
+        inputs = Inputs(
+            market_features=market_features,
+            risk_state=risk_state,
+            selector_inputs=selector_inputs,
+            config=record.inputs.config,
+            risk_mode=record.inputs.risk_mode,
+        )
+        return inputs, selection, outcome
+
+    def _report(
+        self,
+        record: DecisionRecord,
+        inputs: Inputs,
+        selection: Selection,
+        outcome: Outcome,
+        *,
+        strict_core: bool,
+        strict_full: bool,
+    ) -> ReplayReport:
+        config = self._config
         if strict_full:
             run_context = record.run_context
             code_version = record.code_version
@@ -366,12 +716,6 @@ class ReplayRunner:
             code_version = config.code_version_override or record.code_version
             ts_utc = config.ts_utc_override or record.ts_utc
 
-        selector_inputs = (
-            snapshot.selector_inputs
-            if snapshot is not None and snapshot.selector_inputs is not None
-            else record.inputs.selector_inputs
-        )
-
         replay_record = DecisionRecord(
             decision_id=record.decision_id,
             ts_utc=ts_utc,
@@ -380,13 +724,7 @@ class ReplayRunner:
             code_version=code_version,
             run_context=run_context,
             artifacts=record.artifacts,
-            inputs=Inputs(
-                market_features=market_features,
-                risk_state=risk_state,
-                selector_inputs=selector_inputs,
-                config=record.inputs.config,
-                risk_mode=record.inputs.risk_mode,
-            ),
+            inputs=inputs,
             selection=selection,
             outcome=outcome,
         )
@@ -442,7 +780,9 @@ def _resolve_risk_config(record: DecisionRecord, snapshot: Snapshot | None) -> M
         raise ReplayMissingConfigError("snapshot.config.risk_config")
 
     if record_config is not None and snapshot_config is not None:
-        if canonical_json_bytes(record_config) != canonical_json_bytes(snapshot_config):
+        if not _same_json(record_config, snapshot_config) and canonical_json_bytes(
+            record_config
+        ) != canonical_json_bytes(snapshot_config):
             raise ReplayConfigMismatchError(
                 "inputs.config.risk_config != snapshot.config.risk_config"
             )
@@ -453,6 +793,22 @@ def _resolve_risk_config(record: DecisionRecord, snapshot: Snapshot | None) -> M
     return snapshot_config  # type: ignore[return-value]
 
 
+def _cached_risk_config(
+    config: Mapping[str, Any], cache: dict[tuple, RiskConfig] | None
+) -> RiskConfig:
+    """``_build_risk_config``, reused across records whose (flat) config is equal."""
+    if cache is None:
+        return _build_risk_config(config)
+    try:
+        key = tuple(sorted((name, type(value), value) for name, value in config.items()))
+        cached = cache.get(key)
+    except TypeError:
+        return _build_risk_config(config)
+    if cached is None:
+        cached = cache[key] = _build_risk_config(config)
+    return cached
+
+
 def _build_risk_config(config: Mapping[str, Any]) -> RiskConfig:
     if "missing_red" not in config:
         raise ReplayMissingConfigError("inputs.config.risk_config.missing_red")
@@ -469,6 +825,27 @@ def _build_risk_config(config: Mapping[str, Any]) -> RiskConfig:
     )
 
 
+def _records_shards(targets: Sequence[str]) -> list[str]:
+    """Expand run directories into their records files; raise if a target is missing.
+
+    A directory contributes its unsharded ``decision_records.jsonl`` (paper
+    runs) followed by its ``decision_records_*.jsonl`` shards (long runs).
+    """
+    shards: list[str] = []
+    for target in targets:
+        path = Path(target)
+        if path.is_dir():
+            unsharded = path / "decision_records.jsonl"
+            if unsharded.is_file():
+                shards.append(str(unsharded))
+            shards.extend(str(shard) for shard in sorted(path.glob("decision_records_*.jsonl")))
+        elif path.is_file():
+            shards.append(str(path))
+        else:
+            raise FileNotFoundError(target)
+    return shards
+
+
 def main() -> None:
     import argparse
     import sys
@@ -476,7 +853,19 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Replay a decision record and verify reproducibility."
     )
-    parser.add_argument("--decision", required=True, help="Path to decision record JSON")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--decision", help="Path to decision record JSON")
+    target.add_argument(
+        "--records",
+        nargs="+",
+        help="Verify decision-record JSONL shards (files or run directories) instead.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to verify --records shards in parallel (default 1).",
+    )
     parser.add_argument("--snapshot", required=False, help="Path to snapshot JSON")
     parser.add_argument(
         "--strict",
@@ -503,6 +892,47 @@ def main() -> None:
         print("ERROR: --strict and --strict-full are mutually exclusive", file=sys.stderr)
         sys.exit(2)
 
+    if args.records:
+        decision_only = {
+            "--snapshot": args.snapshot,
+            "--strict": args.strict,
+            "--strict-full": args.strict_full,
+            "--out": args.out,
+            "--json": args.json,
+        }
+        for flag, value in decision_only.items():
+            if value:
+                print(f"ERROR: {flag} is not supported with --records", file=sys.stderr)
+                sys.exit(2)
+        try:
+            shards = _records_shards(args.records)
+            if not shards:
+                print("REPLAY_ERROR no decision records found", file=sys.stderr)
+                sys.exit(2)
+            result = replay_verify_shards(shards, workers=args.workers or 1)
+        except FileNotFoundError as exc:
+            print(f"REPLAY_ERROR records not found: {exc.filename or exc}", file=sys.stderr)
+            sys.exit(2)
+        except OSError as exc:
+            print(f"REPLAY_ERROR {exc}", file=sys.stderr)
+            sys.exit(2)
+        print(canonical_json(asdict(result)))
+        if result.mismatched or result.hash_mismatch:
+            print("REPLAY_MISMATCH")
+            sys.exit(2)
+        if result.errors:
+            print(f"REPLAY_ERROR {result.errors} unparseable record lines", file=sys.stderr)
+            sys.exit(2)
+        if result.total == 0:
+            print("REPLAY_ERROR no decision records found", file=sys.stderr)
+            sys.exit(2)
+        print("REPLAY_OK records")
+        return
+
+    if args.workers is not None:
+        print("ERROR: --workers is only supported with --records", file=sys.stderr)
+        sys.exit(2)
+
     decision_payload = json.loads(Path(args.decision).read_text(encoding="utf-8"))
     decision = DecisionRecord.from_dict(decision_payload)
 
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
 from itertools import product
 import json
+import logging
+import multiprocessing
+import os
 from pathlib import Path
 import re
 from typing import Any
 
 import pandas as pd
 
-from backtest.harness import run_backtest
+from backtest.harness import _feature_metadata, compute_features, run_backtest
+
+logger = logging.getLogger(__name__)
 
 
 REQUIRED_COLUMNS = ("open", "high", "low", "close", "volume")
+DECISION_FLUSH_EVERY = 1024
 
 
 @dataclass(frozen=True)
@@ -151,6 +158,400 @@ def _pair_id(
     return sha256(pair_id_source.encode("utf-8")).hexdigest()[:10]
 
 
+def _window_bounds(
+    df: pd.DataFrame, start: datetime | None, end: datetime | None
+) -> tuple[int, int]:
+    """Positional bounds of ``start <= index <= end`` on a sorted index."""
+    base = 0
+    stop = len(df)
+    if start is not None:
+        base = int(df.index.searchsorted(pd.to_datetime(start, utc=True), side="left"))
+    if end is not None:
+        stop = int(df.index.searchsorted(pd.to_datetime(end, utc=True), side="right"))
+    return base, max(base, stop)
+
+
+@dataclass(frozen=True)
+class _RunTask:
+    """One backtest cell; the OHLCV is referenced by dataset key and row bounds."""
+
+    dataset_key: str
+    start: int
+    stop: int | None
+    run_id: str
+    initial_equity: float
+    end_at_utc: str | None
+    commission_bps: float
+    slippage_bps: float
+
+
+@dataclass(frozen=True)
+class _PendingRun:
+    slot: int
+    task: _RunTask
+    context: dict[str, object]
+
+
+FEATURE_SPEC_ID = sha256(
+    json.dumps(_feature_metadata(), sort_keys=True, separators=(",", ":")).encode("utf-8")
+).hexdigest()[:16]
+
+
+def _dataset_fingerprint(df: pd.DataFrame) -> str:
+    hashed = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return sha256(hashed.tobytes()).hexdigest()
+
+
+class _FeatureCache:
+    """Feature frames shared by cells, keyed by (dataset fingerprint, feature spec, window start).
+
+    Features are causal, so one computation from a start row over the longest
+    planned window serves every window starting there as a prefix slice. Each
+    entry is dropped once its last planned task has taken it, so only start
+    rows still in flight stay resident.
+    """
+
+    def __init__(
+        self,
+        datasets: dict[str, pd.DataFrame],
+        tasks: list[_RunTask],
+        fingerprints: dict[str, str] | None = None,
+    ) -> None:
+        self._datasets = datasets
+        self._fingerprints: dict[str, str] = dict(fingerprints or {})
+        self._extents: dict[tuple[str, str, int], int] = {}
+        self._remaining: dict[tuple[str, str, int], int] = {}
+        self._entries: dict[tuple[str, str, int], tuple[pd.DataFrame, pd.DataFrame]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.peak_entries = 0
+        for task in tasks:
+            key = self._key(task)
+            self._extents[key] = max(self._extents.get(key, 0), self._stop(task))
+            self._remaining[key] = self._remaining.get(key, 0) + 1
+
+    def _stop(self, task: _RunTask) -> int:
+        size = len(self._datasets[task.dataset_key])
+        return size if task.stop is None else min(task.stop, size)
+
+    def _key(self, task: _RunTask) -> tuple[str, str, int]:
+        fingerprint = self._fingerprints.get(task.dataset_key)
+        if fingerprint is None:
+            fingerprint = _dataset_fingerprint(self._datasets[task.dataset_key])
+            self._fingerprints[task.dataset_key] = fingerprint
+        return fingerprint, FEATURE_SPEC_ID, task.start
+
+    def get(self, task: _RunTask) -> tuple[pd.DataFrame, pd.DataFrame]:
+        key = self._key(task)
+        self._remaining[key] -= 1
+        try:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                df = self._datasets[task.dataset_key]
+                entry = compute_features(df.iloc[task.start : self._extents[key]])
+                self._entries[key] = entry
+                self.peak_entries = max(self.peak_entries, len(self._entries))
+            else:
+                self.hits += 1
+        finally:
+            if self._remaining[key] <= 0:
+                self._entries.pop(key, None)
+        size = self._stop(task) - task.start
+        features_df, market_state = entry
+        return features_df.iloc[:size], market_state.iloc[:size]
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "peak_entries": self.peak_entries}
+
+
+def _merge_feature_stats(per_unit: list[dict[str, int]]) -> dict[str, int]:
+    """Combine cache stats of units (or of the serial cache) independently of scheduling."""
+    return {
+        "hits": sum(stats["hits"] for stats in per_unit),
+        "misses": sum(stats["misses"] for stats in per_unit),
+        "peak_entries": max((stats["peak_entries"] for stats in per_unit), default=0),
+    }
+
+
+_WORKER_DATASETS: dict[str, pd.DataFrame] = {}
+_WORKER_OUT_DIR: Path | None = None
+_WORKER_FINGERPRINTS: dict[str, str] = {}
+
+
+def _init_worker(
+    datasets: dict[str, pd.DataFrame], out_dir: Path, fingerprints: dict[str, str]
+) -> None:
+    global _WORKER_DATASETS, _WORKER_OUT_DIR, _WORKER_FINGERPRINTS
+    _WORKER_DATASETS = datasets
+    _WORKER_OUT_DIR = out_dir
+    _WORKER_FINGERPRINTS = fingerprints
+
+
+def _execute_run(
+    task: _RunTask, df: pd.DataFrame, out_dir: Path, feature_cache: _FeatureCache | None
+) -> dict[str, object]:
+    """Run one cell and summarize it; failures are returned, never raised."""
+    features = None
+    if feature_cache is not None:
+        try:
+            features = feature_cache.get(task)
+        except Exception:
+            # Let run_backtest recompute and report its own validation error.
+            features = None
+    try:
+        result = run_backtest(
+            df.iloc[task.start : task.stop],
+            task.initial_equity,
+            run_id=task.run_id,
+            out_dir=out_dir,
+            end_at_utc=task.end_at_utc,
+            commission_bps=task.commission_bps,
+            slippage_bps=task.slippage_bps,
+            execution_mode="precomputed",
+            features=features,
+            decision_flush_every=DECISION_FLUSH_EVERY,
+        )
+        metrics_payload = json.loads(result.metrics_path.read_text(encoding="utf-8"))
+        manifest_payload = json.loads(result.manifest_path.read_text(encoding="utf-8"))
+    except Exception as exc:
+        return {"status": "FAILED", "error": str(exc) or exc.__class__.__name__}
+
+    outcome: dict[str, object] = {
+        "status": "OK",
+        "metrics": metrics_payload,
+        "manifest": manifest_payload,
+        "trades_path": str(result.trades_path),
+        "metrics_path": str(result.metrics_path),
+        "manifest_path": str(result.manifest_path),
+        "decision_records_path": str(result.decision_records_path),
+        "strategy_share_available": True,
+        "strategy_share_error": "",
+        "strategy_counts": {},
+        "primary_strategy": "",
+        "primary_strategy_share": 0.0,
+        "decisions": 0,
+    }
+    try:
+        counts, primary, primary_share, decisions = _strategy_usage(result.decision_records_path)
+        outcome["strategy_counts"] = counts
+        outcome["primary_strategy"] = primary or ""
+        outcome["primary_strategy_share"] = float(primary_share)
+        outcome["decisions"] = int(decisions)
+    except Exception as exc:
+        outcome["strategy_share_available"] = False
+        outcome["strategy_share_error"] = str(exc) or exc.__class__.__name__
+    return outcome
+
+
+def _execute_pooled_unit(
+    tasks: list[_RunTask],
+) -> tuple[int, list[dict[str, object]], dict[str, int]]:
+    """Run one unit of tasks sharing a start row; features are computed here, in the worker."""
+    if _WORKER_OUT_DIR is None:
+        failed: dict[str, object] = {"status": "FAILED", "error": "batch_worker_not_initialized"}
+        return (
+            os.getpid(),
+            [dict(failed) for _ in tasks],
+            {"hits": 0, "misses": 0, "peak_entries": 0},
+        )
+    feature_cache = _FeatureCache(_WORKER_DATASETS, tasks, _WORKER_FINGERPRINTS)
+    outcomes = [
+        _execute_run(task, _WORKER_DATASETS[task.dataset_key], _WORKER_OUT_DIR, feature_cache)
+        for task in tasks
+    ]
+    return os.getpid(), outcomes, feature_cache.stats()
+
+
+def _pool_units(
+    tasks: list[_RunTask], fingerprints: dict[str, str], workers: int
+) -> list[list[int]]:
+    """Task indices grouped by feature key, split so there are at least ``workers`` units."""
+    if not tasks:
+        return []
+    groups: dict[tuple[str, int], list[int]] = {}
+    for index, task in enumerate(tasks):
+        groups.setdefault((fingerprints[task.dataset_key], task.start), []).append(index)
+    splits = max(1, -(-workers // len(groups)))
+    units: list[list[int]] = []
+    for indices in groups.values():
+        size = -(-len(indices) // min(splits, len(indices)))
+        units.extend(indices[pos : pos + size] for pos in range(0, len(indices), size))
+    return units
+
+
+def _execute_runs(
+    tasks: list[_RunTask],
+    datasets: dict[str, pd.DataFrame],
+    *,
+    out_dir: Path,
+    workers: int,
+) -> tuple[list[dict[str, object]], dict[str, int]]:
+    """Execute tasks, returning outcomes in input order and feature cache stats.
+
+    Pool workers receive the datasets once at start-up (inherited on fork).
+    Tasks are submitted in units that share a feature start row, so each
+    worker computes the features for its own units and drops them when the
+    unit is done. The returned cache totals depend only on the units, not on
+    which worker ran them; per-worker counts are logged at debug level.
+    """
+    used = sorted({task.dataset_key for task in tasks})
+    fingerprints = {key: _dataset_fingerprint(datasets[key]) for key in used}
+    outcomes: list[dict[str, object]] = [{} for _ in tasks]
+    if workers <= 1 or len(tasks) <= 1:
+        # Run grouped by start row so each feature entry is evicted before the next is built.
+        feature_cache = _FeatureCache(datasets, tasks, fingerprints)
+        for unit in _pool_units(tasks, fingerprints, 1):
+            for index in unit:
+                task = tasks[index]
+                outcomes[index] = _execute_run(
+                    task, datasets[task.dataset_key], out_dir, feature_cache
+                )
+        return outcomes, _merge_feature_stats([feature_cache.stats()])
+
+    units = _pool_units(tasks, fingerprints, workers)
+    context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    unit_stats: list[dict[str, int]] = []
+    per_worker: dict[int, list[dict[str, int]]] = {}
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(units)),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(datasets, out_dir, fingerprints),
+    ) as pool:
+        futures = [pool.submit(_execute_pooled_unit, [tasks[i] for i in unit]) for unit in units]
+        for unit, future in zip(units, futures):
+            try:
+                pid, unit_outcomes, stats = future.result()
+            except Exception as exc:
+                error = str(exc) or exc.__class__.__name__
+                unit_outcomes = [{"status": "FAILED", "error": error} for _ in unit]
+            else:
+                unit_stats.append(stats)
+                per_worker.setdefault(pid, []).append(stats)
+            for index, outcome in zip(unit, unit_outcomes):
+                outcomes[index] = outcome
+    for pid, stats_list in sorted(per_worker.items()):
+        logger.debug("batch feature cache: pid=%s %s", pid, _merge_feature_stats(stats_list))
+    return outcomes, _merge_feature_stats(unit_stats)
+
+
+def _rows_for_outcome(
+    context: dict[str, object], outcome: dict[str, object], *, out_dir: Path
+) -> tuple[dict[str, object], dict[str, object]]:
+    run_id = str(context["run_id"])
+    index_fields = {
+        "symbol": context["symbol"],
+        "timeframe": context["timeframe"],
+        "split_type": context["split_type"],
+        "segment": context["segment"],
+        "pair_id": context["pair_id"],
+        "window_index": context["window_index"],
+        "config_id": context["config_id"],
+        "config_json": context["config_json"],
+    }
+    if outcome.get("status") != "OK":
+        msg = outcome.get("error")
+        row = {
+            "symbol": context["symbol"],
+            "timeframe": context["timeframe"],
+            "split_type": context["split_type"],
+            "segment": context["segment"],
+            "pair_id": context["pair_id"],
+            "window_index": context["window_index"],
+            "status": "FAILED",
+            "run_id": run_id,
+            "config_id": context["config_id"],
+            "config_json": context["config_json"],
+            "error": msg,
+            "data_quality": context["data_quality"],
+            "timestamp_repaired": context["timestamp_repaired"],
+            "timestamp_repaired_reason": context["timestamp_repaired_reason"],
+            "strategy_share_available": False,
+            "strategy_share_error": "",
+            "strategy_counts_json": "{}",
+            "primary_strategy": "",
+            "primary_strategy_share": 0.0,
+            "initial_equity": context["initial_equity"],
+            "commission_bps": context["commission_bps"],
+            "slippage_bps": context["slippage_bps"],
+            "start_at_utc": context["start_at_utc"],
+            "end_at_utc": context["end_at_utc"],
+        }
+        entry = {"status": "FAILED", **index_fields, "error": msg, "artifacts": {}}
+        return row, entry
+
+    metrics_payload = dict(outcome["metrics"])  # type: ignore[call-overload]
+    manifest_payload = dict(outcome["manifest"])  # type: ignore[call-overload]
+    share_available = bool(outcome.get("strategy_share_available"))
+    row = {
+        "symbol": context["symbol"],
+        "timeframe": context["timeframe"],
+        "split_type": context["split_type"],
+        "segment": context["segment"],
+        "pair_id": context["pair_id"],
+        "window_index": context["window_index"],
+        "status": "OK",
+        "run_id": run_id,
+        "config_id": context["config_id"],
+        "config_json": context["config_json"],
+        "error": None,
+        "data_quality": context["data_quality"],
+        "timestamp_repaired": context["timestamp_repaired"],
+        "timestamp_repaired_reason": context["timestamp_repaired_reason"],
+        "strategy_share_available": share_available,
+        "strategy_share_error": outcome.get("strategy_share_error", ""),
+        "strategy_counts_json": _canonical_json(outcome.get("strategy_counts", {}))
+        if share_available
+        else "{}",
+        "primary_strategy": outcome.get("primary_strategy", ""),
+        "primary_strategy_share": float(outcome.get("primary_strategy_share", 0.0)),
+        "initial_equity": context["initial_equity"],
+        "commission_bps": context["commission_bps"],
+        "slippage_bps": context["slippage_bps"],
+        "start_at_utc": context["start_at_utc"],
+        "end_at_utc": context["end_at_utc"],
+    }
+    for key in (
+        "total_return",
+        "max_drawdown",
+        "num_trades",
+        "win_rate",
+        "avg_win",
+        "avg_loss",
+        "total_costs",
+    ):
+        if key in metrics_payload:
+            row[key] = metrics_payload[key]
+
+    entry = {
+        "status": "OK",
+        **index_fields,
+        "artifacts": {
+            "run_dir": str(Path(out_dir) / run_id),
+            "trades": outcome["trades_path"],
+            "metrics": outcome["metrics_path"],
+            "run_manifest": outcome["manifest_path"],
+            "decision_records": outcome["decision_records_path"],
+        },
+        "metrics": {
+            "total_return": metrics_payload.get("total_return"),
+            "max_drawdown": metrics_payload.get("max_drawdown"),
+            "num_trades": metrics_payload.get("num_trades"),
+            "total_costs": metrics_payload.get("total_costs"),
+        },
+        "run_manifest": {
+            "git_sha": manifest_payload.get("git_sha"),
+            "pnl_method": manifest_payload.get("pnl_method"),
+            "end_of_run_position_handling": manifest_payload.get("end_of_run_position_handling"),
+            "strategy_switch_policy": manifest_payload.get("strategy_switch_policy"),
+        },
+    }
+    return row, entry
+
+
 def run_batch_backtests(
     datasets: dict[str, pd.DataFrame],
     *,
@@ -163,7 +564,18 @@ def run_batch_backtests(
     seed_run_id_prefix: str | None = None,
     param_grid: dict[str, list[Any]] | None = None,
     split: dict[str, object] | None = None,
+    workers: int = 1,
 ) -> BatchResult:
+    """Backtest every dataset x param-grid config (x split segment) cell.
+
+    ``workers > 1`` runs cells in a process pool; summary.csv, the index and
+    summary.json match a serial run except for summary.json ``feature_cache``,
+    whose hit/miss counts depend on how ``workers`` splits cells into pool
+    units. A failing cell only produces its FAILED row.
+    """
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError("batch_invalid_workers")
+
     commission_bps = 0.0
     slippage_bps = 0.0
     if costs is not None:
@@ -212,6 +624,8 @@ def run_batch_backtests(
     used_run_ids: set[str] = set()
     overall_strategy_counts: dict[str, int] = {}
     overall_decisions = 0
+    prepared: dict[str, pd.DataFrame] = {}
+    pending: list[_PendingRun] = []
 
     ordered = sorted(
         ((symbol, timeframe, df) for symbol, df in datasets.items()), key=lambda x: (x[0], x[1])
@@ -230,6 +644,8 @@ def run_batch_backtests(
             df = df.sort_index()
             timestamp_repaired = True
             timestamp_repaired_reason = "non_monotonic_sorted"
+        if error is None and isinstance(df, pd.DataFrame):
+            prepared[symbol_str] = df
 
         if error is not None:
             for config in configs:
@@ -335,15 +751,8 @@ def run_batch_backtests(
                 f"{run_id_prefix}_{config_id}" if param_grid is not None else run_id_prefix
             )
             if split_type:
-                df_for_split = df
-                if effective_start is not None:
-                    df_for_split = df_for_split.loc[
-                        df_for_split.index >= pd.to_datetime(effective_start, utc=True)
-                    ]
-                if effective_end is not None:
-                    df_for_split = df_for_split.loc[
-                        df_for_split.index <= pd.to_datetime(effective_end, utc=True)
-                    ]
+                base, stop = _window_bounds(df, effective_start, effective_end)
+                df_for_split = df.iloc[base:stop]
 
                 split_runs: list[dict[str, object]] = []
                 if split_type == "holdout":
@@ -403,14 +812,14 @@ def run_batch_backtests(
                             "segment": "TRAIN",
                             "pair_id": pair_id,
                             "window_index": None,
-                            "df": df_for_split.iloc[:train_bars],
+                            "bounds": (base, base + train_bars),
                         },
                         {
                             "run_id": f"{run_id_base}__seg-TEST",
                             "segment": "TEST",
                             "pair_id": pair_id,
                             "window_index": None,
-                            "df": df_for_split.iloc[train_bars:],
+                            "bounds": (base + train_bars, stop),
                         },
                     ]
                 else:
@@ -474,7 +883,7 @@ def run_batch_backtests(
                                 "segment": "TRAIN",
                                 "pair_id": pair_id,
                                 "window_index": k,
-                                "df": df_for_split.iloc[start_idx:train_end],
+                                "bounds": (base + start_idx, base + train_end),
                             }
                         )
                         split_runs.append(
@@ -483,7 +892,7 @@ def run_batch_backtests(
                                 "segment": "TEST",
                                 "pair_id": pair_id,
                                 "window_index": k,
-                                "df": df_for_split.iloc[train_end:test_end],
+                                "bounds": (base + train_end, base + test_end),
                             }
                         )
                         k += 1
@@ -580,163 +989,43 @@ def run_batch_backtests(
                         }
                         continue
                     used_run_ids.add(run_id)
-                    run_dir = Path(out_dir) / run_id
-
-                    try:
-                        result = run_backtest(
-                            split_run["df"],
-                            effective_initial_equity,
-                            run_id=run_id,
-                            out_dir=out_dir,
-                            end_at_utc=None,
-                            commission_bps=effective_commission_bps,
-                            slippage_bps=effective_slippage_bps,
-                        )
-                        metrics_payload = json.loads(
-                            result.metrics_path.read_text(encoding="utf-8")
-                        )
-                        manifest_payload = json.loads(
-                            result.manifest_path.read_text(encoding="utf-8")
-                        )
-
-                        strategy_share_available = True
-                        strategy_share_error = ""
-                        strategy_counts_json = "{}"
-                        primary = ""
-                        primary_share = 0.0
-                        decisions = 0
-                        try:
-                            counts, primary_calc, primary_share_calc, decisions_calc = (
-                                _strategy_usage(result.decision_records_path)
-                            )
-                            strategy_counts_json = _canonical_json(counts)
-                            primary = primary_calc or ""
-                            primary_share = float(primary_share_calc)
-                            decisions = int(decisions_calc)
-                            overall_decisions += decisions
-                            for strategy_id, count in counts.items():
-                                overall_strategy_counts[strategy_id] = (
-                                    overall_strategy_counts.get(strategy_id, 0) + count
-                                )
-                        except Exception as exc:
-                            strategy_share_available = False
-                            strategy_share_error = str(exc) or exc.__class__.__name__
-
-                        row = {
-                            "symbol": symbol_str,
-                            "timeframe": tf,
-                            "split_type": split_type,
-                            "segment": segment,
-                            "pair_id": pair_id,
-                            "window_index": window_index,
-                            "status": "OK",
-                            "run_id": run_id,
-                            "config_id": config_id,
-                            "config_json": config_json,
-                            "error": None,
-                            "data_quality": quality,
-                            "timestamp_repaired": timestamp_repaired,
-                            "timestamp_repaired_reason": timestamp_repaired_reason,
-                            "strategy_share_available": bool(strategy_share_available),
-                            "strategy_share_error": strategy_share_error,
-                            "strategy_counts_json": strategy_counts_json,
-                            "primary_strategy": primary,
-                            "primary_strategy_share": float(primary_share),
-                            "initial_equity": float(effective_initial_equity),
-                            "commission_bps": float(effective_commission_bps),
-                            "slippage_bps": float(effective_slippage_bps),
-                            "start_at_utc": start_iso,
-                            "end_at_utc": end_iso,
-                        }
-                        for key in (
-                            "total_return",
-                            "max_drawdown",
-                            "num_trades",
-                            "win_rate",
-                            "avg_win",
-                            "avg_loss",
-                            "total_costs",
-                        ):
-                            if key in metrics_payload:
-                                row[key] = metrics_payload[key]
-
-                        rows.append(row)
-                        index_payload[run_id] = {
-                            "status": "OK",
-                            "symbol": symbol_str,
-                            "timeframe": tf,
-                            "split_type": split_type,
-                            "segment": segment,
-                            "pair_id": pair_id,
-                            "window_index": window_index,
-                            "config_id": config_id,
-                            "config_json": config_json,
-                            "artifacts": {
-                                "run_dir": str(run_dir),
-                                "trades": str(result.trades_path),
-                                "metrics": str(result.metrics_path),
-                                "run_manifest": str(result.manifest_path),
-                                "decision_records": str(result.decision_records_path),
-                            },
-                            "metrics": {
-                                "total_return": metrics_payload.get("total_return"),
-                                "max_drawdown": metrics_payload.get("max_drawdown"),
-                                "num_trades": metrics_payload.get("num_trades"),
-                                "total_costs": metrics_payload.get("total_costs"),
-                            },
-                            "run_manifest": {
-                                "git_sha": manifest_payload.get("git_sha"),
-                                "pnl_method": manifest_payload.get("pnl_method"),
-                                "end_of_run_position_handling": manifest_payload.get(
-                                    "end_of_run_position_handling"
-                                ),
-                                "strategy_switch_policy": manifest_payload.get(
-                                    "strategy_switch_policy"
-                                ),
+                    bounds = split_run["bounds"]
+                    pending.append(
+                        _PendingRun(
+                            slot=len(rows),
+                            task=_RunTask(
+                                dataset_key=symbol_str,
+                                start=int(bounds[0]),
+                                stop=int(bounds[1]),
+                                run_id=run_id,
+                                initial_equity=effective_initial_equity,
+                                end_at_utc=None,
+                                commission_bps=effective_commission_bps,
+                                slippage_bps=effective_slippage_bps,
+                            ),
+                            context={
+                                "symbol": symbol_str,
+                                "timeframe": tf,
+                                "split_type": split_type,
+                                "segment": segment,
+                                "pair_id": pair_id,
+                                "window_index": window_index,
+                                "run_id": run_id,
+                                "config_id": config_id,
+                                "config_json": config_json,
+                                "data_quality": quality,
+                                "timestamp_repaired": timestamp_repaired,
+                                "timestamp_repaired_reason": timestamp_repaired_reason,
+                                "initial_equity": float(effective_initial_equity),
+                                "commission_bps": float(effective_commission_bps),
+                                "slippage_bps": float(effective_slippage_bps),
+                                "start_at_utc": start_iso,
+                                "end_at_utc": end_iso,
                             },
-                        }
-                    except Exception as exc:
-                        msg = str(exc) or exc.__class__.__name__
-                        row = {
-                            "symbol": symbol_str,
-                            "timeframe": tf,
-                            "split_type": split_type,
-                            "segment": segment,
-                            "pair_id": pair_id,
-                            "window_index": window_index,
-                            "status": "FAILED",
-                            "run_id": run_id,
-                            "config_id": config_id,
-                            "config_json": config_json,
-                            "error": msg,
-                            "data_quality": quality,
-                            "timestamp_repaired": timestamp_repaired,
-                            "timestamp_repaired_reason": timestamp_repaired_reason,
-                            "strategy_share_available": False,
-                            "strategy_share_error": "",
-                            "strategy_counts_json": "{}",
-                            "primary_strategy": "",
-                            "primary_strategy_share": 0.0,
-                            "initial_equity": float(effective_initial_equity),
-                            "commission_bps": float(effective_commission_bps),
-                            "slippage_bps": float(effective_slippage_bps),
-                            "start_at_utc": start_iso,
-                            "end_at_utc": end_iso,
-                        }
-                        rows.append(row)
-                        index_payload[run_id] = {
-                            "status": "FAILED",
-                            "symbol": symbol_str,
-                            "timeframe": tf,
-                            "split_type": split_type,
-                            "segment": segment,
-                            "pair_id": pair_id,
-                            "window_index": window_index,
-                            "config_id": config_id,
-                            "config_json": config_json,
-                            "error": msg,
-                            "artifacts": {},
-                        }
+                        )
+                    )
+                    rows.append({})
+                    index_payload[run_id] = {}
 
                 continue
             run_id = run_id_base
@@ -789,160 +1078,57 @@ def run_batch_backtests(
                 }
                 continue
 
-            try:
-                df_slice = df
-                if effective_start is not None:
-                    df_slice = df_slice.loc[
-                        df_slice.index >= pd.to_datetime(effective_start, utc=True)
-                    ]
-                result = run_backtest(
-                    df_slice,
-                    effective_initial_equity,
-                    run_id=run_id,
-                    out_dir=out_dir,
-                    end_at_utc=end_iso,
-                    commission_bps=effective_commission_bps,
-                    slippage_bps=effective_slippage_bps,
-                )
-                metrics_payload = json.loads(result.metrics_path.read_text(encoding="utf-8"))
-                manifest_payload = json.loads(result.manifest_path.read_text(encoding="utf-8"))
-
-                strategy_share_available = True
-                strategy_share_error = ""
-                strategy_counts_json = "{}"
-                primary = ""
-                primary_share = 0.0
-                decisions = 0
-                try:
-                    counts, primary_calc, primary_share_calc, decisions_calc = _strategy_usage(
-                        result.decision_records_path
-                    )
-                    strategy_counts_json = _canonical_json(counts)
-                    primary = primary_calc or ""
-                    primary_share = float(primary_share_calc)
-                    decisions = int(decisions_calc)
-                    overall_decisions += decisions
-                    for strategy_id, count in counts.items():
-                        overall_strategy_counts[strategy_id] = (
-                            overall_strategy_counts.get(strategy_id, 0) + count
-                        )
-                except Exception as exc:
-                    strategy_share_available = False
-                    strategy_share_error = str(exc) or exc.__class__.__name__
-
-                row = {
-                    "symbol": symbol_str,
-                    "timeframe": tf,
-                    "split_type": "",
-                    "segment": "",
-                    "pair_id": "",
-                    "window_index": None,
-                    "status": "OK",
-                    "run_id": run_id,
-                    "config_id": config_id,
-                    "config_json": config_json,
-                    "error": None,
-                    "data_quality": quality,
-                    "timestamp_repaired": timestamp_repaired,
-                    "timestamp_repaired_reason": timestamp_repaired_reason,
-                    "strategy_share_available": bool(strategy_share_available),
-                    "strategy_share_error": strategy_share_error,
-                    "strategy_counts_json": strategy_counts_json,
-                    "primary_strategy": primary,
-                    "primary_strategy_share": float(primary_share),
-                    "initial_equity": float(effective_initial_equity),
-                    "commission_bps": float(effective_commission_bps),
-                    "slippage_bps": float(effective_slippage_bps),
-                    "start_at_utc": start_iso,
-                    "end_at_utc": end_iso,
-                }
-                for key in (
-                    "total_return",
-                    "max_drawdown",
-                    "num_trades",
-                    "win_rate",
-                    "avg_win",
-                    "avg_loss",
-                    "total_costs",
-                ):
-                    if key in metrics_payload:
-                        row[key] = metrics_payload[key]
-
-                rows.append(row)
-                index_payload[run_id] = {
-                    "status": "OK",
-                    "symbol": symbol_str,
-                    "timeframe": tf,
-                    "split_type": "",
-                    "segment": "",
-                    "pair_id": "",
-                    "window_index": None,
-                    "config_id": config_id,
-                    "config_json": config_json,
-                    "artifacts": {
-                        "run_dir": str(run_dir),
-                        "trades": str(result.trades_path),
-                        "metrics": str(result.metrics_path),
-                        "run_manifest": str(result.manifest_path),
-                        "decision_records": str(result.decision_records_path),
-                    },
-                    "metrics": {
-                        "total_return": metrics_payload.get("total_return"),
-                        "max_drawdown": metrics_payload.get("max_drawdown"),
-                        "num_trades": metrics_payload.get("num_trades"),
-                        "total_costs": metrics_payload.get("total_costs"),
-                    },
-                    "run_manifest": {
-                        "git_sha": manifest_payload.get("git_sha"),
-                        "pnl_method": manifest_payload.get("pnl_method"),
-                        "end_of_run_position_handling": manifest_payload.get(
-                            "end_of_run_position_handling"
-                        ),
-                        "strategy_switch_policy": manifest_payload.get("strategy_switch_policy"),
+            base, _stop = _window_bounds(df, effective_start, None)
+            pending.append(
+                _PendingRun(
+                    slot=len(rows),
+                    task=_RunTask(
+                        dataset_key=symbol_str,
+                        start=base,
+                        stop=None,
+                        run_id=run_id,
+                        initial_equity=effective_initial_equity,
+                        end_at_utc=end_iso,
+                        commission_bps=effective_commission_bps,
+                        slippage_bps=effective_slippage_bps,
+                    ),
+                    context={
+                        "symbol": symbol_str,
+                        "timeframe": tf,
+                        "split_type": "",
+                        "segment": "",
+                        "pair_id": "",
+                        "window_index": None,
+                        "run_id": run_id,
+                        "config_id": config_id,
+                        "config_json": config_json,
+                        "data_quality": quality,
+                        "timestamp_repaired": timestamp_repaired,
+                        "timestamp_repaired_reason": timestamp_repaired_reason,
+                        "initial_equity": float(effective_initial_equity),
+                        "commission_bps": float(effective_commission_bps),
+                        "slippage_bps": float(effective_slippage_bps),
+                        "start_at_utc": start_iso,
+                        "end_at_utc": end_iso,
                     },
-                }
-            except Exception as exc:
-                msg = str(exc) or exc.__class__.__name__
-                row = {
-                    "symbol": symbol_str,
-                    "timeframe": tf,
-                    "split_type": "",
-                    "segment": "",
-                    "pair_id": "",
-                    "window_index": None,
-                    "status": "FAILED",
-                    "run_id": run_id,
-                    "config_id": config_id,
-                    "config_json": config_json,
-                    "error": msg,
-                    "data_quality": quality,
-                    "timestamp_repaired": timestamp_repaired,
-                    "timestamp_repaired_reason": timestamp_repaired_reason,
-                    "strategy_share_available": False,
-                    "strategy_share_error": "",
-                    "strategy_counts_json": "{}",
-                    "primary_strategy": "",
-                    "primary_strategy_share": 0.0,
-                    "initial_equity": float(effective_initial_equity),
-                    "commission_bps": float(effective_commission_bps),
-                    "slippage_bps": float(effective_slippage_bps),
-                    "start_at_utc": start_iso,
-                    "end_at_utc": end_iso,
-                }
-                rows.append(row)
-                index_payload[run_id] = {
-                    "status": "FAILED",
-                    "symbol": symbol_str,
-                    "timeframe": tf,
-                    "split_type": "",
-                    "segment": "",
-                    "pair_id": "",
-                    "window_index": None,
-                    "config_id": config_id,
-                    "config_json": config_json,
-                    "error": msg,
-                    "artifacts": {},
-                }
+                )
+            )
+            rows.append({})
+            index_payload[run_id] = {}
+
+    tasks = [item.task for item in pending]
+    outcomes, feature_stats = _execute_runs(tasks, prepared, out_dir=Path(out_dir), workers=workers)
+    for item, outcome in zip(pending, outcomes):
+        row, entry = _rows_for_outcome(item.context, outcome, out_dir=Path(out_dir))
+        rows[item.slot] = row
+        index_payload[str(item.context["run_id"])] = entry
+        if outcome.get("status") == "OK" and outcome.get("strategy_share_available"):
+            counts = outcome.get("strategy_counts", {})
+            overall_decisions += int(outcome.get("decisions", 0))
+            for strategy_id, count in counts.items():
+                overall_strategy_counts[strategy_id] = (
+                    overall_strategy_counts.get(strategy_id, 0) + count
+                )
 
     summary_df = pd.DataFrame(rows)
     if not summary_df.empty:
@@ -1228,6 +1414,7 @@ def run_batch_backtests(
         "test_drawdown_threshold": test_drawdown_threshold,
         "top_by_test_return": top_by_test_return,
         "worst_by_test_drawdown": worst_by_test_drawdown,
+        "feature_cache": feature_stats,
     }
     _write_json(summary_json_path, summary_json)
 
@@ -6,7 +6,10 @@ import json
 from pathlib import Path
 from typing import Any, Mapping
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from audit.decision_records import (
     canonical_json,
@@ -22,11 +25,12 @@ from features.regime import (
     RSI_BEAR,
     RSI_BULL,
     RSI_SLOPE_THRESHOLD,
+    expanding_volatility_regime,
 )
 from risk.contracts import RiskState
 from selector.records import selection_to_record
 from selector.selector import select_strategy
-from strategy_registry import get_strategy, list_strategies, run_strategy
+from strategy_registry import get_strategy, list_strategies, run_strategy, run_strategy_many
 
 
 REQUIRED_COLUMNS = {"open", "high", "low", "close", "volume"}
@@ -40,6 +44,7 @@ class BacktestResult:
     metrics_path: Path
     decision_records_path: Path
     manifest_path: Path
+    decision_records_parquet_path: Path | None = None
 
 
 def _iso_utc(ts: pd.Timestamp) -> str:
@@ -113,22 +118,13 @@ def _market_state(df: pd.DataFrame) -> pd.DataFrame:
     momentum_state = momentum_state.mask(bull_mask, "bull")
     momentum_state = momentum_state.mask(bear_mask, "bear")
 
-    atr_pct = feats["atr_pct"].astype(float)
-    vol = pd.Series("mid", index=feats.index, dtype="string")
-    # Compute percentile cutoffs using only past bars to avoid look-ahead.
-    for idx in range(len(atr_pct)):
-        window = atr_pct.iloc[: idx + 1].dropna()
-        value = atr_pct.iloc[idx]
-        if window.empty or not pd.notna(value):
-            continue
-        low_cut = float(window.quantile(ATR_PCT_LOW_QUANTILE))
-        high_cut = float(window.quantile(ATR_PCT_HIGH_QUANTILE))
-        if not (low_cut < high_cut):
-            continue
-        if value <= low_cut:
-            vol.iloc[idx] = "low"
-        elif value >= high_cut:
-            vol.iloc[idx] = "high"
+    # Percentile cutoffs use only past bars to avoid look-ahead.
+    vol = expanding_volatility_regime(
+        feats["atr_pct"],
+        low_quantile=ATR_PCT_LOW_QUANTILE,
+        high_quantile=ATR_PCT_HIGH_QUANTILE,
+        default="mid",
+    )
 
     structure_state = pd.Series("unknown", index=trend_state.index, dtype="string")
     structure_state = structure_state.mask(trend_state == "flat", "meanrevert")
@@ -146,6 +142,15 @@ def _market_state(df: pd.DataFrame) -> pd.DataFrame:
     return out
 
 
+def compute_features(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Return ``(features_df, market_state)`` for validated OHLCV.
+
+    Every column is causal, so the rows for a prefix of ``df`` equal the same
+    rows computed over all of ``df``.
+    """
+    return _feature_frame(df), _market_state(df)
+
+
 def _resolve_strategy_id(name: str) -> str | None:
     matches = [spec for spec in list_strategies() if spec.name == name]
     if not matches:
@@ -249,12 +254,60 @@ def _git_sha() -> str | None:
         return None
 
 
+_DECISION_COLUMNS = (
+    "ts_utc",
+    "timeframe",
+    "risk_state",
+    "market_state",
+    "market_state_hash",
+    "selection",
+)
+
+_SIDECAR_SCHEMA = pa.schema(
+    [
+        ("seq", pa.int64()),
+        ("ts_utc", pa.string()),
+        ("timeframe", pa.string()),
+        ("risk_state", pa.string()),
+        ("market_state", pa.string()),
+        ("market_state_hash", pa.string()),
+        ("selection", pa.string()),
+    ]
+)
+# Rows per Parquet row group; flushes smaller than this are coalesced first.
+_SIDECAR_ROW_GROUP_ROWS = 8192
+
+
 class _DecisionRecordsWriter:
-    def __init__(self, *, out_path: Path, run_id: str) -> None:
+    """Writes ``decision_records.jsonl``, optionally buffering records column-wise.
+
+    Each record is validated on ``append``, so a bad record is rejected on its
+    own. With ``flush_every > 1`` accepted records are collected into per-field
+    lists and each batch is written in one go; the JSONL bytes match the
+    unbuffered writer. ``parquet_path`` adds a Parquet sidecar, streamed out in
+    row groups of ``_SIDECAR_ROW_GROUP_ROWS`` as batches are flushed, so memory
+    stays bounded by one row group however long the run.
+    """
+
+    def __init__(
+        self,
+        *,
+        out_path: Path,
+        run_id: str,
+        flush_every: int = 1,
+        parquet_path: Path | None = None,
+    ) -> None:
         self._path = out_path
         self._file = out_path.open("w", encoding="utf-8", newline="\n")
         self._run_id = run_id
         self._seq = 0
+        self._flush_every = flush_every
+        self._pending: dict[str, list[Any]] = {name: [] for name in _DECISION_COLUMNS}
+        self._sidecar: dict[str, list[Any]] | None = None
+        self._sidecar_writer: pq.ParquetWriter | None = None
+        if parquet_path is not None:
+            self._sidecar = {name: [] for name in _SIDECAR_SCHEMA.names}
+            self._sidecar_writer = pq.ParquetWriter(str(parquet_path), _SIDECAR_SCHEMA)
 
     def append(
         self,
@@ -265,129 +318,162 @@ class _DecisionRecordsWriter:
         market_state: dict,
         selection: dict,
     ) -> None:
-        record = {
-            "schema_version": "dr.v1",
-            "run_id": self._run_id,
-            "seq": self._seq,
-            "ts_utc": ts_utc,
-            "timeframe": timeframe,
-            "risk_state": risk_state,
-            "market_state": market_state,
-            "market_state_hash": compute_market_state_hash(market_state),
-            "selection": selection,
-        }
-        validate_decision_record_v1(record)
-        self._file.write(canonical_json(record) + "\n")
+        pending = self._pending
+        market_state_hash = compute_market_state_hash(market_state)
+        validate_decision_record_v1(
+            {
+                "schema_version": "dr.v1",
+                "run_id": self._run_id,
+                "seq": self._seq + len(pending["ts_utc"]),
+                "ts_utc": ts_utc,
+                "timeframe": timeframe,
+                "risk_state": risk_state,
+                "market_state": market_state,
+                "market_state_hash": market_state_hash,
+                "selection": selection,
+            }
+        )
+        pending["ts_utc"].append(ts_utc)
+        pending["timeframe"].append(timeframe)
+        pending["risk_state"].append(risk_state)
+        pending["market_state"].append(market_state)
+        pending["market_state_hash"].append(market_state_hash)
+        pending["selection"].append(selection)
+        if len(pending["ts_utc"]) >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        pending = self._pending
+        size = len(pending["ts_utc"])
+        if size == 0:
+            return
+        seqs = list(range(self._seq, self._seq + size))
+        hashes = pending["market_state_hash"]
+        lines = [
+            canonical_json(
+                {
+                    "schema_version": "dr.v1",
+                    "run_id": self._run_id,
+                    "seq": seq,
+                    "ts_utc": ts_utc,
+                    "timeframe": timeframe,
+                    "risk_state": risk_state,
+                    "market_state": market_state,
+                    "market_state_hash": market_state_hash,
+                    "selection": selection,
+                }
+            )
+            for seq, ts_utc, timeframe, risk_state, market_state, market_state_hash, selection in zip(
+                seqs,
+                pending["ts_utc"],
+                pending["timeframe"],
+                pending["risk_state"],
+                pending["market_state"],
+                hashes,
+                pending["selection"],
+            )
+        ]
+        self._file.write("\n".join(lines) + "\n")
         self._file.flush()
-        self._seq += 1
+        if self._sidecar is not None:
+            sidecar = self._sidecar
+            sidecar["seq"].extend(seqs)
+            sidecar["ts_utc"].extend(pending["ts_utc"])
+            sidecar["timeframe"].extend(pending["timeframe"])
+            sidecar["risk_state"].extend(pending["risk_state"])
+            sidecar["market_state"].extend(canonical_json(v) for v in pending["market_state"])
+            sidecar["market_state_hash"].extend(hashes)
+            sidecar["selection"].extend(canonical_json(v) for v in pending["selection"])
+            if len(sidecar["seq"]) >= _SIDECAR_ROW_GROUP_ROWS:
+                self._write_sidecar_row_group()
+        self._seq += size
+        for values in pending.values():
+            values.clear()
+
+    def _write_sidecar_row_group(self) -> None:
+        sidecar = self._sidecar
+        if self._sidecar_writer is None or sidecar is None or not sidecar["seq"]:
+            return
+        self._sidecar_writer.write_table(pa.Table.from_pydict(sidecar, schema=_SIDECAR_SCHEMA))
+        for values in sidecar.values():
+            values.clear()
 
     def close(self) -> None:
-        self._file.close()
-
-
-def run_backtest(
-    df_ohlcv: pd.DataFrame,
-    initial_equity: float,
-    *,
-    run_id: str = "backtest",
-    out_dir: str | Path = "runs",
-    end_at_utc: str | None = None,
-    commission_bps: float = 0.0,
-    slippage_bps: float = 0.0,
-) -> BacktestResult:
-    df = _validate_ohlcv(df_ohlcv)
-    if len(df) < 2:
-        raise ValueError("backtest_insufficient_bars")
-    if not isinstance(initial_equity, (int, float)) or initial_equity <= 0:
-        raise ValueError("backtest_invalid_equity")
-    if (
-        not isinstance(commission_bps, (int, float))
-        or isinstance(commission_bps, bool)
-        or float(commission_bps) < 0.0
-    ):
-        raise ValueError("backtest_invalid_commission_bps")
-    if (
-        not isinstance(slippage_bps, (int, float))
-        or isinstance(slippage_bps, bool)
-        or float(slippage_bps) < 0.0
-    ):
-        raise ValueError("backtest_invalid_slippage_bps")
-
-    instrument = str(df.attrs.get("instrument") or "TEST")
-    features_df = _feature_frame(df)
-    features_df.attrs["instrument"] = instrument
-    market_state = _market_state(df)
-    bundle_fingerprint = _bundle_fingerprint(df)
-
-    pnl_method = "mark_to_market"
-    end_of_run_position_handling = "close_on_end"
-    strategy_switch_policy = "no_forced_flat_on_switch"
-
-    def _apply_slippage(price: float, *, side: str) -> tuple[float, float]:
-        bps = float(slippage_bps)
-        if bps == 0.0:
-            return price, 0.0
-        mult = 1.0 + (bps / 10_000.0) if side == "BUY" else 1.0 - (bps / 10_000.0)
-        effective = float(price) * mult
-        slip_cost = abs(effective - float(price))
-        return effective, slip_cost
+        try:
+            self.flush()
+            self._write_sidecar_row_group()
+        finally:
+            self._file.close()
+            if self._sidecar_writer is not None:
+                self._sidecar_writer.close()
+
+
+EXECUTION_MODES = ("per_bar", "precomputed")
+
+_ACTION_HOLD = 0
+_ACTION_ENTER_LONG = 1
+_ACTION_EXIT_LONG = 2
+_ACTION_CODES = {"ENTER_LONG": _ACTION_ENTER_LONG, "EXIT_LONG": _ACTION_EXIT_LONG}
+
+
+@dataclass
+class _BarDecisions:
+    """Per-bar strategy outputs consumed by the fill loop."""
+
+    actions: np.ndarray
+    qty: np.ndarray
+    stop_loss: np.ndarray
+    take_profit: np.ndarray
+
+    @classmethod
+    def empty(cls, size: int) -> "_BarDecisions":
+        return cls(
+            actions=np.full(size, _ACTION_HOLD, dtype=np.int8),
+            qty=np.full(size, np.nan, dtype=np.float64),
+            stop_loss=np.full(size, np.nan, dtype=np.float64),
+            take_profit=np.full(size, np.nan, dtype=np.float64),
+        )
 
-    def _commission_cost(*, qty: float, price: float) -> float:
-        bps = float(commission_bps)
-        if bps == 0.0:
-            return 0.0
-        notional = abs(float(qty) * float(price))
-        return notional * (bps / 10_000.0)
+    def set(self, i: int, decision: Any) -> None:
+        code = _ACTION_CODES.get(decision.action.value, _ACTION_HOLD)
+        self.actions[i] = code
+        if code == _ACTION_ENTER_LONG:
+            self.qty[i] = float(decision.risk.max_position_size)
+            self.stop_loss[i] = float(decision.risk.stop_loss)
+            self.take_profit[i] = float(decision.risk.take_profit)
 
-    run_path = Path(out_dir) / run_id
-    run_path.mkdir(parents=True, exist_ok=True)
-    decision_path = run_path / "decision_records.jsonl"
-    writer = _DecisionRecordsWriter(out_path=decision_path, run_id=run_id)
 
-    equity = float(initial_equity)
-    equity_curve = [equity]
-    trades: list[dict[str, object]] = []
-    trade_pnls: list[float] = []
-    position_qty = 0.0
-    entry_price = 0.0
-    position_commission_paid = 0.0
-    stop_loss = None
-    take_profit = None
-    total_costs = 0.0
-    costs_breakdown = {"commission": 0.0, "slippage": 0.0}
+@dataclass
+class _FillResult:
+    trades: list[dict[str, object]]
+    trade_pnls: list[float]
+    equity_curve: list[float]
+    total_costs: float
+    costs_breakdown: dict[str, float]
 
-    metadata: dict[str, Any] = {
-        "bundle_fingerprint": bundle_fingerprint,
-        "instrument": instrument,
-        "features": _feature_metadata(),
-    }
 
-    config: dict[str, object] = {
-        "execution_timing": "next_open",
-        "stop_takeprofit_policy": "stop_first_if_both_touched",
-        "costs": {"commission_bps": float(commission_bps), "slippage_bps": float(slippage_bps)},
-        "run_id": run_id,
-        "end_at_utc": end_at_utc,
-        "initial_equity": initial_equity,
+def _market_state_row(trend: object, momentum: object, vol: object, structure: object) -> dict:
+    return {
+        "trend_state": str(trend),
+        "momentum_state": str(momentum),
+        "volatility_regime": str(vol),
+        "structure_state": str(structure),
     }
 
-    index = df.index
-    sim_end_idx = len(df) - 1
-    if end_at_utc is not None:
-        cutoff = pd.to_datetime(end_at_utc, utc=True)
-        sim_end_idx = int(index.searchsorted(cutoff, side="right") - 1)
-        if sim_end_idx < 1:
-            raise ValueError("backtest_end_before_start")
-    decision_indices = list(range(sim_end_idx))
 
+def _decide_per_bar(
+    *,
+    market_state: pd.DataFrame,
+    features_df: pd.DataFrame,
+    metadata: Mapping[str, Any],
+    index: pd.DatetimeIndex,
+    decision_indices: range,
+    writer: "_DecisionRecordsWriter",
+) -> _BarDecisions:
+    decisions = _BarDecisions.empty(len(decision_indices))
     for i in decision_indices:
         as_of_ts = index[i]
-        next_ts = index[i + 1]
         as_of_utc = _iso_utc(as_of_ts)
-        next_open = float(df.iloc[i + 1]["open"])
-        next_high = float(df.iloc[i + 1]["high"])
-        next_low = float(df.iloc[i + 1]["low"])
-        next_close = float(df.iloc[i + 1]["close"])
 
         state_row = market_state.loc[as_of_ts]
         market_state_row = {
@@ -403,7 +489,6 @@ def run_backtest(
         selection_record["as_of_utc"] = as_of_utc
 
         decision = None
-        strategy_version: str | None = None
         if selection.strategy_id is not None:
             registry_id = _resolve_strategy_id(selection.strategy_id)
             if registry_id is not None:
@@ -414,8 +499,7 @@ def run_backtest(
                     selection_record["error"] = str(exc)
                     decision = None
                 if decision is not None:
-                    strategy_version = str(strategy.spec.version)
-                    selection_record["strategy_version"] = strategy_version
+                    selection_record["strategy_version"] = str(strategy.spec.version)
                     selection_record["decision_action"] = decision.action.value
                     selection_record["provenance"] = decision.provenance.to_dict()
                     selection_record["resolved_strategy_id"] = registry_id
@@ -427,15 +511,185 @@ def run_backtest(
             market_state=market_state_row,
             selection=selection_record,
         )
+        if decision is not None:
+            decisions.set(i, decision)
+    return decisions
+
+
+def _decide_precomputed(
+    *,
+    market_state: pd.DataFrame,
+    features_df: pd.DataFrame,
+    metadata: Mapping[str, Any],
+    index: pd.DatetimeIndex,
+    decision_indices: range,
+    writer: "_DecisionRecordsWriter",
+) -> _BarDecisions:
+    """Resolve selection and strategy decisions for every bar before writing records.
+
+    Selection is a pure function of the market-state tuple, so it runs once per
+    distinct state; each selected strategy is evaluated for all of its bars in a
+    single ``run_strategy_many`` call.
+    """
+    size = len(decision_indices)
+    decisions = _BarDecisions.empty(size)
+    as_of_utcs = [_iso_utc(ts) for ts in index[:size]]
+    aligned = market_state.reindex(index[:size])
+    columns = [
+        aligned[name].tolist() if name in aligned.columns else ["unknown"] * size
+        for name in ("trend_state", "momentum_state", "volatility_regime", "structure_state")
+    ]
+    state_rows = [_market_state_row(*values) for values in zip(*columns)]
+
+    selections: dict[tuple[str, ...], tuple[dict[str, object], str | None]] = {}
+    base_records: list[dict[str, object]] = []
+    bars_by_strategy: dict[str, list[int]] = {}
+    registry_ids: dict[str, str | None] = {}
+    for i, row in enumerate(state_rows):
+        key = tuple(row.values())
+        cached = selections.get(key)
+        if cached is None:
+            selection = select_strategy(row, RiskState.GREEN)
+            record = selection_to_record(selection)
+            record["strategy_id"] = selection.strategy_id
+            registry_id = None
+            if selection.strategy_id is not None:
+                if selection.strategy_id not in registry_ids:
+                    registry_ids[selection.strategy_id] = _resolve_strategy_id(
+                        selection.strategy_id
+                    )
+                registry_id = registry_ids[selection.strategy_id]
+            cached = (record, registry_id)
+            selections[key] = cached
+        base_records.append(cached[0])
+        if cached[1] is not None:
+            bars_by_strategy.setdefault(cached[1], []).append(i)
+
+    outcomes: dict[int, tuple[Any, str, str]] = {}
+    for registry_id, bars in bars_by_strategy.items():
+        strategy = get_strategy(registry_id)
+        results = run_strategy_many(strategy, features_df, metadata, [as_of_utcs[i] for i in bars])
+        version = str(strategy.spec.version)
+        for i, outcome in zip(bars, results):
+            outcomes[i] = (outcome, registry_id, version)
+
+    for i in decision_indices:
+        selection_record = dict(base_records[i])
+        selection_record["as_of_utc"] = as_of_utcs[i]
+        resolved = outcomes.get(i)
+        if resolved is not None:
+            outcome, registry_id, version = resolved
+            if isinstance(outcome, Exception):
+                selection_record["error"] = str(outcome)
+            else:
+                selection_record["strategy_version"] = version
+                selection_record["decision_action"] = outcome.action.value
+                selection_record["provenance"] = outcome.provenance.to_dict()
+                selection_record["resolved_strategy_id"] = registry_id
+                decisions.set(i, outcome)
+        writer.append(
+            ts_utc=as_of_utcs[i],
+            timeframe="1m",
+            risk_state=RiskState.GREEN.value,
+            market_state=state_rows[i],
+            selection=selection_record,
+        )
+    return decisions
+
+
+def _simulate_fills(
+    df: pd.DataFrame,
+    decisions: _BarDecisions,
+    *,
+    initial_equity: float,
+    sim_end_idx: int,
+    commission_bps: float,
+    slippage_bps: float,
+    pnl_method: str,
+    end_of_run_position_handling: str,
+) -> _FillResult:
+    index = df.index
+    opens = df["open"].to_numpy(dtype=np.float64)
+    highs = df["high"].to_numpy(dtype=np.float64)
+    lows = df["low"].to_numpy(dtype=np.float64)
+    closes = df["close"].to_numpy(dtype=np.float64)
+
+    def _apply_slippage(price: float, *, side: str) -> tuple[float, float]:
+        bps = float(slippage_bps)
+        if bps == 0.0:
+            return price, 0.0
+        mult = 1.0 + (bps / 10_000.0) if side == "BUY" else 1.0 - (bps / 10_000.0)
+        effective = float(price) * mult
+        slip_cost = abs(effective - float(price))
+        return effective, slip_cost
+
+    def _commission_cost(*, qty: float, price: float) -> float:
+        bps = float(commission_bps)
+        if bps == 0.0:
+            return 0.0
+        notional = abs(float(qty) * float(price))
+        return notional * (bps / 10_000.0)
+
+    equity = float(initial_equity)
+    equity_curve = [equity]
+    trades: list[dict[str, object]] = []
+    trade_pnls: list[float] = []
+    position_qty = 0.0
+    entry_price = 0.0
+    position_commission_paid = 0.0
+    stop_loss = None
+    take_profit = None
+    total_costs = 0.0
+    costs_breakdown = {"commission": 0.0, "slippage": 0.0}
+
+    def _close_position(ts: pd.Timestamp, price_raw: float, reason: str) -> None:
+        nonlocal equity, total_costs, position_qty, entry_price, position_commission_paid
+        nonlocal stop_loss, take_profit
+        exit_price_eff, slip_exit = _apply_slippage(price_raw, side="SELL")
+        exit_comm = _commission_cost(qty=position_qty, price=exit_price_eff)
+        equity -= exit_comm
+        gross = (exit_price_eff - entry_price) * position_qty
+        equity += gross
+        net = gross - position_commission_paid - exit_comm
+        trades.append(
+            {
+                "ts_utc": _iso_utc(ts),
+                "side": "SELL",
+                "qty": position_qty,
+                "price": exit_price_eff,
+                "price_raw": price_raw,
+                "commission": exit_comm,
+                "slippage": abs(position_qty) * slip_exit,
+                "reason": reason,
+                "pnl": net,
+                "equity_after": equity,
+            }
+        )
+        total_costs += exit_comm + (abs(position_qty) * slip_exit)
+        costs_breakdown["commission"] += exit_comm
+        costs_breakdown["slippage"] += abs(position_qty) * slip_exit
+        trade_pnls.append(net)
+        position_qty = 0.0
+        entry_price = 0.0
+        position_commission_paid = 0.0
+        stop_loss = None
+        take_profit = None
 
-        action = decision.action.value if decision is not None else "HOLD"
-        if action == "ENTER_LONG" and position_qty == 0.0:
-            qty = float(decision.risk.max_position_size)
+    actions = decisions.actions
+    for i in range(sim_end_idx):
+        action = actions[i]
+        next_open = float(opens[i + 1])
+        next_high = float(highs[i + 1])
+        next_low = float(lows[i + 1])
+        next_close = float(closes[i + 1])
+
+        if action == _ACTION_ENTER_LONG and position_qty == 0.0:
+            qty = float(decisions.qty[i])
             entry_price, slip_cost = _apply_slippage(next_open, side="BUY")
             position_qty = qty
             position_commission_paid = 0.0
-            stop_loss = float(decision.risk.stop_loss)
-            take_profit = float(decision.risk.take_profit)
+            stop_loss = float(decisions.stop_loss[i])
+            take_profit = float(decisions.take_profit[i])
             entry_comm = _commission_cost(qty=qty, price=entry_price)
             equity -= entry_comm
             position_commission_paid += entry_comm
@@ -444,7 +698,7 @@ def run_backtest(
             costs_breakdown["slippage"] += abs(qty) * slip_cost
             trades.append(
                 {
-                    "ts_utc": _iso_utc(next_ts),
+                    "ts_utc": _iso_utc(index[i + 1]),
                     "side": "BUY",
                     "qty": qty,
                     "price": entry_price,
@@ -456,163 +710,185 @@ def run_backtest(
                     "equity_after": equity,
                 }
             )
-            if stop_loss is not None and take_profit is not None:
-                stop_hit = next_low <= stop_loss
-                take_hit = next_high >= take_profit
-                if stop_hit:
-                    exit_price = stop_loss
-                elif take_hit:
-                    exit_price = take_profit
-                else:
-                    exit_price = None
-                if exit_price is not None:
-                    exit_price_eff, slip_exit = _apply_slippage(float(exit_price), side="SELL")
-                    exit_comm = _commission_cost(qty=position_qty, price=exit_price_eff)
-                    equity -= exit_comm
-                    gross = (exit_price_eff - entry_price) * position_qty
-                    equity += gross
-                    net = gross - position_commission_paid - exit_comm
-                    trades.append(
-                        {
-                            "ts_utc": _iso_utc(next_ts),
-                            "side": "SELL",
-                            "qty": position_qty,
-                            "price": exit_price_eff,
-                            "price_raw": float(exit_price),
-                            "commission": exit_comm,
-                            "slippage": abs(position_qty) * slip_exit,
-                            "reason": "stop_loss" if stop_hit else "take_profit",
-                            "pnl": net,
-                            "equity_after": equity,
-                        }
-                    )
-                    total_costs += exit_comm + (abs(position_qty) * slip_exit)
-                    costs_breakdown["commission"] += exit_comm
-                    costs_breakdown["slippage"] += abs(position_qty) * slip_exit
-                    trade_pnls.append(net)
-                    position_qty = 0.0
-                    entry_price = 0.0
-                    position_commission_paid = 0.0
-                    stop_loss = None
-                    take_profit = None
-        elif action == "EXIT_LONG" and position_qty > 0.0:
-            exit_price_eff, slip_exit = _apply_slippage(next_open, side="SELL")
-            exit_comm = _commission_cost(qty=position_qty, price=exit_price_eff)
-            equity -= exit_comm
-            gross = (exit_price_eff - entry_price) * position_qty
-            equity += gross
-            net = gross - position_commission_paid - exit_comm
-            trades.append(
-                {
-                    "ts_utc": _iso_utc(next_ts),
-                    "side": "SELL",
-                    "qty": position_qty,
-                    "price": exit_price_eff,
-                    "price_raw": next_open,
-                    "commission": exit_comm,
-                    "slippage": abs(position_qty) * slip_exit,
-                    "reason": "exit_long",
-                    "pnl": net,
-                    "equity_after": equity,
-                }
-            )
-            total_costs += exit_comm + (abs(position_qty) * slip_exit)
-            costs_breakdown["commission"] += exit_comm
-            costs_breakdown["slippage"] += abs(position_qty) * slip_exit
-            trade_pnls.append(net)
-            position_qty = 0.0
-            entry_price = 0.0
-            position_commission_paid = 0.0
-            stop_loss = None
-            take_profit = None
+            # Same-bar stop/take check after entry; stop wins when both are touched.
+            stop_hit = next_low <= stop_loss
+            take_hit = next_high >= take_profit
+            if stop_hit or take_hit:
+                exit_price = stop_loss if stop_hit else take_profit
+                _close_position(
+                    index[i + 1], float(exit_price), "stop_loss" if stop_hit else "take_profit"
+                )
+        elif action == _ACTION_EXIT_LONG and position_qty > 0.0:
+            _close_position(index[i + 1], next_open, "exit_long")
         elif position_qty > 0.0 and stop_loss is not None and take_profit is not None:
             stop_hit = next_low <= stop_loss
             take_hit = next_high >= take_profit
             if stop_hit or take_hit:
                 exit_price = stop_loss if stop_hit else take_profit
-                exit_price_eff, slip_exit = _apply_slippage(float(exit_price), side="SELL")
-                exit_comm = _commission_cost(qty=position_qty, price=exit_price_eff)
-                equity -= exit_comm
-                gross = (exit_price_eff - entry_price) * position_qty
-                equity += gross
-                net = gross - position_commission_paid - exit_comm
-                trades.append(
-                    {
-                        "ts_utc": _iso_utc(next_ts),
-                        "side": "SELL",
-                        "qty": position_qty,
-                        "price": exit_price_eff,
-                        "price_raw": float(exit_price),
-                        "commission": exit_comm,
-                        "slippage": abs(position_qty) * slip_exit,
-                        "reason": "stop_loss" if stop_hit else "take_profit",
-                        "pnl": net,
-                        "equity_after": equity,
-                    }
+                _close_position(
+                    index[i + 1], float(exit_price), "stop_loss" if stop_hit else "take_profit"
                 )
-                total_costs += exit_comm + (abs(position_qty) * slip_exit)
-                costs_breakdown["commission"] += exit_comm
-                costs_breakdown["slippage"] += abs(position_qty) * slip_exit
-                trade_pnls.append(net)
-                position_qty = 0.0
-                entry_price = 0.0
-                position_commission_paid = 0.0
-                stop_loss = None
-                take_profit = None
 
         if pnl_method == "mark_to_market" and position_qty > 0.0:
             equity_curve.append(equity + (next_close - entry_price) * position_qty)
         else:
             equity_curve.append(equity)
 
-    writer.close()
-
     if end_of_run_position_handling == "close_on_end" and position_qty > 0.0:
-        end_ts = index[sim_end_idx]
-        end_close = float(df.iloc[sim_end_idx]["close"])
-        exit_price_eff, slip_exit = _apply_slippage(end_close, side="SELL")
-        exit_comm = _commission_cost(qty=position_qty, price=exit_price_eff)
-        equity -= exit_comm
-        gross = (exit_price_eff - entry_price) * position_qty
-        equity += gross
-        net = gross - position_commission_paid - exit_comm
-        trades.append(
-            {
-                "ts_utc": _iso_utc(end_ts),
-                "side": "SELL",
-                "qty": position_qty,
-                "price": exit_price_eff,
-                "price_raw": end_close,
-                "commission": exit_comm,
-                "slippage": abs(position_qty) * slip_exit,
-                "reason": "close_on_end",
-                "pnl": net,
-                "equity_after": equity,
-            }
-        )
-        total_costs += exit_comm + (abs(position_qty) * slip_exit)
-        costs_breakdown["commission"] += exit_comm
-        costs_breakdown["slippage"] += abs(position_qty) * slip_exit
-        trade_pnls.append(net)
-        position_qty = 0.0
-        entry_price = 0.0
-        position_commission_paid = 0.0
-        stop_loss = None
-        take_profit = None
+        _close_position(index[sim_end_idx], float(closes[sim_end_idx]), "close_on_end")
         equity_curve[-1] = equity
 
+    return _FillResult(
+        trades=trades,
+        trade_pnls=trade_pnls,
+        equity_curve=equity_curve,
+        total_costs=total_costs,
+        costs_breakdown=costs_breakdown,
+    )
+
+
+def run_backtest(
+    df_ohlcv: pd.DataFrame,
+    initial_equity: float,
+    *,
+    run_id: str = "backtest",
+    out_dir: str | Path = "runs",
+    end_at_utc: str | None = None,
+    commission_bps: float = 0.0,
+    slippage_bps: float = 0.0,
+    execution_mode: str = "per_bar",
+    features: tuple[pd.DataFrame, pd.DataFrame] | None = None,
+    decision_flush_every: int = 1,
+    decision_records_parquet: bool = False,
+) -> BacktestResult:
+    """Run a next-open backtest over ``df_ohlcv``.
+
+    ``execution_mode="precomputed"`` resolves selection and strategy decisions for
+    all bars up front and then runs the fill loop over arrays; its artifacts are
+    byte-identical to the default ``"per_bar"`` mode.
+
+    ``features`` may carry a precomputed ``compute_features`` result aligned with
+    ``df_ohlcv`` (e.g. a prefix slice of a longer computation) to skip that step.
+
+    ``decision_flush_every`` buffers that many decision records between writes and
+    ``decision_records_parquet`` adds a ``decision_records.parquet`` sidecar; the
+    JSONL output is the same either way.
+    """
+    df = _validate_ohlcv(df_ohlcv)
+    if len(df) < 2:
+        raise ValueError("backtest_insufficient_bars")
+    if not isinstance(initial_equity, (int, float)) or initial_equity <= 0:
+        raise ValueError("backtest_invalid_equity")
+    if (
+        not isinstance(commission_bps, (int, float))
+        or isinstance(commission_bps, bool)
+        or float(commission_bps) < 0.0
+    ):
+        raise ValueError("backtest_invalid_commission_bps")
+    if (
+        not isinstance(slippage_bps, (int, float))
+        or isinstance(slippage_bps, bool)
+        or float(slippage_bps) < 0.0
+    ):
+        raise ValueError("backtest_invalid_slippage_bps")
+    if execution_mode not in EXECUTION_MODES:
+        raise ValueError("backtest_invalid_execution_mode")
+    if (
+        not isinstance(decision_flush_every, int)
+        or isinstance(decision_flush_every, bool)
+        or decision_flush_every < 1
+    ):
+        raise ValueError("backtest_invalid_decision_flush_every")
+
+    if features is None:
+        features_df, market_state = compute_features(df)
+    else:
+        features_df, market_state = features
+        if not (features_df.index.equals(df.index) and market_state.index.equals(df.index)):
+            raise ValueError("backtest_features_misaligned")
+        features_df = features_df.copy(deep=False)
+    instrument = str(df.attrs.get("instrument") or "TEST")
+    features_df.attrs["instrument"] = instrument
+    bundle_fingerprint = _bundle_fingerprint(df)
+
+    pnl_method = "mark_to_market"
+    end_of_run_position_handling = "close_on_end"
+    strategy_switch_policy = "no_forced_flat_on_switch"
+
+    run_path = Path(out_dir) / run_id
+    run_path.mkdir(parents=True, exist_ok=True)
+    decision_path = run_path / "decision_records.jsonl"
+    decision_parquet_path = (
+        run_path / "decision_records.parquet" if decision_records_parquet else None
+    )
+    writer = _DecisionRecordsWriter(
+        out_path=decision_path,
+        run_id=run_id,
+        flush_every=decision_flush_every,
+        parquet_path=decision_parquet_path,
+    )
+
+    metadata: dict[str, Any] = {
+        "bundle_fingerprint": bundle_fingerprint,
+        "instrument": instrument,
+        "features": _feature_metadata(),
+    }
+
+    config: dict[str, object] = {
+        "execution_timing": "next_open",
+        "stop_takeprofit_policy": "stop_first_if_both_touched",
+        "costs": {"commission_bps": float(commission_bps), "slippage_bps": float(slippage_bps)},
+        "run_id": run_id,
+        "end_at_utc": end_at_utc,
+        "initial_equity": initial_equity,
+    }
+
+    index = df.index
+    sim_end_idx = len(df) - 1
+    if end_at_utc is not None:
+        cutoff = pd.to_datetime(end_at_utc, utc=True)
+        sim_end_idx = int(index.searchsorted(cutoff, side="right") - 1)
+        if sim_end_idx < 1:
+            raise ValueError("backtest_end_before_start")
+
+    decide = _decide_precomputed if execution_mode == "precomputed" else _decide_per_bar
+    try:
+        decisions = decide(
+            market_state=market_state,
+            features_df=features_df,
+            metadata=metadata,
+            index=index,
+            decision_indices=range(sim_end_idx),
+            writer=writer,
+        )
+    finally:
+        writer.close()
+
+    fills = _simulate_fills(
+        df,
+        decisions,
+        initial_equity=initial_equity,
+        sim_end_idx=sim_end_idx,
+        commission_bps=commission_bps,
+        slippage_bps=slippage_bps,
+        pnl_method=pnl_method,
+        end_of_run_position_handling=end_of_run_position_handling,
+    )
+    trades = fills.trades
+    costs_breakdown = fills.costs_breakdown
+
     trades_path = run_path / "trades.parquet"
     metrics_path = run_path / "metrics.json"
     decision_records_path = decision_path
     _write_trades(trades_path, trades)
 
-    metrics = _metrics_from_equity(equity_curve, trade_pnls)
+    metrics = _metrics_from_equity(fills.equity_curve, fills.trade_pnls)
     metrics_payload = dict(metrics)
     metrics_payload["config"] = config
     metrics_payload["pnl_method"] = pnl_method
     metrics_payload["end_of_run_position_handling"] = end_of_run_position_handling
     metrics_payload["strategy_switch_policy"] = strategy_switch_policy
-    metrics_payload["total_costs"] = float(total_costs)
+    metrics_payload["total_costs"] = float(fills.total_costs)
     metrics_payload["costs_breakdown"] = {
         "commission": float(costs_breakdown["commission"]),
         "slippage": float(costs_breakdown["slippage"]),
@@ -620,6 +896,13 @@ def run_backtest(
     _write_json(metrics_path, metrics_payload)
 
     manifest_path = run_path / "run_manifest.json"
+    artifacts = {
+        "trades": str(trades_path),
+        "metrics": str(metrics_path),
+        "decision_records": str(decision_records_path),
+    }
+    if decision_parquet_path is not None:
+        artifacts["decision_records_parquet"] = str(decision_parquet_path)
     manifest_payload: dict[str, object] = {
         "run_id": run_id,
         "git_sha": _git_sha(),
@@ -629,11 +912,7 @@ def run_backtest(
         "strategy_switch_policy": strategy_switch_policy,
         "data_start_utc": _iso_utc(index[0]),
         "data_end_utc": _iso_utc(index[-1]),
-        "artifacts": {
-            "trades": str(trades_path),
-            "metrics": str(metrics_path),
-            "decision_records": str(decision_records_path),
-        },
+        "artifacts": artifacts,
     }
     _write_json(manifest_path, manifest_payload)
 
@@ -644,4 +923,5 @@ def run_backtest(
         metrics_path=metrics_path,
         decision_records_path=decision_records_path,
         manifest_path=manifest_path,
+        decision_records_parquet_path=decision_parquet_path,
     )
@@ -9,12 +9,16 @@ This module implements:
 from __future__ import annotations
 
 import base64
+import hashlib
+import heapq
 import json
+import os
 import subprocess
+import tempfile
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Mapping, Protocol, Sequence
+from typing import Any, BinaryIO, Callable, Iterator, Mapping, Protocol
 
 from s3.canonical import canonical_json_bytes, sha256_hex_bytes
 
@@ -22,6 +26,9 @@ RAW_SCHEMA_VERSION = "s1.raw.capture.v2"
 CANONICAL_SCHEMA_VERSION = "s1.canonical.ohlcv.v1"
 STATUS_SCHEMA_VERSION = "s1.status.v1"
 MANIFEST_SCHEMA_VERSION = "s1.manifest.v2"
+RAW_CHECKPOINT_SCHEMA_VERSION = "s1.raw.checkpoint.v1"
+RAW_CHECKPOINT_TAIL_BYTES = 4096
+DEFAULT_MAX_RECORDS_IN_MEMORY = 100_000
 
 TRANSPORT_WS = "ws"
 TRANSPORT_REST = "rest"
@@ -84,12 +91,6 @@ def _normalize_text_decimal(value: Decimal) -> str:
     return text or "0"
 
 
-def _jsonl_bytes(rows: Sequence[Mapping[str, Any]]) -> bytes:
-    if not rows:
-        return b""
-    return b"\n".join(canonical_json_bytes(row) for row in rows) + b"\n"
-
-
 def _write_bytes(path: Path, payload: bytes) -> tuple[str, int]:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_bytes(payload)
@@ -97,7 +98,11 @@ def _write_bytes(path: Path, payload: bytes) -> tuple[str, int]:
 
 
 def _sha256_file(path: Path) -> str:
-    return sha256_hex_bytes(path.read_bytes())
+    hasher = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
 
 
 def _maybe_git_sha() -> str | None:
@@ -206,25 +211,130 @@ def _validate_transport_source(transport: str, source: str) -> None:
 
 
 class RawCaptureWriter:
-    """Append-only raw exchange response capture with per-stream ingest sequence."""
+    """Append-only raw exchange response capture with per-stream ingest sequence.
 
-    def __init__(self, raw_log_path: Path):
+    Per-stream sequence state is checkpointed to ``<raw log>.checkpoint.json``
+    (byte offset, tail hash, last seq per stream). On open a checkpoint that
+    matches the log tail is trusted and only records appended after its offset
+    are read; otherwise the whole log is scanned. Appends go through one
+    long-lived handle that is flushed every ``sync_every`` records (and fsynced
+    when ``fsync`` is set); call ``close()`` or use the writer as a context
+    manager to flush the last batch.
+    """
+
+    def __init__(
+        self,
+        raw_log_path: Path,
+        *,
+        sync_every: int = 1,
+        fsync: bool = False,
+        checkpoint_every: int = 1024,
+    ):
+        if sync_every <= 0:
+            raise ValueError("sync_every must be > 0")
+        if checkpoint_every <= 0:
+            raise ValueError("checkpoint_every must be > 0")
         self.raw_log_path = Path(raw_log_path)
+        self.checkpoint_path = self.raw_log_path.with_name(
+            self.raw_log_path.name + ".checkpoint.json"
+        )
+        self._sync_every = sync_every
+        self._fsync = fsync
+        self._checkpoint_every = checkpoint_every
         self._seq_by_stream: dict[str, int] = {}
+        self._fh: BinaryIO | None = None
+        self._offset = 0
+        self._tail = b""
+        self._unsynced = 0
+        self._since_checkpoint = 0
         self._load_existing_state()
 
     def _load_existing_state(self) -> None:
         if not self.raw_log_path.exists():
             return
-        for line in self.raw_log_path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            record = json.loads(line)
-            stream = str(record["stream_id"])
-            seq = int(record["ingest_seq"])
-            prev = self._seq_by_stream.get(stream, 0)
-            if seq > prev:
-                self._seq_by_stream[stream] = seq
+        self._offset = self.raw_log_path.stat().st_size
+        with self.raw_log_path.open("rb") as fh:
+            fh.seek(max(0, self._offset - RAW_CHECKPOINT_TAIL_BYTES))
+            self._tail = fh.read()
+            start = self._restore_checkpoint(fh)
+            fh.seek(start)
+            for line in fh:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                stream = str(record["stream_id"])
+                seq = int(record["ingest_seq"])
+                prev = self._seq_by_stream.get(stream, 0)
+                if seq > prev:
+                    self._seq_by_stream[stream] = seq
+        if start != self._offset:
+            self._write_checkpoint()
+
+    def _restore_checkpoint(self, fh: BinaryIO) -> int:
+        """Load the checkpoint if it matches the log and return the offset to scan from."""
+        try:
+            checkpoint = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            offset = checkpoint["offset"]
+            seq_by_stream = checkpoint["seq_by_stream"]
+            if (
+                checkpoint.get("schema_version") != RAW_CHECKPOINT_SCHEMA_VERSION
+                or not isinstance(offset, int)
+                or not 0 <= offset <= self._offset
+                or not isinstance(seq_by_stream, dict)
+            ):
+                return 0
+            tail_start = max(0, offset - RAW_CHECKPOINT_TAIL_BYTES)
+            fh.seek(tail_start)
+            tail = fh.read(offset - tail_start)
+            if sha256_hex_bytes(tail) != checkpoint["tail_sha256"]:
+                return 0
+            self._seq_by_stream = {str(stream): int(seq) for stream, seq in seq_by_stream.items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            self._seq_by_stream = {}
+            return 0
+        return offset
+
+    def _write_checkpoint(self) -> None:
+        payload = {
+            "schema_version": RAW_CHECKPOINT_SCHEMA_VERSION,
+            "offset": self._offset,
+            "tail_sha256": sha256_hex_bytes(self._tail),
+            "seq_by_stream": dict(sorted(self._seq_by_stream.items())),
+        }
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with tmp_path.open("wb") as fh:
+            fh.write(canonical_json_bytes(payload))
+            if self._fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+        self._since_checkpoint = 0
+
+    def sync(self) -> None:
+        """Flush buffered records (fsync if enabled) and checkpoint when due."""
+        if self._fh is None:
+            return
+        self._fh.flush()
+        if self._fsync:
+            os.fsync(self._fh.fileno())
+        self._unsynced = 0
+        if self._since_checkpoint >= self._checkpoint_every:
+            self._write_checkpoint()
+
+    def close(self) -> None:
+        if self._fh is None:
+            return
+        self.sync()
+        if self._since_checkpoint:
+            self._write_checkpoint()
+        self._fh.close()
+        self._fh = None
+
+    def __enter__(self) -> "RawCaptureWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def append(
         self,
@@ -280,9 +390,16 @@ class RawCaptureWriter:
         }
 
         line = canonical_json_bytes(record) + b"\n"
-        self.raw_log_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.raw_log_path.open("ab") as fh:
-            fh.write(line)
+        if self._fh is None:
+            self.raw_log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.raw_log_path.open("ab")
+        self._fh.write(line)
+        self._offset += len(line)
+        self._tail = (self._tail + line)[-RAW_CHECKPOINT_TAIL_BYTES:]
+        self._unsynced += 1
+        self._since_checkpoint += 1
+        if self._unsynced >= self._sync_every:
+            self.sync()
         return record
 
 
@@ -399,228 +516,334 @@ def _extract_event_ts_ms(record: Mapping[str, Any], payload: Mapping[str, Any])
     raise ValueError("Missing exchange event timestamp in raw record/payload")
 
 
-def _load_raw_records(raw_log_path: Path) -> list[dict[str, Any]]:
-    records: list[dict[str, Any]] = []
-    for line in raw_log_path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        parsed = json.loads(line)
-        if not isinstance(parsed, dict):
-            raise ValueError("raw log entries must be JSON objects")
-
-        required_fields = {
-            "schema_version",
-            "stream_id",
-            "exchange_id",
-            "market",
-            "ingest_seq",
-            "payload_sha256",
-            "source",
-            "feed_channel",
-        }
-        missing = sorted(field for field in required_fields if field not in parsed)
-        if missing:
-            raise ValueError(f"raw log record missing required fields: {missing}")
+_RAW_REQUIRED_FIELDS = (
+    "schema_version",
+    "stream_id",
+    "exchange_id",
+    "market",
+    "ingest_seq",
+    "payload_sha256",
+    "source",
+    "feed_channel",
+)
 
-        payload_bytes = _payload_bytes_from_record(parsed)
-        payload_sha256 = sha256_hex_bytes(payload_bytes)
-        if payload_sha256 != str(parsed["payload_sha256"]):
-            raise ValueError("payload_sha256 mismatch; raw record appears mutated")
-        records.append(parsed)
-    return records
-
-
-def _dedupe_records(
-    records: list[dict[str, Any]],
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int]:
-    deduped: list[dict[str, Any]] = []
-    seen: dict[tuple[str, int], dict[str, Any]] = {}
-    duplicate_conflicts: list[dict[str, Any]] = []
-    idempotent_duplicate_count = 0
 
-    for record in records:
-        key = (str(record["stream_id"]), int(record["ingest_seq"]))
-        existing = seen.get(key)
-        if existing is None:
-            seen[key] = record
-            deduped.append(record)
-            continue
+def _iter_raw_records(raw_log_path: Path) -> Iterator[dict[str, Any]]:
+    """Yield validated raw records in file order, one line at a time."""
+    with raw_log_path.open("r", encoding="utf-8", newline="\n") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            parsed = json.loads(line)
+            if not isinstance(parsed, dict):
+                raise ValueError("raw log entries must be JSON objects")
+
+            missing = sorted(field for field in _RAW_REQUIRED_FIELDS if field not in parsed)
+            if missing:
+                raise ValueError(f"raw log record missing required fields: {missing}")
+
+            payload_bytes = _payload_bytes_from_record(parsed)
+            payload_sha256 = sha256_hex_bytes(payload_bytes)
+            if payload_sha256 != str(parsed["payload_sha256"]):
+                raise ValueError("payload_sha256 mismatch; raw record appears mutated")
+            yield parsed
+
+
+class _ExternalSorter:
+    """Sort JSON-serializable rows with at most ``max_in_memory`` rows held at once.
+
+    Full buffers are sorted and spilled to run files under ``workdir``; iteration
+    merges the runs. Keys must be unique so the merge order is total.
+    """
+
+    def __init__(self, *, workdir: Path, key: Callable[[list[Any]], Any], max_in_memory: int):
+        self._workdir = workdir
+        self._key = key
+        self._max_in_memory = max_in_memory
+        self._buffer: list[list[Any]] = []
+        self._runs: list[Path] = []
+
+    def add(self, row: list[Any]) -> None:
+        self._buffer.append(row)
+        if len(self._buffer) >= self._max_in_memory:
+            self._spill()
+
+    def _spill(self) -> None:
+        self._buffer.sort(key=self._key)
+        path = self._workdir / f"run-{id(self):x}-{len(self._runs):06d}.jsonl"
+        with path.open("w", encoding="utf-8", newline="\n") as fh:
+            for row in self._buffer:
+                fh.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+                fh.write("\n")
+        self._runs.append(path)
+        self._buffer = []
+
+    @staticmethod
+    def _read_run(path: Path) -> Iterator[list[Any]]:
+        with path.open("r", encoding="utf-8", newline="\n") as fh:
+            for line in fh:
+                yield json.loads(line)
+
+    def __iter__(self) -> Iterator[list[Any]]:
+        if not self._runs:
+            self._buffer.sort(key=self._key)
+            return iter(self._buffer)
+        if self._buffer:
+            self._spill()
+        return heapq.merge(*(self._read_run(path) for path in self._runs), key=self._key)
+
+
+class _StagedJsonl:
+    """JSONL artifact written row by row with a running digest."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fh = path.open("wb")
+        self._hasher = hashlib.sha256()
+        self.size_bytes = 0
+        self.record_count = 0
+
+    def write(self, row: Mapping[str, Any]) -> None:
+        line = canonical_json_bytes(row) + b"\n"
+        self._fh.write(line)
+        self._hasher.update(line)
+        self.size_bytes += len(line)
+        self.record_count += 1
+
+    def close(self) -> str:
+        self._fh.close()
+        return self._hasher.hexdigest()
+
+
+@dataclass
+class _ScanResult:
+    raw_records: int
+    seed_record: dict[str, Any] | None
+    duplicate_conflicts: list[dict[str, Any]]
+    idempotent_duplicate_count: int
+    ingest_gaps: list[dict[str, Any]]
+    bucket_gaps: list[dict[str, Any]]
+    late_event_count: int
+    late_buckets: set[int]
+    late_payload_sha256: list[str]
+    events: _StagedJsonl
+    bars: _StagedJsonl
+    events_digest: str
+    bars_digest: str
+
+
+def _canonical_event(record: Mapping[str, Any], timeframe_ms: int) -> dict[str, Any]:
+    payload = _decode_payload_as_json(record)
+    event_ts_ms = _extract_event_ts_ms(record, payload)
+    price = _extract_decimal(payload, "price", "p")
+    qty = _extract_decimal(payload, "qty", "q", "size", "volume")
+    return {
+        "schema_version": CANONICAL_SCHEMA_VERSION,
+        "stream_id": str(record["stream_id"]),
+        "exchange_id": str(record["exchange_id"]),
+        "market": str(record["market"]),
+        "transport": str(record.get("transport", record.get("channel", ""))),
+        "source": str(record["source"]),
+        "feed_channel": str(record["feed_channel"]),
+        "ingest_seq": int(record["ingest_seq"]),
+        "event_ts_ms": event_ts_ms,
+        "bucket_start_ms": (event_ts_ms // timeframe_ms) * timeframe_ms,
+        "price": _normalize_text_decimal(price),
+        "qty": _normalize_text_decimal(qty),
+        "payload_sha256": str(record["payload_sha256"]),
+    }
 
-        if str(existing["payload_sha256"]) == str(record["payload_sha256"]):
-            idempotent_duplicate_count += 1
-            continue
 
-        duplicate_conflicts.append(
-            {
-                "type": "duplicate_ingest_seq_conflict",
-                "stream_id": key[0],
-                "ingest_seq": key[1],
-                "existing_payload_sha256": str(existing["payload_sha256"]),
-                "conflict_payload_sha256": str(record["payload_sha256"]),
-            }
-        )
-    return deduped, duplicate_conflicts, idempotent_duplicate_count
+def _open_bar(event: Mapping[str, Any], timeframe_ms: int) -> dict[str, Any]:
+    price = Decimal(str(event["price"]))
+    return {
+        "exchange_id": event["exchange_id"],
+        "market": event["market"],
+        "bucket_start_ms": int(event["bucket_start_ms"]),
+        "open": price,
+        "high": price,
+        "low": price,
+        "close": price,
+        "volume": Decimal(str(event["qty"])),
+        "event_count": 1,
+        "source_ingest_seq_start": int(event["ingest_seq"]),
+        "source_ingest_seq_end": int(event["ingest_seq"]),
+        "source_payload_sha256": [str(event["payload_sha256"])],
+    }
 
 
-def _detect_ingest_gaps(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    by_stream: dict[str, list[int]] = {}
-    for record in records:
-        stream = str(record["stream_id"])
-        by_stream.setdefault(stream, []).append(int(record["ingest_seq"]))
+def _extend_bar(row: dict[str, Any], event: Mapping[str, Any]) -> None:
+    price = Decimal(str(event["price"]))
+    row["high"] = max(row["high"], price)
+    row["low"] = min(row["low"], price)
+    row["close"] = price
+    row["volume"] += Decimal(str(event["qty"]))
+    row["event_count"] = int(row["event_count"]) + 1
+    row["source_ingest_seq_start"] = min(
+        int(row["source_ingest_seq_start"]), int(event["ingest_seq"])
+    )
+    row["source_ingest_seq_end"] = max(int(row["source_ingest_seq_end"]), int(event["ingest_seq"]))
+    row["source_payload_sha256"].append(str(event["payload_sha256"]))
 
-    gaps: list[dict[str, Any]] = []
-    for stream_id, seqs in sorted(by_stream.items()):
-        if not seqs:
-            continue
-        expected = 1
-        for seq in sorted(seqs):
-            if seq != expected:
-                gaps.append(
-                    {
-                        "type": "ingest_seq_gap",
-                        "stream_id": stream_id,
-                        "expected_ingest_seq": expected,
-                        "found_ingest_seq": seq,
-                    }
-                )
-            expected = seq + 1
-    return gaps
-
-
-def _parse_trade_events(
-    records: list[dict[str, Any]], timeframe_ms: int
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    stream_max_bucket: dict[str, int] = {}
-    late_events: list[dict[str, Any]] = []
-    canonical_events: list[dict[str, Any]] = []
-
-    for record in sorted(records, key=lambda row: (str(row["stream_id"]), int(row["ingest_seq"]))):
-        payload = _decode_payload_as_json(record)
-        event_ts_ms = _extract_event_ts_ms(record, payload)
-        price = _extract_decimal(payload, "price", "p")
-        qty = _extract_decimal(payload, "qty", "q", "size", "volume")
-        bucket_start_ms = (event_ts_ms // timeframe_ms) * timeframe_ms
-
-        event = {
-            "schema_version": CANONICAL_SCHEMA_VERSION,
-            "stream_id": str(record["stream_id"]),
-            "exchange_id": str(record["exchange_id"]),
-            "market": str(record["market"]),
-            "transport": str(record.get("transport", record.get("channel", ""))),
-            "source": str(record["source"]),
-            "feed_channel": str(record["feed_channel"]),
-            "ingest_seq": int(record["ingest_seq"]),
-            "event_ts_ms": event_ts_ms,
-            "bucket_start_ms": bucket_start_ms,
-            "price": _normalize_text_decimal(price),
-            "qty": _normalize_text_decimal(qty),
-            "payload_sha256": str(record["payload_sha256"]),
-        }
 
-        stream_id = str(record["stream_id"])
-        max_bucket = stream_max_bucket.get(stream_id)
-        if max_bucket is not None and bucket_start_ms < max_bucket:
-            late_events.append(event)
-            continue
-        stream_max_bucket[stream_id] = bucket_start_ms
-        canonical_events.append(event)
+def _finish_bar(row: Mapping[str, Any], timeframe_ms: int) -> dict[str, Any]:
+    return {
+        "schema_version": CANONICAL_SCHEMA_VERSION,
+        "exchange_id": row["exchange_id"],
+        "market": row["market"],
+        "timeframe_ms": timeframe_ms,
+        "bucket_start_ms": row["bucket_start_ms"],
+        "open": _normalize_text_decimal(row["open"]),
+        "high": _normalize_text_decimal(row["high"]),
+        "low": _normalize_text_decimal(row["low"]),
+        "close": _normalize_text_decimal(row["close"]),
+        "volume": _normalize_text_decimal(row["volume"]),
+        "event_count": row["event_count"],
+        "source_ingest_seq_range": {
+            "start": row["source_ingest_seq_start"],
+            "end": row["source_ingest_seq_end"],
+        },
+        "source_payload_sha256": row["source_payload_sha256"],
+    }
 
-    canonical_events.sort(
-        key=lambda row: (int(row["event_ts_ms"]), int(row["ingest_seq"]), str(row["stream_id"]))
-    )
-    return canonical_events, late_events
-
-
-def _build_ohlcv_bars(
-    canonical_events: list[dict[str, Any]], timeframe_ms: int
-) -> list[dict[str, Any]]:
-    buckets: dict[int, dict[str, Any]] = {}
-    for event in canonical_events:
-        bucket_start = int(event["bucket_start_ms"])
-        price = Decimal(str(event["price"]))
-        qty = Decimal(str(event["qty"]))
-        row = buckets.get(bucket_start)
-        if row is None:
-            row = {
-                "schema_version": CANONICAL_SCHEMA_VERSION,
-                "exchange_id": event["exchange_id"],
-                "market": event["market"],
-                "timeframe_ms": timeframe_ms,
-                "bucket_start_ms": bucket_start,
-                "open": price,
-                "high": price,
-                "low": price,
-                "close": price,
-                "volume": qty,
-                "event_count": 1,
-                "source_ingest_seq_start": int(event["ingest_seq"]),
-                "source_ingest_seq_end": int(event["ingest_seq"]),
-                "source_payload_sha256": [str(event["payload_sha256"])],
-            }
-            buckets[bucket_start] = row
-            continue
 
-        row["high"] = max(row["high"], price)
-        row["low"] = min(row["low"], price)
-        row["close"] = price
-        row["volume"] += qty
-        row["event_count"] = int(row["event_count"]) + 1
-        row["source_ingest_seq_start"] = min(
-            int(row["source_ingest_seq_start"]), int(event["ingest_seq"])
-        )
-        row["source_ingest_seq_end"] = max(
-            int(row["source_ingest_seq_end"]), int(event["ingest_seq"])
-        )
-        row["source_payload_sha256"].append(str(event["payload_sha256"]))
+def _scan_raw_log(
+    raw_log_path: Path, *, timeframe_ms: int, workdir: Path, max_records_in_memory: int
+) -> _ScanResult:
+    """Dedupe, gap-check and canonicalize the raw log with bounded memory.
 
-    bars: list[dict[str, Any]] = []
-    for bucket_start in sorted(buckets):
-        row = buckets[bucket_start]
-        bars.append(
-            {
-                "schema_version": CANONICAL_SCHEMA_VERSION,
-                "exchange_id": row["exchange_id"],
-                "market": row["market"],
-                "timeframe_ms": timeframe_ms,
-                "bucket_start_ms": bucket_start,
-                "open": _normalize_text_decimal(row["open"]),
-                "high": _normalize_text_decimal(row["high"]),
-                "low": _normalize_text_decimal(row["low"]),
-                "close": _normalize_text_decimal(row["close"]),
-                "volume": _normalize_text_decimal(row["volume"]),
-                "event_count": row["event_count"],
-                "source_ingest_seq_range": {
-                    "start": row["source_ingest_seq_start"],
-                    "end": row["source_ingest_seq_end"],
-                },
-                "source_payload_sha256": row["source_payload_sha256"],
-            }
-        )
-    return bars
+    Records are externally sorted by ``(stream_id, ingest_seq, file position)`` so
+    that dedupe, ingest-gap and late-event detection are single streaming passes;
+    accepted events are then sorted by the canonical ordering rule and written to
+    staged events/bars files bucket by bucket.
+    """
+    for stale in workdir.iterdir():
+        stale.unlink()
 
+    by_stream = _ExternalSorter(
+        workdir=workdir,
+        key=lambda row: (row[0], row[1], row[2]),
+        max_in_memory=max_records_in_memory,
+    )
+    seed_record: dict[str, Any] | None = None
+    for position, record in enumerate(_iter_raw_records(raw_log_path)):
+        if seed_record is None:
+            seed_record = {
+                "exchange_id": record["exchange_id"],
+                "market": record["market"],
+                "feed_channel": record.get("feed_channel", "trades"),
+            }
+        by_stream.add([str(record["stream_id"]), int(record["ingest_seq"]), position, record])
 
-def _detect_bucket_gaps(
-    canonical_events: list[dict[str, Any]], timeframe_ms: int
-) -> list[dict[str, Any]]:
-    if not canonical_events:
-        return []
-    observed = sorted({int(event["bucket_start_ms"]) for event in canonical_events})
-    min_bucket = observed[0]
-    max_bucket = observed[-1]
-    observed_set = set(observed)
-    gaps: list[dict[str, Any]] = []
-    current = min_bucket
-    while current <= max_bucket:
-        if current not in observed_set:
-            gaps.append(
+    by_time = _ExternalSorter(
+        workdir=workdir,
+        key=lambda row: (row[0], row[1], row[2]),
+        max_in_memory=max_records_in_memory,
+    )
+    raw_records = 0
+    conflicts: list[tuple[int, dict[str, Any]]] = []
+    idempotent_duplicate_count = 0
+    ingest_gaps: list[dict[str, Any]] = []
+    late_buckets: set[int] = set()
+    late_payload_sha256: list[str] = []
+    current_key: tuple[str, int] | None = None
+    current_sha256 = ""
+    current_stream: str | None = None
+    expected_seq = 1
+    max_bucket: int | None = None
+
+    for stream_id, ingest_seq, position, record in by_stream:
+        key = (stream_id, ingest_seq)
+        if key == current_key:
+            if str(record["payload_sha256"]) == current_sha256:
+                idempotent_duplicate_count += 1
+            else:
+                conflicts.append(
+                    (
+                        position,
+                        {
+                            "type": "duplicate_ingest_seq_conflict",
+                            "stream_id": stream_id,
+                            "ingest_seq": ingest_seq,
+                            "existing_payload_sha256": current_sha256,
+                            "conflict_payload_sha256": str(record["payload_sha256"]),
+                        },
+                    )
+                )
+            continue
+        current_key = key
+        current_sha256 = str(record["payload_sha256"])
+        raw_records += 1
+
+        if stream_id != current_stream:
+            current_stream = stream_id
+            expected_seq = 1
+            max_bucket = None
+        if ingest_seq != expected_seq:
+            ingest_gaps.append(
                 {
-                    "type": "bucket_gap",
-                    "bucket_start_ms": current,
-                    "timeframe_ms": timeframe_ms,
+                    "type": "ingest_seq_gap",
+                    "stream_id": stream_id,
+                    "expected_ingest_seq": expected_seq,
+                    "found_ingest_seq": ingest_seq,
                 }
             )
-        current += timeframe_ms
-    return gaps
+        expected_seq = ingest_seq + 1
+
+        event = _canonical_event(record, timeframe_ms)
+        bucket_start_ms = int(event["bucket_start_ms"])
+        if max_bucket is not None and bucket_start_ms < max_bucket:
+            late_buckets.add(bucket_start_ms)
+            late_payload_sha256.append(str(event["payload_sha256"]))
+            continue
+        max_bucket = bucket_start_ms
+        by_time.add([int(event["event_ts_ms"]), int(event["ingest_seq"]), stream_id, event])
+
+    events = _StagedJsonl(workdir / "canonical_events.jsonl.staged")
+    bars = _StagedJsonl(workdir / "canonical_ohlcv.jsonl.staged")
+    bucket_gaps: list[dict[str, Any]] = []
+    bar: dict[str, Any] | None = None
+    try:
+        for _, _, _, event in by_time:
+            events.write(event)
+            bucket_start = int(event["bucket_start_ms"])
+            if bar is not None and bar["bucket_start_ms"] == bucket_start:
+                _extend_bar(bar, event)
+                continue
+            if bar is not None:
+                bars.write(_finish_bar(bar, timeframe_ms))
+                for missing in range(
+                    bar["bucket_start_ms"] + timeframe_ms, bucket_start, timeframe_ms
+                ):
+                    bucket_gaps.append(
+                        {
+                            "type": "bucket_gap",
+                            "bucket_start_ms": missing,
+                            "timeframe_ms": timeframe_ms,
+                        }
+                    )
+            bar = _open_bar(event, timeframe_ms)
+        if bar is not None:
+            bars.write(_finish_bar(bar, timeframe_ms))
+    finally:
+        events_digest = events.close()
+        bars_digest = bars.close()
+
+    return _ScanResult(
+        raw_records=raw_records,
+        seed_record=seed_record,
+        duplicate_conflicts=[conflict for _, conflict in sorted(conflicts, key=lambda c: c[0])],
+        idempotent_duplicate_count=idempotent_duplicate_count,
+        ingest_gaps=ingest_gaps,
+        bucket_gaps=bucket_gaps,
+        late_event_count=len(late_payload_sha256),
+        late_buckets=late_buckets,
+        late_payload_sha256=late_payload_sha256,
+        events=events,
+        bars=bars,
+        events_digest=events_digest,
+        bars_digest=bars_digest,
+    )
 
 
 def _record_meta(
@@ -666,10 +889,18 @@ def canonicalize_from_raw_logs(
     run_id: str = "",
     backfill_provider: BackfillProvider | None = None,
     backfill_policy: BackfillPolicy | None = None,
+    max_records_in_memory: int = DEFAULT_MAX_RECORDS_IN_MEMORY,
 ) -> CanonicalizationResult:
-    """Build deterministic canonical events/OHLCV strictly from raw logs."""
+    """Build deterministic canonical events/OHLCV strictly from raw logs.
+
+    The raw log is streamed and externally sorted, so memory stays bounded by
+    ``max_records_in_memory`` rows (plus the gap/revision reports); outputs do
+    not depend on it.
+    """
     if timeframe_ms <= 0:
         raise ValueError("timeframe_ms must be a positive integer")
+    if max_records_in_memory <= 0:
+        raise ValueError("max_records_in_memory must be > 0")
 
     policy = backfill_policy or BackfillPolicy()
     if policy.max_attempts < 0:
@@ -690,9 +921,6 @@ def canonicalize_from_raw_logs(
     revision_status_path = output_dir / "revision_status.json"
     manifest_path = output_dir / "manifest.json"
 
-    records = _load_raw_records(raw_log_path)
-    records, duplicate_conflicts, idempotent_duplicate_count = _dedupe_records(records)
-
     config_payload = {
         "schema_version": CANONICAL_SCHEMA_VERSION,
         "timeframe_ms": timeframe_ms,
@@ -706,177 +934,182 @@ def canonicalize_from_raw_logs(
         },
     }
     config_sha256 = sha256_hex_bytes(canonical_json_bytes(config_payload))
-    raw_log_sha256 = _sha256_file(raw_log_path)
-    effective_run_id = run_id
-    if not effective_run_id:
-        effective_run_id = sha256_hex_bytes(f"{raw_log_sha256}:{config_sha256}".encode("utf-8"))[
-            :16
-        ]
-
-    attempts = 0
-    backfill_attempted = False
-    backfill_attempt_log: list[dict[str, Any]] = []
-    fail_reason: str | None = None
-    backfill_outcome = "not_needed"
-
-    while True:
-        ingest_gaps = _detect_ingest_gaps(records)
-        canonical_events, late_events = _parse_trade_events(records, timeframe_ms=timeframe_ms)
-        bucket_gaps = _detect_bucket_gaps(canonical_events, timeframe_ms=timeframe_ms)
-        all_gaps = ingest_gaps + bucket_gaps
-
-        if duplicate_conflicts:
-            fail_reason = "duplicate_ingest_seq_conflict"
-            backfill_outcome = "unresolved"
-            break
-
-        if not all_gaps:
-            backfill_outcome = "resolved" if backfill_attempted else "not_needed"
-            break
-
-        if attempts >= policy.max_attempts:
-            fail_reason = "gap_unresolved_after_backfill_attempts"
-            backfill_outcome = "unresolved"
-            break
-
-        # Backfill uses deterministic request ordering and writes through the same raw path.
-        backfill_attempted = True
-        attempts += 1
-        attempt_info: dict[str, Any] = {
-            "attempt": attempts,
-            "requested_bucket_gaps": len(bucket_gaps),
-            "inserted_raw_records": 0,
-            "provider_calls": [],
-        }
-
-        seed_record = records[0] if records else None
-        exchange_id = str(seed_record["exchange_id"]) if seed_record is not None else "unknown"
-        market = str(seed_record["market"]) if seed_record is not None else "unknown"
-        feed_channel = (
-            str(seed_record.get("feed_channel", "trades")) if seed_record is not None else "trades"
-        )
-        writer = RawCaptureWriter(raw_log_path)
 
-        for gap in bucket_gaps:
-            start_ms = int(gap["bucket_start_ms"])
-            end_ms = start_ms + timeframe_ms - 1
-            try:
-                payloads = provider.backfill(
-                    symbol=market,
-                    start_ms=start_ms,
-                    end_ms=end_ms,
-                    limit=policy.limit,
-                )
-            except Exception as exc:
-                attempt_info["provider_calls"].append(
-                    {
-                        "start_ms": start_ms,
-                        "end_ms": end_ms,
-                        "error": str(exc),
-                    }
-                )
-                continue
+    with tempfile.TemporaryDirectory(prefix=".canonicalize-", dir=output_dir) as tmp:
+        workdir = Path(tmp)
 
-            if payloads is None:
-                payloads = []
-            attempt_info["provider_calls"].append(
-                {
-                    "start_ms": start_ms,
-                    "end_ms": end_ms,
-                    "returned_payloads": len(payloads),
-                }
+        def scan() -> _ScanResult:
+            return _scan_raw_log(
+                raw_log_path,
+                timeframe_ms=timeframe_ms,
+                workdir=workdir,
+                max_records_in_memory=max_records_in_memory,
             )
-            for payload in payloads:
-                if not isinstance(payload, (bytes, bytearray)):
-                    raise ValueError("backfill provider must return bytes payloads")
-                writer.append(
-                    exchange_id=exchange_id,
-                    market=market,
-                    transport=TRANSPORT_REST,
-                    source=SOURCE_REST_BACKFILL,
-                    feed_channel=feed_channel,
-                    received_at_ms=end_ms,
-                    payload_raw_bytes=bytes(payload),
-                )
-                attempt_info["inserted_raw_records"] += 1
-
-        backfill_attempt_log.append(attempt_info)
-        records = _load_raw_records(raw_log_path)
-        records, duplicate_conflicts, idempotent_duplicate_count = _dedupe_records(records)
-
-    ingest_gaps = _detect_ingest_gaps(records)
-    canonical_events, late_events = _parse_trade_events(records, timeframe_ms=timeframe_ms)
-    bucket_gaps = _detect_bucket_gaps(canonical_events, timeframe_ms=timeframe_ms)
-    all_gaps = ingest_gaps + bucket_gaps
-    fail_closed = bool(all_gaps or duplicate_conflicts)
 
-    if fail_closed and fail_reason is None:
-        fail_reason = "gap_unresolved"
-    if not fail_closed:
-        fail_reason = None
-
-    gap_status = {
-        "schema_version": STATUS_SCHEMA_VERSION,
-        "run_id": effective_run_id,
-        "policy": "gap",
-        "status": "GAP_UNRESOLVED" if fail_closed else "OK",
-        "fail_closed": fail_closed,
-        "backfill_attempted": backfill_attempted,
-        "attempts": attempts,
-        "max_attempts": policy.max_attempts,
-        "outcome": backfill_outcome,
-        "reason": fail_reason,
-        "gaps": all_gaps,
-        "duplicate_conflicts": duplicate_conflicts,
-        "idempotent_duplicate_count": idempotent_duplicate_count,
-        "backfill_attempt_log": backfill_attempt_log,
-    }
-    revision_status = {
-        "schema_version": STATUS_SCHEMA_VERSION,
-        "run_id": effective_run_id,
-        "policy": "revision",
-        "status": "REVISION_CANDIDATE" if late_events else "NONE",
-        "reason_code": "late_data" if late_events else None,
-        "late_event_count": len(late_events),
-        "affected_buckets": sorted({int(event["bucket_start_ms"]) for event in late_events}),
-        "late_event_payload_sha256": [str(event["payload_sha256"]) for event in late_events],
-    }
+        scanned = scan()
+        raw_log_sha256 = _sha256_file(raw_log_path)
+        effective_run_id = run_id
+        if not effective_run_id:
+            effective_run_id = sha256_hex_bytes(
+                f"{raw_log_sha256}:{config_sha256}".encode("utf-8")
+            )[:16]
+
+        attempts = 0
+        backfill_attempted = False
+        backfill_attempt_log: list[dict[str, Any]] = []
+        fail_reason: str | None = None
+        backfill_outcome = "not_needed"
+
+        while True:
+            all_gaps = scanned.ingest_gaps + scanned.bucket_gaps
+
+            if scanned.duplicate_conflicts:
+                fail_reason = "duplicate_ingest_seq_conflict"
+                backfill_outcome = "unresolved"
+                break
+
+            if not all_gaps:
+                backfill_outcome = "resolved" if backfill_attempted else "not_needed"
+                break
+
+            if attempts >= policy.max_attempts:
+                fail_reason = "gap_unresolved_after_backfill_attempts"
+                backfill_outcome = "unresolved"
+                break
+
+            # Backfill uses deterministic request ordering and writes through the same raw path.
+            backfill_attempted = True
+            attempts += 1
+            attempt_info: dict[str, Any] = {
+                "attempt": attempts,
+                "requested_bucket_gaps": len(scanned.bucket_gaps),
+                "inserted_raw_records": 0,
+                "provider_calls": [],
+            }
 
-    artifact_digests: dict[str, str] = {}
-    artifact_meta: dict[str, dict[str, int | str | None]] = {}
+            seed_record = scanned.seed_record
+            exchange_id = str(seed_record["exchange_id"]) if seed_record is not None else "unknown"
+            market = str(seed_record["market"]) if seed_record is not None else "unknown"
+            feed_channel = (
+                str(seed_record.get("feed_channel", "trades"))
+                if seed_record is not None
+                else "trades"
+            )
+            with RawCaptureWriter(raw_log_path) as writer:
+                for gap in scanned.bucket_gaps:
+                    start_ms = int(gap["bucket_start_ms"])
+                    end_ms = start_ms + timeframe_ms - 1
+                    try:
+                        payloads = provider.backfill(
+                            symbol=market,
+                            start_ms=start_ms,
+                            end_ms=end_ms,
+                            limit=policy.limit,
+                        )
+                    except Exception as exc:
+                        attempt_info["provider_calls"].append(
+                            {
+                                "start_ms": start_ms,
+                                "end_ms": end_ms,
+                                "error": str(exc),
+                            }
+                        )
+                        continue
+
+                    if payloads is None:
+                        payloads = []
+                    attempt_info["provider_calls"].append(
+                        {
+                            "start_ms": start_ms,
+                            "end_ms": end_ms,
+                            "returned_payloads": len(payloads),
+                        }
+                    )
+                    for payload in payloads:
+                        if not isinstance(payload, (bytes, bytearray)):
+                            raise ValueError("backfill provider must return bytes payloads")
+                        writer.append(
+                            exchange_id=exchange_id,
+                            market=market,
+                            transport=TRANSPORT_REST,
+                            source=SOURCE_REST_BACKFILL,
+                            feed_channel=feed_channel,
+                            received_at_ms=end_ms,
+                            payload_raw_bytes=bytes(payload),
+                        )
+                        attempt_info["inserted_raw_records"] += 1
+
+            backfill_attempt_log.append(attempt_info)
+            scanned = scan()
+
+        duplicate_conflicts = scanned.duplicate_conflicts
+        idempotent_duplicate_count = scanned.idempotent_duplicate_count
+        all_gaps = scanned.ingest_gaps + scanned.bucket_gaps
+        fail_closed = bool(all_gaps or duplicate_conflicts)
+
+        if fail_closed and fail_reason is None:
+            fail_reason = "gap_unresolved"
+        if not fail_closed:
+            fail_reason = None
+
+        gap_status = {
+            "schema_version": STATUS_SCHEMA_VERSION,
+            "run_id": effective_run_id,
+            "policy": "gap",
+            "status": "GAP_UNRESOLVED" if fail_closed else "OK",
+            "fail_closed": fail_closed,
+            "backfill_attempted": backfill_attempted,
+            "attempts": attempts,
+            "max_attempts": policy.max_attempts,
+            "outcome": backfill_outcome,
+            "reason": fail_reason,
+            "gaps": all_gaps,
+            "duplicate_conflicts": duplicate_conflicts,
+            "idempotent_duplicate_count": idempotent_duplicate_count,
+            "backfill_attempt_log": backfill_attempt_log,
+        }
+        late_event_count = scanned.late_event_count
+        revision_status = {
+            "schema_version": STATUS_SCHEMA_VERSION,
+            "run_id": effective_run_id,
+            "policy": "revision",
+            "status": "REVISION_CANDIDATE" if late_event_count else "NONE",
+            "reason_code": "late_data" if late_event_count else None,
+            "late_event_count": late_event_count,
+            "affected_buckets": sorted(scanned.late_buckets),
+            "late_event_payload_sha256": scanned.late_payload_sha256,
+        }
 
-    gap_digest, gap_size = _write_bytes(gap_status_path, canonical_json_bytes(gap_status))
-    revision_digest, revision_size = _write_bytes(
-        revision_status_path, canonical_json_bytes(revision_status)
-    )
-    artifact_digests[gap_status_path.name] = gap_digest
-    artifact_digests[revision_status_path.name] = revision_digest
-    artifact_meta[gap_status_path.name] = _record_meta(gap_digest, gap_size, record_count=None)
-    artifact_meta[revision_status_path.name] = _record_meta(
-        revision_digest, revision_size, record_count=None
-    )
+        artifact_digests: dict[str, str] = {}
+        artifact_meta: dict[str, dict[str, int | str | None]] = {}
 
-    bars: list[dict[str, Any]] = []
-    if fail_closed:
-        if canonical_events_path.exists():
-            canonical_events_path.unlink()
-        if canonical_ohlcv_path.exists():
-            canonical_ohlcv_path.unlink()
-    else:
-        bars = _build_ohlcv_bars(canonical_events, timeframe_ms=timeframe_ms)
-        events_payload = _jsonl_bytes(canonical_events)
-        bars_payload = _jsonl_bytes(bars)
-        events_digest, events_size = _write_bytes(canonical_events_path, events_payload)
-        bars_digest, bars_size = _write_bytes(canonical_ohlcv_path, bars_payload)
-        artifact_digests[canonical_events_path.name] = events_digest
-        artifact_digests[canonical_ohlcv_path.name] = bars_digest
-        artifact_meta[canonical_events_path.name] = _record_meta(
-            events_digest, events_size, record_count=len(canonical_events)
+        gap_digest, gap_size = _write_bytes(gap_status_path, canonical_json_bytes(gap_status))
+        revision_digest, revision_size = _write_bytes(
+            revision_status_path, canonical_json_bytes(revision_status)
         )
-        artifact_meta[canonical_ohlcv_path.name] = _record_meta(
-            bars_digest, bars_size, record_count=len(bars)
+        artifact_digests[gap_status_path.name] = gap_digest
+        artifact_digests[revision_status_path.name] = revision_digest
+        artifact_meta[gap_status_path.name] = _record_meta(gap_digest, gap_size, record_count=None)
+        artifact_meta[revision_status_path.name] = _record_meta(
+            revision_digest, revision_size, record_count=None
         )
 
+        if fail_closed:
+            if canonical_events_path.exists():
+                canonical_events_path.unlink()
+            if canonical_ohlcv_path.exists():
+                canonical_ohlcv_path.unlink()
+        else:
+            for staged, target, digest in (
+                (scanned.events, canonical_events_path, scanned.events_digest),
+                (scanned.bars, canonical_ohlcv_path, scanned.bars_digest),
+            ):
+                os.replace(staged.path, target)
+                artifact_digests[target.name] = digest
+                artifact_meta[target.name] = _record_meta(
+                    digest, staged.size_bytes, record_count=staged.record_count
+                )
+
     manifest = {
         "schema_version": MANIFEST_SCHEMA_VERSION,
         "run_id": effective_run_id,
@@ -891,10 +1124,10 @@ def canonicalize_from_raw_logs(
         "time_bucket_rule": "utc_epoch_boundary",
         "code_version": {"git_sha": _maybe_git_sha()},
         "record_counts": {
-            "raw_records": len(records),
-            "canonical_events": len(canonical_events) if not fail_closed else 0,
-            "canonical_bars": len(bars) if not fail_closed else 0,
-            "late_events": len(late_events),
+            "raw_records": scanned.raw_records,
+            "canonical_events": scanned.events.record_count if not fail_closed else 0,
+            "canonical_bars": scanned.bars.record_count if not fail_closed else 0,
+            "late_events": late_event_count,
         },
         "fail_closed": fail_closed,
         "fail_reason": fail_reason,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
@@ -50,18 +51,19 @@ def atr_wilder(high: pd.Series, low: pd.Series, close: pd.Series, period: int =
         axis=1,
     ).max(axis=1)
 
-    out = pd.Series(0.0, index=close.index, dtype=float)
-    if len(tr) < period:
-        return out
+    values = tr.to_numpy(dtype=float)
+    out = np.zeros(len(values), dtype=float)
+    if len(values) < period:
+        return pd.Series(out, index=close.index, dtype=float)
 
-    atr = tr.iloc[:period].mean()
-    out.iloc[period - 1] = atr
+    # Wilder smoothing is a first-order recursion; run it over plain floats.
+    atr = float(tr.iloc[:period].mean())
+    out[period - 1] = atr
+    for i, tr_val in enumerate(values[period:].tolist(), start=period):
+        atr = ((atr * (period - 1)) + tr_val) / period
+        out[i] = atr
 
-    for i in range(period, len(tr)):
-        atr = ((atr * (period - 1)) + tr.iloc[i]) / period
-        out.iloc[i] = atr
-
-    return out
+    return pd.Series(out, index=close.index, dtype=float)
 
 
 def adx_wilder(
@@ -100,66 +102,74 @@ def adx_wilder(
         axis=1,
     ).max(axis=1)
 
-    out = pd.DataFrame(
-        {
-            "plus_di": pd.Series(float("nan"), index=high.index, dtype=float),
-            "minus_di": pd.Series(float("nan"), index=high.index, dtype=float),
-            "adx": pd.Series(float("nan"), index=high.index, dtype=float),
-        }
-    )
+    size = len(tr)
+    plus_di_out = np.full(size, np.nan, dtype=float)
+    minus_di_out = np.full(size, np.nan, dtype=float)
+    adx_out = np.full(size, np.nan, dtype=float)
+
+    def _frame() -> pd.DataFrame:
+        return pd.DataFrame(
+            {"plus_di": plus_di_out, "minus_di": minus_di_out, "adx": adx_out},
+            index=high.index,
+        )
 
-    if len(tr) <= period:
-        return out
+    if size <= period:
+        return _frame()
 
     tr.iloc[0] = 0.0
     plus_dm.iloc[0] = 0.0
     minus_dm.iloc[0] = 0.0
 
-    tr_smooth = tr.iloc[1 : period + 1].sum()
-    plus_dm_smooth = plus_dm.iloc[1 : period + 1].sum()
-    minus_dm_smooth = minus_dm.iloc[1 : period + 1].sum()
-
-    def _di(dm_val: float, tr_val: float) -> float:
-        if tr_val == 0.0:
-            return 0.0
-        return 100.0 * (dm_val / tr_val)
-
-    di_index = period
-    plus_di = _di(plus_dm_smooth, tr_smooth)
-    minus_di = _di(minus_dm_smooth, tr_smooth)
-    out.iloc[di_index, out.columns.get_loc("plus_di")] = plus_di
-    out.iloc[di_index, out.columns.get_loc("minus_di")] = minus_di
-    dx_values: list[float] = []
-    denom = plus_di + minus_di
-    dx_values.append(0.0 if denom == 0.0 else 100.0 * abs(plus_di - minus_di) / denom)
+    tr_smooth = float(tr.iloc[1 : period + 1].sum())
+    plus_dm_smooth = float(plus_dm.iloc[1 : period + 1].sum())
+    minus_dm_smooth = float(minus_dm.iloc[1 : period + 1].sum())
 
-    for i in range(period + 1, len(tr)):
-        tr_smooth = tr_smooth - (tr_smooth / period) + tr.iloc[i]
-        plus_dm_smooth = plus_dm_smooth - (plus_dm_smooth / period) + plus_dm.iloc[i]
-        minus_dm_smooth = minus_dm_smooth - (minus_dm_smooth / period) + minus_dm.iloc[i]
+    plus_di = _wilder_di(plus_dm_smooth, tr_smooth)
+    minus_di = _wilder_di(minus_dm_smooth, tr_smooth)
+    plus_di_out[period] = plus_di
+    minus_di_out[period] = minus_di
+    dx_values = [_wilder_dx(plus_di, minus_di)]
 
-        plus_di = _di(plus_dm_smooth, tr_smooth)
-        minus_di = _di(minus_dm_smooth, tr_smooth)
-        out.iloc[i, out.columns.get_loc("plus_di")] = plus_di
-        out.iloc[i, out.columns.get_loc("minus_di")] = minus_di
+    tail = zip(
+        tr.to_numpy(dtype=float)[period + 1 :].tolist(),
+        plus_dm.to_numpy(dtype=float)[period + 1 :].tolist(),
+        minus_dm.to_numpy(dtype=float)[period + 1 :].tolist(),
+    )
+    for i, (tr_val, plus_val, minus_val) in enumerate(tail, start=period + 1):
+        tr_smooth = tr_smooth - (tr_smooth / period) + tr_val
+        plus_dm_smooth = plus_dm_smooth - (plus_dm_smooth / period) + plus_val
+        minus_dm_smooth = minus_dm_smooth - (minus_dm_smooth / period) + minus_val
 
-        denom = plus_di + minus_di
-        dx_values.append(0.0 if denom == 0.0 else 100.0 * abs(plus_di - minus_di) / denom)
+        plus_di = _wilder_di(plus_dm_smooth, tr_smooth)
+        minus_di = _wilder_di(minus_dm_smooth, tr_smooth)
+        plus_di_out[i] = plus_di
+        minus_di_out[i] = minus_di
+        dx_values.append(_wilder_dx(plus_di, minus_di))
 
     if len(dx_values) < period:
-        return out
+        return _frame()
 
     adx_start = period * 2
-    if adx_start < len(tr):
+    if adx_start < size:
         adx = sum(dx_values[:period]) / period
-        out.iloc[adx_start, out.columns.get_loc("adx")] = adx
-        dx_idx = period
-        for i in range(adx_start + 1, len(tr)):
-            dx_idx += 1
-            adx = ((adx * (period - 1)) + dx_values[dx_idx]) / period
-            out.iloc[i, out.columns.get_loc("adx")] = adx
+        adx_out[adx_start] = adx
+        # The DX of bar ``adx_start`` itself is not folded in (matches the seed window).
+        for i, dx in enumerate(dx_values[period + 1 :], start=adx_start + 1):
+            adx = ((adx * (period - 1)) + dx) / period
+            adx_out[i] = adx
+
+    return _frame()
+
+
+def _wilder_di(dm_val: float, tr_val: float) -> float:
+    if tr_val == 0.0:
+        return 0.0
+    return 100.0 * (dm_val / tr_val)
 
-    return out
+
+def _wilder_dx(plus_di: float, minus_di: float) -> float:
+    denom = plus_di + minus_di
+    return 0.0 if denom == 0.0 else 100.0 * abs(plus_di - minus_di) / denom
 
 
 def sma(close: pd.Series, period: int = 20) -> pd.Series:
@@ -178,6 +188,33 @@ def rolling_std(close: pd.Series, period: int = 20, ddof: int = 0) -> pd.Series:
     return close.rolling(window=period, min_periods=period).std(ddof=ddof)
 
 
+def expanding_quantile(values: pd.Series, q: float) -> pd.Series:
+    """Quantile of all non-NaN values up to and including each row.
+
+    Matches ``values.iloc[: i + 1].dropna().quantile(q)`` bit for bit (linear
+    interpolation) in O(n log n): the bracketing order statistics come from the
+    expanding skiplist and are blended with NumPy's lerp formula.
+    """
+    if not 0.0 <= q <= 1.0:
+        raise ValueError("q must be in [0, 1]")
+
+    values = values.astype(float)
+    expanding = values.expanding(min_periods=1)
+    lower = expanding.quantile(q, interpolation="lower").to_numpy(dtype=float)
+    upper = expanding.quantile(q, interpolation="higher").to_numpy(dtype=float)
+    count = values.notna().cumsum().to_numpy(dtype=float)
+
+    # Series.quantile goes through np.percentile, which rescales q by 100.
+    q_eff = np.true_divide(np.float64(q) * 100.0, 100.0)
+    virtual = (count - 1.0) * q_eff
+    gamma = virtual - np.floor(virtual)
+    diff = upper - lower
+    with np.errstate(invalid="ignore"):
+        out = np.where(gamma >= 0.5, upper - diff * (1.0 - gamma), lower + diff * gamma)
+    out[count == 0] = np.nan
+    return pd.Series(out, index=values.index, dtype=float)
+
+
 def bollinger_bands(
     close: pd.Series,
     period: int = 20,
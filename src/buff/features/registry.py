@@ -17,12 +17,15 @@ from buff.features.indicators import (
     sma,
     vwap_typical_daily,
 )
+from buff.features.contract import FeatureContractError
+from buff.features.streaming import STREAMS, StreamingIndicator
 
 
 FEATURES = {
     "ema_20": {
         "requires": ["close"],
         "kind": "ema",
+        "stream": STREAMS["ema"],
         "func": lambda df, **params: ema(df["close"], **params),
         "params": {"period": 20},
         "outputs": ["ema_20"],
@@ -30,6 +33,7 @@ FEATURES = {
     "rsi_14": {
         "requires": ["close"],
         "kind": "rsi",
+        "stream": STREAMS["rsi"],
         "func": lambda df, **params: rsi_wilder(df["close"], **params),
         "params": {"period": 14},
         "outputs": ["rsi_14"],
@@ -37,6 +41,7 @@ FEATURES = {
     "atr_14": {
         "requires": ["high", "low", "close"],
         "kind": "atr",
+        "stream": STREAMS["atr"],
         "func": lambda df, **params: atr_wilder(df["high"], df["low"], df["close"], **params),
         "params": {"period": 14},
         "outputs": ["atr_14"],
@@ -44,6 +49,7 @@ FEATURES = {
     "sma_20": {
         "requires": ["close"],
         "kind": "sma",
+        "stream": STREAMS["sma"],
         "func": lambda df, **params: sma(df["close"], **params),
         "params": {"period": 20},
         "outputs": ["sma_20"],
@@ -51,6 +57,7 @@ FEATURES = {
     "std_20": {
         "requires": ["close"],
         "kind": "std",
+        "stream": STREAMS["std"],
         "func": lambda df, **params: rolling_std(df["close"], **params),
         "params": {"period": 20, "ddof": 0},
         "outputs": ["std_20"],
@@ -58,6 +65,7 @@ FEATURES = {
     "bbands_20_2": {
         "requires": ["close"],
         "kind": "bbands",
+        "stream": STREAMS["bbands"],
         "func": lambda df, **params: bollinger_bands(df["close"], **params),
         "params": {"period": 20, "k": 2.0, "ddof": 0},
         "outputs": ["bb_mid_20_2", "bb_upper_20_2", "bb_lower_20_2"],
@@ -65,6 +73,7 @@ FEATURES = {
     "macd_12_26_9": {
         "requires": ["close"],
         "kind": "macd",
+        "stream": STREAMS["macd"],
         "func": lambda df, **params: macd(df["close"], **params),
         "params": {"fast": 12, "slow": 26, "signal": 9},
         "outputs": ["macd_12_26_9", "macd_signal_12_26_9", "macd_hist_12_26_9"],
@@ -72,6 +81,7 @@ FEATURES = {
     "ema_50": {
         "requires": ["close"],
         "kind": "ema",
+        "stream": STREAMS["ema"],
         "func": lambda df, **params: ema(df["close"], **params),
         "params": {"period": 50},
         "outputs": ["ema_50"],
@@ -79,6 +89,7 @@ FEATURES = {
     "ema_spread_20_50": {
         "requires": ["close"],
         "kind": "ema_spread",
+        "stream": STREAMS["ema_spread"],
         "func": lambda df, **params: ema_spread(df["close"], **params),
         "params": {"fast": 20, "slow": 50},
         "outputs": ["ema_spread_20_50"],
@@ -86,6 +97,7 @@ FEATURES = {
     "rsi_slope_14_5": {
         "requires": ["close"],
         "kind": "rsi_slope",
+        "stream": STREAMS["rsi_slope"],
         "func": lambda df, **params: rsi_slope(df["close"], **params),
         "params": {"period": 14, "slope": 5},
         "outputs": ["rsi_slope_14_5"],
@@ -93,6 +105,7 @@ FEATURES = {
     "roc_12": {
         "requires": ["close"],
         "kind": "roc",
+        "stream": STREAMS["roc"],
         "func": lambda df, **params: roc(df["close"], **params),
         "params": {"period": 12},
         "outputs": ["roc_12"],
@@ -100,6 +113,7 @@ FEATURES = {
     "vwap_typical_daily": {
         "requires": ["high", "low", "close", "volume"],
         "kind": "vwap",
+        "stream": STREAMS["vwap"],
         "func": lambda df, **params: vwap_typical_daily(
             df["high"], df["low"], df["close"], df["volume"], **params
         ),
@@ -109,6 +123,7 @@ FEATURES = {
     "obv": {
         "requires": ["close", "volume"],
         "kind": "obv",
+        "stream": STREAMS["obv"],
         "func": lambda df, **params: obv(df["close"], df["volume"], **params),
         "params": {},
         "outputs": ["obv"],
@@ -116,8 +131,17 @@ FEATURES = {
     "adx_14": {
         "requires": ["high", "low", "close"],
         "kind": "adx",
+        "stream": STREAMS["adx"],
         "func": lambda df, **params: adx_wilder(df["high"], df["low"], df["close"], **params),
         "params": {"period": 14},
         "outputs": ["plus_di_14", "minus_di_14", "adx_14"],
     },
 }
+
+
+def build_stream(feature_id: str) -> StreamingIndicator:
+    """Fresh streaming indicator for a registry feature, using its registry params."""
+    entry = FEATURES.get(feature_id)
+    if entry is None:
+        raise FeatureContractError("feature_unknown_id")
+    return entry["stream"](**entry["params"])
@@ -0,0 +1,645 @@
+"""Streaming (bar-by-bar) counterparts of the batch indicators.
+
+Each indicator consumes one bar per ``update`` call and returns the value the
+batch function in ``buff.features.indicators`` produces for that row, bit for
+bit. The recursions mirror pandas' own kernels (``ewm(adjust=False)`` and the
+Kahan-compensated rolling mean and Welford rolling variance), so feeding a history bar by bar gives
+the same column as recomputing it over the whole history.
+
+``snapshot`` returns a plain dict (JSON-serializable) and ``restore`` loads it
+back, so a live or paper loop can persist state between bars.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+import math
+from typing import Any, Mapping
+
+import numpy as np
+import pandas as pd
+
+from buff.features.indicators import _wilder_di, _wilder_dx
+
+NAN = float("nan")
+# pandas flags a rolling variance for recomputation below this conditioning ratio.
+_INV_COND_TOL = float(np.finfo(np.float64).eps) * 1e3
+
+
+def _div(num: float, den: float) -> float:
+    # IEEE division like pandas (x/0 -> +/-inf, 0/0 -> nan) instead of raising.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float(np.float64(num) / np.float64(den))
+
+
+def _nanmax(*values: float) -> float:
+    present = [value for value in values if value == value]
+    return max(present) if present else NAN
+
+
+def _true_range(high: float, low: float, prev_close: float) -> float:
+    return _nanmax(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+class _StreamState:
+    """Snapshot/restore for streams and their kernels; all state lives in plain attributes."""
+
+    kind = ""
+
+    def snapshot(self) -> dict[str, Any]:
+        state: dict[str, Any] = {}
+        for name, value in vars(self).items():
+            if isinstance(value, _StreamState):
+                state[name] = value.snapshot()
+            elif isinstance(value, deque):
+                state[name] = list(value)
+            elif isinstance(value, list):
+                state[name] = list(value)
+            else:
+                state[name] = value
+        return {"kind": self.kind, "state": state}
+
+    def restore(self, snapshot: Mapping[str, Any]) -> None:
+        if snapshot.get("kind") != self.kind:
+            raise ValueError("streaming_snapshot_kind_mismatch")
+        state = snapshot.get("state")
+        if not isinstance(state, Mapping) or set(state) != set(vars(self)):
+            raise ValueError("streaming_snapshot_invalid")
+        for name, value in state.items():
+            current = getattr(self, name)
+            if isinstance(current, _StreamState):
+                current.restore(value)
+            elif isinstance(current, deque):
+                setattr(self, name, deque(value, maxlen=current.maxlen))
+            elif isinstance(current, list):
+                setattr(self, name, list(value))
+            else:
+                setattr(self, name, value)
+
+
+class StreamingIndicator(_StreamState, ABC):
+    """One indicator fed bar by bar; ``update`` returns the batch value for that bar."""
+
+    @abstractmethod
+    def update(self, bar: Mapping[str, Any]) -> Any:
+        raise NotImplementedError
+
+
+class _EwmMean(_StreamState):
+    """``Series.ewm(alpha=..., adjust=False, min_periods=...).mean()`` one value at a time."""
+
+    kind = "_ewm_mean"
+
+    def __init__(self, *, com: float, min_periods: int) -> None:
+        # pandas converts span/alpha to a centre of mass and back; keep that rounding.
+        alpha = 1.0 / (1.0 + com)
+        self.old_wt_factor = 1.0 - alpha
+        self.new_wt = alpha
+        self.min_periods = max(int(min_periods), 1)
+        self.weighted = NAN
+        self.old_wt = 1.0
+        self.nobs = 0
+        self.started = False
+
+    def push(self, value: float) -> float:
+        is_observation = value == value
+        self.nobs += int(is_observation)
+        if not self.started:
+            self.started = True
+            self.weighted = value
+        elif self.weighted == self.weighted:
+            self.old_wt *= self.old_wt_factor
+            if is_observation:
+                if self.weighted != value:
+                    self.weighted = self.old_wt * self.weighted + self.new_wt * value
+                    self.weighted /= self.old_wt + self.new_wt
+                self.old_wt = 1.0
+        elif is_observation:
+            self.weighted = value
+        return self.weighted if self.nobs >= self.min_periods else NAN
+
+
+def _span_ewm(period: int) -> _EwmMean:
+    return _EwmMean(com=(period - 1) / 2.0, min_periods=period)
+
+
+def _wilder_ewm(period: int) -> _EwmMean:
+    alpha = 1.0 / period
+    return _EwmMean(com=(1.0 - alpha) / alpha, min_periods=period)
+
+
+class _RollingMean(_StreamState):
+    """Fixed-window ``rolling(period).mean()`` with pandas' compensated sums."""
+
+    kind = "_rolling_mean"
+
+    def __init__(self, period: int) -> None:
+        self.window: deque[float] = deque(maxlen=period)
+        self.period = period
+        self.nobs = 0
+        self.neg_ct = 0
+        self.sum_x = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.num_consecutive_same_value = 0
+        self.prev_value = NAN
+        self.started = False
+
+    def push(self, value: float) -> float:
+        if not self.started:
+            self.started = True
+            self.prev_value = value
+        if len(self.window) == self.period:
+            self._remove(self.window[0])
+        self.window.append(value)
+        self._add(value)
+        if self.nobs < self.period or self.nobs <= 0:
+            return NAN
+        result = self.sum_x / self.nobs
+        if self.num_consecutive_same_value >= self.nobs:
+            result = self.prev_value
+        elif self.neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self.neg_ct == self.nobs and result > 0:
+            result = 0.0
+        return result
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        self.nobs += 1
+        y = value - self.compensation_add
+        t = self.sum_x + y
+        self.compensation_add = t - self.sum_x - y
+        self.sum_x = t
+        if math.copysign(1.0, value) < 0:
+            self.neg_ct += 1
+        if value == self.prev_value:
+            self.num_consecutive_same_value += 1
+        else:
+            self.num_consecutive_same_value = 1
+        self.prev_value = value
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        self.nobs -= 1
+        y = -value - self.compensation_remove
+        t = self.sum_x + y
+        self.compensation_remove = t - self.sum_x - y
+        self.sum_x = t
+        if math.copysign(1.0, value) < 0:
+            self.neg_ct -= 1
+
+
+class _RollingVar(_StreamState):
+    """Fixed-window ``rolling(period).var(ddof)`` with pandas' Welford/Kahan kernel."""
+
+    kind = "_rolling_var"
+
+    def __init__(self, period: int, ddof: int) -> None:
+        self.window: deque[float] = deque(maxlen=period)
+        self.period = period
+        self.ddof = ddof
+        self.nobs = 0.0
+        self.mean_x = 0.0
+        self.ssqdm_x = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.numerically_unstable = False
+        self.started = False
+
+    def push(self, value: float) -> float:
+        # pandas rebuilds the first window, and every window when period == 1.
+        requires_recompute = not self.started or self.period == 1
+        self.started = True
+        if not requires_recompute and len(self.window) == self.period:
+            self._remove(self.window[0])
+        self.window.append(value)
+        if not requires_recompute:
+            self._add(value)
+        if requires_recompute or self.numerically_unstable:
+            self.nobs = self.mean_x = self.ssqdm_x = 0.0
+            self.compensation_add = self.compensation_remove = 0.0
+            for item in self.window:
+                self._add(item)
+            self.numerically_unstable = False
+        if self.nobs >= self.period and self.nobs > self.ddof:
+            return self.ssqdm_x / (self.nobs - self.ddof)
+        return NAN
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        prev_m2 = self.ssqdm_x
+        self.nobs += 1
+        prev_mean = self.mean_x - self.compensation_add
+        y = value - self.compensation_add
+        t = y - self.mean_x
+        self.compensation_add = t + self.mean_x - y
+        self.mean_x = self.mean_x + t / self.nobs
+        self.ssqdm_x = self.ssqdm_x + (value - prev_mean) * (value - self.mean_x)
+        if prev_m2 * _INV_COND_TOL > self.ssqdm_x:
+            self.numerically_unstable = True
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        prev_m2 = self.ssqdm_x
+        self.nobs -= 1
+        if not self.nobs:
+            self.mean_x = 0.0
+            self.ssqdm_x = 0.0
+            self.numerically_unstable = False
+            return
+        prev_mean = self.mean_x - self.compensation_remove
+        y = value - self.compensation_remove
+        t = y - self.mean_x
+        self.compensation_remove = t + self.mean_x - y
+        self.mean_x = self.mean_x - t / self.nobs
+        self.ssqdm_x = self.ssqdm_x - (value - prev_mean) * (value - self.mean_x)
+        if prev_m2 * _INV_COND_TOL > self.ssqdm_x:
+            self.numerically_unstable = True
+
+
+class _RollingStd(_StreamState):
+    """Fixed-window ``rolling_std``: the square root of ``_RollingVar``, clipped at 0."""
+
+    kind = "_rolling_std"
+
+    def __init__(self, period: int, ddof: int) -> None:
+        self.var = _RollingVar(period, ddof)
+
+    def push(self, value: float) -> float:
+        var = self.var.push(value)
+        return 0.0 if var < 0 else math.sqrt(var)
+
+
+def _check_period(period: int, name: str = "period") -> None:
+    if period <= 0:
+        raise ValueError(f"{name} must be > 0")
+
+
+class EmaStream(StreamingIndicator):
+    """Streaming ``ema``."""
+
+    kind = "ema"
+
+    def __init__(self, period: int = 20) -> None:
+        _check_period(period)
+        self.ewm = _span_ewm(period)
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        return self.ewm.push(float(bar["close"]))
+
+
+class RsiStream(StreamingIndicator):
+    """Streaming ``rsi_wilder``."""
+
+    kind = "rsi"
+
+    def __init__(self, period: int = 14) -> None:
+        _check_period(period)
+        self.prev_close: float | None = None
+        self.avg_gain = _wilder_ewm(period)
+        self.avg_loss = _wilder_ewm(period)
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        close = float(bar["close"])
+        if self.prev_close is None:
+            gain = loss = 0.0
+        else:
+            delta = close - self.prev_close
+            # Series.clip keeps NaN; max() would not.
+            gain = delta if delta != delta else max(delta, 0.0)
+            loss = -delta if delta != delta else max(-delta, 0.0)
+        self.prev_close = close
+        avg_gain = self.avg_gain.push(gain)
+        avg_loss = self.avg_loss.push(loss)
+        if avg_loss == 0:
+            return 100.0
+        rs = _div(avg_gain, avg_loss)
+        return 100.0 - (100.0 / (1.0 + rs))
+
+
+class AtrStream(StreamingIndicator):
+    """Streaming ``atr_wilder`` (0.0 during warm-up, as in the batch version)."""
+
+    kind = "atr"
+
+    def __init__(self, period: int = 14) -> None:
+        _check_period(period)
+        self.period = period
+        self.prev_close = NAN
+        self.seed: list[float] = []
+        self.atr = NAN
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        close = float(bar["close"])
+        tr = _true_range(float(bar["high"]), float(bar["low"]), self.prev_close)
+        self.prev_close = close
+        if len(self.seed) < self.period:
+            self.seed.append(tr)
+            if len(self.seed) < self.period:
+                return 0.0
+            self.atr = float(pd.Series(self.seed, dtype=float).mean())
+            return self.atr
+        self.atr = ((self.atr * (self.period - 1)) + tr) / self.period
+        return self.atr
+
+
+class AdxStream(StreamingIndicator):
+    """Streaming ``adx_wilder``; returns ``{"plus_di", "minus_di", "adx"}``."""
+
+    kind = "adx"
+
+    def __init__(self, period: int = 14) -> None:
+        _check_period(period)
+        self.period = period
+        self.count = 0
+        self.prev_high = NAN
+        self.prev_low = NAN
+        self.prev_close = NAN
+        self.seed_tr: list[float] = []
+        self.seed_plus: list[float] = []
+        self.seed_minus: list[float] = []
+        self.tr_smooth = NAN
+        self.plus_dm_smooth = NAN
+        self.minus_dm_smooth = NAN
+        self.seed_dx: list[float] = []
+        self.adx = NAN
+
+    def update(self, bar: Mapping[str, Any]) -> dict[str, float]:
+        high = float(bar["high"])
+        low = float(bar["low"])
+        close = float(bar["close"])
+        i = self.count
+        self.count += 1
+        if i == 0:
+            tr = plus_dm = minus_dm = 0.0
+        else:
+            up_move = high - self.prev_high
+            down_move = self.prev_low - low
+            plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+            minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+            tr = _true_range(high, low, self.prev_close)
+        self.prev_high, self.prev_low, self.prev_close = high, low, close
+
+        out = {"plus_di": NAN, "minus_di": NAN, "adx": NAN}
+        period = self.period
+        if i == 0:
+            return out
+        if i <= period:
+            self.seed_tr.append(tr)
+            self.seed_plus.append(plus_dm)
+            self.seed_minus.append(minus_dm)
+            if i < period:
+                return out
+            self.tr_smooth = float(pd.Series(self.seed_tr, dtype=float).sum())
+            self.plus_dm_smooth = float(pd.Series(self.seed_plus, dtype=float).sum())
+            self.minus_dm_smooth = float(pd.Series(self.seed_minus, dtype=float).sum())
+        else:
+            self.tr_smooth = self.tr_smooth - (self.tr_smooth / period) + tr
+            self.plus_dm_smooth = self.plus_dm_smooth - (self.plus_dm_smooth / period) + plus_dm
+            self.minus_dm_smooth = self.minus_dm_smooth - (self.minus_dm_smooth / period) + minus_dm
+
+        plus_di = _wilder_di(self.plus_dm_smooth, self.tr_smooth)
+        minus_di = _wilder_di(self.minus_dm_smooth, self.tr_smooth)
+        dx = _wilder_dx(plus_di, minus_di)
+        out["plus_di"] = plus_di
+        out["minus_di"] = minus_di
+
+        if i < 2 * period:
+            self.seed_dx.append(dx)
+        elif i == 2 * period:
+            self.adx = sum(self.seed_dx) / period
+            out["adx"] = self.adx
+        else:
+            self.adx = ((self.adx * (period - 1)) + dx) / period
+            out["adx"] = self.adx
+        return out
+
+
+class SmaStream(StreamingIndicator):
+    """Streaming ``sma``."""
+
+    kind = "sma"
+
+    def __init__(self, period: int = 20) -> None:
+        _check_period(period)
+        self.mean = _RollingMean(period)
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        return self.mean.push(float(bar["close"]))
+
+
+class StdStream(StreamingIndicator):
+    """Streaming ``rolling_std``."""
+
+    kind = "std"
+
+    def __init__(self, period: int = 20, ddof: int = 0) -> None:
+        _check_period(period)
+        self.std = _RollingStd(period, ddof)
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        return self.std.push(float(bar["close"]))
+
+
+class BollingerStream(StreamingIndicator):
+    """Streaming ``bollinger_bands``; returns ``{"mid", "upper", "lower"}``."""
+
+    kind = "bbands"
+
+    def __init__(self, period: int = 20, k: float = 2.0, ddof: int = 0) -> None:
+        _check_period(period)
+        self.k = k
+        self.mean = _RollingMean(period)
+        self.std = _RollingStd(period, ddof)
+
+    def update(self, bar: Mapping[str, Any]) -> dict[str, float]:
+        close = float(bar["close"])
+        mid = self.mean.push(close)
+        sd = self.std.push(close)
+        return {"mid": mid, "upper": mid + (self.k * sd), "lower": mid - (self.k * sd)}
+
+
+class MacdStream(StreamingIndicator):
+    """Streaming ``macd``; returns ``{"macd", "signal", "hist"}``."""
+
+    kind = "macd"
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
+        if fast <= 0 or slow <= 0 or signal <= 0:
+            raise ValueError("fast, slow, and signal must be > 0")
+        if fast >= slow:
+            raise ValueError("fast must be < slow")
+        self.fast = _span_ewm(fast)
+        self.slow = _span_ewm(slow)
+        self.signal = _span_ewm(signal)
+        self.warmup = slow + signal - 1
+        self.count = 0
+
+    def update(self, bar: Mapping[str, Any]) -> dict[str, float]:
+        close = float(bar["close"])
+        macd_line = self.fast.push(close) - self.slow.push(close)
+        signal_line = self.signal.push(macd_line)
+        self.count += 1
+        if self.count < self.warmup:
+            return {"macd": NAN, "signal": NAN, "hist": NAN}
+        return {"macd": macd_line, "signal": signal_line, "hist": macd_line - signal_line}
+
+
+class EmaSpreadStream(StreamingIndicator):
+    """Streaming ``ema_spread``."""
+
+    kind = "ema_spread"
+
+    def __init__(self, fast: int = 20, slow: int = 50) -> None:
+        if fast <= 0 or slow <= 0:
+            raise ValueError("fast and slow must be > 0")
+        if fast >= slow:
+            raise ValueError("fast must be < slow")
+        self.fast = _span_ewm(fast)
+        self.slow = _span_ewm(slow)
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        close = float(bar["close"])
+        return self.fast.push(close) - self.slow.push(close)
+
+
+class RsiSlopeStream(StreamingIndicator):
+    """Streaming ``rsi_slope``."""
+
+    kind = "rsi_slope"
+
+    def __init__(self, period: int = 14, slope: int = 5) -> None:
+        if slope <= 0:
+            raise ValueError("slope must be > 0")
+        self.rsi = RsiStream(period)
+        self.slope = slope
+        self.history: deque[float] = deque(maxlen=slope + 1)
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        self.history.append(self.rsi.update(bar))
+        if len(self.history) <= self.slope:
+            return NAN
+        return (self.history[-1] - self.history[0]) / float(self.slope)
+
+
+class RocStream(StreamingIndicator):
+    """Streaming ``roc``."""
+
+    kind = "roc"
+
+    def __init__(self, period: int = 12) -> None:
+        _check_period(period)
+        self.period = period
+        self.history: deque[float] = deque(maxlen=period + 1)
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        self.history.append(float(bar["close"]))
+        if len(self.history) <= self.period:
+            return NAN
+        return 100.0 * (_div(self.history[-1], self.history[0]) - 1.0)
+
+
+class VwapDailyStream(StreamingIndicator):
+    """Streaming ``vwap_typical_daily``.
+
+    Bars carrying a ``timestamp`` accumulate per UTC day; without one every bar
+    is its own group, as with a non-datetime index in the batch version.
+    """
+
+    kind = "vwap"
+
+    def __init__(self) -> None:
+        self.day: str | None = None
+        self.cum_pv = 0.0
+        self.cum_v = 0.0
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        high = float(bar["high"])
+        low = float(bar["low"])
+        close = float(bar["close"])
+        volume = float(bar["volume"])
+        timestamp = bar.get("timestamp")
+        day = None if timestamp is None else pd.Timestamp(timestamp).normalize().isoformat()
+        if day is None or day != self.day:
+            self.cum_pv = 0.0
+            self.cum_v = 0.0
+        self.day = day
+
+        pv = ((high + low + close) / 3.0) * volume
+        # cumsum skips NaN rows but keeps them NaN in the output.
+        if pv == pv:
+            self.cum_pv += pv
+        if volume == volume:
+            self.cum_v += volume
+        if pv != pv or volume != volume or self.cum_v == 0.0:
+            return NAN
+        return _div(self.cum_pv, self.cum_v)
+
+
+class ObvStream(StreamingIndicator):
+    """Streaming ``obv``."""
+
+    kind = "obv"
+
+    def __init__(self) -> None:
+        self.prev_close: float | None = None
+        self.total = 0.0
+
+    def update(self, bar: Mapping[str, Any]) -> float:
+        close = float(bar["close"])
+        volume = float(bar["volume"])
+        direction = 0.0
+        if self.prev_close is not None:
+            delta = close - self.prev_close
+            direction = 1.0 if delta > 0 else (-1.0 if delta < 0 else 0.0)
+        self.prev_close = close
+        flow = volume * direction
+        if flow != flow:
+            return NAN
+        self.total += flow
+        return self.total
+
+
+STREAMS: dict[str, type[StreamingIndicator]] = {
+    cls.kind: cls
+    for cls in (
+        EmaStream,
+        RsiStream,
+        AtrStream,
+        AdxStream,
+        SmaStream,
+        StdStream,
+        BollingerStream,
+        MacdStream,
+        EmaSpreadStream,
+        RsiSlopeStream,
+        RocStream,
+        VwapDailyStream,
+        ObvStream,
+    )
+}
+
+
+__all__ = [
+    "STREAMS",
+    "AdxStream",
+    "AtrStream",
+    "BollingerStream",
+    "EmaSpreadStream",
+    "EmaStream",
+    "MacdStream",
+    "ObvStream",
+    "RocStream",
+    "RsiSlopeStream",
+    "RsiStream",
+    "SmaStream",
+    "StdStream",
+    "StreamingIndicator",
+    "VwapDailyStream",
+]
@@ -53,8 +53,19 @@ def _prepare_frame(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     return ordered
 
 
-def write_parquet(df: pd.DataFrame, out_dir: Path, symbol: str, timeframe: str) -> Path:
-    """Write OHLCV parquet with deterministic schema and ordering."""
+def write_parquet(
+    df: pd.DataFrame,
+    out_dir: Path,
+    symbol: str,
+    timeframe: str,
+    *,
+    write_statistics: bool | list[str] = WRITE_STATISTICS,
+) -> Path:
+    """Write OHLCV parquet with deterministic schema and ordering.
+
+    ``write_statistics`` is passed to pyarrow; ``["timestamp"]`` emits the
+    row-group min/max readers need to skip row groups outside a time window.
+    """
     out_path = parquet_path(out_dir, symbol, timeframe)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -70,11 +81,17 @@ def write_parquet(df: pd.DataFrame, out_dir: Path, symbol: str, timeframe: str)
         use_dictionary=False,
         row_group_size=ROW_GROUP_SIZE,
         data_page_size=DATA_PAGE_SIZE,
-        write_statistics=WRITE_STATISTICS,
+        write_statistics=write_statistics,
     )
     return out_path
 
 
-def write_parquet_1m(df: pd.DataFrame, out_dir: Path, symbol: str) -> Path:
+def write_parquet_1m(
+    df: pd.DataFrame,
+    out_dir: Path,
+    symbol: str,
+    *,
+    write_statistics: bool | list[str] = WRITE_STATISTICS,
+) -> Path:
     """Write 1m OHLCV parquet with deterministic schema and ordering."""
-    return write_parquet(df, out_dir, symbol, "1m")
+    return write_parquet(df, out_dir, symbol, "1m", write_statistics=write_statistics)
@@ -10,6 +10,8 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+from buff.features.indicators import expanding_quantile
+
 from .build_features import FEATURE_COLUMNS
 
 EMA_SPREAD_THRESHOLD = 0.001
@@ -70,6 +72,25 @@ def _volatility_cluster(
     return cluster
 
 
+def expanding_volatility_regime(
+    atr_pct: pd.Series,
+    *,
+    low_quantile: float = ATR_PCT_LOW_QUANTILE,
+    high_quantile: float = ATR_PCT_HIGH_QUANTILE,
+    default: str = "mid",
+) -> pd.Series:
+    """Label volatility against quantile cutoffs of past and current bars only."""
+    atr_pct = atr_pct.astype(float)
+    low_cut = expanding_quantile(atr_pct, low_quantile)
+    high_cut = expanding_quantile(atr_pct, high_quantile)
+    usable = atr_pct.notna() & (low_cut < high_cut)
+
+    labels = pd.Series(default, index=atr_pct.index, dtype="string")
+    labels = labels.mask(usable & (atr_pct >= high_cut), "high")
+    labels = labels.mask(usable & (atr_pct <= low_cut), "low")
+    return labels
+
+
 def classify_regimes(
     features: pd.DataFrame,
     *,
@@ -80,8 +101,13 @@ def classify_regimes(
     atr_pct_low_quantile: float = ATR_PCT_LOW_QUANTILE,
     atr_pct_high_quantile: float = ATR_PCT_HIGH_QUANTILE,
     include_volatility_cluster: bool = False,
+    expanding_volatility: bool = False,
 ) -> pd.DataFrame:
-    """Classify deterministic regimes from precomputed features."""
+    """Classify deterministic regimes from precomputed features.
+
+    With ``expanding_volatility`` the ATR% cutoffs use only past bars instead of
+    the full sample, so labels never look ahead.
+    """
     required = {"ema_20", "ema_50", "rsi_14", "rsi_slope_14_5", "atr_pct"}
     _ensure_columns(features, required)
 
@@ -107,7 +133,14 @@ def classify_regimes(
     valid = atr_pct.dropna()
     volatility_regime = pd.Series("normal", index=features.index, dtype="string")
 
-    if not valid.empty:
+    if expanding_volatility:
+        volatility_regime = expanding_volatility_regime(
+            atr_pct,
+            low_quantile=atr_pct_low_quantile,
+            high_quantile=atr_pct_high_quantile,
+            default="normal",
+        )
+    elif not valid.empty:
         low_cut = float(np.nanpercentile(valid, atr_pct_low_quantile * 100.0))
         high_cut = float(np.nanpercentile(valid, atr_pct_high_quantile * 100.0))
         if np.isfinite(low_cut) and np.isfinite(high_cut) and low_cut < high_cut:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 
+from audit.decision_records import DURABILITY_MODES, DURABILITY_PER_RECORD, DurabilityPolicy
 from paper.long_run import LongRunConfig, run_long_paper
 
 
@@ -13,6 +14,29 @@ def main() -> int:
     parser.add_argument("--rotate-every-records", type=int, default=5000)
     parser.add_argument("--replay-every-records", type=int, default=2000)
     parser.add_argument("--feed", type=str, default=None)
+    parser.add_argument(
+        "--full-replay",
+        action="store_true",
+        help="Re-verify every shard from the start instead of resuming from checkpoints.",
+    )
+    parser.add_argument(
+        "--sync-mode",
+        choices=DURABILITY_MODES,
+        default=DURABILITY_PER_RECORD,
+        help="When decision records are fsynced: every record, in groups, or on close.",
+    )
+    parser.add_argument(
+        "--sync-every-records",
+        type=int,
+        default=256,
+        help="Group commit size for --sync-mode group.",
+    )
+    parser.add_argument(
+        "--sync-every-ms",
+        type=float,
+        default=None,
+        help="Group commit age limit in milliseconds for --sync-mode group.",
+    )
     args = parser.parse_args()
 
     config = LongRunConfig(
@@ -22,6 +46,12 @@ def main() -> int:
         rotate_every_records=args.rotate_every_records,
         replay_every_records=args.replay_every_records,
         feed_path=args.feed,
+        full_replay=args.full_replay,
+        durability=DurabilityPolicy(
+            mode=args.sync_mode,
+            max_records=args.sync_every_records,
+            max_delay_ms=args.sync_every_ms,
+        ),
     )
 
     try:
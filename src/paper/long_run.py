@@ -7,11 +7,13 @@ from pathlib import Path
 
 from audit.decision_records import (
     DecisionRecordWriter,
+    DurabilityPolicy,
+    SyncMetrics,
     infer_next_seq_from_jsonl,
     infer_next_shard_and_seq,
     make_records_path,
 )
-from audit.replay import replay_verify
+from audit.replay import replay_verify_incremental
 from paper.market_state_feed import cycling_feed, load_market_state_feed
 from paper.paper_runner import generate_mock_market_state
 from risk.contracts import RiskState
@@ -29,6 +31,8 @@ class LongRunConfig:
     replay_every_records: int = 2000
     out_dir: str = "runs"
     feed_path: str | None = None
+    full_replay: bool = False
+    durability: DurabilityPolicy | None = None
 
 
 def _risk_state(step: int) -> RiskState:
@@ -47,7 +51,13 @@ def _resolve_run_dir(run_id: str, out_dir: str) -> Path:
 
 
 def _writer_for_shard(
-    run_id: str, shard_index: int, start_seq: int, out_dir: str
+    run_id: str,
+    shard_index: int,
+    start_seq: int,
+    out_dir: str,
+    *,
+    durability: DurabilityPolicy | None = None,
+    metrics: SyncMetrics | None = None,
 ) -> DecisionRecordWriter:
     base = Path(out_dir)
     base.mkdir(parents=True, exist_ok=True)
@@ -58,29 +68,58 @@ def _writer_for_shard(
     finally:
         os.chdir(cwd)
     records_path = (base / "runs" / run_id / f"decision_records_{shard_index:04d}.jsonl").resolve()
-    return DecisionRecordWriter(out_path=str(records_path), run_id=run_id, start_seq=start_seq)
+    return DecisionRecordWriter(
+        out_path=str(records_path),
+        run_id=run_id,
+        start_seq=start_seq,
+        durability=durability,
+        metrics=metrics,
+    )
 
 
 def _list_shards(run_dir: Path) -> list[Path]:
     return sorted(run_dir.glob("decision_records_*.jsonl"))
 
 
-def _replay_all_shards(run_dir: Path) -> dict:
-    totals = {"total": 0, "matched": 0, "mismatched": 0, "hash_mismatch": 0, "errors": 0}
+def _replay_all_shards(run_dir: Path, *, full: bool = False) -> dict:
+    """Verify every shard, resuming each from its replay checkpoint unless ``full``."""
+    totals = {
+        "total": 0,
+        "matched": 0,
+        "mismatched": 0,
+        "hash_mismatch": 0,
+        "errors": 0,
+        "torn_tail": 0,
+        "unsynced": 0,
+    }
     for shard in _list_shards(run_dir):
-        result = replay_verify(records_path=str(shard))
+        result = replay_verify_incremental(records_path=str(shard), full=full)
         totals["total"] += result.total
         totals["matched"] += result.matched
         totals["mismatched"] += result.mismatched
         totals["hash_mismatch"] += result.hash_mismatch
         totals["errors"] += result.errors
+        totals["torn_tail"] += result.torn_tail
+        totals["unsynced"] += result.unsynced
     return totals
 
 
 def run_long_paper(config: LongRunConfig) -> dict:
     run_dir = _resolve_run_dir(config.run_id, config.out_dir)
+    sync_metrics = SyncMetrics()
+
+    def open_writer(shard_index: int, next_seq: int) -> DecisionRecordWriter:
+        return _writer_for_shard(
+            config.run_id,
+            shard_index,
+            next_seq,
+            config.out_dir,
+            durability=config.durability,
+            metrics=sync_metrics,
+        )
+
     shard_index, next_seq = infer_next_shard_and_seq(str(run_dir))
-    writer = _writer_for_shard(config.run_id, shard_index, next_seq, config.out_dir)
+    writer = open_writer(shard_index, next_seq)
 
     feed_errors = 0
     feed_iter = None
@@ -95,6 +134,8 @@ def run_long_paper(config: LongRunConfig) -> dict:
     records_written = 0
 
     while time.time() - start_ts < config.duration_seconds:
+        # Time spent between appends still counts toward the group-commit deadline.
+        writer.maybe_sync()
         if feed_iter is not None:
             market_state = next(feed_iter)
         else:
@@ -115,15 +156,15 @@ def run_long_paper(config: LongRunConfig) -> dict:
             records_path = run_dir / f"decision_records_{shard_index:04d}.jsonl"
             next_seq = infer_next_seq_from_jsonl(str(records_path))
             shard_index += 1
-            writer = _writer_for_shard(config.run_id, shard_index, next_seq, config.out_dir)
+            writer = open_writer(shard_index, next_seq)
 
         if config.replay_every_records > 0 and records_written % config.replay_every_records == 0:
             writer.close()
-            totals = _replay_all_shards(run_dir)
+            totals = _replay_all_shards(run_dir, full=config.full_replay)
             if totals["mismatched"] > 0 or totals["hash_mismatch"] > 0:
                 raise RuntimeError("replay_verification_failed")
             shard_index, next_seq = infer_next_shard_and_seq(str(run_dir))
-            writer = _writer_for_shard(config.run_id, shard_index, next_seq, config.out_dir)
+            writer = open_writer(shard_index, next_seq)
 
         if (
             config.restart_every_seconds > 0
@@ -131,15 +172,16 @@ def run_long_paper(config: LongRunConfig) -> dict:
         ):
             writer.close()
             shard_index, next_seq = infer_next_shard_and_seq(str(run_dir))
-            writer = _writer_for_shard(config.run_id, shard_index, next_seq, config.out_dir)
+            writer = open_writer(shard_index, next_seq)
             last_restart = time.time()
 
     writer.close()
-    totals = _replay_all_shards(run_dir)
+    totals = _replay_all_shards(run_dir, full=config.full_replay)
     if totals["mismatched"] > 0 or totals["hash_mismatch"] > 0:
         raise RuntimeError("replay_verification_failed")
 
     totals["records_path"] = str(run_dir)
     totals["shards"] = len(_list_shards(run_dir))
     totals["feed_errors"] = feed_errors
+    totals["sync"] = sync_metrics.snapshot()
     return totals
@@ -1,5 +1,5 @@
 """Strategy selection helpers."""
 
-from .selector import select_strategy
+from .selector import clear_selection_cache, select_strategy, selection_cache_info
 
-__all__ = ["select_strategy"]
+__all__ = ["clear_selection_cache", "select_strategy", "selection_cache_info"]
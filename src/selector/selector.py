@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import replace
+from functools import lru_cache
 from typing import Mapping
 
 from risk.contracts import RiskState
@@ -16,6 +18,7 @@ from strategies.registry import StrategyRegistry
 
 
 _MARKET_STATE_KEYS = ("trend_state", "volatility_regime", "momentum_state", "structure_state")
+SELECTION_CACHE_SIZE = 1024
 
 
 def _coerce_risk_state(value: RiskState | str) -> RiskState:
@@ -268,9 +271,7 @@ def select_strategy_contract(
     )
 
 
-def select_strategy(signals: MarketSignals, risk_state: RiskState) -> SelectionResult:
-    risk_state_enum = _coerce_risk_state(risk_state)
-    market_state = _normalize_market_state(signals)
+def _select(market_state: dict[str, object], risk_state_enum: RiskState) -> SelectionResult:
     selector_input = SelectorInput(
         schema_version=1,
         market_state=market_state,
@@ -294,3 +295,34 @@ def select_strategy(signals: MarketSignals, risk_state: RiskState) -> SelectionR
         rule_id=str(legacy_rule_id),
         inputs=legacy_inputs,
     )
+
+
+@lru_cache(maxsize=SELECTION_CACHE_SIZE)
+def _select_cached(state: tuple[str, ...], risk_state_enum: RiskState) -> SelectionResult:
+    return _select(dict(zip(_MARKET_STATE_KEYS, state)), risk_state_enum)
+
+
+def select_strategy(signals: MarketSignals, risk_state: RiskState) -> SelectionResult:
+    """Select a strategy for ``signals``; all-string states are memoized."""
+    risk_state_enum = _coerce_risk_state(risk_state)
+    market_state = _normalize_market_state(signals)
+    state = tuple(market_state.values())
+    if not all(type(value) is str for value in state):
+        return _select(market_state, risk_state_enum)
+    result = _select_cached(state, risk_state_enum)
+    # ``inputs`` is handed to callers (and into records), so never share the cached dict.
+    return replace(result, inputs=dict(result.inputs))
+
+
+def selection_cache_info() -> dict[str, int | None]:
+    info = _select_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "maxsize": info.maxsize,
+        "currsize": info.currsize,
+    }
+
+
+def clear_selection_cache() -> None:
+    _select_cached.cache_clear()
@@ -5,6 +5,7 @@ import math
 import re
 from typing import Any, Callable, Mapping, Sequence
 
+import numpy as np
 import pandas as pd
 
 from buff.features.indicators import (
@@ -60,6 +61,23 @@ class StrategyContext:
     params: Mapping[str, Any]
     position: PositionState | None = None
     indicators: Mapping[str, Any] | None = None
+    # Set by harnesses that validated the full series once; its prefixes stay valid.
+    history_validated: bool = False
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """Indicators a strategy reads, computed from history and resolved params.
+
+    ``compute`` must be causal (row ``i`` depends only on rows ``<= i``) so that a
+    full-series computation sliced at a bar equals computing over that prefix.
+    ``columns`` are the OHLCV columns it reads; their current bar is still
+    validated on every call.
+    """
+
+    names: tuple[str, ...]
+    columns: tuple[str, ...]
+    compute: Callable[[pd.DataFrame, Mapping[str, Any]], Mapping[str, Any]]
 
 
 @dataclass(frozen=True)
@@ -68,6 +86,7 @@ class BuiltinStrategyDefinition:
     version: str
     get_schema: Callable[[], dict[str, Any]]
     on_bar: Callable[[StrategyContext | Mapping[str, Any]], dict[str, Any]]
+    indicators: IndicatorSpec | None = None
 
 
 def is_semver(value: str) -> bool:
@@ -197,10 +216,21 @@ def validate_history(
     return history
 
 
-def numeric_series(history: pd.DataFrame, name: str) -> pd.Series:
+def numeric_column(history: pd.DataFrame, name: str) -> pd.Series:
     if name not in history.columns:
         raise ValueError(f"strategy_history_missing_columns:{name}")
-    series = pd.to_numeric(history[name], errors="coerce")
+    return pd.to_numeric(history[name], errors="coerce")
+
+
+def numeric_series(history: pd.DataFrame, name: str, *, tail: int | None = None) -> pd.Series:
+    """Numeric ``name`` column whose current bar must be finite.
+
+    ``tail`` converts only the last ``tail`` rows, for callers that read a
+    fixed window ending at the current bar.
+    """
+    if tail is not None:
+        history = history.iloc[-tail:]
+    series = numeric_column(history, name)
     if not math.isfinite(float(series.iloc[-1])):
         raise ValueError("strategy_history_invalid")
     return series
@@ -279,29 +309,60 @@ def prepare_context(
     schema: Mapping[str, Any],
 ) -> tuple[pd.DataFrame, dict[str, Any], bool, PositionState | None]:
     context = extract_context(ctx)
-    history = validate_history(context.history)
+    history = context.history
+    if not context.history_validated:
+        history = validate_history(history)
     params = resolve_params(schema.get("params", []), context.params)
     warmup_bars = int(schema.get("warmup_bars", 0))
     in_warmup = len(history) < warmup_bars
     return history, params, in_warmup, context.position
 
 
-def last_two(series: pd.Series) -> tuple[float, float] | None:
-    cleaned = pd.to_numeric(series, errors="coerce")
+def compute_indicators(
+    spec: IndicatorSpec, history: pd.DataFrame, params: Mapping[str, Any]
+) -> dict[str, np.ndarray]:
+    values = spec.compute(history, params)
+    return {
+        name: np.asarray(pd.to_numeric(values[name], errors="coerce"), dtype=float)
+        for name in spec.names
+    }
+
+
+def bar_indicators(
+    ctx: StrategyContext | Mapping[str, Any],
+    spec: IndicatorSpec,
+    history: pd.DataFrame,
+    params: Mapping[str, Any],
+) -> Mapping[str, np.ndarray]:
+    """Indicator arrays ending at the current bar.
+
+    Uses the views a harness precomputed (``ctx.indicators``) when they cover
+    ``spec``; otherwise computes them over ``history``.
+    """
+    for column in spec.columns:
+        numeric_series(history, column, tail=1)
+    provided = ctx.indicators if isinstance(ctx, StrategyContext) else ctx.get("indicators")
+    if provided is not None and all(name in provided for name in spec.names):
+        return provided
+    return compute_indicators(spec, history, params)
+
+
+def last_two(series: pd.Series | np.ndarray) -> tuple[float, float] | None:
+    cleaned = np.asarray(pd.to_numeric(series, errors="coerce"), dtype=float)
     if len(cleaned) < 2:
         return None
-    prev = float(cleaned.iloc[-2])
-    curr = float(cleaned.iloc[-1])
+    prev = float(cleaned[-2])
+    curr = float(cleaned[-1])
     if not math.isfinite(prev) or not math.isfinite(curr):
         return None
     return prev, curr
 
 
-def last_value(series: pd.Series) -> float | None:
-    cleaned = pd.to_numeric(series, errors="coerce")
-    if cleaned.empty:
+def last_value(series: pd.Series | np.ndarray) -> float | None:
+    cleaned = np.asarray(pd.to_numeric(series, errors="coerce"), dtype=float)
+    if len(cleaned) == 0:
         return None
-    curr = float(cleaned.iloc[-1])
+    curr = float(cleaned[-1])
     if not math.isfinite(curr):
         return None
     return curr
@@ -450,6 +511,21 @@ def last_pivot_levels(
     return pivot_high, pivot_low
 
 
+def pivot_levels(high: pd.Series, low: pd.Series, lookback: int) -> pd.DataFrame:
+    """Per-bar ``last_pivot_levels``: row ``i`` holds the levels confirmed by bar ``i``."""
+    if lookback <= 0:
+        empty = pd.Series(float("nan"), index=high.index)
+        return pd.DataFrame({"pivot_high": empty, "pivot_low": empty.copy()})
+    window = lookback * 2 + 1
+    position = np.arange(len(high))
+    eligible = position >= lookback
+    peak = high.rolling(window=window, min_periods=1, center=True).max()
+    trough = low.rolling(window=window, min_periods=1, center=True).min()
+    pivot_high = high.where(eligible & (high == peak)).ffill().shift(lookback)
+    pivot_low = low.where(eligible & (low == trough)).ffill().shift(lookback)
+    return pd.DataFrame({"pivot_high": pivot_high, "pivot_low": pivot_low})
+
+
 def update_position_extremes(position: PositionState, *, high: float, low: float) -> PositionState:
     max_price = max(position.max_price, high)
     min_price = min(position.min_price, low)
@@ -468,11 +544,14 @@ __all__ = [
     "ALLOWED_CATEGORIES",
     "ALLOWED_INTENTS",
     "BuiltinStrategyDefinition",
+    "IndicatorSpec",
     "PositionState",
     "StrategyContext",
     "adx_wilder",
     "atr_wilder",
+    "bar_indicators",
     "bollinger_bands",
+    "compute_indicators",
     "ema",
     "intent_response",
     "is_semver",
@@ -481,7 +560,9 @@ __all__ = [
     "last_two",
     "last_value",
     "macd",
+    "numeric_column",
     "numeric_series",
+    "pivot_levels",
     "prepare_context",
     "roc",
     "rolling_max",
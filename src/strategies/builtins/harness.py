@@ -10,6 +10,8 @@ from strategies.builtins.common import (
     BuiltinStrategyDefinition,
     PositionState,
     StrategyContext,
+    compute_indicators,
+    resolve_params,
     update_position_extremes,
     validate_history,
 )
@@ -112,12 +114,31 @@ def run_intent_backtest(
                 bars_in_trade=int(initial_position.get("bars_in_trade", 0)),
             )
 
+    # History is validated once here and declared indicators are computed once
+    # over the full series; each bar sees prefix views of both, so per-bar work
+    # does not grow with the bar index.
+    columns = None
+    if strategy.indicators is not None:
+        resolved = resolve_params(schema.get("params", []), params)
+        columns = compute_indicators(strategy.indicators, history, resolved)
+
+    close_col = history["close"]
+    high_col = history["high"]
+    low_col = history["low"]
     for idx in range(len(history)):
-        bar_history = history.iloc[: idx + 1]
-        ctx = StrategyContext(history=bar_history, params=params or {}, position=position)
+        indicators = None
+        if columns is not None:
+            indicators = {name: values[: idx + 1] for name, values in columns.items()}
+        ctx = StrategyContext(
+            history=history.iloc[: idx + 1],
+            params=params or {},
+            position=position,
+            indicators=indicators,
+            history_validated=True,
+        )
         result = strategy.on_bar(ctx)
         intent = _intent(result)
-        price = float(bar_history["close"].iloc[-1])
+        price = float(close_col.iloc[idx])
 
         if intent in {"ENTER_LONG", "ENTER_SHORT"}:
             side = "LONG" if intent == "ENTER_LONG" else "SHORT"
@@ -135,8 +156,8 @@ def run_intent_backtest(
                 timeline.append(_timeline_event("exit", idx, f"{position.side.lower()}_to_flip"))
                 position = None
             if position is None:
-                high = float(bar_history["high"].iloc[-1])
-                low = float(bar_history["low"].iloc[-1])
+                high = float(high_col.iloc[idx])
+                low = float(low_col.iloc[idx])
                 position = PositionState(
                     side=side,
                     entry_price=price,
@@ -165,8 +186,8 @@ def run_intent_backtest(
                 position = None
 
         if position is not None:
-            high = float(bar_history["high"].iloc[-1])
-            low = float(bar_history["low"].iloc[-1])
+            high = float(high_col.iloc[idx])
+            low = float(low_col.iloc[idx])
             position = update_position_extremes(position, high=high, low=low)
 
     timeline.append(_timeline_event("run_end", len(history) - 1))
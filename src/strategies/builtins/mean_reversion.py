@@ -5,10 +5,13 @@ from typing import Any
 
 from strategies.builtins.common import (
     BuiltinStrategyDefinition,
+    IndicatorSpec,
+    bar_indicators,
     bollinger_bands,
     intent_response,
     keltner_channels,
     last_value,
+    numeric_column,
     numeric_series,
     prepare_context,
     rsi_wilder,
@@ -71,6 +74,15 @@ def rsi_mean_reversion_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_RSI_SCHEMA)
 
 
+def _rsi_mean_reversion_indicators(history, params) -> dict[str, Any]:
+    return {"rsi": rsi_wilder(numeric_column(history, "close"), period=int(params["period"]))}
+
+
+_RSI_INDICATORS = IndicatorSpec(
+    names=("rsi",), columns=("close",), compute=_rsi_mean_reversion_indicators
+)
+
+
 def rsi_mean_reversion_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _RSI_SCHEMA)
     period = int(params["period"])
@@ -83,9 +95,7 @@ def rsi_mean_reversion_on_bar(ctx) -> dict[str, Any]:
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    close = numeric_series(history, "close")
-    rsi = rsi_wilder(close, period=period)
-    value = last_value(rsi)
+    value = last_value(bar_indicators(ctx, _RSI_INDICATORS, history, params)["rsi"])
     if value is None:
         return intent_response("HOLD", tags=["insufficient_history"])
 
@@ -105,6 +115,7 @@ RSI_MEAN_REVERSION = BuiltinStrategyDefinition(
     version=_RSI_SCHEMA["version"],
     get_schema=rsi_mean_reversion_get_schema,
     on_bar=rsi_mean_reversion_on_bar,
+    indicators=_RSI_INDICATORS,
 )
 
 
@@ -144,19 +155,28 @@ def bollinger_reversion_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_BB_REVERSION_SCHEMA)
 
 
+def _bollinger_reversion_indicators(history, params) -> dict[str, Any]:
+    close = numeric_column(history, "close")
+    return bollinger_bands(close, period=int(params["period"]), k=float(params["k"]))
+
+
+_BB_REVERSION_INDICATORS = IndicatorSpec(
+    names=("upper", "lower", "mid"), columns=("close",), compute=_bollinger_reversion_indicators
+)
+
+
 def bollinger_reversion_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _BB_REVERSION_SCHEMA)
     period = int(params["period"])
-    k = float(params["k"])
     warmup = max(period, _BB_REVERSION_SCHEMA["warmup_bars"])
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    close = numeric_series(history, "close")
-    bands = bollinger_bands(close, period=period, k=k)
-    upper = bands["upper"].iloc[-1]
-    lower = bands["lower"].iloc[-1]
-    mid = bands["mid"].iloc[-1]
+    close = numeric_series(history, "close", tail=1)
+    bands = bar_indicators(ctx, _BB_REVERSION_INDICATORS, history, params)
+    upper = bands["upper"][-1]
+    lower = bands["lower"][-1]
+    mid = bands["mid"][-1]
     price = float(close.iloc[-1])
 
     if price < lower:
@@ -175,6 +195,7 @@ BOLLINGER_REVERSION = BuiltinStrategyDefinition(
     version=_BB_REVERSION_SCHEMA["version"],
     get_schema=bollinger_reversion_get_schema,
     on_bar=bollinger_reversion_on_bar,
+    indicators=_BB_REVERSION_INDICATORS,
 )
 
 
@@ -223,6 +244,17 @@ def zscore_reversion_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_ZSCORE_SCHEMA)
 
 
+def _zscore_reversion_indicators(history, params) -> dict[str, Any]:
+    return {
+        "zscore": zscore_series(numeric_column(history, "close"), period=int(params["lookback"]))
+    }
+
+
+_ZSCORE_INDICATORS = IndicatorSpec(
+    names=("zscore",), columns=("close",), compute=_zscore_reversion_indicators
+)
+
+
 def zscore_reversion_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, position = prepare_context(ctx, _ZSCORE_SCHEMA)
     lookback = int(params["lookback"])
@@ -234,9 +266,7 @@ def zscore_reversion_on_bar(ctx) -> dict[str, Any]:
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    close = numeric_series(history, "close")
-    zscore = zscore_series(close, period=lookback)
-    value = last_value(zscore)
+    value = last_value(bar_indicators(ctx, _ZSCORE_INDICATORS, history, params)["zscore"])
     if value is None:
         return intent_response("HOLD", tags=["insufficient_history"])
 
@@ -256,6 +286,7 @@ ZSCORE_REVERSION = BuiltinStrategyDefinition(
     version=_ZSCORE_SCHEMA["version"],
     get_schema=zscore_reversion_get_schema,
     on_bar=zscore_reversion_on_bar,
+    indicators=_ZSCORE_INDICATORS,
 )
 
 
@@ -304,24 +335,37 @@ def keltner_reversion_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_KELTNER_SCHEMA)
 
 
+def _keltner_reversion_indicators(history, params) -> dict[str, Any]:
+    return keltner_channels(
+        numeric_column(history, "high"),
+        numeric_column(history, "low"),
+        numeric_column(history, "close"),
+        ema_period=int(params["ema_period"]),
+        atr_period=int(params["atr_period"]),
+        atr_mult=float(params["atr_mult"]),
+    )
+
+
+_KELTNER_INDICATORS = IndicatorSpec(
+    names=("upper", "lower", "mid"),
+    columns=("high", "low", "close"),
+    compute=_keltner_reversion_indicators,
+)
+
+
 def keltner_reversion_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _KELTNER_SCHEMA)
     ema_period = int(params["ema_period"])
     atr_period = int(params["atr_period"])
-    atr_mult = float(params["atr_mult"])
     warmup = max(ema_period, atr_period, _KELTNER_SCHEMA["warmup_bars"])
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
-    close = numeric_series(history, "close")
-    kc = keltner_channels(
-        high, low, close, ema_period=ema_period, atr_period=atr_period, atr_mult=atr_mult
-    )
-    upper = kc["upper"].iloc[-1]
-    lower = kc["lower"].iloc[-1]
-    mid = kc["mid"].iloc[-1]
+    close = numeric_series(history, "close", tail=1)
+    kc = bar_indicators(ctx, _KELTNER_INDICATORS, history, params)
+    upper = kc["upper"][-1]
+    lower = kc["lower"][-1]
+    mid = kc["mid"][-1]
     price = float(close.iloc[-1])
 
     if price < lower:
@@ -340,6 +384,7 @@ KELTNER_REVERSION = BuiltinStrategyDefinition(
     version=_KELTNER_SCHEMA["version"],
     get_schema=keltner_reversion_get_schema,
     on_bar=keltner_reversion_on_bar,
+    indicators=_KELTNER_INDICATORS,
 )
 
 
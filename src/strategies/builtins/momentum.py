@@ -5,11 +5,13 @@ from typing import Any
 
 from strategies.builtins.common import (
     BuiltinStrategyDefinition,
+    IndicatorSpec,
+    bar_indicators,
     intent_response,
     last_two,
     last_value,
     macd,
-    numeric_series,
+    numeric_column,
     prepare_context,
     roc,
     stochastic_kd,
@@ -71,6 +73,20 @@ def macd_momentum_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_MACD_SCHEMA)
 
 
+def _macd_momentum_indicators(history, params) -> dict[str, Any]:
+    return macd(
+        numeric_column(history, "close"),
+        fast=int(params["fast"]),
+        slow=int(params["slow"]),
+        signal=int(params["signal"]),
+    )
+
+
+_MACD_INDICATORS = IndicatorSpec(
+    names=("macd", "signal", "hist"), columns=("close",), compute=_macd_momentum_indicators
+)
+
+
 def macd_momentum_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _MACD_SCHEMA)
     fast = int(params["fast"])
@@ -83,8 +99,7 @@ def macd_momentum_on_bar(ctx) -> dict[str, Any]:
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    close = numeric_series(history, "close")
-    macd_df = macd(close, fast=fast, slow=slow, signal=signal)
+    macd_df = bar_indicators(ctx, _MACD_INDICATORS, history, params)
     pair_macd = last_two(macd_df["macd"])
     pair_signal = last_two(macd_df["signal"])
     hist = last_value(macd_df["hist"])
@@ -112,6 +127,7 @@ MACD_MOMENTUM = BuiltinStrategyDefinition(
     version=_MACD_SCHEMA["version"],
     get_schema=macd_momentum_get_schema,
     on_bar=macd_momentum_on_bar,
+    indicators=_MACD_INDICATORS,
 )
 
 
@@ -160,6 +176,15 @@ def roc_momentum_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_ROC_SCHEMA)
 
 
+def _roc_momentum_indicators(history, params) -> dict[str, Any]:
+    return {"roc": roc(numeric_column(history, "close"), period=int(params["period"]))}
+
+
+_ROC_INDICATORS = IndicatorSpec(
+    names=("roc",), columns=("close",), compute=_roc_momentum_indicators
+)
+
+
 def roc_momentum_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _ROC_SCHEMA)
     period = int(params["period"])
@@ -169,9 +194,7 @@ def roc_momentum_on_bar(ctx) -> dict[str, Any]:
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    close = numeric_series(history, "close")
-    roc_series = roc(close, period=period)
-    value = last_value(roc_series)
+    value = last_value(bar_indicators(ctx, _ROC_INDICATORS, history, params)["roc"])
     if value is None:
         return intent_response("HOLD", tags=["insufficient_history"])
 
@@ -191,6 +214,7 @@ ROC_MOMENTUM = BuiltinStrategyDefinition(
     version=_ROC_SCHEMA["version"],
     get_schema=roc_momentum_get_schema,
     on_bar=roc_momentum_on_bar,
+    indicators=_ROC_INDICATORS,
 )
 
 
@@ -257,6 +281,22 @@ def stochastic_momentum_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_STOCH_SCHEMA)
 
 
+def _stochastic_momentum_indicators(history, params) -> dict[str, Any]:
+    return stochastic_kd(
+        numeric_column(history, "high"),
+        numeric_column(history, "low"),
+        numeric_column(history, "close"),
+        k_period=int(params["k_period"]),
+        d_period=int(params["d_period"]),
+        smooth_k=int(params["smooth_k"]),
+    )
+
+
+_STOCH_INDICATORS = IndicatorSpec(
+    names=("k", "d"), columns=("high", "low", "close"), compute=_stochastic_momentum_indicators
+)
+
+
 def stochastic_momentum_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _STOCH_SCHEMA)
     k_period = int(params["k_period"])
@@ -271,18 +311,7 @@ def stochastic_momentum_on_bar(ctx) -> dict[str, Any]:
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
-    close = numeric_series(history, "close")
-
-    stoch = stochastic_kd(
-        high,
-        low,
-        close,
-        k_period=k_period,
-        d_period=d_period,
-        smooth_k=smooth_k,
-    )
+    stoch = bar_indicators(ctx, _STOCH_INDICATORS, history, params)
     pair_k = last_two(stoch["k"])
     pair_d = last_two(stoch["d"])
     if pair_k is None or pair_d is None:
@@ -312,6 +341,7 @@ STOCHASTIC_MOMENTUM = BuiltinStrategyDefinition(
     version=_STOCH_SCHEMA["version"],
     get_schema=stochastic_momentum_get_schema,
     on_bar=stochastic_momentum_on_bar,
+    indicators=_STOCH_INDICATORS,
 )
 
 
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import copy
+import math
 from typing import Any
 
 from strategies.builtins.common import (
     BuiltinStrategyDefinition,
+    IndicatorSpec,
+    bar_indicators,
     intent_response,
-    last_pivot_levels,
+    numeric_column,
     numeric_series,
+    pivot_levels,
     prepare_context,
     rolling_max,
     rolling_min,
@@ -51,6 +55,26 @@ def pivot_breakout_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_PIVOT_SCHEMA)
 
 
+def _pivot_breakout_indicators(history, params) -> dict[str, Any]:
+    return pivot_levels(
+        numeric_column(history, "high"),
+        numeric_column(history, "low"),
+        int(params["pivot_lookback"]),
+    )
+
+
+_PIVOT_INDICATORS = IndicatorSpec(
+    names=("pivot_high", "pivot_low"),
+    columns=("high", "low"),
+    compute=_pivot_breakout_indicators,
+)
+
+
+def _level(values) -> float | None:
+    level = float(values[-1])
+    return None if math.isnan(level) else level
+
+
 def pivot_breakout_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _PIVOT_SCHEMA)
     lookback = int(params["pivot_lookback"])
@@ -59,11 +83,11 @@ def pivot_breakout_on_bar(ctx) -> dict[str, Any]:
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
-    close = numeric_series(history, "close")
+    pivots = bar_indicators(ctx, _PIVOT_INDICATORS, history, params)
+    close = numeric_series(history, "close", tail=1)
 
-    pivot_high, pivot_low = last_pivot_levels(high, low, lookback)
+    pivot_high = _level(pivots["pivot_high"])
+    pivot_low = _level(pivots["pivot_low"])
     if pivot_high is None and pivot_low is None:
         return intent_response("HOLD", tags=["no_pivot"])
 
@@ -84,6 +108,7 @@ PIVOT_BREAKOUT = BuiltinStrategyDefinition(
     version=_PIVOT_SCHEMA["version"],
     get_schema=pivot_breakout_get_schema,
     on_bar=pivot_breakout_on_bar,
+    indicators=_PIVOT_INDICATORS,
 )
 
 
@@ -132,6 +157,19 @@ def sr_retest_rule_based_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_SR_SCHEMA)
 
 
+def _sr_retest_indicators(history, params) -> dict[str, Any]:
+    lookback = int(params["lookback"])
+    return {
+        "resistance": rolling_max(numeric_column(history, "high"), lookback).shift(1),
+        "support": rolling_min(numeric_column(history, "low"), lookback).shift(1),
+    }
+
+
+_SR_INDICATORS = IndicatorSpec(
+    names=("resistance", "support"), columns=("high", "low"), compute=_sr_retest_indicators
+)
+
+
 def sr_retest_rule_based_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _SR_SCHEMA)
     lookback = int(params["lookback"])
@@ -141,21 +179,22 @@ def sr_retest_rule_based_on_bar(ctx) -> dict[str, Any]:
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
-    close = numeric_series(history, "close")
+    high = numeric_series(history, "high", tail=1)
+    low = numeric_series(history, "low", tail=1)
+    close = numeric_series(history, "close", tail=2)
 
-    resistance = rolling_max(high, lookback).shift(1)
-    support = rolling_min(low, lookback).shift(1)
-    if resistance.isna().iloc[-1] or support.isna().iloc[-1]:
+    levels = bar_indicators(ctx, _SR_INDICATORS, history, params)
+    resistance = levels["resistance"]
+    support = levels["support"]
+    if math.isnan(resistance[-1]) or math.isnan(support[-1]):
         return intent_response("HOLD", tags=["insufficient_history"])
 
     prev_close = float(close.iloc[-2])
     curr_close = float(close.iloc[-1])
     curr_low = float(low.iloc[-1])
     curr_high = float(high.iloc[-1])
-    res_level = float(resistance.iloc[-1])
-    sup_level = float(support.iloc[-1])
+    res_level = float(resistance[-1])
+    sup_level = float(support[-1])
 
     broke_up = prev_close > res_level * (1.0 + breakout_buffer)
     retest_up = curr_low <= res_level * (1.0 + retest_tolerance) and curr_close >= res_level
@@ -179,6 +218,7 @@ SR_RETEST_RULE_BASED = BuiltinStrategyDefinition(
     version=_SR_SCHEMA["version"],
     get_schema=sr_retest_rule_based_get_schema,
     on_bar=sr_retest_rule_based_on_bar,
+    indicators=_SR_INDICATORS,
 )
 
 
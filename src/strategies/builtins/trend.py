@@ -5,11 +5,14 @@ from typing import Any
 
 from strategies.builtins.common import (
     BuiltinStrategyDefinition,
+    IndicatorSpec,
     adx_wilder,
+    bar_indicators,
     bollinger_bands,
     ema,
     intent_response,
     last_two,
+    numeric_column,
     numeric_series,
     prepare_context,
     sma,
@@ -54,6 +57,19 @@ def sma_crossover_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_SMA_SCHEMA)
 
 
+def _sma_crossover_indicators(history, params) -> dict[str, Any]:
+    close = numeric_column(history, "close")
+    return {
+        "fast": sma(close, period=int(params["fast_period"])),
+        "slow": sma(close, period=int(params["slow_period"])),
+    }
+
+
+_SMA_INDICATORS = IndicatorSpec(
+    names=("fast", "slow"), columns=("close",), compute=_sma_crossover_indicators
+)
+
+
 def sma_crossover_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _SMA_SCHEMA)
     fast = int(params["fast_period"])
@@ -64,11 +80,9 @@ def sma_crossover_on_bar(ctx) -> dict[str, Any]:
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    close = numeric_series(history, "close")
-    fast_series = sma(close, period=fast)
-    slow_series = sma(close, period=slow)
-    pair_fast = last_two(fast_series)
-    pair_slow = last_two(slow_series)
+    indicators = bar_indicators(ctx, _SMA_INDICATORS, history, params)
+    pair_fast = last_two(indicators["fast"])
+    pair_slow = last_two(indicators["slow"])
     if pair_fast is None or pair_slow is None:
         return intent_response("HOLD", tags=["insufficient_history"])
 
@@ -89,6 +103,7 @@ SMA_CROSSOVER = BuiltinStrategyDefinition(
     version=_SMA_SCHEMA["version"],
     get_schema=sma_crossover_get_schema,
     on_bar=sma_crossover_on_bar,
+    indicators=_SMA_INDICATORS,
 )
 
 
@@ -128,6 +143,19 @@ def ema_crossover_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_EMA_SCHEMA)
 
 
+def _ema_crossover_indicators(history, params) -> dict[str, Any]:
+    close = numeric_column(history, "close")
+    return {
+        "fast": ema(close, period=int(params["fast_period"])),
+        "slow": ema(close, period=int(params["slow_period"])),
+    }
+
+
+_EMA_INDICATORS = IndicatorSpec(
+    names=("fast", "slow"), columns=("close",), compute=_ema_crossover_indicators
+)
+
+
 def ema_crossover_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _EMA_SCHEMA)
     fast = int(params["fast_period"])
@@ -138,11 +166,9 @@ def ema_crossover_on_bar(ctx) -> dict[str, Any]:
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    close = numeric_series(history, "close")
-    fast_series = ema(close, period=fast)
-    slow_series = ema(close, period=slow)
-    pair_fast = last_two(fast_series)
-    pair_slow = last_two(slow_series)
+    indicators = bar_indicators(ctx, _EMA_INDICATORS, history, params)
+    pair_fast = last_two(indicators["fast"])
+    pair_slow = last_two(indicators["slow"])
     if pair_fast is None or pair_slow is None:
         return intent_response("HOLD", tags=["insufficient_history"])
 
@@ -163,6 +189,7 @@ EMA_CROSSOVER = BuiltinStrategyDefinition(
     version=_EMA_SCHEMA["version"],
     get_schema=ema_crossover_get_schema,
     on_bar=ema_crossover_on_bar,
+    indicators=_EMA_INDICATORS,
 )
 
 
@@ -202,6 +229,27 @@ def donchian_breakout_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_DONCHIAN_SCHEMA)
 
 
+def _donchian_breakout_indicators(history, params) -> dict[str, Any]:
+    high = numeric_column(history, "high")
+    low = numeric_column(history, "low")
+    lookback = int(params["lookback"])
+    exit_lookback = int(params["exit_lookback"])
+    # Channels over the bars before the current one, skipping NaNs like Series.max/min.
+    return {
+        "prev_high": high.rolling(window=lookback, min_periods=1).max().shift(1),
+        "prev_low": low.rolling(window=lookback, min_periods=1).min().shift(1),
+        "exit_high": high.rolling(window=exit_lookback, min_periods=1).max().shift(1),
+        "exit_low": low.rolling(window=exit_lookback, min_periods=1).min().shift(1),
+    }
+
+
+_DONCHIAN_INDICATORS = IndicatorSpec(
+    names=("prev_high", "prev_low", "exit_high", "exit_low"),
+    columns=("high", "low"),
+    compute=_donchian_breakout_indicators,
+)
+
+
 def donchian_breakout_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _DONCHIAN_SCHEMA)
     lookback = int(params["lookback"])
@@ -212,14 +260,13 @@ def donchian_breakout_on_bar(ctx) -> dict[str, Any]:
     if len(history) <= warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
-    close = numeric_series(history, "close")
+    close = numeric_series(history, "close", tail=1)
+    channels = bar_indicators(ctx, _DONCHIAN_INDICATORS, history, params)
 
-    prev_high = float(high.iloc[-lookback - 1 : -1].max())
-    prev_low = float(low.iloc[-lookback - 1 : -1].min())
-    exit_high = float(high.iloc[-exit_lookback - 1 : -1].max())
-    exit_low = float(low.iloc[-exit_lookback - 1 : -1].min())
+    prev_high = float(channels["prev_high"][-1])
+    prev_low = float(channels["prev_low"][-1])
+    exit_high = float(channels["exit_high"][-1])
+    exit_low = float(channels["exit_low"][-1])
     price = float(close.iloc[-1])
 
     if price > prev_high:
@@ -238,6 +285,7 @@ DONCHIAN_BREAKOUT = BuiltinStrategyDefinition(
     version=_DONCHIAN_SCHEMA["version"],
     get_schema=donchian_breakout_get_schema,
     on_bar=donchian_breakout_on_bar,
+    indicators=_DONCHIAN_INDICATORS,
 )
 
 
@@ -277,19 +325,28 @@ def bollinger_breakout_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_BB_BREAKOUT_SCHEMA)
 
 
+def _bollinger_breakout_indicators(history, params) -> dict[str, Any]:
+    close = numeric_column(history, "close")
+    return bollinger_bands(close, period=int(params["period"]), k=float(params["k"]))
+
+
+_BB_BREAKOUT_INDICATORS = IndicatorSpec(
+    names=("upper", "lower", "mid"), columns=("close",), compute=_bollinger_breakout_indicators
+)
+
+
 def bollinger_breakout_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _BB_BREAKOUT_SCHEMA)
     period = int(params["period"])
-    k = float(params["k"])
     warmup = max(period, _BB_BREAKOUT_SCHEMA["warmup_bars"])
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    close = numeric_series(history, "close")
-    bands = bollinger_bands(close, period=period, k=k)
-    upper = bands["upper"].iloc[-1]
-    lower = bands["lower"].iloc[-1]
-    mid = bands["mid"].iloc[-1]
+    close = numeric_series(history, "close", tail=1)
+    bands = bar_indicators(ctx, _BB_BREAKOUT_INDICATORS, history, params)
+    upper = bands["upper"][-1]
+    lower = bands["lower"][-1]
+    mid = bands["mid"][-1]
     price = float(close.iloc[-1])
 
     if price > upper:
@@ -308,6 +365,7 @@ BOLLINGER_BREAKOUT = BuiltinStrategyDefinition(
     version=_BB_BREAKOUT_SCHEMA["version"],
     get_schema=bollinger_breakout_get_schema,
     on_bar=bollinger_breakout_on_bar,
+    indicators=_BB_BREAKOUT_INDICATORS,
 )
 
 
@@ -347,19 +405,31 @@ def supertrend_trend_follow_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_SUPERTREND_SCHEMA)
 
 
+def _supertrend_indicators(history, params) -> dict[str, Any]:
+    st = supertrend(
+        numeric_column(history, "high"),
+        numeric_column(history, "low"),
+        numeric_column(history, "close"),
+        period=int(params["atr_period"]),
+        multiplier=float(params["multiplier"]),
+    )
+    return {"trend": st["trend"]}
+
+
+_SUPERTREND_INDICATORS = IndicatorSpec(
+    names=("trend",), columns=("high", "low", "close"), compute=_supertrend_indicators
+)
+
+
 def supertrend_trend_follow_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _SUPERTREND_SCHEMA)
     atr_period = int(params["atr_period"])
-    multiplier = float(params["multiplier"])
     warmup = max(atr_period + 1, _SUPERTREND_SCHEMA["warmup_bars"])
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
-    close = numeric_series(history, "close")
-    st = supertrend(high, low, close, period=atr_period, multiplier=multiplier)
-    pair_trend = last_two(st["trend"])
+    indicators = bar_indicators(ctx, _SUPERTREND_INDICATORS, history, params)
+    pair_trend = last_two(indicators["trend"])
     if pair_trend is None:
         return intent_response("HOLD", tags=["insufficient_history"])
     prev_trend, curr_trend = pair_trend
@@ -375,6 +445,7 @@ SUPERTREND_TREND_FOLLOW = BuiltinStrategyDefinition(
     version=_SUPERTREND_SCHEMA["version"],
     get_schema=supertrend_trend_follow_get_schema,
     on_bar=supertrend_trend_follow_on_bar,
+    indicators=_SUPERTREND_INDICATORS,
 )
 
 
@@ -432,6 +503,21 @@ def adx_filtered_breakout_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_ADX_BREAKOUT_SCHEMA)
 
 
+def _adx_filtered_breakout_indicators(history, params) -> dict[str, Any]:
+    adx_df = adx_wilder(
+        numeric_column(history, "high"),
+        numeric_column(history, "low"),
+        numeric_column(history, "close"),
+        period=int(params["adx_period"]),
+    )
+    return {"adx": adx_df["adx"]}
+
+
+_ADX_BREAKOUT_INDICATORS = IndicatorSpec(
+    names=("adx",), columns=("high", "low", "close"), compute=_adx_filtered_breakout_indicators
+)
+
+
 def adx_filtered_breakout_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _ADX_BREAKOUT_SCHEMA)
     lookback = int(params["lookback"])
@@ -442,12 +528,12 @@ def adx_filtered_breakout_on_bar(ctx) -> dict[str, Any]:
     if len(history) <= warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
-    close = numeric_series(history, "close")
+    window = max(lookback, exit_lookback) + 1
+    high = numeric_series(history, "high", tail=window)
+    low = numeric_series(history, "low", tail=window)
+    close = numeric_series(history, "close", tail=1)
 
-    adx_df = adx_wilder(high, low, close, period=adx_period)
-    adx_value = adx_df["adx"].iloc[-1]
+    adx_value = bar_indicators(ctx, _ADX_BREAKOUT_INDICATORS, history, params)["adx"][-1]
     if adx_value is None or adx_value != adx_value:
         return intent_response("HOLD", tags=["adx_not_ready"])
 
@@ -473,6 +559,7 @@ ADX_FILTERED_BREAKOUT = BuiltinStrategyDefinition(
     version=_ADX_BREAKOUT_SCHEMA["version"],
     get_schema=adx_filtered_breakout_get_schema,
     on_bar=adx_filtered_breakout_on_bar,
+    indicators=_ADX_BREAKOUT_INDICATORS,
 )
 
 
@@ -5,10 +5,13 @@ from typing import Any
 
 from strategies.builtins.common import (
     BuiltinStrategyDefinition,
+    IndicatorSpec,
     atr_wilder,
+    bar_indicators,
     bollinger_bands,
     intent_response,
     keltner_channels,
+    numeric_column,
     numeric_series,
     prepare_context,
     strategy_schema,
@@ -69,6 +72,21 @@ def atr_volatility_breakout_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_ATR_BREAKOUT_SCHEMA)
 
 
+def _atr_volatility_breakout_indicators(history, params) -> dict[str, Any]:
+    atr = atr_wilder(
+        numeric_column(history, "high"),
+        numeric_column(history, "low"),
+        numeric_column(history, "close"),
+        period=int(params["atr_period"]),
+    )
+    return {"atr": atr}
+
+
+_ATR_BREAKOUT_INDICATORS = IndicatorSpec(
+    names=("atr",), columns=("high", "low", "close"), compute=_atr_volatility_breakout_indicators
+)
+
+
 def atr_volatility_breakout_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _ATR_BREAKOUT_SCHEMA)
     lookback = int(params["lookback"])
@@ -79,12 +97,13 @@ def atr_volatility_breakout_on_bar(ctx) -> dict[str, Any]:
     if len(history) <= warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
-    close = numeric_series(history, "close")
+    window = max(lookback, exit_lookback) + 1
+    high = numeric_series(history, "high", tail=window)
+    low = numeric_series(history, "low", tail=window)
+    close = numeric_series(history, "close", tail=1)
 
-    atr = atr_wilder(high, low, close, period=atr_period)
-    atr_pct = float(atr.iloc[-1]) / float(close.iloc[-1])
+    atr = bar_indicators(ctx, _ATR_BREAKOUT_INDICATORS, history, params)["atr"]
+    atr_pct = float(atr[-1]) / float(close.iloc[-1])
 
     prev_high = float(high.iloc[-lookback - 1 : -1].max())
     prev_low = float(low.iloc[-lookback - 1 : -1].min())
@@ -108,6 +127,7 @@ ATR_VOLATILITY_BREAKOUT = BuiltinStrategyDefinition(
     version=_ATR_BREAKOUT_SCHEMA["version"],
     get_schema=atr_volatility_breakout_get_schema,
     on_bar=atr_volatility_breakout_on_bar,
+    indicators=_ATR_BREAKOUT_INDICATORS,
 )
 
 
@@ -174,39 +194,55 @@ def bb_keltner_squeeze_release_get_schema() -> dict[str, Any]:
     return copy.deepcopy(_SQUEEZE_SCHEMA)
 
 
+def _bb_keltner_squeeze_indicators(history, params) -> dict[str, Any]:
+    high = numeric_column(history, "high")
+    low = numeric_column(history, "low")
+    close = numeric_column(history, "close")
+    kc_period = int(params["kc_period"])
+    bb = bollinger_bands(close, period=int(params["bb_period"]), k=float(params["bb_k"]))
+    kc = keltner_channels(
+        high,
+        low,
+        close,
+        ema_period=kc_period,
+        atr_period=kc_period,
+        atr_mult=float(params["kc_atr_mult"]),
+    )
+    squeeze = (bb["upper"] < kc["upper"]) & (bb["lower"] > kc["lower"])
+    return {"upper": bb["upper"], "lower": bb["lower"], "mid": bb["mid"], "squeeze": squeeze}
+
+
+_SQUEEZE_INDICATORS = IndicatorSpec(
+    names=("upper", "lower", "mid", "squeeze"),
+    columns=("high", "low", "close"),
+    compute=_bb_keltner_squeeze_indicators,
+)
+
+
 def bb_keltner_squeeze_release_on_bar(ctx) -> dict[str, Any]:
     history, params, in_warmup, _ = prepare_context(ctx, _SQUEEZE_SCHEMA)
     bb_period = int(params["bb_period"])
-    bb_k = float(params["bb_k"])
     kc_period = int(params["kc_period"])
-    kc_atr_mult = float(params["kc_atr_mult"])
     squeeze_bars = int(params["squeeze_bars"])
     warmup = max(bb_period, kc_period, squeeze_bars, _SQUEEZE_SCHEMA["warmup_bars"])
     if len(history) < warmup or in_warmup:
         return intent_response("HOLD", tags=["warmup"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
-    close = numeric_series(history, "close")
-
-    bb = bollinger_bands(close, period=bb_period, k=bb_k)
-    kc = keltner_channels(
-        high, low, close, ema_period=kc_period, atr_period=kc_period, atr_mult=kc_atr_mult
-    )
-
-    squeeze = (bb["upper"] < kc["upper"]) & (bb["lower"] > kc["lower"])
+    close = numeric_series(history, "close", tail=1)
+    bb = bar_indicators(ctx, _SQUEEZE_INDICATORS, history, params)
+    squeeze = bb["squeeze"]
     if len(squeeze) < squeeze_bars + 1:
         return intent_response("HOLD", tags=["insufficient_history"])
 
-    prior_squeeze = squeeze.iloc[-(squeeze_bars + 1) : -1].all()
-    current_squeeze = bool(squeeze.iloc[-1])
+    prior_squeeze = squeeze[-(squeeze_bars + 1) : -1].all()
+    current_squeeze = bool(squeeze[-1])
     if not prior_squeeze or current_squeeze:
         return intent_response("HOLD")
 
     price = float(close.iloc[-1])
-    upper = float(bb["upper"].iloc[-1])
-    lower = float(bb["lower"].iloc[-1])
-    mid = float(bb["mid"].iloc[-1])
+    upper = float(bb["upper"][-1])
+    lower = float(bb["lower"][-1])
+    mid = float(bb["mid"][-1])
 
     if price > upper:
         return intent_response("ENTER_LONG", confidence=0.7, tags=["squeeze_release_up"])
@@ -224,6 +260,7 @@ BB_KELTNER_SQUEEZE_RELEASE = BuiltinStrategyDefinition(
     version=_SQUEEZE_SCHEMA["version"],
     get_schema=bb_keltner_squeeze_release_get_schema,
     on_bar=bb_keltner_squeeze_release_on_bar,
+    indicators=_SQUEEZE_INDICATORS,
 )
 
 
@@ -100,8 +100,8 @@ def trailing_stop_wrapper_on_bar(ctx) -> dict[str, Any]:
     if position is None:
         return intent_response("HOLD", tags=["no_position"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
+    high = numeric_series(history, "high", tail=1)
+    low = numeric_series(history, "low", tail=1)
     curr_high = float(high.iloc[-1])
     curr_low = float(low.iloc[-1])
 
@@ -171,8 +171,8 @@ def fixed_rr_stop_target_wrapper_on_bar(ctx) -> dict[str, Any]:
     if position is None:
         return intent_response("HOLD", tags=["no_position"])
 
-    high = numeric_series(history, "high")
-    low = numeric_series(history, "low")
+    high = numeric_series(history, "high", tail=1)
+    low = numeric_series(history, "low", tail=1)
     curr_high = float(high.iloc[-1])
     curr_low = float(low.iloc[-1])
     entry = float(position.entry_price)
@@ -0,0 +1,113 @@
+"""Shared many-as-of evaluation for the builtin V1 runners."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from strategy_registry.decision import Decision
+
+SingleRunner = Callable[[pd.DataFrame, Any, str], Decision]
+IndicatorLoader = Callable[[pd.DataFrame], pd.DataFrame]
+LatestDecider = Callable[[pd.DataFrame, pd.DataFrame, Any, str], Decision]
+
+
+def as_of_prefix_lengths(
+    features_df: pd.DataFrame, as_of_utcs: Sequence[str]
+) -> list[int | Exception] | None:
+    """Number of rows visible at each as-of, or None when timestamps are unsorted.
+
+    Per-timestamp errors match what ``_filter_to_as_of`` would raise for that as-of.
+    """
+    if "timestamp" in features_df.columns:
+        ts = pd.to_datetime(features_df["timestamp"], utc=True, errors="coerce")
+        if ts.isna().any():
+            return [ValueError("strategy_timestamp_invalid") for _ in as_of_utcs]
+        ts_index = pd.DatetimeIndex(ts)
+    elif isinstance(features_df.index, pd.DatetimeIndex):
+        ts_index = pd.DatetimeIndex(pd.to_datetime(features_df.index, utc=True, errors="coerce"))
+        if ts_index.isna().any():
+            return [ValueError("strategy_timestamp_invalid") for _ in as_of_utcs]
+    else:
+        return [len(features_df) for _ in as_of_utcs]
+    if not ts_index.is_monotonic_increasing:
+        return None
+
+    try:
+        parsed = pd.DatetimeIndex(pd.to_datetime(list(as_of_utcs), utc=True, format="ISO8601"))
+    except Exception:
+        parsed = None
+    if parsed is not None:
+        positions = ts_index.searchsorted(parsed, side="right")
+        return [int(pos) for pos in positions]
+
+    lengths: list[int | Exception] = []
+    for as_of_utc in as_of_utcs:
+        try:
+            as_of_ts = pd.to_datetime(as_of_utc, utc=True)
+        except Exception as exc:
+            error = ValueError("strategy_as_of_invalid")
+            error.__cause__ = exc
+            lengths.append(error)
+            continue
+        lengths.append(int(ts_index.searchsorted(as_of_ts, side="right")))
+    return lengths
+
+
+def run_batch(
+    features_df: pd.DataFrame,
+    metadata: Mapping[str, Any] | Any,
+    as_of_utcs: Sequence[str],
+    *,
+    runner: SingleRunner,
+    load_indicators: IndicatorLoader,
+    decide: LatestDecider,
+) -> list[Decision | Exception]:
+    """Evaluate many as-of timestamps with one indicator pass.
+
+    Indicators are causal, so the rows visible at each as-of are a prefix of the
+    full-history frame. ``load_indicators`` validates and builds the indicator
+    frame, ``decide`` turns the last two complete rows into a decision, and
+    ``runner`` is the per-timestamp fallback used when timestamps are not sorted.
+    """
+    if not isinstance(features_df, pd.DataFrame):
+        raise ValueError("strategy_features_invalid")
+    prefix_lengths = as_of_prefix_lengths(features_df, as_of_utcs)
+    if prefix_lengths is None:
+        outcomes: list[Decision | Exception] = []
+        for as_of_utc in as_of_utcs:
+            try:
+                outcomes.append(runner(features_df, metadata, as_of_utc))
+            except Exception as exc:
+                outcomes.append(exc)
+        return outcomes
+
+    visible = [length for length in prefix_lengths if isinstance(length, int)]
+    filtered = features_df.iloc[: max(visible, default=0)]
+    try:
+        indicators = load_indicators(filtered)
+    except Exception as exc:
+        return [exc for _ in as_of_utcs]
+    numeric = indicators.apply(pd.to_numeric, errors="coerce")
+    complete_rows = np.flatnonzero(numeric.notna().all(axis=1).to_numpy())
+    cleaned = numeric.iloc[complete_rows]
+
+    outcomes = []
+    for as_of_utc, length in zip(as_of_utcs, prefix_lengths):
+        if isinstance(length, Exception):
+            outcomes.append(length)
+            continue
+        count = int(np.searchsorted(complete_rows, length, side="left"))
+        try:
+            if count < 2:
+                raise ValueError("strategy_insufficient_history")
+            latest = cleaned.iloc[count - 2 : count]
+            outcomes.append(decide(latest, features_df, metadata, as_of_utc))
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
+
+__all__ = ["as_of_prefix_lengths", "run_batch"]
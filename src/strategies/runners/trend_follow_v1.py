@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 import pandas as pd
 
@@ -15,6 +15,8 @@ from strategy_registry.decision import (
 )
 from strategy_registry.registry import StrategySpec
 
+from .batch import run_batch
+
 
 EMA_FAST = 20
 EMA_SLOW = 50
@@ -100,6 +102,11 @@ def _validate_required_columns(features_df: pd.DataFrame) -> None:
         raise ValueError(f"strategy_missing_columns:{','.join(missing)}")
 
 
+def _validated_indicators(filtered: pd.DataFrame) -> pd.DataFrame:
+    _validate_required_columns(filtered)
+    return _load_indicators(filtered)
+
+
 def _latest_two_rows(indicators: pd.DataFrame) -> pd.DataFrame:
     cleaned = indicators.apply(pd.to_numeric, errors="coerce").dropna()
     if len(cleaned) < 2:
@@ -221,20 +228,12 @@ def _filter_to_as_of(features_df: pd.DataFrame, as_of_utc: str) -> pd.DataFrame:
     return features_df
 
 
-def trend_follow_v1_runner(
+def _decision_from_latest(
+    latest: pd.DataFrame,
     features_df: pd.DataFrame,
     metadata: Mapping[str, Any] | Any,
     as_of_utc: str,
 ) -> Decision:
-    if not isinstance(features_df, pd.DataFrame):
-        raise ValueError("strategy_features_invalid")
-    if not isinstance(as_of_utc, str) or not as_of_utc:
-        raise ValueError("strategy_as_of_invalid")
-
-    filtered = _filter_to_as_of(features_df, as_of_utc)
-    _validate_required_columns(filtered)
-    indicators = _load_indicators(filtered)
-    latest = _latest_two_rows(indicators)
     action, signals = _decision_action(latest)
     risk, entry_price = _risk_fields(latest.iloc[1])
 
@@ -255,4 +254,41 @@ def trend_follow_v1_runner(
     )
 
 
-__all__ = ["TREND_FOLLOW_V1_SPEC", "trend_follow_v1_runner", "_compute_indicators_from_ohlcv"]
+def trend_follow_v1_runner(
+    features_df: pd.DataFrame,
+    metadata: Mapping[str, Any] | Any,
+    as_of_utc: str,
+) -> Decision:
+    if not isinstance(features_df, pd.DataFrame):
+        raise ValueError("strategy_features_invalid")
+    if not isinstance(as_of_utc, str) or not as_of_utc:
+        raise ValueError("strategy_as_of_invalid")
+
+    filtered = _filter_to_as_of(features_df, as_of_utc)
+    indicators = _validated_indicators(filtered)
+    latest = _latest_two_rows(indicators)
+    return _decision_from_latest(latest, features_df, metadata, as_of_utc)
+
+
+def trend_follow_v1_batch_runner(
+    features_df: pd.DataFrame,
+    metadata: Mapping[str, Any] | Any,
+    as_of_utcs: Sequence[str],
+) -> list[Decision | Exception]:
+    """Evaluate many as-of timestamps with one indicator pass (see ``run_batch``)."""
+    return run_batch(
+        features_df,
+        metadata,
+        as_of_utcs,
+        runner=trend_follow_v1_runner,
+        load_indicators=_validated_indicators,
+        decide=_decision_from_latest,
+    )
+
+
+__all__ = [
+    "TREND_FOLLOW_V1_SPEC",
+    "trend_follow_v1_runner",
+    "trend_follow_v1_batch_runner",
+    "_compute_indicators_from_ohlcv",
+]
@@ -1,6 +1,6 @@
 from .builtins import list_intent_strategies
 from .decision import Decision, DecisionAction, DecisionRisk
-from .execution import run_strategy
+from .execution import run_strategy, run_strategy_many
 from .registry import (
     StrategyDefinition,
     StrategyId,
@@ -27,5 +27,6 @@ __all__ = [
     "SelectionRecord",
     "select_strategy",
     "run_strategy",
+    "run_strategy_many",
     "list_intent_strategies",
 ]
@@ -3,8 +3,16 @@ from __future__ import annotations
 from typing import Any
 
 from strategy_registry.registry import StrategyDefinition, StrategyRegistryError, register_strategy
-from strategies.runners.mean_revert_v1 import MEAN_REVERT_V1_SPEC, mean_revert_v1_runner
-from strategies.runners.trend_follow_v1 import TREND_FOLLOW_V1_SPEC, trend_follow_v1_runner
+from strategies.runners.mean_revert_v1 import (
+    MEAN_REVERT_V1_SPEC,
+    mean_revert_v1_batch_runner,
+    mean_revert_v1_runner,
+)
+from strategies.runners.trend_follow_v1 import (
+    TREND_FOLLOW_V1_SPEC,
+    trend_follow_v1_batch_runner,
+    trend_follow_v1_runner,
+)
 
 BUILTIN_STRATEGY_IDS = {
     f"{TREND_FOLLOW_V1_SPEC.name}@{TREND_FOLLOW_V1_SPEC.version}",
@@ -13,12 +21,14 @@ BUILTIN_STRATEGY_IDS = {
 
 
 def register_builtin_strategies() -> None:
-    for spec, runner in (
-        (TREND_FOLLOW_V1_SPEC, trend_follow_v1_runner),
-        (MEAN_REVERT_V1_SPEC, mean_revert_v1_runner),
+    for spec, runner, batch_runner in (
+        (TREND_FOLLOW_V1_SPEC, trend_follow_v1_runner, trend_follow_v1_batch_runner),
+        (MEAN_REVERT_V1_SPEC, mean_revert_v1_runner, mean_revert_v1_batch_runner),
     ):
         try:
-            register_strategy(StrategyDefinition(spec=spec, runner=runner))
+            register_strategy(
+                StrategyDefinition(spec=spec, runner=runner, batch_runner=batch_runner)
+            )
         except StrategyRegistryError as exc:
             if exc.code != "strategy_already_registered":
                 raise
@@ -77,16 +77,13 @@ def _infer_instrument(
     raise StrategyExecutionError("strategy_instrument_missing")
 
 
-def run_strategy(
+def _check_inputs(
     strategy: Strategy,
     features_df: pd.DataFrame,
     metadata: FeatureBundleMetadata | Mapping[str, Any],
-    as_of_utc: str,
-) -> Decision:
+) -> Any:
     if not isinstance(features_df, pd.DataFrame):
         raise StrategyExecutionError("strategy_features_invalid")
-    if not isinstance(as_of_utc, str) or not as_of_utc:
-        raise StrategyExecutionError("strategy_as_of_invalid")
 
     try:
         spec = strategy.spec
@@ -98,8 +95,16 @@ def run_strategy(
     missing_outputs = sorted(col for col in required_outputs if col not in features_df.columns)
     if missing_outputs:
         raise StrategyExecutionError("strategy_missing_features")
+    return spec
 
-    decision = strategy.run(features_df, metadata, as_of_utc)
+
+def _check_decision(
+    spec: Any,
+    decision: object,
+    features_df: pd.DataFrame,
+    metadata: FeatureBundleMetadata | Mapping[str, Any],
+    as_of_utc: str,
+) -> Decision:
     if not isinstance(decision, Decision):
         raise StrategyExecutionError("strategy_decision_invalid")
 
@@ -128,3 +133,69 @@ def run_strategy(
         raise StrategyExecutionError("strategy_as_of_invalid")
 
     return decision
+
+
+def run_strategy(
+    strategy: Strategy,
+    features_df: pd.DataFrame,
+    metadata: FeatureBundleMetadata | Mapping[str, Any],
+    as_of_utc: str,
+) -> Decision:
+    if not isinstance(features_df, pd.DataFrame):
+        raise StrategyExecutionError("strategy_features_invalid")
+    if not isinstance(as_of_utc, str) or not as_of_utc:
+        raise StrategyExecutionError("strategy_as_of_invalid")
+
+    spec = _check_inputs(strategy, features_df, metadata)
+    decision = strategy.run(features_df, metadata, as_of_utc)
+    return _check_decision(spec, decision, features_df, metadata, as_of_utc)
+
+
+def run_strategy_many(
+    strategy: Strategy,
+    features_df: pd.DataFrame,
+    metadata: FeatureBundleMetadata | Mapping[str, Any],
+    as_of_utcs: Sequence[str],
+) -> list[Decision | Exception]:
+    """Run a strategy for many as-of timestamps under the ``run_strategy`` contract.
+
+    Each outcome is either the validated decision or the exception ``run_strategy``
+    would have raised for that timestamp. Strategies exposing ``run_many`` evaluate
+    the whole sequence in one pass; others are called once per timestamp.
+    """
+    as_of_list = list(as_of_utcs)
+    try:
+        spec = _check_inputs(strategy, features_df, metadata)
+    except Exception as exc:
+        return [exc for _ in as_of_list]
+
+    valid = [isinstance(value, str) and bool(value) for value in as_of_list]
+    pending = [value for value, ok in zip(as_of_list, valid) if ok]
+    run_many = getattr(strategy, "run_many", None)
+    if callable(run_many):
+        raw = list(run_many(features_df, metadata, pending))
+    else:
+        raw = []
+        for as_of_utc in pending:
+            try:
+                raw.append(strategy.run(features_df, metadata, as_of_utc))
+            except Exception as exc:
+                raw.append(exc)
+    if len(raw) != len(pending):
+        raise StrategyExecutionError("strategy_batch_length_mismatch")
+
+    outcomes: list[Decision | Exception] = []
+    produced = iter(zip(pending, raw))
+    for ok in valid:
+        if not ok:
+            outcomes.append(StrategyExecutionError("strategy_as_of_invalid"))
+            continue
+        as_of_utc, value = next(produced)
+        if isinstance(value, Exception):
+            outcomes.append(value)
+            continue
+        try:
+            outcomes.append(_check_decision(spec, value, features_df, metadata, as_of_utc))
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
@@ -95,10 +95,25 @@ class Strategy(Protocol):
 class StrategyDefinition:
     spec: StrategySpec
     runner: Any
+    batch_runner: Any = None
 
     def run(self, features_df: Any, metadata: Any, as_of_utc: str) -> Decision:
         return self.runner(features_df, metadata, as_of_utc)
 
+    def run_many(
+        self, features_df: Any, metadata: Any, as_of_utcs: Sequence[str]
+    ) -> list[Decision | Exception]:
+        """Evaluate many as-of timestamps; failures are returned in place, not raised."""
+        if self.batch_runner is not None:
+            return list(self.batch_runner(features_df, metadata, as_of_utcs))
+        outcomes: list[Decision | Exception] = []
+        for as_of_utc in as_of_utcs:
+            try:
+                outcomes.append(self.runner(features_df, metadata, as_of_utc))
+            except Exception as exc:
+                outcomes.append(exc)
+        return outcomes
+
 
 @dataclass
 class StrategyRegistry:
@@ -5,9 +5,10 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
-from backtest.harness import run_backtest
+from backtest.harness import _DecisionRecordsWriter, compute_features, run_backtest
 from buff.features.indicators import atr_wilder
 from selector.types import SelectionResult
 from strategies.runners import mean_revert_v1
@@ -254,3 +255,114 @@ def test_close_on_end(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     assert result.trades.iloc[-1]["side"] == "SELL"
     assert result.trades.iloc[-1]["reason"] == "close_on_end"
     assert result.trades.iloc[-1]["price"] == pytest.approx(100.0, rel=1e-12)
+
+
+def _make_random_walk(n: int = 240, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.003, n)))
+    open_ = np.r_[close[0], close[:-1]] * (1.0 + rng.normal(0.0, 0.0005, n))
+    high = np.maximum(open_, close) * (1.0 + np.abs(rng.normal(0.0, 0.002, n)))
+    low = np.minimum(open_, close) * (1.0 - np.abs(rng.normal(0.0, 0.002, n)))
+    idx = pd.date_range("2026-02-01", periods=n, freq="min", tz="UTC", name="timestamp")
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": np.ones(n)},
+        index=idx,
+    )
+
+
+@pytest.mark.parametrize("make_df", [_make_ohlcv, _make_random_walk])
+def test_precomputed_mode_is_byte_identical(tmp_path: Path, make_df) -> None:
+    df = make_df()
+    kwargs = {"run_id": "bt", "commission_bps": 5.0, "slippage_bps": 2.0}
+    per_bar = run_backtest(df, 10_000.0, out_dir=tmp_path / "per_bar", **kwargs)
+    precomputed = run_backtest(
+        df, 10_000.0, out_dir=tmp_path / "precomputed", execution_mode="precomputed", **kwargs
+    )
+
+    for attr in ("trades_path", "metrics_path", "decision_records_path"):
+        assert getattr(per_bar, attr).read_bytes() == getattr(precomputed, attr).read_bytes()
+
+
+def test_invalid_execution_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="backtest_invalid_execution_mode"):
+        run_backtest(_make_ohlcv(), 10_000.0, out_dir=tmp_path, execution_mode="vectorized")
+
+
+def test_prefix_slice_of_longer_features_is_byte_identical(tmp_path: Path) -> None:
+    df = _make_random_walk(n=300)
+    window = df.iloc[:200]
+    features_df, market_state = compute_features(df)
+    kwargs = {"run_id": "bt", "execution_mode": "precomputed"}
+    fresh = run_backtest(window, 10_000.0, out_dir=tmp_path / "fresh", **kwargs)
+    sliced = run_backtest(
+        window,
+        10_000.0,
+        out_dir=tmp_path / "sliced",
+        features=(features_df.iloc[:200], market_state.iloc[:200]),
+        **kwargs,
+    )
+
+    for attr in ("trades_path", "metrics_path", "decision_records_path"):
+        assert getattr(fresh, attr).read_bytes() == getattr(sliced, attr).read_bytes()
+    with pytest.raises(ValueError, match="backtest_features_misaligned"):
+        run_backtest(
+            window, 10_000.0, out_dir=tmp_path / "bad", features=(features_df, market_state)
+        )
+
+
+def test_buffered_decision_writer_rejects_bad_record_alone(tmp_path: Path) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    writer = _DecisionRecordsWriter(out_path=out_path, run_id="bt", flush_every=8)
+    record = {
+        "timeframe": "1m",
+        "risk_state": "GREEN",
+        "market_state": {"trend_state": "up"},
+        "selection": {"strategy_id": "NONE"},
+    }
+    writer.append(ts_utc="2026-01-01T00:00:00Z", **record)
+    with pytest.raises(ValueError, match="invalid_ts_utc"):
+        writer.append(ts_utc="not-a-timestamp", **record)
+    writer.append(ts_utc="2026-01-01T00:01:00Z", **record)
+    writer.close()
+
+    records = [json.loads(line) for line in out_path.read_text(encoding="utf-8").splitlines()]
+    assert [(r["seq"], r["ts_utc"]) for r in records] == [
+        (0, "2026-01-01T00:00:00Z"),
+        (1, "2026-01-01T00:01:00Z"),
+    ]
+
+
+def test_buffered_decision_records_match_and_write_parquet_sidecar(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("backtest.harness._SIDECAR_ROW_GROUP_ROWS", 100)
+    df = _make_random_walk()
+    kwargs = {"run_id": "bt", "execution_mode": "precomputed"}
+    unbuffered = run_backtest(df, 10_000.0, out_dir=tmp_path / "unbuffered", **kwargs)
+    buffered = run_backtest(
+        df,
+        10_000.0,
+        out_dir=tmp_path / "buffered",
+        decision_flush_every=64,
+        decision_records_parquet=True,
+        **kwargs,
+    )
+
+    jsonl = buffered.decision_records_path.read_bytes()
+    assert jsonl == unbuffered.decision_records_path.read_bytes()
+    assert unbuffered.decision_records_parquet_path is None
+    sidecar = pd.read_parquet(buffered.decision_records_parquet_path)
+    records = [json.loads(line) for line in jsonl.decode("utf-8").splitlines()]
+    assert sidecar["seq"].tolist() == [record["seq"] for record in records]
+    assert sidecar["market_state_hash"].tolist() == [r["market_state_hash"] for r in records]
+    assert [json.loads(v) for v in sidecar["selection"]] == [r["selection"] for r in records]
+    # Row groups are written as batches flush instead of holding every row until close.
+    row_groups = pq.ParquetFile(buffered.decision_records_parquet_path).metadata.num_row_groups
+    assert row_groups == -(-len(records) // 128)
+    manifest = json.loads(buffered.manifest_path.read_text(encoding="utf-8"))
+    assert manifest["artifacts"]["decision_records_parquet"] == str(
+        buffered.decision_records_parquet_path
+    )
+
+    with pytest.raises(ValueError, match="backtest_invalid_decision_flush_every"):
+        run_backtest(df, 10_000.0, out_dir=tmp_path / "bad", decision_flush_every=0)
@@ -828,3 +828,92 @@ def test_drawdown_ranking_picks_larger_as_worst(
     summary_json = json.loads(result.summary_json_path.read_text(encoding="utf-8"))
     worst = summary_json["worst_by_test_drawdown"][0]
     assert worst["symbol"] == "BBB"
+
+
+def test_process_pool_matches_serial_and_isolates_failures(tmp_path: Path) -> None:
+    datasets = {
+        "AAA": _make_ohlcv(last_open=99.0),
+        "BBB": _make_ohlcv(last_open=101.0),
+    }
+    kwargs = {
+        "timeframe": "1m",
+        "start_at_utc": None,
+        "end_at_utc": None,
+        "initial_equity": 10_000.0,
+        "seed_run_id_prefix": "pool",
+        "param_grid": {"initial_equity": [-1.0, 10_000.0]},
+    }
+    serial = run_batch_backtests(datasets, out_dir=tmp_path / "serial", **kwargs)
+    pooled = run_batch_backtests(datasets, out_dir=tmp_path / "pooled", workers=2, **kwargs)
+
+    assert serial.summary_csv_path.read_bytes() == pooled.summary_csv_path.read_bytes()
+    summary = pd.read_csv(pooled.summary_csv_path)
+    assert sorted(summary["status"].tolist()) == ["FAILED", "FAILED", "OK", "OK"]
+    assert set(summary.loc[summary["status"] == "FAILED", "error"]) == {"backtest_invalid_equity"}
+    assert {run_id: entry["status"] for run_id, entry in serial.index.items()} == {
+        run_id: entry["status"] for run_id, entry in pooled.index.items()
+    }
+
+
+def test_invalid_workers_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="batch_invalid_workers"):
+        run_batch_backtests(
+            {"AAA": _make_ohlcv(last_open=99.0)},
+            out_dir=tmp_path,
+            timeframe="1m",
+            start_at_utc=None,
+            end_at_utc=None,
+            initial_equity=10_000.0,
+            workers=0,
+        )
+
+
+def test_feature_cache_shared_across_grid_and_windows(tmp_path: Path) -> None:
+    result = run_batch_backtests(
+        {"AAA": _make_ohlcv_n(periods=200, last_open=99.0)},
+        out_dir=tmp_path,
+        timeframe="1m",
+        start_at_utc=None,
+        end_at_utc=None,
+        initial_equity=10_000.0,
+        seed_run_id_prefix="cache",
+        param_grid={"commission_bps": [0.0, 10.0]},
+        split={"type": "walk_forward", "train_bars": 60, "test_bars": 30, "step_bars": 30},
+    )
+
+    summary = pd.read_csv(result.summary_csv_path)
+    assert len(summary) == 16
+    assert set(summary["status"]) == {"OK"}
+    summary_json = json.loads(result.summary_json_path.read_text(encoding="utf-8"))
+    # TRAIN starts 0..90 and TEST starts 60..150 share six feature computations,
+    # and each start row is evicted before the next one is computed.
+    assert summary_json["feature_cache"] == {"hits": 10, "misses": 6, "peak_entries": 1}
+
+
+def test_feature_cache_computed_in_pool_workers(tmp_path: Path) -> None:
+    kwargs = {
+        "timeframe": "1m",
+        "start_at_utc": None,
+        "end_at_utc": None,
+        "initial_equity": 10_000.0,
+        "seed_run_id_prefix": "cache",
+        "param_grid": {"commission_bps": [0.0, 10.0]},
+        "split": {"type": "walk_forward", "train_bars": 60, "test_bars": 30, "step_bars": 30},
+    }
+    datasets = {"AAA": _make_ohlcv_n(periods=200, last_open=99.0)}
+    serial = run_batch_backtests(datasets, out_dir=tmp_path / "serial", **kwargs)
+    pooled = run_batch_backtests(datasets, out_dir=tmp_path / "pooled", workers=2, **kwargs)
+
+    repeat = run_batch_backtests(datasets, out_dir=tmp_path / "repeat", workers=2, **kwargs)
+
+    assert serial.summary_csv_path.read_bytes() == pooled.summary_csv_path.read_bytes()
+    serial_json = json.loads(serial.summary_json_path.read_text(encoding="utf-8"))
+    pooled_json = json.loads(pooled.summary_json_path.read_text(encoding="utf-8"))
+    assert serial_json.pop("feature_cache") == {"hits": 10, "misses": 6, "peak_entries": 1}
+    stats = pooled_json.pop("feature_cache")
+    assert pooled_json == serial_json
+    assert stats["hits"] + stats["misses"] == 16
+    assert stats["misses"] >= 6
+    assert stats["peak_entries"] == 1
+    repeat_stats = json.loads(repeat.summary_json_path.read_text(encoding="utf-8"))
+    assert repeat_stats["feature_cache"] == stats
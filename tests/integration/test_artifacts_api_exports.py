@@ -66,14 +66,14 @@ def test_export_endpoints(monkeypatch, tmp_path):
     assert len(decisions_data) == 2
     assert all(item["symbol"] == "BTCUSDT" for item in decisions_data)
     assert all(item["timestamp"].endswith("Z") for item in decisions_data)
-    assert decisions.headers["cache-control"] == "no-store"
+    assert decisions.headers["cache-control"] == "private, no-cache"
 
     errors_csv = client.get(f"/api/runs/{run_id}/errors/export", params={"format": "csv"})
     assert errors_csv.status_code == 200
     assert errors_csv.headers["content-type"].startswith("text/csv")
     assert "attachment" in errors_csv.headers["content-disposition"]
     assert "run-export-errors.csv" in errors_csv.headers["content-disposition"]
-    assert errors_csv.headers["cache-control"] == "no-store"
+    assert errors_csv.headers["cache-control"] == "private, no-cache"
     lines = errors_csv.text.strip().splitlines()
     assert len(lines) >= 2
     header = lines[0].split(",")
@@ -87,7 +87,7 @@ def test_export_endpoints(monkeypatch, tmp_path):
     trades_data = json.loads(trades_json.text)
     assert len(trades_data) == 2
     assert all(item["timestamp"].endswith("Z") for item in trades_data)
-    assert trades_json.headers["cache-control"] == "no-store"
+    assert trades_json.headers["cache-control"] == "private, no-cache"
 
     decisions_csv = client.get(
         f"/api/runs/{run_id}/decisions/export", params={"format": "csv", "symbol": "BTCUSDT"}
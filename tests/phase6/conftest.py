@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import pytest
+
+from apps.api.phase6.experiment_builder import shutdown_experiment_executor
+
+
+@pytest.fixture(autouse=True)
+def _reset_experiment_executor():
+    yield
+    shutdown_experiment_executor()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from apps.api.phase6.engine import EngineConfig, run_engine
+
+
+def _bars(num_bars: int = 400, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 + np.cumsum(rng.normal(0.0, 1.0, num_bars)), 2)
+    open_ = np.round(close + rng.normal(0.0, 0.3, num_bars), 2)
+    return pd.DataFrame(
+        {
+            "ts": pd.date_range("2024-01-01", periods=num_bars, freq="min", tz="UTC"),
+            "open": open_,
+            "high": np.maximum(open_, close) + 0.5,
+            "low": np.minimum(open_, close) - 0.5,
+            "close": close,
+            "volume": 1.0,
+        }
+    )
+
+
+def _config(strategy_id: str, params: dict) -> EngineConfig:
+    return EngineConfig(
+        strategy_id=strategy_id,
+        strategy_params=params,
+        symbol="BTCUSDT",
+        timeframe="1m",
+        risk_level=3,
+        commission_bps=10.0,
+        slippage_bps=5.0,
+        initial_equity=10_000.0,
+    )
+
+
+def test_ma_cross_records_follow_the_fills():
+    df = _bars()
+    calls: list[tuple[int, int]] = []
+    result = run_engine(
+        df,
+        _config("ma_cross", {"fast_period": 3, "slow_period": 8}),
+        run_id="run-1",
+        progress=lambda done, total: calls.append((done, total)),
+    )
+
+    decisions = list(result.decisions)
+    equity = list(result.equity_curve)
+    assert len(decisions) == len(equity) == len(df)
+    assert calls[-1] == (len(df), len(df))
+    assert {d["run_id"] for d in decisions} == {"run-1"}
+    assert [d["seq"] for d in decisions] == list(range(len(df)))
+    assert decisions[0]["ts_utc"] == "2024-01-01T00:00:00.000Z"
+    assert result.trades
+
+    # Every trade opens the bar after an ENTER_LONG decision and closes the bar
+    # after an EXIT_LONG one (or on the last bar), with no other actions.
+    index_of = {d["ts_utc"]: i for i, d in enumerate(decisions)}
+    expected: dict[int, str] = {}
+    for trade in result.trades:
+        expected[index_of[trade["entry_time"]] - 1] = "ENTER_LONG"
+        exit_index = index_of[trade["exit_time"]]
+        expected[exit_index if exit_index == len(df) - 1 else exit_index - 1] = "EXIT_LONG"
+    actions = {i: d["action"] for i, d in enumerate(decisions) if d["action"] != "HOLD"}
+    assert actions == expected
+
+    # Flat bars hold the realized cash; open bars mark the position to the close.
+    cash = 10_000.0
+    for trade in result.trades:
+        entry, exit_ = index_of[trade["entry_time"]], index_of[trade["exit_time"]]
+        entry_fee = trade["qty"] * trade["entry_price"] * 10.0 / 10_000.0
+        for i in range(entry, exit_):
+            marked = cash + trade["qty"] * (df["close"].iloc[i] - trade["entry_price"]) - entry_fee
+            assert abs(equity[i]["equity"] - marked) < 1e-6
+        cash += trade["pnl"]
+        assert abs(equity[exit_]["equity"] - cash) < 1e-6
+    assert abs(result.metrics["final_equity"] - cash) < 1e-6
+    assert result.metrics["num_records"] == len(result.trades)
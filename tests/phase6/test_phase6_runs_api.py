@@ -250,6 +250,309 @@ def test_run_idempotent(monkeypatch, tmp_path):
     assert before_hash == after_hash
 
 
+def test_run_create_async_reports_progress(monkeypatch, tmp_path):
+    from apps.api.phase6.run_queue import get_run_queue
+
+    runs_root = tmp_path / "runs"
+    runs_root.mkdir()
+    monkeypatch.setenv("RUNS_ROOT", str(runs_root))
+    monkeypatch.setenv("BUFF_DEFAULT_USER", TEST_USER_ID)
+
+    client = TestClient(app)
+    queued = client.post(
+        "/api/v1/runs",
+        json=_payload(run_id="run_async"),
+        headers={"Prefer": "respond-async"},
+    )
+    assert queued.status_code == 202
+    body = queued.json()
+    assert body["run_id"] == "run_async"
+    assert body["status"] in {"QUEUED", "RUNNING"}
+    assert body["links"]["status"] == "/api/v1/runs/run_async/status"
+
+    assert get_run_queue().join(timeout=30)
+    status = client.get("/api/v1/runs/run_async/status")
+    assert status.status_code == 200
+    assert status.json()["state"] == "COMPLETED"
+    assert status.json()["percent"] == 100
+    run_dir = _run_path(runs_root, "run_async")
+    for name in REQUIRED_ARTIFACTS:
+        assert (run_dir / name).exists()
+
+    again = client.post(
+        "/api/v1/runs",
+        json=_payload(run_id="run_async"),
+        headers={"Prefer": "respond-async"},
+    )
+    assert again.status_code == 200
+
+
+def test_run_status_prefers_registry_over_failed_async_job(monkeypatch, tmp_path):
+    from apps.api.phase6 import run_builder
+    from apps.api.phase6.run_queue import get_run_queue
+
+    runs_root = tmp_path / "runs"
+    runs_root.mkdir()
+    monkeypatch.setenv("RUNS_ROOT", str(runs_root))
+    monkeypatch.setenv("BUFF_DEFAULT_USER", TEST_USER_ID)
+    original_load = run_builder.load_run_data
+    calls = {"count": 0}
+
+    def flaky_load(data_source):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise RuntimeError("transient read failure")
+        return original_load(data_source)
+
+    monkeypatch.setattr(run_builder, "load_run_data", flaky_load)
+    client = TestClient(app)
+    queued = client.post(
+        "/api/v1/runs",
+        json=_payload(run_id="run_stale"),
+        headers={"Prefer": "respond-async"},
+    )
+    assert queued.status_code == 202
+    assert get_run_queue().join(timeout=30)
+    failed = client.get("/api/v1/runs/run_stale/status").json()
+    assert failed["state"] == "FAILED"
+    assert failed["error_envelope"]["error_code"] == "INTERNAL"
+
+    created = client.post("/api/v1/runs", json=_payload(run_id="run_stale"))
+    assert created.status_code == 201
+    status = client.get("/api/v1/runs/run_stale/status").json()
+    assert status["state"] == "COMPLETED"
+    assert "error_envelope" not in status
+
+
+def test_dataset_cache_reuses_validated_frames_by_content_hash(monkeypatch, tmp_path):
+    from apps.api.phase6 import run_builder
+    from apps.api.phase6.dataset_cache import dataset_cache_path
+
+    monkeypatch.setenv("RUNS_ROOT", str(tmp_path))
+    data_source = {"type": "csv", "path": CROSS_PATH, "symbol": "BTCUSDT", "timeframe": "5m"}
+    first = run_builder.load_run_data(data_source)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("dataset was re-parsed")
+
+    monkeypatch.setattr(run_builder, "_parse_and_validate_csv", fail)
+    monkeypatch.setattr(run_builder, "_align_timeframe", fail)
+    second = run_builder.load_run_data(data_source)
+    pd.testing.assert_frame_equal(second.df_1m, first.df_1m)
+    pd.testing.assert_frame_equal(second.df_tf, first.df_tf)
+    assert second.data_meta == first.data_meta
+
+    copied = tmp_path / "copy.csv"
+    shutil.copyfile(CROSS_PATH, copied)
+    original_entry = dataset_cache_path(tmp_path, Path(CROSS_PATH).resolve(), data_source, "1m")
+    assert dataset_cache_path(tmp_path, copied, data_source, "1m") == original_entry
+    copied.write_bytes(copied.read_bytes() + b"\n")
+    assert dataset_cache_path(tmp_path, copied, data_source, "1m") != original_entry
+
+
+def test_dataset_cache_evicts_least_recently_used_entries(monkeypatch, tmp_path):
+    from apps.api.phase6 import dataset_cache
+
+    frame = pd.DataFrame({"close": [float(i) for i in range(256)]})
+    root = tmp_path / dataset_cache.DATASET_CACHE_DIRNAME
+    entries = [root / name / "ohlcv_1m_window.arrow" for name in ("a", "b", "c")]
+    monkeypatch.setenv(dataset_cache.DATASET_CACHE_MAX_BYTES_ENV, str(10**9))
+    for index, entry in enumerate(entries):
+        dataset_cache.write_cached_frame(entry, frame)
+        os.utime(entry, ns=(index * 10**9, index * 10**9))
+    entry_bytes = entries[0].stat().st_size
+
+    # Reading "a" makes "b" the least recently used entry.
+    assert dataset_cache.read_cached_frame(entries[0]) is not None
+    monkeypatch.setenv(dataset_cache.DATASET_CACHE_MAX_BYTES_ENV, str(entry_bytes * 2))
+    assert dataset_cache.prune_dataset_cache(root) == [entries[1]]
+    assert [entry.exists() for entry in entries] == [True, False, True]
+    assert not entries[1].parent.exists()
+
+    # A write never evicts the entry it just stored.
+    newest = root / "d" / "ohlcv_1m_window.arrow"
+    monkeypatch.setenv(dataset_cache.DATASET_CACHE_MAX_BYTES_ENV, "0")
+    dataset_cache.write_cached_frame(newest, frame)
+    assert sorted(root.glob("*/*.arrow")) == [newest]
+
+
+def test_cached_run_data_reloads_an_evicted_entry(monkeypatch, tmp_path):
+    from apps.api.phase6 import run_builder
+
+    monkeypatch.setenv("RUNS_ROOT", str(tmp_path))
+    data_source = {"type": "csv", "path": CROSS_PATH, "symbol": "BTCUSDT", "timeframe": "5m"}
+    data = run_builder.load_run_data(data_source)
+    cached = run_builder.cached_run_data(data_source, data)
+    assert cached is not None
+    cached.df_tf_path.unlink()
+
+    reloaded = cached.load()
+    pd.testing.assert_frame_equal(reloaded.df_1m, data.df_1m)
+    pd.testing.assert_frame_equal(reloaded.df_tf, data.df_tf)
+    assert reloaded.data_meta == data.data_meta
+
+
+def test_columnar_artifact_profile_serves_the_same_ohlcv(monkeypatch, tmp_path):
+    runs_root = tmp_path / "runs"
+    runs_root.mkdir()
+    monkeypatch.setenv("RUNS_ROOT", str(runs_root))
+    monkeypatch.setenv("BUFF_DEFAULT_USER", TEST_USER_ID)
+    strategy = {"id": "ma_cross", "params": {"fast_period": 2, "slow_period": 3}}
+
+    client = TestClient(app)
+    json_run = client.post("/api/v1/runs", json=_payload(path=CROSS_PATH, strategy=strategy))
+    columnar_payload = {
+        **_payload(path=CROSS_PATH, strategy=strategy),
+        "artifact_profile": "columnar",
+    }
+    columnar_run = client.post("/api/v1/runs", json=columnar_payload)
+    assert json_run.status_code == 201
+    assert columnar_run.status_code == 201
+    json_id = json_run.json()["run_id"]
+    columnar_id = columnar_run.json()["run_id"]
+    assert columnar_id != json_id
+
+    run_dir = _run_path(runs_root, columnar_id)
+    assert not list(run_dir.glob("ohlcv_*.jsonl"))
+    manifest = json.loads((run_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["artifacts"]["profile"] == "columnar"
+    assert manifest["artifacts"]["digests"] == {
+        "ohlcv_1m.parquet": hashlib.sha256((run_dir / "ohlcv_1m.parquet").read_bytes()).hexdigest()
+    }
+
+    for query in ("", "?limit=3", "?start_ts=2026-02-01T00:03:00Z&end_ts=2026-02-01T00:06:00Z"):
+        expected = client.get(f"/api/v1/runs/{json_id}/ohlcv{query}").json()
+        actual = client.get(f"/api/v1/runs/{columnar_id}/ohlcv{query}").json()
+        assert actual.pop("source") == "ohlcv_1m.parquet"
+        assert expected.pop("source") == "ohlcv_1m.jsonl"
+        assert actual.pop("run_id") == columnar_id
+        assert expected.pop("run_id") == json_id
+        assert actual == expected
+
+    invalid = client.post("/api/v1/runs", json={**_payload(), "artifact_profile": "xml"})
+    assert invalid.status_code == 400
+    assert invalid.json()["code"] == "RUN_CONFIG_INVALID"
+
+
+def test_run_artifacts_are_served_with_etags_and_ranges(monkeypatch, tmp_path):
+    runs_root = tmp_path / "runs"
+    runs_root.mkdir()
+    monkeypatch.setenv("RUNS_ROOT", str(runs_root))
+    monkeypatch.setenv("BUFF_DEFAULT_USER", TEST_USER_ID)
+
+    client = TestClient(app)
+    created = client.post("/api/v1/runs", json=_payload())
+    assert created.status_code == 201
+    run_id = created.json()["run_id"]
+    artifact_bytes = (_run_path(runs_root, run_id) / "decision_records.jsonl").read_bytes()
+    artifact_url = f"/api/v1/runs/{run_id}/artifacts/decision_records.jsonl"
+
+    full = client.get(artifact_url)
+    assert full.status_code == 200
+    assert full.content == artifact_bytes
+    etag = full.headers["etag"]
+    assert etag == f'"{hashlib.sha256(artifact_bytes).hexdigest()}"'
+    assert full.headers["accept-ranges"] == "bytes"
+
+    not_modified = client.get(artifact_url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    partial = client.get(artifact_url, headers={"Range": "bytes=10-19"})
+    assert partial.status_code == 206
+    assert partial.content == artifact_bytes[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(artifact_bytes)}"
+    stale = client.get(artifact_url, headers={"Range": "bytes=10-19", "If-Range": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == artifact_bytes
+
+    for view in ("metrics", "ohlcv?limit=2", "decisions/export?format=csv"):
+        first = client.get(f"/api/v1/runs/{run_id}/{view}")
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "private, no-cache"
+        again = client.get(f"/api/v1/runs/{run_id}/{view}")
+        assert again.content == first.content
+        assert again.headers["etag"] == first.headers["etag"]
+        revalidated = client.get(
+            f"/api/v1/runs/{run_id}/{view}", headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert revalidated.status_code == 304
+
+    other_window = client.get(f"/api/v1/runs/{run_id}/ohlcv?limit=3")
+    assert (
+        other_window.headers["etag"]
+        != client.get(f"/api/v1/runs/{run_id}/ohlcv?limit=2").headers["etag"]
+    )
+
+
+def test_ohlcv_max_points_serves_pyramid_levels(monkeypatch, tmp_path):
+    runs_root = tmp_path / "runs"
+    runs_root.mkdir()
+    monkeypatch.setenv("RUNS_ROOT", str(runs_root))
+    monkeypatch.setenv("BUFF_DEFAULT_USER", TEST_USER_ID)
+
+    client = TestClient(app)
+    created = client.post("/api/v1/runs", json=_payload(path=CROSS_PATH))
+    assert created.status_code == 201
+    run_id = created.json()["run_id"]
+    pyramid_file = _run_path(runs_root, run_id) / ".index" / "ohlcv_1m.pyramid.arrow"
+    assert pyramid_file.is_file()
+
+    base = client.get(f"/api/v1/runs/{run_id}/ohlcv").json()
+    candles = base["candles"]
+    full = client.get(f"/api/v1/runs/{run_id}/ohlcv?max_points=10000").json()
+    assert full.pop("bars_per_candle") == 1
+    assert full == base
+
+    coarse = client.get(f"/api/v1/runs/{run_id}/ohlcv?max_points=3").json()
+    size = coarse["bars_per_candle"]
+    assert size > 1
+    assert 0 < coarse["count"] <= 3
+    first = coarse["candles"][0]
+    group = candles[:size]
+    assert first["ts"] == group[0]["ts"]
+    assert first["open"] == group[0]["open"]
+    assert first["close"] == group[-1]["close"]
+    assert first["high"] == max(candle["high"] for candle in group)
+    assert first["low"] == min(candle["low"] for candle in group)
+
+    window = {"start_ts": candles[2]["ts"], "end_ts": candles[5]["ts"], "max_points": 4}
+    windowed = client.get(f"/api/v1/runs/{run_id}/ohlcv", params=window).json()
+    assert windowed["bars_per_candle"] == 1
+    assert windowed["candles"] == candles[2:6]
+
+    # Runs without a stored pyramid get one built on first use.
+    pyramid_file.unlink()
+    rebuilt = client.get(f"/api/v1/runs/{run_id}/ohlcv?max_points=2").json()
+    assert pyramid_file.is_file()
+    assert rebuilt["count"] <= 2
+    assert rebuilt["candles"][0]["open"] == candles[0]["open"]
+
+
+def test_normalize_float_array_matches_scalar_numeric_policy():
+    import numpy as np
+
+    from apps.api.phase6.numeric import normalize_float_array, normalize_numbers
+
+    rng = np.random.default_rng(7)
+    prices = np.round(rng.normal(100.0, 50.0, 2000), 2)
+    values = np.concatenate(
+        [
+            prices,
+            prices + 0.1,
+            prices * 1.1,
+            rng.normal(0.0, 1e-9, 200),
+            np.arange(-200, 200) * 5e-9,
+            [-0.0, 2.675, 1.000000005, -1.000000005, 1.000000015, 1e8 + 0.123456789],
+        ]
+    )
+
+    expected = np.array([float(normalize_numbers(float(value))) for value in values])
+    actual = normalize_float_array(values)
+    assert np.array_equal(actual, expected)
+    assert np.array_equal(np.signbit(actual), np.signbit(expected))
+
+
 def test_run_conflict(monkeypatch, tmp_path):
     runs_root = tmp_path / "runs"
     runs_root.mkdir()
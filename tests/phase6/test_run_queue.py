@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+from apps.api.phase6.run_builder import RunBuilderError
+from apps.api.phase6.run_queue import RunQueue
+
+
+def test_round_robin_across_users_with_concurrency_limit():
+    queue = RunQueue(max_workers=1)
+    gate = threading.Event()
+    order: list[str] = []
+
+    queue.submit("gate", "run-gate", "h", lambda report: gate.wait(5))
+    for user_id, run_id in [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1")]:
+        queue.submit(user_id, run_id, "h", lambda report, run_id=run_id: order.append(run_id))
+    gate.set()
+
+    assert queue.join(timeout=5)
+    assert order == ["a1", "b1", "a2", "a3"]
+    assert queue.get("a", "a3")["state"] == "COMPLETED"
+    assert queue.get("a", "a3")["percent"] == 100
+
+
+def test_progress_failure_and_duplicate_submission():
+    queue = RunQueue(max_workers=2)
+    started = threading.Event()
+    release = threading.Event()
+
+    def work(report):
+        report("SIMULATING", 40)
+        started.set()
+        release.wait(5)
+        raise RunBuilderError("DATA_INVALID", "bad data", 400)
+
+    queue.submit("u", "run-x", "h1", work)
+    assert started.wait(5)
+    running = queue.get("u", "run-x")
+    assert (running["state"], running["stage"], running["percent"]) == ("RUNNING", "SIMULATING", 40)
+    assert queue.submit("u", "run-x", "h2", work)["inputs_hash"] == "h1"
+
+    release.set()
+    assert queue.join(timeout=5)
+    failed = queue.get("u", "run-x")
+    assert failed["state"] == "FAILED"
+    assert failed["error"]["code"] == "DATA_INVALID"
+    assert queue.get("other", "run-x") is None
+
+
+def test_unexpected_failure_is_logged_with_traceback(caplog):
+    queue = RunQueue(max_workers=1)
+
+    def work(report):
+        raise RuntimeError("disk on fire")
+
+    with caplog.at_level(logging.ERROR, logger="apps.api.phase6.run_queue"):
+        queue.submit("u", "run-boom", "h", work)
+        assert queue.join(timeout=5)
+
+    assert queue.get("u", "run-boom")["error"]["code"] == "INTERNAL"
+    [record] = [r for r in caplog.records if r.name == "apps.api.phase6.run_queue"]
+    assert "run-boom" in record.getMessage()
+    assert record.exc_info is not None and "disk on fire" in str(record.exc_info[1])
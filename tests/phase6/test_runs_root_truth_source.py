@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
 
 import pandas as pd
@@ -8,7 +10,8 @@ from fastapi.testclient import TestClient
 
 from apps.api.main import app
 from apps.api.phase6.paths import user_root, user_runs_root
-from apps.api.phase6.registry import upsert_registry_entry
+from apps.api.phase6 import registry
+from apps.api.phase6.registry import build_registry_entry, upsert_registry_entry
 
 TEST_USER_ID = "test-user"
 
@@ -175,3 +178,37 @@ def test_demo_mode_allows_artifacts_root(monkeypatch, tmp_path):
     summary = client.get(f"/api/v1/runs/{run_id}/summary")
     assert summary.status_code == 200
     assert summary.json().get("mode") == "demo"
+
+
+def _age(*paths: Path) -> None:
+    stamp = time.time() - 60
+    for path in paths:
+        os.utime(path, (stamp, stamp))
+
+
+def test_registry_entry_reuses_artifact_evaluation_until_run_dir_changes(monkeypatch, tmp_path):
+    run_dir = _make_runs_root_run(tmp_path / "runs", "run-cached").resolve()
+    _age(*run_dir.iterdir(), run_dir)
+    evaluations: list[Path] = []
+    evaluate = registry._evaluate_artifacts
+    monkeypatch.setattr(
+        registry,
+        "_evaluate_artifacts",
+        lambda path: evaluations.append(path) or evaluate(path),
+    )
+    registry.invalidate_registry_cache()
+
+    first = build_registry_entry(run_dir, {})
+    first["checks"]["required"].clear()
+    second = build_registry_entry(run_dir, {})
+    assert len(evaluations) == 1
+    assert second["health"] == "HEALTHY"
+    assert second["checks"]["required"]
+
+    (run_dir / "metrics.json").write_text("{broken", encoding="utf-8")
+    _age(run_dir / "metrics.json")
+    assert build_registry_entry(run_dir, {})["invalid_artifacts"] == ["metrics.json"]
+
+    (run_dir / "config.json").unlink()
+    assert build_registry_entry(run_dir, {})["missing_artifacts"] == ["config.json"]
+    assert len(evaluations) == 3
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -78,14 +79,18 @@ def test_s7_experiment_caps_too_many_candidates(experiment_env: Path) -> None:
 def test_s7_experiment_concurrency_lock(
     experiment_env: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    original_create_run = s7_builder.create_run
+    original_execute_run = s7_builder.execute_run
+    delayed_calls: list[str] = []
 
-    def delayed_create_run(payload: dict[str, object], *, user_id: str | None = None):
+    def delayed_execute_run(prepared, **kwargs):
         # Hold the experiment lock long enough for a competing request to hit timeout.
+        delayed_calls.append(prepared.run_id)
         time.sleep(0.2)
-        return original_create_run(payload, user_id=user_id)
+        return original_execute_run(prepared, **kwargs)
 
-    monkeypatch.setattr(s7_builder, "create_run", delayed_create_run)
+    # Run candidates in this process so the patched execute_run is what holds the lock.
+    monkeypatch.setenv(s7_builder.EXPERIMENT_WORKERS_ENV, "1")
+    monkeypatch.setattr(s7_builder, "execute_run", delayed_execute_run)
     monkeypatch.setattr(s7_builder, "_EXPERIMENT_LOCK_TIMEOUT_SECONDS", 0.05)
     monkeypatch.setattr(s7_builder, "_EXPERIMENT_LOCK_POLL_SECONDS", 0.005)
 
@@ -125,6 +130,7 @@ def test_s7_experiment_concurrency_lock(
 
     assert len(successes) == 1
     assert len(failures) == 1
+    assert len(delayed_calls) == 2
 
     status_code, response_payload = successes[0]
     assert status_code == 201
@@ -160,3 +166,129 @@ def test_write_json_atomic_writes_complete_json(tmp_path: Path) -> None:
 
     leftovers = sorted(target.parent.glob(f".{target.name}.tmp-*"))
     assert leftovers == []
+
+
+def test_s7_experiment_pool_matches_serial_and_loads_each_dataset_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loads: list[str] = []
+    original_load = s7_builder.load_run_data
+
+    def counting_load(data_source: dict[str, object]):
+        loads.append(str(data_source["path"]))
+        return original_load(data_source)
+
+    monkeypatch.setattr(s7_builder, "load_run_data", counting_load)
+    payload = {
+        "schema_version": "1.0.0",
+        "name": "s7-pool-test",
+        "candidates": [
+            {
+                "candidate_id": f"cross_{slow}",
+                "run_config": _run_payload(
+                    path=CROSS_PATH,
+                    strategy={"id": "ma_cross", "params": {"fast_period": 2, "slow_period": slow}},
+                ),
+            }
+            for slow in (5, 3, 4)
+        ]
+        + [
+            {
+                "candidate_id": "hold_a",
+                "run_config": _run_payload(path=SAMPLE_PATH, strategy={"id": "hold", "params": {}}),
+            },
+            {
+                "candidate_id": "hold_again",
+                "run_config": _run_payload(path=SAMPLE_PATH, strategy={"id": "hold", "params": {}}),
+            },
+        ],
+    }
+
+    outputs = {}
+    for workers in ("1", "3"):
+        runs_root = tmp_path / f"workers_{workers}"
+        runs_root.mkdir()
+        monkeypatch.setenv("RUNS_ROOT", str(runs_root))
+        monkeypatch.setenv(s7_builder.EXPERIMENT_WORKERS_ENV, workers)
+        status_code, response = s7_builder.create_experiment(payload, user_id=TEST_USER_ID)
+        assert status_code == 201
+        experiment_dir = _experiments_root(runs_root) / str(response["experiment_id"])
+        outputs[workers] = (
+            (experiment_dir / "experiment_manifest.json").read_bytes(),
+            (experiment_dir / "comparison_summary.json").read_bytes(),
+        )
+
+    assert sorted(loads) == sorted([CROSS_PATH, SAMPLE_PATH] * 2)
+    assert outputs["1"] == outputs["3"]
+    manifest = json.loads(outputs["3"][0])
+    assert [item["candidate_id"] for item in manifest["candidates"]] == [
+        "cross_5",
+        "cross_3",
+        "cross_4",
+        "hold_a",
+        "hold_again",
+    ]
+    assert manifest["candidates"][3]["run_status_code"] == 201
+    assert manifest["candidates"][4]["run_status_code"] == 200
+    assert manifest["candidates"][4]["run_id"] == manifest["candidates"][3]["run_id"]
+
+
+def test_s7_experiment_executor_is_shared_bounded_and_resettable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv(s7_builder.EXPERIMENT_WORKERS_ENV, raising=False)
+    executor = s7_builder.get_experiment_executor()
+    assert s7_builder.get_experiment_executor() is executor
+    pids = {future.result() for future in [executor.submit(os.getpid) for _ in range(8)]}
+    assert os.getpid() not in pids
+    assert len(pids) <= s7_builder.DEFAULT_EXPERIMENT_WORKERS
+
+    s7_builder.shutdown_experiment_executor()
+    assert s7_builder.get_experiment_executor() is not executor
+
+
+def test_s7_experiment_progress_is_served_while_running(
+    experiment_env: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(s7_builder.EXPERIMENT_WORKERS_ENV, "1")
+    client = TestClient(app)
+    polled: list[dict[str, object]] = []
+    original_write = s7_builder._write_progress_manifest
+
+    def write_and_poll(progress_path: Path, **kwargs: object) -> None:
+        original_write(progress_path, **kwargs)
+        response = client.get(f"/api/v1/experiments/{kwargs['experiment_id']}/progress")
+        assert response.status_code == 200
+        polled.append(response.json())
+
+    monkeypatch.setattr(s7_builder, "_write_progress_manifest", write_and_poll)
+    payload = {
+        "schema_version": "1.0.0",
+        "name": "s7-progress",
+        "candidates": [
+            {
+                "candidate_id": f"cross_{slow}",
+                "run_config": _run_payload(
+                    path=CROSS_PATH,
+                    strategy={"id": "ma_cross", "params": {"fast_period": 2, "slow_period": slow}},
+                ),
+            }
+            for slow in (3, 4)
+        ],
+    }
+    status_code, response = s7_builder.create_experiment(payload, user_id=TEST_USER_ID)
+    assert status_code == 201
+    experiment_id = str(response["experiment_id"])
+
+    assert [item["status"] for item in polled] == ["RUNNING", "RUNNING"]
+    assert [item["counts"]["succeeded"] for item in polled] == [1, 2]
+    assert all(item["counts"]["total_candidates"] == 2 for item in polled)
+    progress_path = s7_builder.experiment_progress_path(
+        _experiments_root(experiment_env), experiment_id
+    )
+    assert not progress_path.exists()
+
+    final = client.get(f"/api/v1/experiments/{experiment_id}/progress")
+    assert final.status_code == 200
+    assert final.json()["status"] == "COMPLETED"
+    assert final.json()["counts"] == {"total_candidates": 2, "succeeded": 2, "failed": 0}
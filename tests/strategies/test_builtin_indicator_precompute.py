@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import dataclasses
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies.builtins import BUILTIN_STRATEGIES
+from strategies.builtins import common
+from strategies.builtins.common import last_pivot_levels, pivot_levels
+from strategies.builtins.harness import run_intent_backtest
+
+
+def _random_walk_ohlcv(num_bars: int = 160, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, num_bars))
+    close[40:48] = close[39]
+    open_ = close + rng.normal(0.0, 0.3, num_bars)
+    high = np.maximum(open_, close) + rng.uniform(0.0, 1.0, num_bars)
+    low = np.minimum(open_, close) - rng.uniform(0.0, 1.0, num_bars)
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": rng.uniform(100.0, 200.0, num_bars),
+        },
+        index=pd.date_range("2024-01-01", periods=num_bars, freq="h", tz="UTC"),
+    )
+
+
+@pytest.mark.parametrize("strategy", BUILTIN_STRATEGIES, ids=lambda s: s.strategy_id)
+def test_precomputed_indicators_match_per_bar_computation(strategy) -> None:
+    ohlcv = _random_walk_ohlcv()
+    fast = run_intent_backtest(strategy, ohlcv)
+    slow = run_intent_backtest(dataclasses.replace(strategy, indicators=None), ohlcv)
+
+    assert fast.trades == slow.trades
+    assert fast.timeline == slow.timeline
+
+
+@pytest.mark.parametrize("strategy", BUILTIN_STRATEGIES, ids=lambda s: s.strategy_id)
+def test_per_bar_work_does_not_grow_with_history(strategy, monkeypatch) -> None:
+    ohlcv = _random_walk_ohlcv()
+    validations: list[int] = []
+    converted_rows: list[int] = []
+    original_validate = common.validate_history
+    original_numeric = common.numeric_column
+
+    def counting_validate(history, **kwargs):
+        validations.append(len(history))
+        return original_validate(history, **kwargs)
+
+    def counting_numeric(history, name):
+        converted_rows.append(len(history))
+        return original_numeric(history, name)
+
+    monkeypatch.setattr(common, "validate_history", counting_validate)
+    monkeypatch.setattr(common, "numeric_column", counting_numeric)
+    run_intent_backtest(strategy, ohlcv, initial_position={"side": "LONG"})
+
+    assert validations == []
+    # A quadratic path would convert ~n^2/2 rows per column read on every bar.
+    assert sum(converted_rows) <= len(ohlcv) * 64
+
+
+def test_pivot_levels_match_last_pivot_levels_on_every_prefix() -> None:
+    ohlcv = _random_walk_ohlcv(80)
+    levels = pivot_levels(ohlcv["high"], ohlcv["low"], 3)
+    for end in range(1, len(ohlcv) + 1):
+        expected = last_pivot_levels(ohlcv["high"].iloc[:end], ohlcv["low"].iloc[:end], 3)
+        row = levels.iloc[end - 1]
+        actual = tuple(None if np.isnan(v) else float(v) for v in row)
+        assert actual == expected
@@ -73,6 +73,8 @@ def test_cli_replay_exit_codes(tmp_path: Path) -> None:
             "--snapshot",
             str(snapshot_path),
             "--strict",
+            "--out",
+            str(tmp_path / "replays"),
         ],
         capture_output=True,
         text=True,
@@ -254,6 +256,8 @@ def test_cli_replay_writes_diff_json(tmp_path: Path) -> None:
             "--strict",
             "--json",
             str(diff_path),
+            "--out",
+            str(tmp_path / "replays"),
         ],
         capture_output=True,
         text=True,
@@ -67,3 +67,18 @@ def test_parquet_reproducible_and_sorted(tmp_path: Path) -> None:
         "volume",
     ]
     assert df_read["timestamp"].is_monotonic_increasing
+
+
+def test_parquet_timestamp_statistics_are_opt_in(tmp_path: Path) -> None:
+    df = _make_df(1_700_000_000_000)
+    plain = write_parquet_1m(df, tmp_path / "plain", "BTCUSDT")
+    with_stats = write_parquet_1m(df, tmp_path / "stats", "BTCUSDT", write_statistics=["timestamp"])
+
+    assert pq.ParquetFile(plain).metadata.row_group(0).column(1).statistics is None
+    row_group = pq.ParquetFile(with_stats).metadata.row_group(0)
+    stats = row_group.column(1).statistics
+    assert (stats.min, stats.max) == (1_700_000_000_000, 1_700_000_000_000 + 2 * MS)
+    assert row_group.column(2).statistics is None
+    assert _sha256(with_stats) == _sha256(
+        write_parquet_1m(df, tmp_path / "stats_b", "BTCUSDT", write_statistics=["timestamp"])
+    )
@@ -5,7 +5,25 @@ from pathlib import Path
 
 import pytest
 
-from audit.decision_records import DecisionRecordWriter, canonical_json, ensure_run_dir, sha256_hex
+import audit.decision_records as decision_records_module
+from audit.decision_records import (
+    DURABILITY_GROUP,
+    DURABILITY_ON_CLOSE,
+    DecisionRecordWriter,
+    DurabilityPolicy,
+    SyncMetrics,
+    canonical_json,
+    compute_market_state_hash,
+    ensure_run_dir,
+    infer_next_seq_from_jsonl,
+    infer_next_shard_and_seq,
+    load_shard_manifest,
+    market_state_hash_cache_info,
+    read_sync_marker,
+    refresh_shard_manifest,
+    sha256_hex,
+)
+from audit.replay import replay_verify
 from risk.contracts import RiskState
 from selector.records import selection_to_record
 from selector.selector import select_strategy
@@ -115,3 +133,262 @@ def test_writer_rejects_invalid_schema(tmp_path: Path) -> None:
             selection={"strategy_id": "TEST", "rule_id": "R1", "reason": "invalid"},
         )
     writer.close()
+
+
+def test_market_state_hash_memoized_and_unchanged() -> None:
+    state = {"trend_state": "up", "momentum_state": "bull"}
+    before = market_state_hash_cache_info()["hits"]
+    expected = sha256_hex(canonical_json(state))
+    assert compute_market_state_hash(state) == expected
+    assert compute_market_state_hash(dict(reversed(list(state.items())))) == expected
+    assert market_state_hash_cache_info()["hits"] >= before + 1
+    nested = {"trend_state": {"value": "up"}, "score": -0.0}
+    assert compute_market_state_hash(nested) == sha256_hex(canonical_json(nested))
+
+
+def _append_green(writer: DecisionRecordWriter, count: int) -> None:
+    market_state = {
+        "trend_state": "up",
+        "volatility_regime": "low",
+        "momentum_state": "neutral",
+        "structure_state": "breakout",
+    }
+    selection = selection_to_record(select_strategy(market_state, RiskState.GREEN))
+    for _ in range(count):
+        writer.append(
+            timeframe="1m",
+            risk_state=RiskState.GREEN.value,
+            market_state=market_state,
+            selection=selection,
+        )
+
+
+@pytest.fixture
+def fsync_calls(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    fsync = decision_records_module.os.fsync
+
+    def counting(fd: int) -> None:
+        calls.append(fd)
+        fsync(fd)
+
+    monkeypatch.setattr(decision_records_module.os, "fsync", counting)
+    return calls
+
+
+def test_writer_group_commit_batches_fsyncs(tmp_path: Path, fsync_calls: list[int]) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    metrics = SyncMetrics()
+    writer = DecisionRecordWriter(
+        out_path=str(out_path),
+        run_id="test_run",
+        durability=DurabilityPolicy(mode=DURABILITY_GROUP, max_records=4),
+        metrics=metrics,
+    )
+    data_fd = writer._file.fileno()
+    _append_green(writer, 10)
+    assert fsync_calls.count(data_fd) == 2
+    marker = read_sync_marker(str(out_path))
+    assert marker is not None
+    assert marker["last_seq"] == 7
+    assert marker["offset"] == len(b"".join(out_path.read_bytes().splitlines(True)[:8]))
+    # Open writes the marker (file + dir); each commit fsyncs data, marker and dir.
+    assert len(fsync_calls) == 2 * 3 + 2
+
+    writer.close()
+    assert fsync_calls.count(data_fd) == 3
+    assert read_sync_marker(str(out_path))["offset"] == out_path.stat().st_size
+    snapshot = metrics.snapshot()
+    assert snapshot["syncs"] == 3
+    assert snapshot["fsyncs"] == 3 * 3
+    assert snapshot["records"] == 10
+    assert snapshot["batch_size_max"] == 4
+    assert replay_verify(records_path=str(out_path)).matched == 10
+
+
+def test_writer_group_commit_syncs_after_max_delay(tmp_path: Path, fsync_calls: list[int]) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    writer = DecisionRecordWriter(
+        out_path=str(out_path),
+        run_id="test_run",
+        durability=DurabilityPolicy(mode=DURABILITY_GROUP, max_records=1000, max_delay_ms=0),
+    )
+    data_fd = writer._file.fileno()
+    _append_green(writer, 3)
+    assert fsync_calls.count(data_fd) == 3
+    writer.close()
+
+
+def test_writer_maybe_sync_enforces_deadline_while_idle(
+    tmp_path: Path, fsync_calls: list[int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    now = [100.0]
+    monkeypatch.setattr(decision_records_module.time, "monotonic", lambda: now[0])
+    writer = DecisionRecordWriter(
+        out_path=str(out_path),
+        run_id="test_run",
+        durability=DurabilityPolicy(mode=DURABILITY_GROUP, max_records=1000, max_delay_ms=50),
+    )
+    data_fd = writer._file.fileno()
+    _append_green(writer, 1)
+    writer.maybe_sync()
+    assert data_fd not in fsync_calls
+
+    now[0] += 0.06
+    writer.maybe_sync()
+    assert fsync_calls.count(data_fd) == 1
+    assert read_sync_marker(str(out_path))["offset"] == out_path.stat().st_size
+    writer.maybe_sync()
+    assert fsync_calls.count(data_fd) == 1
+    writer.close()
+
+
+def test_writer_on_close_durability_and_default(tmp_path: Path, fsync_calls: list[int]) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    writer = DecisionRecordWriter(
+        out_path=str(out_path),
+        run_id="test_run",
+        durability=DurabilityPolicy(mode=DURABILITY_ON_CLOSE),
+    )
+    data_fd = writer._file.fileno()
+    _append_green(writer, 5)
+    assert data_fd not in fsync_calls
+    assert read_sync_marker(str(out_path))["offset"] == 0
+    writer.close()
+    assert fsync_calls.count(data_fd) == 1
+
+    per_record = tmp_path / "per_record.jsonl"
+    fsync_calls.clear()
+    writer = DecisionRecordWriter(out_path=str(per_record), run_id="test_run")
+    _append_green(writer, 3)
+    writer.close()
+    assert len(fsync_calls) == 3
+    assert read_sync_marker(str(per_record)) is None
+    assert writer.metrics.snapshot()["batch_size_max"] == 1
+
+
+def test_replay_reports_records_past_sync_marker(tmp_path: Path, fsync_calls: list[int]) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    writer = DecisionRecordWriter(
+        out_path=str(out_path),
+        run_id="test_run",
+        durability=DurabilityPolicy(mode=DURABILITY_GROUP, max_records=4),
+    )
+    _append_green(writer, 6)
+    writer._file.flush()
+    result = replay_verify(records_path=str(out_path))
+    assert result.total == 6
+    assert result.unsynced == 2
+
+    # A crashed writer never closes; the next one fsyncs its tail before moving the marker.
+    fsync_calls.clear()
+    resumed = DecisionRecordWriter(
+        out_path=str(out_path),
+        run_id="test_run",
+        start_seq=6,
+        durability=DurabilityPolicy(mode=DURABILITY_GROUP, max_records=4),
+    )
+    assert resumed._file.fileno() in fsync_calls
+    assert read_sync_marker(str(out_path))["offset"] == out_path.stat().st_size
+    assert replay_verify(records_path=str(out_path)).unsynced == 0
+    resumed.close()
+    writer._file.close()
+
+    per_record = DecisionRecordWriter(out_path=str(out_path), run_id="test_run", start_seq=6)
+    per_record.close()
+    assert read_sync_marker(str(out_path)) is None
+
+
+def test_durability_policy_validates() -> None:
+    with pytest.raises(ValueError):
+        DurabilityPolicy(mode="sometimes")
+    with pytest.raises(ValueError):
+        DurabilityPolicy(mode=DURABILITY_GROUP, max_records=0)
+
+
+def test_replay_flags_torn_tail(tmp_path: Path) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    writer = DecisionRecordWriter(out_path=str(out_path), run_id="test_run")
+    _append_green(writer, 3)
+    writer.close()
+    assert replay_verify(records_path=str(out_path)).torn_tail == 0
+
+    out_path.write_bytes(out_path.read_bytes()[:-20])
+    result = replay_verify(records_path=str(out_path))
+    assert result.torn_tail == 1
+    assert result.total == 2
+    assert result.errors == 1
+
+
+@pytest.mark.parametrize("block_bytes", [7, 64, 65536])
+def test_infer_next_seq_reads_tail_and_skips_torn_lines(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, block_bytes: int
+) -> None:
+    monkeypatch.setattr(decision_records_module, "_TAIL_BLOCK_BYTES", block_bytes)
+    out_path = tmp_path / "decision_records.jsonl"
+    assert infer_next_seq_from_jsonl(str(out_path)) == 0
+    out_path.write_text("", encoding="utf-8")
+    assert infer_next_seq_from_jsonl(str(out_path)) == 0
+
+    writer = DecisionRecordWriter(out_path=str(out_path), run_id="test_run", start_seq=40)
+    _append_green(writer, 5)
+    writer.close()
+    assert infer_next_seq_from_jsonl(str(out_path)) == 45
+
+    with out_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"seq": "x"}\n[1, 2]\n\n{bad json\n')
+    data = out_path.read_bytes()
+    out_path.write_bytes(data + b'{"schema_version":"dr.v1","seq":46')
+    assert infer_next_seq_from_jsonl(str(out_path)) == 45
+
+    out_path.write_bytes(b"not json\n" * 3)
+    assert infer_next_seq_from_jsonl(str(out_path)) == 0
+
+
+def test_shard_manifest_skips_unchanged_shards(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    assert infer_next_shard_and_seq(str(run_dir)) == (0, 0)
+    for index, start in ((0, 0), (1, 3)):
+        writer = DecisionRecordWriter(
+            out_path=str(run_dir / f"decision_records_{index:04d}.jsonl"),
+            run_id="test_run",
+            start_seq=start,
+        )
+        _append_green(writer, 3)
+        writer.close()
+
+    assert infer_next_shard_and_seq(str(run_dir)) == (1, 6)
+    assert [
+        (info.shard_index, info.first_seq, info.last_seq)
+        for info in refresh_shard_manifest(str(run_dir))
+    ] == [(0, 0, 2), (1, 3, 5)]
+    manifest = load_shard_manifest(str(run_dir))
+    assert manifest[1].size == (run_dir / "decision_records_0001.jsonl").stat().st_size
+
+    reads: list[Path] = []
+    last_seq = decision_records_module._last_seq
+
+    def counting(path: Path) -> int | None:
+        reads.append(path)
+        return last_seq(path)
+
+    monkeypatch.setattr(decision_records_module, "_last_seq", counting)
+    assert infer_next_shard_and_seq(str(run_dir)) == (1, 6)
+    assert reads == []
+
+    writer = DecisionRecordWriter(
+        out_path=str(run_dir / "decision_records_0001.jsonl"), run_id="test_run", start_seq=6
+    )
+    _append_green(writer, 2)
+    writer.close()
+    assert infer_next_shard_and_seq(str(run_dir)) == (1, 8)
+    assert [path.name for path in reads] == ["decision_records_0001.jsonl"]
+    assert load_shard_manifest(str(run_dir))[1].last_seq == 7
+
+    (run_dir / "decision_records_0001.jsonl").unlink()
+    assert infer_next_shard_and_seq(str(run_dir)) == (0, 3)
+    assert sorted(load_shard_manifest(str(run_dir))) == [0]
@@ -32,3 +32,12 @@ def test_regime_stability() -> None:
     for col in ["trend_state", "momentum_state", "volatility_regime"]:
         match_ratio = (base_slice[col] == noisy_slice[col]).mean()
         assert match_ratio >= 0.7
+
+
+def test_expanding_volatility_regime_has_no_lookahead() -> None:
+    df = make_ohlcv(260)
+    full = classify_regimes(build_features(df), expanding_volatility=True)
+    truncated = classify_regimes(build_features(df.iloc[:150]), expanding_volatility=True)
+
+    assert full["volatility_regime"].iloc[:150].tolist() == truncated["volatility_regime"].tolist()
+    assert set(full["volatility_regime"].dropna().unique()) <= {"low", "normal", "high"}
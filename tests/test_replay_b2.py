@@ -1,10 +1,23 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
+import audit.replay as replay_module
 from audit.decision_records import DecisionRecordWriter
-from audit.replay import replay_verify
+from audit.replay import (
+    ReplayResult,
+    replay_checkpoint_path,
+    replay_verify,
+    replay_verify_incremental,
+    replay_verify_shards,
+)
+from paper.paper_runner import generate_mock_market_state
 from risk.contracts import RiskState
 from selector.records import selection_to_record
 from selector.selector import select_strategy
@@ -117,3 +130,206 @@ def test_replay_detects_selection_mismatch(tmp_path: Path) -> None:
 
     result = replay_verify(records_path=str(out_path))
     assert result.mismatched == 1
+
+
+def _append_mock_records(out_path: Path, start: int, count: int) -> None:
+    writer = DecisionRecordWriter(out_path=str(out_path), run_id="test_run", start_seq=start)
+    for step in range(start, start + count):
+        market_state = generate_mock_market_state(step)
+        risk_state = RiskState.YELLOW if step % 3 == 0 else RiskState.GREEN
+        writer.append(
+            timeframe="1m",
+            risk_state=risk_state.value,
+            market_state=market_state,
+            selection=selection_to_record(select_strategy(market_state, risk_state)),
+        )
+    writer.close()
+
+
+@pytest.fixture
+def verified_lines(monkeypatch: pytest.MonkeyPatch) -> list[object]:
+    seen: list[object] = []
+    verify_record = replay_module._verify_record
+
+    def counting(record):
+        seen.append(record["seq"])
+        return verify_record(record)
+
+    monkeypatch.setattr(replay_module, "_verify_record", counting)
+    return seen
+
+
+def test_incremental_replay_only_verifies_appended_records(
+    tmp_path: Path, verified_lines: list[object]
+) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    _append_mock_records(out_path, 0, 6)
+    assert replay_verify_incremental(records_path=str(out_path)) == replay_verify(
+        records_path=str(out_path)
+    )
+
+    _append_mock_records(out_path, 6, 4)
+    verified_lines.clear()
+    result = replay_verify_incremental(records_path=str(out_path))
+    assert verified_lines == [6, 7, 8, 9]
+    assert result == replay_verify(records_path=str(out_path))
+    assert result.total == 10 and result.matched == 10
+
+    checkpoint = json.loads(replay_checkpoint_path(str(out_path)).read_text(encoding="utf-8"))
+    assert checkpoint["offset"] == out_path.stat().st_size
+    assert checkpoint["last_seq"] == 9
+
+    verified_lines.clear()
+    assert replay_verify_incremental(records_path=str(out_path)).total == 10
+    assert verified_lines == []
+
+
+def test_incremental_replay_holds_back_partial_tail(
+    tmp_path: Path, verified_lines: list[object]
+) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    _append_mock_records(out_path, 0, 3)
+    replay_verify_incremental(records_path=str(out_path))
+
+    complete = out_path.read_bytes()
+    _append_mock_records(out_path, 3, 1)
+    appended = out_path.read_bytes()[len(complete) :]
+    out_path.write_bytes(complete + appended[:-1])
+    verified_lines.clear()
+    torn = replay_verify_incremental(records_path=str(out_path))
+    assert torn.total == 4 and torn.torn_tail == 1
+    checkpoint = json.loads(replay_checkpoint_path(str(out_path)).read_text(encoding="utf-8"))
+    assert checkpoint["offset"] == len(complete)
+
+    out_path.write_bytes(complete + appended)
+    verified_lines.clear()
+    assert replay_verify_incremental(records_path=str(out_path)).total == 4
+    assert verified_lines == [3]
+
+
+def test_incremental_replay_restarts_when_shard_changes(
+    tmp_path: Path, verified_lines: list[object]
+) -> None:
+    out_path = tmp_path / "decision_records.jsonl"
+    _append_mock_records(out_path, 0, 5)
+    replay_verify_incremental(records_path=str(out_path))
+
+    lines = out_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    out_path.write_text("".join(lines[:3]), encoding="utf-8")
+    verified_lines.clear()
+    assert replay_verify_incremental(records_path=str(out_path)).total == 3
+    assert verified_lines == [0, 1, 2]
+
+    loaded = json.loads(lines[0])
+    loaded["selection"]["strategy_id"] = "MEAN_REVERT"
+    out_path.write_text(json.dumps(loaded) + "\n" + "".join(lines[1:3]), encoding="utf-8")
+    result = replay_verify_incremental(records_path=str(out_path), full=True)
+    assert result.mismatched == 1
+    assert result == replay_verify(records_path=str(out_path))
+
+
+def _tamper_selection(path: Path, line_index: int) -> None:
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    loaded = json.loads(lines[line_index])
+    loaded["selection"]["strategy_id"] = "MEAN_REVERT"
+    lines[line_index] = json.dumps(loaded) + "\n"
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def test_replay_verify_shards_merges_in_path_order(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    shards = [tmp_path / f"decision_records_{index:04d}.jsonl" for index in range(3)]
+    for index, shard in enumerate(shards):
+        _append_mock_records(shard, index * 8, 8)
+    _tamper_selection(shards[2], 1)
+    _tamper_selection(shards[0], 5)
+    with shards[1].open("a", encoding="utf-8") as handle:
+        handle.write("{bad json\n")
+
+    serial = [replay_verify(records_path=str(shard)) for shard in shards]
+    capsys.readouterr()
+    expected = ReplayResult(
+        **{
+            key: sum(getattr(result, key) for result in serial)
+            for key in ("total", "matched", "mismatched", "hash_mismatch", "errors", "torn_tail")
+        }
+    )
+    assert expected.total == 24 and expected.mismatched == 2 and expected.errors == 1
+
+    paths = [str(shard) for shard in shards]
+    assert replay_verify_shards(paths) == expected
+    serial_output = capsys.readouterr().out
+    assert replay_verify_shards(paths, workers=3) == expected
+    assert capsys.readouterr().out == serial_output
+    assert [item["seq"] for item in json.loads(serial_output)["mismatches"]] == [5, 17]
+
+
+def test_cli_replay_verifies_record_shards(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    for index in range(2):
+        _append_mock_records(run_dir / f"decision_records_{index:04d}.jsonl", index * 4, 4)
+    env = os.environ.copy()
+    src_path = str(Path(__file__).resolve().parents[1] / "src")
+    env["PYTHONPATH"] = src_path + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+    command = [sys.executable, "-m", "audit.cli_replay", "--records", str(run_dir)]
+
+    ok = subprocess.run(
+        [*command, "--workers", "2"], capture_output=True, text=True, check=False, env=env
+    )
+    assert ok.returncode == 0, ok.stderr
+    assert json.loads(ok.stdout.splitlines()[0])["matched"] == 8
+    assert ok.stdout.splitlines()[-1] == "REPLAY_OK records"
+
+    _tamper_selection(run_dir / "decision_records_0001.jsonl", 0)
+    bad = subprocess.run(command, capture_output=True, text=True, check=False, env=env)
+    assert bad.returncode == 2
+    assert bad.stdout.splitlines()[-1] == "REPLAY_MISMATCH"
+
+
+def test_cli_replay_records_rejects_empty_garbage_and_bad_flags(tmp_path: Path) -> None:
+    env = os.environ.copy()
+    src_path = str(Path(__file__).resolve().parents[1] / "src")
+    env["PYTHONPATH"] = src_path + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+
+    def cli(*args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "audit.cli_replay", *args],
+            capture_output=True,
+            text=True,
+            check=False,
+            env=env,
+        )
+
+    paper_run = tmp_path / "paper_run"
+    paper_run.mkdir()
+    _append_mock_records(paper_run / "decision_records.jsonl", 0, 3)
+    ok = cli("--records", str(paper_run))
+    assert ok.returncode == 0, ok.stderr
+    assert json.loads(ok.stdout.splitlines()[0])["matched"] == 3
+
+    empty_run = tmp_path / "empty_run"
+    empty_run.mkdir()
+    empty = cli("--records", str(empty_run))
+    assert empty.returncode == 2
+    assert "REPLAY_ERROR no decision records found" in empty.stderr
+
+    garbage = tmp_path / "garbage.jsonl"
+    garbage.write_text("{bad json\nnot json either\n", encoding="utf-8")
+    bad = cli("--records", str(garbage))
+    assert bad.returncode == 2
+    assert "REPLAY_ERROR 2 unparseable record lines" in bad.stderr
+
+    missing = cli("--records", str(tmp_path / "missing.jsonl"))
+    assert missing.returncode == 2
+    assert "REPLAY_ERROR records not found" in missing.stderr
+    assert "Traceback" not in missing.stderr
+
+    strict = cli("--records", str(paper_run), "--strict")
+    assert strict.returncode == 2
+    assert "--strict is not supported with --records" in strict.stderr
+
+    workers = cli("--decision", str(tmp_path / "decision.json"), "--workers", "2")
+    assert workers.returncode == 2
+    assert "--workers is only supported with --records" in workers.stderr
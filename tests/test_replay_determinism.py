@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
 from audit.decision_record import (
     Artifacts,
     CodeVersion,
@@ -113,3 +119,55 @@ def test_replay_matches_with_fixed_seed() -> None:
     assert record.hashes is not None
     assert report.replay_record.hashes is not None
     assert record.hashes.content_hash == report.replay_record.hashes.content_hash
+
+
+def _fixture_batch() -> tuple[list[DecisionRecord], list[Snapshot]]:
+    base = json.loads(Path("tests/fixtures/decision_payload.json").read_text(encoding="utf-8"))
+    snapshot_payload = json.loads(
+        Path("tests/fixtures/snapshot_payload.json").read_text(encoding="utf-8")
+    )
+    shared = Snapshot.from_dict(snapshot_payload)
+    payloads = []
+    for index in range(8):
+        payload = copy.deepcopy(base)
+        payload["decision_id"] = f"dec-{index:03d}"
+        payloads.append(payload)
+    payloads[2]["selection"]["strategy_id"] = "MEAN_REVERT"
+    payloads[3]["outcome"]["notes"] = "edited"
+    # Equal by value but not by type: canonical JSON differs, the structured diff does not.
+    payloads[5]["inputs"]["selector_inputs"] = {"selector_version": 1.0}
+    payloads[6]["inputs"]["market_features"]["trend_state"] = "down"
+
+    own_payload = dict(snapshot_payload, decision_id="dec-007")
+    own_payload.pop("snapshot_hash", None)
+    snapshots = [shared] * 7 + [Snapshot.from_dict(own_payload)]
+    return [DecisionRecord.from_dict(payload) for payload in payloads], snapshots
+
+
+@pytest.mark.parametrize(
+    ("strict_core", "strict_full"), [(False, False), (True, False), (False, True)]
+)
+def test_replay_many_agrees_with_replay(strict_core: bool, strict_full: bool) -> None:
+    records, snapshots = _fixture_batch()
+    runner = ReplayRunner()
+    expected = [
+        runner.replay(record, snapshot, strict_core=strict_core, strict_full=strict_full)
+        for record, snapshot in zip(records, snapshots)
+    ]
+
+    batch = runner.replay_many(records, snapshots, strict_core=strict_core, strict_full=strict_full)
+    assert batch.total == len(records)
+    assert batch.matched == sum(report.matched for report in expected)
+    assert [index for index, _ in batch.mismatches] == [
+        index for index, report in enumerate(expected) if not report.matched
+    ]
+    for index, report in batch.mismatches:
+        assert report.diffs == expected[index].diffs
+        assert report.replay_record == expected[index].replay_record
+    assert {2, 3, 6} <= {index for index, _ in batch.mismatches}
+
+
+def test_replay_many_requires_aligned_snapshots() -> None:
+    records, snapshots = _fixture_batch()
+    with pytest.raises(ValueError):
+        ReplayRunner().replay_many(records, snapshots[:-1])
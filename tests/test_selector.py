@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from risk.contracts import RiskState
-from selector.selector import select_strategy
+from selector.selector import clear_selection_cache, select_strategy, selection_cache_info
 
 
 def _signals(
@@ -81,3 +81,16 @@ def test_risk_precedence_red_over_market_rules() -> None:
     )
     assert result.strategy_id is None
     assert result.rule_id == "R0"
+
+
+def test_repeated_states_hit_selection_cache() -> None:
+    clear_selection_cache()
+    signals = _signals(trend_state="up", volatility_regime="low", structure_state="breakout")
+    first = select_strategy(signals, RiskState.GREEN)
+    first.inputs["trend_state"] = "mutated"
+    second = select_strategy(dict(signals), "GREEN")
+
+    assert second.strategy_id == first.strategy_id
+    assert second.inputs["trend_state"] == "up"
+    assert selection_cache_info()["hits"] == 1
+    assert selection_cache_info()["misses"] == 1
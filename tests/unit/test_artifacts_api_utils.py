@@ -7,7 +7,14 @@ import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
-from apps.api.artifacts import DecisionRecords, discover_runs, resolve_run_dir
+from apps.api.artifacts import (
+    DecisionRecords,
+    _matches_filters,
+    _normalize_record,
+    discover_runs,
+    filter_decisions,
+    resolve_run_dir,
+)
 from apps.api.main import app
 from apps.api.timeutils import format_ts, parse_ts
 
@@ -225,6 +232,57 @@ def test_decisions_streaming_pagination(monkeypatch, tmp_path):
     assert len(data["results"]) == 50
 
 
+def test_decision_index_matches_full_scan_and_tracks_file_version(tmp_path):
+    _, run_dir = _make_run(tmp_path, "run-index")
+    decision_path = run_dir / "decision_records.jsonl"
+    start_ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    _write_synthetic_jsonl(decision_path, 400, start_ts)
+    with decision_path.open("a", encoding="utf-8") as handle:
+        handle.write('{not json}\n\n"string"\n')
+        handle.write(json.dumps({"symbols": ["BTCUSDT", "SOLUSDT"], "action": ["placed"]}) + "\n")
+
+    cases = [
+        {},
+        {"symbols": ["SOLUSDT"]},
+        {"symbols": ["BTCUSDT"], "actions": ["placed"], "reason_codes": ["RISK_BLOCK"]},
+        {"severities": ["ERROR", "INFO"], "start_ts": start_ts + timedelta(seconds=37)},
+        {"actions": ["noop"], "end_ts": start_ts + timedelta(seconds=120, milliseconds=500)},
+    ]
+    for case in cases:
+        filters = {
+            "symbols": None,
+            "actions": None,
+            "severities": None,
+            "reason_codes": None,
+            "start_ts": None,
+            "end_ts": None,
+            **case,
+        }
+        expected = [
+            _normalize_record(record)
+            for record in DecisionRecords(decision_path)
+            if _matches_filters(
+                record,
+                *(set(filters[key]) if filters[key] else None for key in list(filters)[:4]),
+                filters["start_ts"],
+                filters["end_ts"],
+            )
+        ]
+        data = filter_decisions(decision_path, **filters, page=2, page_size=25)
+        assert data["total"] == len(expected)
+        assert data["results"] == expected[25:50]
+
+    assert (run_dir / ".index" / "decision_records.jsonl.json").exists()
+    assert sorted(path.name for path in run_dir.iterdir() if path.is_file()) == [
+        "decision_records.jsonl"
+    ]
+
+    with decision_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"symbol": "SOLUSDT", "decision_id": "late"}) + "\n")
+    data = filter_decisions(decision_path, ["SOLUSDT"], None, None, None, None, None, 1, 10)
+    assert [item.get("decision_id") for item in data["results"]] == [None, "late"]
+
+
 def test_summary_cache_invalidation(monkeypatch, tmp_path):
     artifacts_root, run_dir = _make_run(tmp_path, "run-cache")
     decision_path = run_dir / "decision_records.jsonl"
@@ -279,3 +337,47 @@ def test_errors_capped(monkeypatch, tmp_path):
     assert len(data["errors"]) == 2000
     assert data["errors"][0]["decision_id"] == "dec-500"
     assert data["errors"][-1]["decision_id"] == "dec-2499"
+
+
+def test_parquet_loaders_push_time_window_down(tmp_path):
+    import pandas as pd
+
+    from apps.api.artifacts import load_ohlcv, load_trades
+
+    timestamps = pd.Series(pd.date_range("2026-01-01", periods=1000, freq="min", tz="UTC"))
+    timestamps[3] = pd.NaT
+    frame = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "open": range(1000),
+            "high": range(1000),
+            "low": range(1000),
+            "close": range(1000),
+            "volume": range(1000),
+            "side": "BUY",
+        }
+    ).iloc[::-1]
+    path = tmp_path / "ohlcv_1m.parquet"
+    frame.to_parquet(path, row_group_size=100)
+    start = datetime(2026, 1, 1, 2, tzinfo=timezone.utc)
+    end = datetime(2026, 1, 1, 3, 30, 30, tzinfo=timezone.utc)
+
+    ohlcv = load_ohlcv(path, start_ts=start, end_ts=end, limit=10)
+    assert ohlcv["count"] == 10
+    assert ohlcv["start_ts"] == "2026-01-01T02:00:00.000Z"
+    assert ohlcv["candles"][1] == {
+        "ts": "2026-01-01T02:01:00.000Z",
+        "open": 121.0,
+        "high": 121.0,
+        "low": 121.0,
+        "close": 121.0,
+        "volume": 121.0,
+    }
+    assert load_ohlcv(path, start_ts=None, end_ts=None, limit=None)["count"] == 999
+
+    trades = load_trades(path, start, end, page=1, page_size=5)
+    assert trades["total"] == 91
+    assert [row["timestamp"] for row in trades["results"]][:2] == [
+        "2026-01-01T03:30:00.000Z",
+        "2026-01-01T03:29:00.000Z",
+    ]
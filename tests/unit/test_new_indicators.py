@@ -9,6 +9,7 @@ from buff.features.indicators import (
     adx_wilder,
     ema,
     ema_spread,
+    expanding_quantile,
     obv,
     roc,
     rsi_slope,
@@ -97,3 +98,17 @@ def test_adx_14_length_warmup_determinism() -> None:
     _assert_deterministic(out1["plus_di"], out2["plus_di"])
     _assert_deterministic(out1["minus_di"], out2["minus_di"])
     _assert_deterministic(out1["adx"], out2["adx"])
+
+
+def test_expanding_quantile_matches_prefix_quantile() -> None:
+    rng = np.random.default_rng(11)
+    values = pd.Series(np.round(rng.normal(0.0, 1.0, 300), 1))
+    values[rng.random(300) < 0.2] = np.nan
+    for q in (0.0, 0.33, 0.5, 0.67, 1.0):
+        out = expanding_quantile(values, q)
+        for i in range(len(values)):
+            window = values.iloc[: i + 1].dropna()
+            if window.empty:
+                assert np.isnan(out.iloc[i])
+            else:
+                assert out.iloc[i] == float(window.quantile(q))
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from buff.data.online_data_plane import (
+    FailClosedError,
+    RawCaptureWriter,
+    canonicalize_from_raw_logs,
+)
+
+
+def _capture(path: Path, trades: list[tuple[str, int, str, str]], **writer_kwargs) -> None:
+    with RawCaptureWriter(path, **writer_kwargs) as writer:
+        for market, ts, price, qty in trades:
+            writer.append(
+                exchange_id="ex",
+                market=market,
+                transport="ws",
+                source="ws_live",
+                feed_channel="trades",
+                received_at_ms=ts,
+                payload_raw_text=json.dumps({"E": ts, "p": price, "q": qty}),
+            )
+
+
+def _seqs(path: Path) -> list[tuple[str, int]]:
+    return [
+        (record["stream_id"], record["ingest_seq"])
+        for record in map(json.loads, path.read_text(encoding="utf-8").splitlines())
+    ]
+
+
+def _outputs(output_dir: Path) -> dict[str, bytes]:
+    return {path.name: path.read_bytes() for path in sorted(output_dir.iterdir())}
+
+
+def test_spilling_to_disk_does_not_change_outputs(tmp_path: Path) -> None:
+    raw_log = tmp_path / "raw.jsonl"
+    _capture(
+        raw_log,
+        [
+            ("BTC", 1_000, "10", "1"),
+            ("ETH", 1_500, "20", "2"),
+            ("BTC", 61_000, "11", "1"),
+            ("BTC", 62_000, "9.5", "0.5"),
+            ("BTC", 30_000, "12", "1"),
+            ("ETH", 119_000, "21", "1"),
+        ],
+    )
+    with raw_log.open("a", encoding="utf-8") as fh:
+        fh.write(raw_log.read_text(encoding="utf-8").splitlines()[2] + "\n")
+
+    in_memory = canonicalize_from_raw_logs(
+        raw_log_path=raw_log, output_dir=tmp_path / "mem", timeframe_ms=60_000, run_id="r"
+    )
+    spilled = canonicalize_from_raw_logs(
+        raw_log_path=raw_log,
+        output_dir=tmp_path / "spill",
+        timeframe_ms=60_000,
+        run_id="r",
+        max_records_in_memory=2,
+    )
+
+    assert _outputs(tmp_path / "mem") == _outputs(tmp_path / "spill")
+    assert in_memory.artifact_digests == spilled.artifact_digests
+    bars = [
+        json.loads(line)
+        for line in (tmp_path / "spill" / "canonical_ohlcv.jsonl").read_text().splitlines()
+    ]
+    assert [(bar["bucket_start_ms"], bar["open"], bar["close"]) for bar in bars] == [
+        (0, "10", "20"),
+        (60_000, "11", "21"),
+    ]
+    revision = json.loads((tmp_path / "spill" / "revision_status.json").read_text())
+    assert revision["late_event_count"] == 1
+    gap_status = json.loads((tmp_path / "spill" / "gap_status.json").read_text())
+    assert gap_status["idempotent_duplicate_count"] == 1
+
+
+def test_conflicting_duplicate_fails_closed_without_canonical_outputs(tmp_path: Path) -> None:
+    raw_log = tmp_path / "raw.jsonl"
+    _capture(raw_log, [("BTC", 1_000, "10", "1"), ("BTC", 2_000, "11", "1")])
+    lines = raw_log.read_text(encoding="utf-8").splitlines()
+    conflict = json.loads(lines[1])
+    conflict["ingest_seq"] = 1
+    raw_log.write_text("\n".join([*lines, json.dumps(conflict)]) + "\n", encoding="utf-8")
+
+    with pytest.raises(FailClosedError) as excinfo:
+        canonicalize_from_raw_logs(
+            raw_log_path=raw_log,
+            output_dir=tmp_path / "out",
+            timeframe_ms=60_000,
+            max_records_in_memory=1,
+        )
+
+    assert excinfo.value.result.fail_reason == "duplicate_ingest_seq_conflict"
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [
+        "gap_status.json",
+        "manifest.json",
+        "revision_status.json",
+    ]
+
+
+def test_writer_resumes_from_checkpoint_and_scans_only_the_tail(tmp_path: Path) -> None:
+    raw_log = tmp_path / "raw.jsonl"
+    _capture(raw_log, [("BTC", 1_000, "10", "1"), ("ETH", 1_500, "20", "2")], sync_every=8)
+    checkpoint = json.loads((tmp_path / "raw.jsonl.checkpoint.json").read_text())
+    assert checkpoint["offset"] == raw_log.stat().st_size
+
+    # Records appended after the checkpoint (e.g. a crash before it was rewritten).
+    lines = raw_log.read_text(encoding="utf-8").splitlines()
+    extra = json.loads(lines[0])
+    extra["ingest_seq"] = 2
+    with raw_log.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps(extra) + "\n")
+    checkpoint["seq_by_stream"]["ex:ETH:ws:trades"] = 40
+    (tmp_path / "raw.jsonl.checkpoint.json").write_text(json.dumps(checkpoint))
+
+    _capture(raw_log, [("BTC", 2_000, "11", "1"), ("ETH", 2_500, "21", "1")])
+
+    # The checkpoint is trusted (ETH resumes at 41) and the unchecked tail is read (BTC at 3).
+    assert _seqs(raw_log)[-2:] == [("ex:BTC:ws:trades", 3), ("ex:ETH:ws:trades", 41)]
+
+
+def test_writer_rescans_when_checkpoint_does_not_match_log(tmp_path: Path) -> None:
+    raw_log = tmp_path / "raw.jsonl"
+    _capture(raw_log, [("BTC", 1_000, "10", "1"), ("BTC", 2_000, "11", "1")])
+    lines = raw_log.read_text(encoding="utf-8").splitlines()
+    raw_log.write_text(lines[0] + "\n", encoding="utf-8")
+
+    _capture(raw_log, [("BTC", 3_000, "12", "1")])
+
+    assert _seqs(raw_log) == [("ex:BTC:ws:trades", 1), ("ex:BTC:ws:trades", 2)]
@@ -0,0 +1,83 @@
+"""Streaming indicators must reproduce the batch registry features exactly."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from buff.features.contract import FeatureContractError
+from buff.features.indicators import rolling_std
+from buff.features.registry import FEATURES, build_stream
+from buff.features.streaming import EmaStream, StdStream, StreamingIndicator
+
+
+def _load_df() -> pd.DataFrame:
+    df = pd.read_csv("tests/goldens/expected.csv")
+    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    df = df.set_index("timestamp")
+    return df[["open", "high", "low", "close", "volume"]]
+
+
+def _with_gaps(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy()
+    out.iloc[60:75, out.columns.get_loc("close")] = out["close"].iloc[60]
+    out.iloc[90, out.columns.get_loc("close")] = np.nan
+    out.iloc[120, out.columns.get_loc("volume")] = 0.0
+    return out
+
+
+def _stream(feature_id: str, df: pd.DataFrame, *, restore_at: int | None = None) -> np.ndarray:
+    stream = build_stream(feature_id)
+    rows = []
+    for i, (ts, row) in enumerate(df.iterrows()):
+        if i == restore_at:
+            state = json.loads(json.dumps(stream.snapshot()))
+            stream = build_stream(feature_id)
+            stream.restore(state)
+        value = stream.update({**row.to_dict(), "timestamp": ts})
+        rows.append(list(value.values()) if isinstance(value, dict) else [value])
+    return np.asarray(rows, dtype=float)
+
+
+@pytest.mark.parametrize("feature_id", sorted(FEATURES))
+@pytest.mark.parametrize("make_df", [_load_df, lambda: _with_gaps(_load_df())])
+def test_stream_matches_batch_bit_for_bit(feature_id: str, make_df) -> None:
+    df = make_df()
+    entry = FEATURES[feature_id]
+    expected = np.asarray(entry["func"](df, **entry["params"]), dtype=float).reshape(len(df), -1)
+
+    streamed = _stream(feature_id, df, restore_at=len(df) // 2)
+
+    assert streamed.shape == expected.shape
+    assert np.array_equal(streamed, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize(("period", "ddof"), [(1, 0), (3, 1), (20, 0), (20, 2)])
+def test_std_stream_follows_pandas_online_kernel(period: int, ddof: int) -> None:
+    # Large level shifts exercise pandas' cancellation check and recompute path.
+    rng = np.random.default_rng(7)
+    close = pd.Series(
+        np.concatenate([rng.normal(1e9, 1.0, 200), rng.normal(0.0, 1e-6, 200), np.full(40, 5.0)])
+    )
+    stream = StdStream(period, ddof)
+    streamed = [stream.update({"close": value}) for value in close]
+
+    assert np.array_equal(streamed, rolling_std(close, period, ddof), equal_nan=True)
+
+
+def test_restore_rejects_foreign_snapshot() -> None:
+    with pytest.raises(ValueError, match="streaming_snapshot_kind_mismatch"):
+        EmaStream(20).restore(build_stream("rsi_14").snapshot())
+    with pytest.raises(FeatureContractError, match="feature_unknown_id"):
+        build_stream("nope")
+
+
+def test_streaming_indicator_requires_update() -> None:
+    class NoUpdate(StreamingIndicator):
+        kind = "no_update"
+
+    with pytest.raises(TypeError):
+        NoUpdate()
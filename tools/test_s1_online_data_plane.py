@@ -113,47 +113,45 @@ def _assert_identical_artifacts(dir_a: Path, dir_b: Path, names: list[str]) -> N
 
 
 def test_raw_capture_rejects_object_payload(tmp_path: Path) -> None:
-    writer = RawCaptureWriter(tmp_path / "raw.jsonl")
-
-    with pytest.raises(ValueError, match="payload_raw_text must be str"):
-        writer.append(
-            exchange_id="binance",
-            market="BTCUSDT",
-            transport="ws",
-            source="ws_live",
-            feed_channel="trades",
-            received_at_ms=1,
-            payload_raw_text={"event_ts_ms": 1},  # type: ignore[arg-type]
-        )
+    with RawCaptureWriter(tmp_path / "raw.jsonl") as writer:
+        with pytest.raises(ValueError, match="payload_raw_text must be str"):
+            writer.append(
+                exchange_id="binance",
+                market="BTCUSDT",
+                transport="ws",
+                source="ws_live",
+                feed_channel="trades",
+                received_at_ms=1,
+                payload_raw_text={"event_ts_ms": 1},  # type: ignore[arg-type]
+            )
 
 
 def test_payload_sha256_uses_exact_raw_bytes(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_whitespace.jsonl"
-    writer = RawCaptureWriter(raw_log)
-
     payload_compact = _payload_bytes(1_700_000_000_000, "100", "1", pretty=False)
     payload_pretty = _payload_bytes(1_700_000_000_000, "100", "1", pretty=True)
 
-    rec_compact = writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=10,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=payload_compact,
-    )
-    rec_pretty = writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=20,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=payload_pretty,
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        rec_compact = writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=10,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=payload_compact,
+        )
+        rec_pretty = writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=20,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=payload_pretty,
+        )
 
     assert rec_compact["payload_sha256"] != rec_pretty["payload_sha256"]
     assert rec_compact["payload_sha256"] == sha256_hex_bytes(payload_compact)
@@ -162,19 +160,19 @@ def test_payload_sha256_uses_exact_raw_bytes(tmp_path: Path) -> None:
 
 def test_raw_roundtrip_bytes_fidelity(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_roundtrip.jsonl"
-    writer = RawCaptureWriter(raw_log)
     payload = b'{"event_ts_ms":1700000000000,"price":"100","qty":"1"}\n\x00binary-tail'
 
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=payload,
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=payload,
+        )
 
     line = raw_log.read_text(encoding="utf-8").splitlines()[0]
     record = json.loads(line)
@@ -184,18 +182,17 @@ def test_raw_roundtrip_bytes_fidelity(tmp_path: Path) -> None:
 
 def test_raw_schema_includes_source_and_feed_channel(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_schema.jsonl"
-    writer = RawCaptureWriter(raw_log)
-
-    record = writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="rest",
-        source="rest_backfill",
-        feed_channel="trades",
-        received_at_ms=10,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        record = writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="rest",
+            source="rest_backfill",
+            feed_channel="trades",
+            received_at_ms=10,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
+        )
 
     assert record["source"] == "rest_backfill"
     assert record["feed_channel"] == "trades"
@@ -216,27 +213,27 @@ def test_raw_schema_includes_source_and_feed_channel(tmp_path: Path) -> None:
 
 def test_replay_determinism(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_det" / "events.jsonl"
-    writer = RawCaptureWriter(raw_log)
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_000_100,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100.0", "1.0"),
-    )
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_060_100,
-        exchange_event_ts_ms=1_700_000_060_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_060_000, "101.0", "2.0"),
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_000_100,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100.0", "1.0"),
+        )
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_060_100,
+            exchange_event_ts_ms=1_700_000_060_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_060_000, "101.0", "2.0"),
+        )
 
     out_a = tmp_path / "out_a"
     out_b = tmp_path / "out_b"
@@ -269,18 +266,20 @@ def test_replay_determinism(tmp_path: Path) -> None:
 
 def test_replay_identical_sizes_and_counts(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_size" / "events.jsonl"
-    writer = RawCaptureWriter(raw_log)
-    for i, ts_ms in enumerate([1_700_000_000_000, 1_700_000_060_000, 1_700_000_120_000], start=1):
-        writer.append(
-            exchange_id="binance",
-            market="BTCUSDT",
-            transport="ws",
-            source="ws_live",
-            feed_channel="trades",
-            received_at_ms=ts_ms + 100,
-            exchange_event_ts_ms=ts_ms,
-            payload_raw_bytes=_payload_bytes(ts_ms, str(100 + i), "1"),
-        )
+    with RawCaptureWriter(raw_log) as writer:
+        for i, ts_ms in enumerate(
+            [1_700_000_000_000, 1_700_000_060_000, 1_700_000_120_000], start=1
+        ):
+            writer.append(
+                exchange_id="binance",
+                market="BTCUSDT",
+                transport="ws",
+                source="ws_live",
+                feed_channel="trades",
+                received_at_ms=ts_ms + 100,
+                exchange_event_ts_ms=ts_ms,
+                payload_raw_bytes=_payload_bytes(ts_ms, str(100 + i), "1"),
+            )
 
     out_a = tmp_path / "size_a"
     out_b = tmp_path / "size_b"
@@ -300,27 +299,27 @@ def test_replay_identical_sizes_and_counts(tmp_path: Path) -> None:
 
 def test_gap_triggers_backfill_attempts(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_gap_attempts" / "events.jsonl"
-    writer = RawCaptureWriter(raw_log)
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_000_100,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
-    )
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_120_100,
-        exchange_event_ts_ms=1_700_000_120_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_120_000, "102", "1"),
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_000_100,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
+        )
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_120_100,
+            exchange_event_ts_ms=1_700_000_120_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_120_000, "102", "1"),
+        )
 
     provider = FakeBackfillProvider(responses=[[]])
     with pytest.raises(FailClosedError) as exc:
@@ -345,27 +344,27 @@ def test_gap_triggers_backfill_attempts(tmp_path: Path) -> None:
 
 def test_gap_unresolved_after_n_attempts_emits_gap_unresolved(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_gap_unresolved" / "events.jsonl"
-    writer = RawCaptureWriter(raw_log)
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_000_100,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
-    )
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_120_100,
-        exchange_event_ts_ms=1_700_000_120_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_120_000, "102", "1"),
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_000_100,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
+        )
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_120_100,
+            exchange_event_ts_ms=1_700_000_120_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_120_000, "102", "1"),
+        )
 
     provider = FakeBackfillProvider(responses=[[], []])
     with pytest.raises(FailClosedError):
@@ -389,27 +388,27 @@ def test_gap_unresolved_after_n_attempts_emits_gap_unresolved(tmp_path: Path) ->
 
 def test_gap_resolved_clears_fail_closed(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_gap_resolved" / "events.jsonl"
-    writer = RawCaptureWriter(raw_log)
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_000_100,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
-    )
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_120_100,
-        exchange_event_ts_ms=1_700_000_120_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_120_000, "102", "1"),
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_000_100,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
+        )
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_120_100,
+            exchange_event_ts_ms=1_700_000_120_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_120_000, "102", "1"),
+        )
 
     missing_bucket_payload = _payload_bytes(1_700_000_060_000, "101", "1")
     provider = FakeBackfillProvider(responses=[[missing_bucket_payload]])
@@ -435,27 +434,27 @@ def test_gap_resolved_clears_fail_closed(tmp_path: Path) -> None:
 
 def test_unresolved_gap_blocks_canonical_publication(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_block" / "events.jsonl"
-    writer = RawCaptureWriter(raw_log)
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_000_100,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
-    )
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_120_100,
-        exchange_event_ts_ms=1_700_000_120_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_120_000, "102", "1"),
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_000_100,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
+        )
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_120_100,
+            exchange_event_ts_ms=1_700_000_120_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_120_000, "102", "1"),
+        )
 
     with pytest.raises(FailClosedError):
         canonicalize_from_raw_logs(
@@ -513,6 +512,8 @@ def test_late_event_policy(tmp_path: Path) -> None:
         exchange_event_ts_ms=1_700_000_000_000,
         payload_raw_bytes=_payload_bytes(1_700_000_000_000, "999", "5"),
     )
+    base_writer.close()
+    late_writer.close()
 
     canonicalize_from_raw_logs(
         raw_log_path=base_raw,
@@ -605,17 +606,17 @@ def test_duplicate_seq_diff_hash_fail_closed(tmp_path: Path) -> None:
 
 def test_manifest_contains_repro_fields(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_manifest" / "events.jsonl"
-    writer = RawCaptureWriter(raw_log)
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=1_700_000_000_100,
-        exchange_event_ts_ms=1_700_000_000_000,
-        payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=1_700_000_000_100,
+            exchange_event_ts_ms=1_700_000_000_000,
+            payload_raw_bytes=_payload_bytes(1_700_000_000_000, "100", "1"),
+        )
 
     canonicalize_from_raw_logs(
         raw_log_path=raw_log,
@@ -636,29 +637,28 @@ def test_manifest_contains_repro_fields(tmp_path: Path) -> None:
 
 def test_equal_timestamps_deterministic_tiebreak(tmp_path: Path) -> None:
     raw_log = tmp_path / "raw_tiebreak" / "events.jsonl"
-    writer = RawCaptureWriter(raw_log)
-
-    ts_ms = 1_700_000_000_000
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=ts_ms + 100,
-        exchange_event_ts_ms=ts_ms,
-        payload_raw_bytes=_payload_bytes(ts_ms, "100", "1"),
-    )
-    writer.append(
-        exchange_id="binance",
-        market="BTCUSDT",
-        transport="ws",
-        source="ws_live",
-        feed_channel="trades",
-        received_at_ms=ts_ms + 200,
-        exchange_event_ts_ms=ts_ms,
-        payload_raw_bytes=_payload_bytes(ts_ms, "101", "1"),
-    )
+    with RawCaptureWriter(raw_log) as writer:
+        ts_ms = 1_700_000_000_000
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=ts_ms + 100,
+            exchange_event_ts_ms=ts_ms,
+            payload_raw_bytes=_payload_bytes(ts_ms, "100", "1"),
+        )
+        writer.append(
+            exchange_id="binance",
+            market="BTCUSDT",
+            transport="ws",
+            source="ws_live",
+            feed_channel="trades",
+            received_at_ms=ts_ms + 200,
+            exchange_event_ts_ms=ts_ms,
+            payload_raw_bytes=_payload_bytes(ts_ms, "101", "1"),
+        )
 
     canonicalize_from_raw_logs(
         raw_log_path=raw_log,